@@ -247,3 +247,235 @@ STATIC_LAZY_REGISTRY = {
     "gnomADGetGeneConstraints": "gnomad_tool",
     "gnomADGraphQLTool": "gnomad_tool",
 }
+
+# Map of module_name.ClassName -> source digest, used for cache versions
+STATIC_CLASS_FINGERPRINTS = {
+    "admetai_tool.ADMETAITool": "452af998835a0109",
+    "agentic_tool.AgenticTool": "b481bcb42d465e36",
+    "alphafold_tool.AlphaFoldRESTTool": "50c3648c62e49807",
+    "arxiv_tool.ArXivTool": "2589abad6eb745db",
+    "base_tool.BaseTool": "c510d7335a2c1f6a",
+    "biogrid_tool.BioGRIDRESTTool": "223ca5b52c1d5f6e",
+    "biorxiv_tool.BioRxivTool": "785c03981f2473a0",
+    "blast_tool.NCBIBlastTool": "30394d760c40ef14",
+    "boltz_tool.Boltz2DockingTool": "1de8c7738adee5e3",
+    "cbioportal_tool.CBioPortalRESTTool": "597e81f7ea08c94a",
+    "cdc_tool.CDCRESTTool": "ca14dc61219e237a",
+    "cellosaurus_tool.CellosaurusGetCellLineInfoTool": "9960191322e1a449",
+    "cellosaurus_tool.CellosaurusQueryConverterTool": "1235cc8947fa110e",
+    "cellosaurus_tool.CellosaurusSearchTool": "425dc7bcb8dbae15",
+    "chem_tool.ChEMBLTool": "0d5e2085e97f8b92",
+    "clinvar_tool.ClinVarGetClinicalSignificance": "4375bf1bf6260839",
+    "clinvar_tool.ClinVarGetVariantDetails": "333becc75829d852",
+    "clinvar_tool.ClinVarRESTTool": "8cb3b9b32870ca84",
+    "clinvar_tool.ClinVarSearchVariants": "a13dede5aded5d0f",
+    "compose_tool.ComposeTool": "0a76228bc0ff05d5",
+    "core_tool.CoreTool": "dc5a49ece8381f64",
+    "crossref_tool.CrossrefTool": "5e99894197e0d95d",
+    "ctg_tool.ClinicalTrialsDetailsTool": "96fbb91b81cc447c",
+    "ctg_tool.ClinicalTrialsSearchTool": "9c3650d3b5ea8020",
+    "ctg_tool.ClinicalTrialsTool": "546df18ad3a7e1c5",
+    "custom_tool.CustomTool": "1dd602c7714ec417",
+    "dailymed_tool.GetSPLBySetIDTool": "a40305623e9b9589",
+    "dailymed_tool.SearchSPLTool": "9a240c6bcbd6a690",
+    "database_setup.embedding_database.EmbeddingDatabase": "025da9e4df3043d2",
+    "database_setup.embedding_sync.EmbeddingSync": "50be3a0279524e5e",
+    "database_setup.generic_embedding_search_tool.EmbeddingCollectionSearchTool": "126c3b184b81b6b8",
+    "dataset_tool.DatasetTool": "89160973f887787e",
+    "dblp_tool.DBLPTool": "c9e2fcb506640059",
+    "dbpedia_tool.DBpediaSPARQLTool": "1e630fb571c64de8",
+    "dbsnp_tool.dbSNPGetFrequencies": "b344108713ba3b4d",
+    "dbsnp_tool.dbSNPGetVariantByRsID": "b25c2b50e6c802ea",
+    "dbsnp_tool.dbSNPRESTTool": "9a55882239e0bb3b",
+    "dbsnp_tool.dbSNPSearchByGene": "a9393ab12ea73165",
+    "doaj_tool.DOAJTool": "dfc995b1c051fb75",
+    "efo_tool.EFOTool": "ea9abf6881b735b5",
+    "emdb_tool.EMDBRESTTool": "a7cc1ef125133879",
+    "encode_tool.ENCODEFilesTool": "d0e2136e5b73026a",
+    "encode_tool.ENCODESearchTool": "4485ae1efe046585",
+    "enrichr_tool.EnrichrTool": "6ff9f5c8fcaac435",
+    "ensembl_tool.EnsemblGetSequence": "3586bce4b118edeb",
+    "ensembl_tool.EnsemblGetVariants": "e057f91b8723a5d0",
+    "ensembl_tool.EnsemblLookupGene": "b282a23369b269e8",
+    "ensembl_tool.EnsemblRESTTool": "9785b28fa8d08226",
+    "euhealth.euhealth_tool.EuHealthDeepDiveTool": "fb616ef213682b3d",
+    "euhealth.euhealth_tool.EuHealthTopicSearchTool": "571ff524dc720642",
+    "europe_pmc_tool.EuropePMCTool": "a5bfd06b85a09217",
+    "fatcat_tool.FatcatScholarTool": "944982d9082a9180",
+    "file_download_tool.BinaryDownloadTool": "2bc01b8e7b45608b",
+    "file_download_tool.FileDownloadTool": "cd429bbadc9ef747",
+    "file_download_tool.TextDownloadTool": "7488e426900bb7bc",
+    "gbif_tool.GBIFOccurrenceTool": "849d4d447c6c9893",
+    "gbif_tool.GBIFTool": "53afb27c95be918c",
+    "gdc_tool.GDCCasesTool": "c7c49f759055e729",
+    "gdc_tool.GDCFilesTool": "77ea48af265d8684",
+    "gene_ontology_tool.GeneOntologyTool": "63c543e69516442f",
+    "genomics_gene_search_tool.GWASGeneSearch": "c5a6a42afd07e74b",
+    "geo_tool.GEOGetDatasetInfo": "a74e3fe8a67297d7",
+    "geo_tool.GEOGetSampleInfo": "6228fa295b19b54a",
+    "geo_tool.GEORESTTool": "7e11111c9d34e656",
+    "geo_tool.GEOSearchDatasets": "3081beef36d85ca6",
+    "ghost_tool.GhostTool": "1075a25e0685f659",
+    "gnomad_tool.gnomADGetGeneConstraints": "68ba79367fa5f2eb",
+    "gnomad_tool.gnomADGraphQLTool": "7717d4123f61fbf8",
+    "graphql_tool.DiseaseTargetScoreTool": "6ea34b9f1568e490",
+    "graphql_tool.GraphQLTool": "b47e5c029ff40f05",
+    "graphql_tool.OpentargetGeneticsTool": "14e15b931765befb",
+    "graphql_tool.OpentargetTool": "80aca1d03936ba01",
+    "graphql_tool.OpentargetToolDrugNameMatch": "9cb387240d38696d",
+    "gtex_tool.GTExEQTLTool": "539e083a44b268dc",
+    "gtex_tool.GTExExpressionTool": "19c14cb348eebc48",
+    "gtopdb_tool.GtoPdbRESTTool": "d1df3ef034b4ae6b",
+    "gwas_tool.GWASAssociationByID": "91bd2499bfc0fef8",
+    "gwas_tool.GWASAssociationSearch": "e2d3a5761b0a5152",
+    "gwas_tool.GWASAssociationsForSNP": "517a76f7ab789516",
+    "gwas_tool.GWASAssociationsForStudy": "ec576e37b3399a97",
+    "gwas_tool.GWASAssociationsForTrait": "0839fdd1a2073d1b",
+    "gwas_tool.GWASRESTTool": "fa21c0f1da8fe9e9",
+    "gwas_tool.GWASSNPByID": "91dc89751b0c09f9",
+    "gwas_tool.GWASSNPSearch": "8ed7e503567b2e0f",
+    "gwas_tool.GWASSNPsForGene": "8bb66425cffe0c1f",
+    "gwas_tool.GWASStudiesForTrait": "aa55464a768477a9",
+    "gwas_tool.GWASStudyByID": "bc537f620e108c05",
+    "gwas_tool.GWASStudySearch": "aacc080ee3ad1552",
+    "gwas_tool.GWASVariantsForTrait": "30f7f462dde20b83",
+    "hal_tool.HALTool": "e62e80b9358f8ec2",
+    "health_disparities_tool.HealthDisparitiesTool": "d04ddb5162b0a552",
+    "hpa_tool.HPAGetBiologicalProcessTool": "ff09fa8db8f19133",
+    "hpa_tool.HPAGetCancerPrognosticsTool": "2fbf9c3bff264b11",
+    "hpa_tool.HPAGetComparativeExpressionTool": "0d9855b1a1f323dd",
+    "hpa_tool.HPAGetContextualBiologicalProcessTool": "7d1fddf7d5a14ad7",
+    "hpa_tool.HPAGetDiseaseExpressionTool": "c3c717ba447938c4",
+    "hpa_tool.HPAGetGeneJSONTool": "ee13c9be9407d73d",
+    "hpa_tool.HPAGetGenePageDetailsTool": "49c7b094581fa829",
+    "hpa_tool.HPAGetGeneXMLTool": "b9c2eee24b75dffa",
+    "hpa_tool.HPAGetProteinInteractionsTool": "b01efcfdb2224af7",
+    "hpa_tool.HPAGetRnaExpressionBySourceTool": "7477c6b3e74dee5f",
+    "hpa_tool.HPAGetRnaExpressionByTissueTool": "dbcbc241bd026a56",
+    "hpa_tool.HPAGetSubcellularLocationTool": "23c4b210f89d2cd4",
+    "hpa_tool.HPAJsonApiTool": "bc40a3a09fd73da6",
+    "hpa_tool.HPASearchApiTool": "79ca99054a8b0774",
+    "hpa_tool.HPASearchGenesTool": "0a6c2049ae227e76",
+    "hpa_tool.HPAXmlApiTool": "f1e211196cce1566",
+    "humanbase_tool.HumanBaseTool": "f71717fa505c7bcf",
+    "interpro_tool.InterProRESTTool": "e378f4f9ab15e94f",
+    "jaspar_tool.JASPARRESTTool": "c0b8fa174bea36a1",
+    "kegg_tool.KEGGFindGenes": "1964262c1dd4796f",
+    "kegg_tool.KEGGGetGeneInfo": "bf21a32c579e88fc",
+    "kegg_tool.KEGGGetPathwayInfo": "64b7fff47b5b7684",
+    "kegg_tool.KEGGListOrganisms": "20bd622cd1c2106c",
+    "kegg_tool.KEGGRESTTool": "996288ae075bf313",
+    "kegg_tool.KEGGSearchPathway": "250e23b47579f8dd",
+    "markitdown_tool.MarkItDownTool": "8d524bf782f3505f",
+    "mcp_client_tool.BaseMCPClient": "19f796978e44222b",
+    "mcp_client_tool.MCPAutoLoaderTool": "9730197355ff7ff0",
+    "mcp_client_tool.MCPClientTool": "565c6e98358208ea",
+    "mcp_client_tool.MCPProxyTool": "47910201db623c98",
+    "mcp_client_tool.MCPServerDiscovery": "11dd6e730a0e4821",
+    "medlineplus_tool.MedlinePlusRESTTool": "10a2e45600007ee5",
+    "medrxiv_tool.MedRxivTool": "136c5f7d1f9a04f5",
+    "mgnify_tool.MGnifyAnalysesTool": "fb336c60e8efd166",
+    "mgnify_tool.MGnifyStudiesTool": "2579befb06138a78",
+    "molecule_2d_tool.Molecule2DTool": "0eefef434ce1937f",
+    "molecule_3d_tool.Molecule3DTool": "240a92609e6b1f1f",
+    "mpd_tool.MPDRESTTool": "568165c0913110c8",
+    "ncbi_eutils_tool.NCBIEUtilsTool": "52c30180012547ab",
+    "nhanes_tool.NHANESTool": "118a9dd1970383ab",
+    "obis_tool.OBISOccurrenceTool": "9c4d052ceb2e3279",
+    "obis_tool.OBISTaxaTool": "45f98f5cd0f9f0a2",
+    "odphp_tool.ODPHPItemList": "1a95260813311bae",
+    "odphp_tool.ODPHPMyHealthfinder": "ef2cb5cf18f60476",
+    "odphp_tool.ODPHPOutlinkFetch": "8dc248bf091d3a58",
+    "odphp_tool.ODPHPRESTTool": "311ce5ce607adcec",
+    "odphp_tool.ODPHPTopicSearch": "86b488a26d56b27d",
+    "ols_tool.DetailedTermInfo": "26e4b880c1bebf34",
+    "ols_tool.OLSTool": "d277eaacfaf24801",
+    "ols_tool.OntologyInfo": "6c2f376de5d2297e",
+    "ols_tool.OntologySearchResponse": "8091e5e8d3b01974",
+    "ols_tool.PagedResponse": "687010e49c7bbaba",
+    "ols_tool.TermInfo": "00748d11fcb14c7b",
+    "ols_tool.TermSearchResponse": "3add01331d76f2a1",
+    "openaire_tool.OpenAIRETool": "0e1a0a4fb2f767a4",
+    "openalex_tool.OpenAlexTool": "95c50e706cd1655f",
+    "openfda_adv_tool.FDACountAdditiveReactionsTool": "be6f676713277de0",
+    "openfda_adv_tool.FDADrugAdverseEventDetailTool": "a82580c51ff20f55",
+    "openfda_adv_tool.FDADrugAdverseEventTool": "8fbac974b11b49c1",
+    "openfda_adv_tool.FDADrugInteractionDetailTool": "f3b210947aac49d6",
+    "openfda_tool.FDADrugLabelGetDrugGenericNameTool": "b789fbeb947aadfb",
+    "openfda_tool.FDADrugLabelGetDrugNamesByIndicationAggregated": "b7d18eb947c62ef5",
+    "openfda_tool.FDADrugLabelGetDrugNamesByIndicationStats": "0cb0bf0a24e9f000",
+    "openfda_tool.FDADrugLabelSearchIDTool": "af9fdf19f68a68fe",
+    "openfda_tool.FDADrugLabelSearchTool": "3c7d5137b51027ae",
+    "openfda_tool.FDADrugLabelTool": "760597403936bb6b",
+    "openfda_tool.FDATool": "b73848f28903b92c",
+    "osf_preprints_tool.OSFPreprintsTool": "8506de6e493c855c",
+    "package_discovery_tool.DynamicPackageDiscovery": "72d609a55423102a",
+    "package_tool.PackageTool": "73cd0df95cf94917",
+    "paleobiology_tool.PaleobiologyRESTTool": "b213554b1e24e9d2",
+    "pmc_tool.PMCTool": "d50f9522c8c9115f",
+    "pride_tool.PRIDERESTTool": "5af41005b7419cc4",
+    "protein_structure_3d_tool.ProteinStructure3DTool": "63d56aa81263f7e1",
+    "pubchem_tool.PubChemRESTTool": "18afbeeb93d9c271",
+    "pubmed_tool.PubMedTool": "86a64e877206fd83",
+    "pubtator_tool.PubTatorTool": "8170ef5fe7559425",
+    "pypi_package_inspector_tool.PyPIPackageInspector": "99251cd6f0a753f8",
+    "python_executor_tool.BasePythonExecutor": "ad16af25580fe2ca",
+    "python_executor_tool.PythonCodeExecutor": "e612ca1b75ca2db6",
+    "python_executor_tool.PythonScriptRunner": "553a05ffc9144ff4",
+    "rcsb_pdb_tool.RCSBTool": "a0172e8f91f03908",
+    "rcsb_search_tool.RCSBSearchTool": "617d12364e877348",
+    "reactome_tool.ReactomeRESTTool": "a76d0f9e00263420",
+    "regulomedb_tool.RegulomeDBRESTTool": "92e7a137a63c7d20",
+    "remap_tool.ReMapRESTTool": "a369d00f9e3f3509",
+    "remote_tool.RemoteTool": "7e812a326cc8649c",
+    "restful_tool.MonarchDiseasesForMultiplePhenoTool": "c336cf4f36964b0d",
+    "restful_tool.MonarchTool": "e6009ba47639526b",
+    "restful_tool.RESTfulTool": "0f56c5f6bebf7e11",
+    "rnacentral_tool.RNAcentralGetTool": "06079266374ccac4",
+    "rnacentral_tool.RNAcentralSearchTool": "c3e3f683e2976448",
+    "rxnorm_tool.RxNormTool": "d0ce6f663a9d64fa",
+    "screen_tool.SCREENRESTTool": "44cc8fd5e778614b",
+    "semantic_scholar_tool.SemanticScholarTool": "db3b41397a007c18",
+    "smolagent_tool.SmolAgentTool": "e5b85a2de881ddfd",
+    "smolagent_tool.ToolUniverseTool": "b9b1d00ad87688bb",
+    "string_tool.STRINGRESTTool": "16ac3e45c7f21b95",
+    "tool_discovery_tools.ExecuteToolTool": "f958089dafeb562e",
+    "tool_discovery_tools.GetToolInfoTool": "1dd55a4508dc3e77",
+    "tool_discovery_tools.GrepToolsTool": "60c916ad36df07dc",
+    "tool_discovery_tools.ListToolsTool": "c02f67d6b1e8bf0f",
+    "tool_finder_embedding.ToolFinderEmbedding": "0b02d11b27d26d70",
+    "tool_finder_keyword.ToolFinderKeyword": "5aef3476462828b8",
+    "tool_finder_llm.ToolFinderLLM": "ec5f374065bf13e8",
+    "umls_tool.UMLSRESTTool": "391b11ae03f9d88f",
+    "unified_guideline_tools.CMAGuidelinesTool": "5e488ef1373bcba3",
+    "unified_guideline_tools.EuropePMCGuidelinesTool": "d8cc9e48dee384ef",
+    "unified_guideline_tools.GINGuidelinesTool": "07f3e96908ea56ec",
+    "unified_guideline_tools.NICEGuidelineFullTextTool": "a0db9a065af97393",
+    "unified_guideline_tools.NICEWebScrapingTool": "173a2e26a3c410e7",
+    "unified_guideline_tools.OpenAlexGuidelinesTool": "0abe41c653fa2082",
+    "unified_guideline_tools.PubMedGuidelinesTool": "a6682db55692317b",
+    "unified_guideline_tools.TRIPDatabaseTool": "0b66ca9b17f79454",
+    "unified_guideline_tools.WHOGuidelineFullTextTool": "ad5e0c095d649f67",
+    "unified_guideline_tools.WHOGuidelinesTool": "0c578a22a2af7666",
+    "uniprot_tool.UniProtRESTTool": "3d26efe343a8f613",
+    "unpaywall_tool.UnpaywallTool": "6ea2f86ee53d6518",
+    "url_tool.URLHTMLTagTool": "0c6756368cab6f1e",
+    "url_tool.URLToPDFTextTool": "3cd6895e8257a5c8",
+    "uspto_tool.USPTOOpenDataPortalTool": "1c09bea06fb06ae5",
+    "visualization_tool.VisualizationTool": "093e7b0e2cf350c6",
+    "web_search_tool.WebAPIDocumentationSearchTool": "35a4dabcbc6b6dc8",
+    "web_search_tool.WebSearchTool": "c255393f84ae859c",
+    "who_gho_tool.WHOGHOQueryTool": "7bb73780dcf33b6b",
+    "who_gho_tool.WHOGHORESTTool": "5b4e6a6facb32e7c",
+    "who_gho_tool.WHOGHOStatisticTool": "226e613a4c87d902",
+    "who_gho_tool.WHOGHOTopicTool": "68d19a77182eff8b",
+    "wikidata_sparql_tool.WikidataSPARQLTool": "56af29f8996ba913",
+    "wikipathways_tool.WikiPathwaysGetTool": "cb7138dd91cd9ca8",
+    "wikipathways_tool.WikiPathwaysSearchTool": "d1b95c7880849f59",
+    "wikipedia_tool.WikipediaContentTool": "c2da0fc85f2b6a04",
+    "wikipedia_tool.WikipediaSearchTool": "82ff8e3bd9f8b0fe",
+    "wikipedia_tool.WikipediaSummaryTool": "d68462dbcc9333c6",
+    "worms_tool.WoRMSRESTTool": "63f538d520223371",
+    "xml_tool.XMLDatasetTool": "893b197ef5475106",
+    "zenodo_tool.ZenodoTool": "faace14366da5132",
+}
@@ -0,0 +1,798 @@
+"""
+STATIC TOOL INDEX - GENERATED FILE
+Do not edit manually. Generated by generate_tools.py from the default tool files.
+"""
+
+# Map of tool_name -> tool file category
+STATIC_TOOL_INDEX = {
+    "ADMETAI_predict_BBB_penetrance": "admetai",
+    "ADMETAI_predict_CYP_interactions": "admetai",
+    "ADMETAI_predict_bioavailability": "admetai",
+    "ADMETAI_predict_clearance_distribution": "admetai",
+    "ADMETAI_predict_nuclear_receptor_activity": "admetai",
+    "ADMETAI_predict_physicochemical_properties": "admetai",
+    "ADMETAI_predict_solubility_lipophilicity_hydration": "admetai",
+    "ADMETAI_predict_stress_response": "admetai",
+    "ADMETAI_predict_toxicity": "admetai",
+    "ADMETAnalyzerAgent": "drug_discovery_agents",
+    "AdvancedCodeQualityAnalyzer": "agents",
+    "AdverseEventICDMapper": "adverse_event",
+    "AdverseEventPredictionQuestionGenerator": "adverse_event",
+    "AdverseEventPredictionQuestionGeneratorWithContext": "adverse_event",
+    "ArXiv_search_papers": "arxiv",
+    "ArgumentDescriptionOptimizer": "optimizer",
+    "BLAST_nucleotide_search": "blast",
+    "BLAST_protein_search": "blast",
+    "BioRxiv_search_preprints": "biorxiv",
+    "BiomarkerDiscoveryWorkflow": "compose",
+    "CMA_Guidelines_Search": "guidelines",
+    "CORE_search_papers": "core",
+    "CallAgent": "special_tools",
+    "ChEMBL_search_similar_molecules": "ChEMBL",
+    "ClinicalTrialDesignAgent": "drug_discovery_agents",
+    "CodeQualityAnalyzer": "tool_discovery_agents",
+    "CompoundDiscoveryAgent": "drug_discovery_agents",
+    "ComprehensiveDrugDiscoveryPipeline": "compose",
+    "Crossref_search_works": "crossref",
+    "DBLP_search_publications": "dblp",
+    "DBpedia_SPARQL_query": "dbpedia",
+    "DOAJ_search_articles": "doaj",
+    "DailyMed_get_spl_by_setid": "dailymed",
+    "DailyMed_search_spls": "dailymed",
+    "DataAnalysisValidityReviewer": "agents",
+    "DescriptionAnalyzer": "agents",
+    "DescriptionQualityEvaluator": "agents",
+    "DiseaseAnalyzerAgent": "drug_discovery_agents",
+    "DomainExpertValidator": "agents",
+    "DrugInteractionAnalyzerAgent": "drug_discovery_agents",
+    "DrugOptimizationAgent": "drug_discovery_agents",
+    "DrugSafetyAnalyzer": "compose",
+    "EMDB_get_structure": "emdb",
+    "ENCODE_list_files": "encode",
+    "ENCODE_search_experiments": "encode",
+    "EthicalComplianceReviewer": "agents",
+    "EuropePMC_Guidelines_Search": "guidelines",
+    "EuropePMC_search_articles": "EuropePMC",
+    "ExperimentalDesignScorer": "agents",
+    "FAERS_count_additive_administration_routes": "fda_drug_adverse_event",
+    "FAERS_count_additive_adverse_reactions": "fda_drug_adverse_event",
+    "FAERS_count_additive_event_reports_by_country": "fda_drug_adverse_event",
+    "FAERS_count_additive_reaction_outcomes": "fda_drug_adverse_event",
+    "FAERS_count_additive_reports_by_reporter_country": "fda_drug_adverse_event",
+    "FAERS_count_additive_seriousness_classification": "fda_drug_adverse_event",
+    "FAERS_count_country_by_drug_event": "fda_drug_adverse_event",
+    "FAERS_count_death_related_by_drug": "fda_drug_adverse_event",
+    "FAERS_count_drug_routes_by_event": "fda_drug_adverse_event",
+    "FAERS_count_drugs_by_drug_event": "fda_drug_adverse_event",
+    "FAERS_count_outcomes_by_drug_event": "fda_drug_adverse_event",
+    "FAERS_count_patient_age_distribution": "fda_drug_adverse_event",
+    "FAERS_count_reactions_by_drug_event": "fda_drug_adverse_event",
+    "FAERS_count_reportercountry_by_drug_event": "fda_drug_adverse_event",
+    "FAERS_count_seriousness_by_drug_event": "fda_drug_adverse_event",
+    "FAERS_search_adverse_event_reports": "fda_drug_adverse_event_detail",
+    "FAERS_search_reports_by_drug_and_indication": "fda_drug_adverse_event_detail",
+    "FAERS_search_reports_by_drug_and_outcome": "fda_drug_adverse_event_detail",
+    "FAERS_search_reports_by_drug_and_reaction": "fda_drug_adverse_event_detail",
+    "FAERS_search_reports_by_drug_combination": "fda_drug_adverse_event_detail",
+    "FAERS_search_serious_reports_by_drug": "fda_drug_adverse_event_detail",
+    "FDA_get_abuse_dependence_info_by_drug_name": "fda_drug_label",
+    "FDA_get_abuse_info_by_drug_name": "fda_drug_label",
+    "FDA_get_accessories_info_by_drug_name": "fda_drug_label",
+    "FDA_get_active_ingredient_info_by_drug_name": "fda_drug_label",
+    "FDA_get_adverse_reactions_by_drug_name": "fda_drug_label",
+    "FDA_get_alarms_by_drug_name": "fda_drug_label",
+    "FDA_get_animal_pharmacology_info_by_drug_name": "fda_drug_label",
+    "FDA_get_assembly_installation_info_by_drug_name": "fda_drug_label",
+    "FDA_get_boxed_warning_info_by_drug_name": "fda_drug_label",
+    "FDA_get_brand_name_generic_name": "fda_drug_label",
+    "FDA_get_calibration_instructions_by_drug_name": "fda_drug_label",
+    "FDA_get_carcinogenic_mutagenic_fertility_by_drug_name": "fda_drug_label",
+    "FDA_get_child_safety_info_by_drug_name": "fda_drug_label",
+    "FDA_get_clinical_pharmacology_by_drug_name": "fda_drug_label",
+    "FDA_get_clinical_studies_info_by_drug_name": "fda_drug_label",
+    "FDA_get_contact_for_questions_info_by_drug_name": "fda_drug_label",
+    "FDA_get_contraindications_by_drug_name": "fda_drug_label",
+    "FDA_get_controlled_substance_DEA_schedule_info_by_drug_name": "fda_drug_label",
+    "FDA_get_dear_health_care_provider_letter_info_by_drug_name": "fda_drug_label",
+    "FDA_get_dependence_info_by_drug_name": "fda_drug_label",
+    "FDA_get_disposal_info_by_drug_name": "fda_drug_label",
+    "FDA_get_do_not_use_info_by_drug_name": "fda_drug_label",
+    "FDA_get_document_id_by_drug_name": "fda_drug_label",
+    "FDA_get_dosage_and_storage_information_by_drug_name": "fda_drug_label",
+    "FDA_get_dosage_forms_and_strengths_by_drug_name": "fda_drug_label",
+    "FDA_get_drug_generic_name": "fda_drug_label",
+    "FDA_get_drug_interactions_by_drug_name": "fda_drug_label",
+    "FDA_get_drug_name_by_SPL_ID": "fda_drug_label",
+    "FDA_get_drug_name_by_adverse_reaction": "fda_drug_label",
+    "FDA_get_drug_name_by_calibration_instructions": "fda_drug_label",
+    "FDA_get_drug_name_by_dependence_info": "fda_drug_label",
+    "FDA_get_drug_name_by_document_id": "fda_drug_label",
+    "FDA_get_drug_name_by_dosage_info": "fda_drug_label",
+    "FDA_get_drug_name_by_environmental_warning": "fda_drug_label",
+    "FDA_get_drug_name_by_inactive_ingredient": "fda_drug_label",
+    "FDA_get_drug_name_by_info_on_conditions_for_doctor_consultation": "fda_drug_label",
+    "FDA_get_drug_name_by_labor_and_delivery_info": "fda_drug_label",
+    "FDA_get_drug_name_by_microbiology": "fda_drug_label",
+    "FDA_get_drug_name_by_other_safety_info": "fda_drug_label",
+    "FDA_get_drug_name_by_pharmacodynamics": "fda_drug_label",
+    "FDA_get_drug_name_by_pharmacogenomics": "fda_drug_label",
+    "FDA_get_drug_name_by_precautions": "fda_drug_label",
+    "FDA_get_drug_name_by_pregnancy_or_breastfeeding_info": "fda_drug_label",
+    "FDA_get_drug_name_by_principal_display_panel": "fda_drug_label",
+    "FDA_get_drug_name_by_reference": "fda_drug_label",
+    "FDA_get_drug_name_by_set_id": "fda_drug_label",
+    "FDA_get_drug_name_by_stop_use_info": "fda_drug_label",
+    "FDA_get_drug_name_by_storage_and_handling_info": "fda_drug_label",
+    "FDA_get_drug_name_by_warnings": "fda_drug_label",
+    "FDA_get_drug_name_from_patient_package_insert": "fda_drug_label",
+    "FDA_get_drug_names_by_abuse_dependence_info": "fda_drug_label",
+    "FDA_get_drug_names_by_abuse_info": "fda_drug_label",
+    "FDA_get_drug_names_by_accessories": "fda_drug_label",
+    "FDA_get_drug_names_by_active_ingredient": "fda_drug_label",
+    "FDA_get_drug_names_by_alarm": "fda_drug_label",
+    "FDA_get_drug_names_by_animal_pharmacology_info": "fda_drug_label",
+    "FDA_get_drug_names_by_application_number_NDC_number": "fda_drug_label",
+    "FDA_get_drug_names_by_assembly_installation_info": "fda_drug_label",
+    "FDA_get_drug_names_by_boxed_warning": "fda_drug_label",
+    "FDA_get_drug_names_by_child_safety_info": "fda_drug_label",
+    "FDA_get_drug_names_by_clinical_pharmacology": "fda_drug_label",
+    "FDA_get_drug_names_by_clinical_studies": "fda_drug_label",
+    "FDA_get_drug_names_by_consulting_doctor_pharmacist_info": "fda_drug_label",
+    "FDA_get_drug_names_by_contraindications": "fda_drug_label",
+    "FDA_get_drug_names_by_controlled_substance_DEA_schedule": "fda_drug_label",
+    "FDA_get_drug_names_by_dear_health_care_provider_letter_info": "fda_drug_label",
+    "FDA_get_drug_names_by_disposal_info": "fda_drug_label",
+    "FDA_get_drug_names_by_dosage_forms_and_strengths_info": "fda_drug_label",
+    "FDA_get_drug_names_by_drug_interactions": "fda_drug_label",
+    "FDA_get_drug_names_by_effective_time": "fda_drug_label",
+    "FDA_get_drug_names_by_food_safety_warnings": "fda_drug_label",
+    "FDA_get_drug_names_by_general_precautions": "fda_drug_label",
+    "FDA_get_drug_names_by_geriatric_use": "fda_drug_label",
+    "FDA_get_drug_names_by_health_claim": "fda_drug_label",
+    "FDA_get_drug_names_by_indication": "fda_drug_label",
+    "FDA_get_drug_names_by_indication_aggregated": "fda_drug_label",
+    "FDA_get_drug_names_by_indication_stats": "fda_drug_label",
+    "FDA_get_drug_names_by_info_for_nursing_mothers": "fda_drug_label",
+    "FDA_get_drug_names_by_information_for_owners_or_caregivers": "fda_drug_label",
+    "FDA_get_drug_names_by_ingredient": "fda_drug_label",
+    "FDA_get_drug_names_by_instructions_for_use": "fda_drug_label",
+    "FDA_get_drug_names_by_lab_test_interference": "fda_drug_label",
+    "FDA_get_drug_names_by_lab_tests": "fda_drug_label",
+    "FDA_get_drug_names_by_mechanism_of_action": "fda_drug_label",
+    "FDA_get_drug_names_by_medication_guide": "fda_drug_label",
+    "FDA_get_drug_names_by_nonclinical_toxicology_info": "fda_drug_label",
+    "FDA_get_drug_names_by_nonteratogenic_effects": "fda_drug_label",
+    "FDA_get_drug_names_by_overdosage_info": "fda_drug_label",
+    "FDA_get_drug_names_by_pediatric_use": "fda_drug_label",
+    "FDA_get_drug_names_by_pharmacokinetics": "fda_drug_label",
+    "FDA_get_drug_names_by_population_use": "fda_drug_label",
+    "FDA_get_drug_names_by_pregnancy_effects_info": "fda_drug_label",
+    "FDA_get_drug_names_by_residue_warning": "fda_drug_label",
+    "FDA_get_drug_names_by_risk": "fda_drug_label",
+    "FDA_get_drug_names_by_route": "fda_drug_label",
+    "FDA_get_drug_names_by_safe_handling_warning": "fda_drug_label",
+    "FDA_get_drug_names_by_safety_summary": "fda_drug_label",
+    "FDA_get_drug_names_by_spl_indexing_data_elements": "fda_drug_label",
+    "FDA_get_drug_names_by_teratogenic_effects": "fda_drug_label",
+    "FDA_get_drug_names_by_user_safety_warning": "fda_drug_label",
+    "FDA_get_drug_names_by_warnings_and_cautions": "fda_drug_label",
+    "FDA_get_drugs_by_carcinogenic_mutagenic_fertility": "fda_drug_label",
+    "FDA_get_effective_time_by_drug_name": "fda_drug_label",
+    "FDA_get_environmental_warning_by_drug_name": "fda_drug_label",
+    "FDA_get_general_precautions_by_drug_name": "fda_drug_label",
+    "FDA_get_geriatric_use_info_by_drug_name": "fda_drug_label",
+    "FDA_get_health_claims_by_drug_name": "fda_drug_label",
+    "FDA_get_inactive_ingredient_info_by_drug_name": "fda_drug_label",
+    "FDA_get_indications_by_drug_name": "fda_drug_label",
+    "FDA_get_info_for_nursing_mothers_by_drug_name": "fda_drug_label",
+    "FDA_get_info_for_patients_by_drug_name": "fda_drug_label",
+    "FDA_get_info_on_conditions_for_doctor_consultation_by_drug_name": "fda_drug_label",
+    "FDA_get_info_on_consulting_doctor_pharmacist_by_drug_name": "fda_drug_label",
+    "FDA_get_information_for_owners_or_caregivers_by_drug_name": "fda_drug_label",
+    "FDA_get_ingredients_by_drug_name": "fda_drug_label",
+    "FDA_get_instructions_for_use_by_drug_name": "fda_drug_label",
+    "FDA_get_lab_test_interference_info_by_drug_name": "fda_drug_label",
+    "FDA_get_lab_tests_by_drug_name": "fda_drug_label",
+    "FDA_get_labor_and_delivery_info_by_drug_name": "fda_drug_label",
+    "FDA_get_manufacturer_name_NDC_number_by_drug_name": "fda_drug_label",
+    "FDA_get_mechanism_of_action_by_drug_name": "fda_drug_label",
+    "FDA_get_medication_guide_info_by_drug_name": "fda_drug_label",
+    "FDA_get_microbiology_info_by_drug_name": "fda_drug_label",
+    "FDA_get_nonclinical_toxicology_info_by_drug_name": "fda_drug_label",
+    "FDA_get_nonteratogenic_effects_by_drug_name": "fda_drug_label",
+    "FDA_get_other_safety_info_by_drug_name": "fda_drug_label",
+    "FDA_get_overdosage_info_by_drug_name": "fda_drug_label",
+    "FDA_get_patient_package_insert_from_drug_name": "fda_drug_label",
+    "FDA_get_pediatric_use_info_by_drug_name": "fda_drug_label",
+    "FDA_get_pharmacodynamics_by_drug_name": "fda_drug_label",
+    "FDA_get_pharmacogenomics_info_by_drug_name": "fda_drug_label",
+    "FDA_get_pharmacokinetics_by_drug_name": "fda_drug_label",
+    "FDA_get_population_use_info_by_drug_name": "fda_drug_label",
+    "FDA_get_precautions_by_drug_name": "fda_drug_label",
+    "FDA_get_pregnancy_effects_info_by_drug_name": "fda_drug_label",
+    "FDA_get_pregnancy_or_breastfeeding_info_by_drug_name": "fda_drug_label",
+    "FDA_get_principal_display_panel_by_drug_name": "fda_drug_label",
+    "FDA_get_purpose_info_by_drug_name": "fda_drug_label",
+    "FDA_get_recent_changes_by_drug_name": "fda_drug_label",
+    "FDA_get_reference_info_by_drug_name": "fda_drug_label",
+    "FDA_get_residue_warning_by_drug_name": "fda_drug_label",
+    "FDA_get_risk_info_by_drug_name": "fda_drug_label",
+    "FDA_get_route_info_by_drug_name": "fda_drug_label",
+    "FDA_get_safe_handling_warnings_by_drug_name": "fda_drug_label",
+    "FDA_get_safety_summary_by_drug_name": "fda_drug_label",
+    "FDA_get_spl_indexing_data_elements_by_drug_name": "fda_drug_label",
+    "FDA_get_spl_unclassified_section_by_drug_name": "fda_drug_label",
+    "FDA_get_stop_use_info_by_drug_name": "fda_drug_label",
+    "FDA_get_storage_and_handling_info_by_drug_name": "fda_drug_label",
+    "FDA_get_teratogenic_effects_by_drug_name": "fda_drug_label",
+    "FDA_get_user_safety_warning_by_drug_names": "fda_drug_label",
+    "FDA_get_warnings_and_cautions_by_drug_name": "fda_drug_label",
+    "FDA_get_warnings_by_drug_name": "fda_drug_label",
+    "FDA_get_when_using_info": "fda_drug_label",
+    "FDA_retrieve_device_use_by_drug_name": "fda_drug_label",
+    "FDA_retrieve_drug_name_by_device_use": "fda_drug_label",
+    "FDA_retrieve_drug_names_by_patient_medication_info": "fda_drug_label",
+    "FDA_retrieve_patient_medication_info_by_drug_name": "fda_drug_label",
+    "Fatcat_search_scholar": "fatcat",
+    "Finish": "special_tools",
+    "GBIF_search_occurrences": "gbif",
+    "GBIF_search_species": "gbif",
+    "GDC_list_files": "gdc",
+    "GDC_search_cases": "gdc",
+    "GIN_Guidelines_Search": "guidelines",
+    "GO_get_annotations_for_gene": "go",
+    "GO_get_genes_for_term": "go",
+    "GO_get_term_by_id": "go",
+    "GO_get_term_details": "go",
+    "GO_search_terms": "go",
+    "GTEx_get_expression_summary": "gtex",
+    "GTEx_query_eqtl": "gtex",
+    "GWAS_search_associations_by_gene": "gwas",
+    "GtoPdb_get_targets": "gtopdb",
+    "HAL_search_archive": "hal",
+    "HPA_get_biological_processes_by_gene": "hpa",
+    "HPA_get_cancer_prognostics_by_gene": "hpa",
+    "HPA_get_comparative_expression_by_gene_and_cellline": "hpa",
+    "HPA_get_comprehensive_gene_details_by_ensembl_id": "hpa",
+    "HPA_get_contextual_biological_process_analysis": "hpa",
+    "HPA_get_disease_expression_by_gene_tissue_disease": "hpa",
+    "HPA_get_gene_basic_info_by_ensembl_id": "hpa",
+    "HPA_get_gene_tsv_data_by_ensembl_id": "hpa",
+    "HPA_get_protein_interactions_by_gene": "hpa",
+    "HPA_get_rna_expression_by_source": "hpa",
+    "HPA_get_rna_expression_in_specific_tissues": "hpa",
+    "HPA_get_subcellular_location": "hpa",
+    "HPA_search_genes_by_query": "hpa",
+    "HypothesisGenerator": "agents",
+    "InterPro_get_domain_details": "interpro",
+    "InterPro_get_protein_domains": "interpro",
+    "InterPro_search_domains": "interpro",
+    "JASPAR_get_transcription_factors": "jaspar",
+    "LabelGenerator": "agents",
+    "LiteratureContextReviewer": "agents",
+    "LiteratureSearchTool": "compose",
+    "LiteratureSynthesisAgent": "drug_discovery_agents",
+    "MGnify_list_analyses": "mgnify",
+    "MGnify_search_studies": "mgnify",
+    "MPD_get_phenotype_data": "mpd",
+    "MedRxiv_search_preprints": "medrxiv",
+    "MedicalLiteratureReviewer": "agents",
+    "MedicalTermNormalizer": "agents",
+    "MedlinePlus_connect_lookup_by_code": "medlineplus",
+    "MedlinePlus_get_genetics_condition_by_name": "medlineplus",
+    "MedlinePlus_get_genetics_gene_by_name": "medlineplus",
+    "MedlinePlus_get_genetics_index": "medlineplus",
+    "MedlinePlus_search_topics_by_keyword": "medlineplus",
+    "MethodologyRigorReviewer": "agents",
+    "NICE_Clinical_Guidelines_Search": "guidelines",
+    "NICE_Guideline_Full_Text": "guidelines",
+    "NoveltySignificanceReviewer": "agents",
+    "OBIS_search_occurrences": "obis",
+    "OBIS_search_taxa": "obis",
+    "OSF_search_preprints": "osf_preprints",
+    "OSL_get_efo_id_by_disease_name": "EFO",
+    "OpenAIRE_search_publications": "openaire",
+    "OpenAlex_Guidelines_Search": "guidelines",
+    "OpenTargets_drug_pharmacogenomics_data": "opentarget",
+    "OpenTargets_get_approved_indications_by_drug_chemblId": "opentarget",
+    "OpenTargets_get_associated_diseases_by_drug_chemblId": "opentarget",
+    "OpenTargets_get_associated_drugs_by_disease_efoId": "opentarget",
+    "OpenTargets_get_associated_drugs_by_target_ensemblID": "opentarget",
+    "OpenTargets_get_associated_phenotypes_by_disease_efoId": "opentarget",
+    "OpenTargets_get_associated_targets_by_disease_efoId": "opentarget",
+    "OpenTargets_get_associated_targets_by_drug_chemblId": "opentarget",
+    "OpenTargets_get_biological_mouse_models_by_ensemblID": "opentarget",
+    "OpenTargets_get_chemical_probes_by_target_ensemblID": "opentarget",
+    "OpenTargets_get_disease_ancestors_parents_by_efoId": "opentarget",
+    "OpenTargets_get_disease_descendants_children_by_efoId": "opentarget",
+    "OpenTargets_get_disease_description_by_efoId": "opentarget",
+    "OpenTargets_get_disease_id_description_by_name": "opentarget",
+    "OpenTargets_get_disease_ids_by_efoId": "idmap",
+    "OpenTargets_get_disease_ids_by_name": "idmap",
+    "OpenTargets_get_disease_locations_by_efoId": "opentarget",
+    "OpenTargets_get_disease_synonyms_by_efoId": "opentarget",
+    "OpenTargets_get_disease_therapeutic_areas_by_efoId": "opentarget",
+    "OpenTargets_get_diseases_phenotypes_by_target_ensembl": "opentarget",
+    "OpenTargets_get_drug_adverse_events_by_chemblId": "opentarget",
+    "OpenTargets_get_drug_approval_status_by_chemblId": "opentarget",
+    "OpenTargets_get_drug_chembId_by_generic_name": "opentarget",
+    "OpenTargets_get_drug_description_by_chemblId": "opentarget",
+    "OpenTargets_get_drug_id_description_by_name": "opentarget",
+    "OpenTargets_get_drug_indications_by_chemblId": "opentarget",
+    "OpenTargets_get_drug_mechanisms_of_action_by_chemblId": "opentarget",
+    "OpenTargets_get_drug_names_by_chemblId": "opentarget",
+    "OpenTargets_get_drug_synonyms_by_chemblId": "opentarget",
+    "OpenTargets_get_drug_trade_names_by_chemblId": "opentarget",
+    "OpenTargets_get_drug_warnings_by_chemblId": "opentarget",
+    "OpenTargets_get_drug_withdrawn_blackbox_status_by_chemblId": "opentarget",
+    "OpenTargets_get_gene_ontology_terms_by_goID": "opentarget",
+    "OpenTargets_get_known_drugs_by_drug_chemblId": "opentarget",
+    "OpenTargets_get_parent_child_molecules_by_drug_chembl_ID": "opentarget",
+    "OpenTargets_get_publications_by_disease_efoId": "opentarget",
+    "OpenTargets_get_publications_by_drug_chemblId": "opentarget",
+    "OpenTargets_get_publications_by_target_ensemblID": "opentarget",
+    "OpenTargets_get_similar_entities_by_disease_efoId": "opentarget",
+    "OpenTargets_get_similar_entities_by_drug_chemblId": "opentarget",
+    "OpenTargets_get_similar_entities_by_target_ensemblID": "opentarget",
+    "OpenTargets_get_target_classes_by_ensemblID": "opentarget",
+    "OpenTargets_get_target_constraint_info_by_ensemblID": "opentarget",
+    "OpenTargets_get_target_enabling_packages_by_ensemblID": "opentarget",
+    "OpenTargets_get_target_gene_ontology_by_ensemblID": "opentarget",
+    "OpenTargets_get_target_genomic_location_by_ensemblID": "opentarget",
+    "OpenTargets_get_target_homologues_by_ensemblID": "opentarget",
+    "OpenTargets_get_target_id_description_by_name": "opentarget",
+    "OpenTargets_get_target_interactions_by_ensemblID": "opentarget",
+    "OpenTargets_get_target_safety_profile_by_ensemblID": "opentarget",
+    "OpenTargets_get_target_subcellular_locations_by_ensemblID": "opentarget",
+    "OpenTargets_get_target_synonyms_by_ensemblID": "opentarget",
+    "OpenTargets_get_target_tractability_by_ensemblID": "opentarget",
+    "OpenTargets_map_any_disease_id_to_all_other_ids": "idmap",
+    "OpenTargets_multi_entity_search_by_query_string": "opentarget",
+    "OpenTargets_search_category_counts_by_query_string": "opentarget",
+    "OpenTargets_target_disease_evidence": "opentarget",
+    "OutputSummarizationComposer": "output_summarization",
+    "PDB_search_similar_structures": "rcsb_search",
+    "PMC_search_papers": "pmc",
+    "PRIDE_search_proteomics": "pride",
+    "PackageAnalyzer": "tool_discovery_agents",
+    "Paleobiology_get_fossils": "paleobiology",
+    "ProtocolOptimizer": "agents",
+    "PubChem_get_CID_by_SMILES": "pubchem",
+    "PubChem_get_CID_by_compound_name": "pubchem",
+    "PubChem_get_associated_patents_by_CID": "pubchem",
+    "PubChem_get_compound_2D_image_by_CID": "pubchem",
+    "PubChem_get_compound_properties_by_CID": "pubchem",
+    "PubChem_get_compound_synonyms_by_CID": "pubchem",
+    "PubChem_get_compound_xrefs_by_CID": "pubchem",
+    "PubChem_search_compounds_by_similarity": "pubchem",
+    "PubChem_search_compounds_by_substructure": "pubchem",
+    "PubMed_Guidelines_Search": "guidelines",
+    "PubMed_search_articles": "pubmed",
+    "PubTator3_EntityAutocomplete": "pubtator",
+    "PubTator3_LiteratureSearch": "pubtator",
+    "PyPIPackageInspector": "pypi_package_inspector_tools",
+    "QuestionRephraser": "agents",
+    "RNAcentral_get_by_accession": "rnacentral",
+    "RNAcentral_search": "rnacentral",
+    "ReMap_get_transcription_factor_binding": "remap",
+    "Reactome_get_pathway_reactions": "reactome",
+    "ReferenceInfoAnalyzer": "tool_discovery_agents",
+    "RegulomeDB_query_variant": "regulomedb",
+    "ReproducibilityTransparencyReviewer": "agents",
+    "ResultsInterpretationReviewer": "agents",
+    "RxNorm_get_drug_names": "rxnorm",
+    "SCREEN_get_regulatory_elements": "screen",
+    "ScientificTextSummarizer": "agents",
+    "SemanticScholar_search_papers": "semantic_scholar",
+    "TRIP_Database_Guidelines_Search": "guidelines",
+    "TestCaseGenerator": "optimizer",
+    "TestResultsAnalyzer": "tool_discovery_agents",
+    "ToolCompatibilityAnalyzer": "tool_composition",
+    "ToolDescriptionOptimizer": "optimizer",
+    "ToolDiscover": "tool_discovery_agents",
+    "ToolGraphComposer": "tool_composition",
+    "ToolGraphGenerationPipeline": "compose",
+    "ToolMetadataGenerationPipeline": "compose",
+    "ToolMetadataGenerator": "agents",
+    "ToolMetadataStandardizer": "agents",
+    "ToolOutputSummarizer": "output_summarization",
+    "ToolQualityEvaluator": "agents",
+    "ToolRelationshipDetector": "agents",
+    "Tool_Finder": "tool_finder",
+    "Tool_Finder_Keyword": "tool_finder",
+    "Tool_Finder_LLM": "tool_finder",
+    "Tool_RAG": "tool_finder",
+    "UniProt_get_alternative_names_by_accession": "uniprot",
+    "UniProt_get_disease_variants_by_accession": "uniprot",
+    "UniProt_get_entry_by_accession": "uniprot",
+    "UniProt_get_function_by_accession": "uniprot",
+    "UniProt_get_isoform_ids_by_accession": "uniprot",
+    "UniProt_get_organism_by_accession": "uniprot",
+    "UniProt_get_ptm_processing_by_accession": "uniprot",
+    "UniProt_get_recommended_name_by_accession": "uniprot",
+    "UniProt_get_sequence_by_accession": "uniprot",
+    "UniProt_get_subcellular_location_by_accession": "uniprot",
+    "UniProt_id_mapping": "uniprot",
+    "UniProt_search": "uniprot",
+    "UnifiedToolGenerator": "tool_discovery_agents",
+    "Unpaywall_check_oa_status": "unpaywall",
+    "WHO_Guideline_Full_Text": "guidelines",
+    "WHO_Guidelines_Search": "guidelines",
+    "WikiPathways_get_pathway": "wikipathways",
+    "WikiPathways_search": "wikipathways",
+    "Wikidata_SPARQL_query": "wikidata_sparql",
+    "Wikipedia_get_content": "wikipedia",
+    "Wikipedia_get_summary": "wikipedia",
+    "Wikipedia_search": "wikipedia",
+    "WoRMS_search_species": "worms",
+    "WritingPresentationReviewer": "agents",
+    "XMLToolOptimizer": "tool_discovery_agents",
+    "Zenodo_search_records": "zenodo",
+    "advanced_literature_search_agent": "smolagents",
+    "alphafold_get_annotations": "alphafold",
+    "alphafold_get_prediction": "alphafold",
+    "alphafold_get_summary": "alphafold",
+    "cBioPortal_get_cancer_studies": "cbioportal",
+    "cBioPortal_get_mutations": "cbioportal",
+    "call_agentic_human": "agents",
+    "cancer_biomarkers_disease_target_score": "disease_target_score",
+    "cancer_gene_census_disease_target_score": "disease_target_score",
+    "cellosaurus_get_cell_line_info": "cellosaurus",
+    "cellosaurus_query_converter": "cellosaurus",
+    "cellosaurus_search_cell_lines": "cellosaurus",
+    "chembl_disease_target_score": "disease_target_score",
+    "clinvar_get_clinical_significance": "clinvar",
+    "clinvar_get_variant_details": "clinvar",
+    "clinvar_search_variants": "clinvar",
+    "convert_to_markdown": "markitdown",
+    "dbsnp_get_frequencies": "dbsnp",
+    "dbsnp_get_variant_by_rsid": "dbsnp",
+    "dbsnp_search_by_gene": "dbsnp",
+    "dict_search": "dataset",
+    "dili_search": "dataset",
+    "diqt_search": "dataset",
+    "disease_target_score": "disease_target_score",
+    "download_binary_file": "file_download",
+    "download_file": "file_download",
+    "download_text_content": "file_download",
+    "drugbank_filter_drugs_by_name": "xml",
+    "drugbank_full_search": "dataset",
+    "drugbank_get_drug_basic_info_by_drug_name_or_drugbank_id": "xml",
+    "drugbank_get_drug_chemistry_by_drug_name_or_drugbank_id": "xml",
+    "drugbank_get_drug_desc_pharmacology_by_moa": "xml",
+    "drugbank_get_drug_interactions_by_drug_name_or_drugbank_id": "xml",
+    "drugbank_get_drug_name_and_description_by_indication": "xml",
+    "drugbank_get_drug_name_and_description_by_pathway_name": "xml",
+    "drugbank_get_drug_name_and_description_by_target_name": "xml",
+    "drugbank_get_drug_products_by_name_or_drugbank_id": "xml",
+    "drugbank_get_drug_references_by_drug_name_or_drugbank_id": "xml",
+    "drugbank_get_indications_by_drug_name_or_drugbank_id": "xml",
+    "drugbank_get_pathways_reactions_by_drug_or_id": "xml",
+    "drugbank_get_pharmacology_by_drug_name_or_drugbank_id": "xml",
+    "drugbank_get_safety_by_drug_name_or_drugbank_id": "xml",
+    "drugbank_get_targets_by_drug_name_or_drugbank_id": "xml",
+    "drugbank_links_search": "dataset",
+    "drugbank_vocab_filter": "dataset",
+    "drugbank_vocab_search": "dataset",
+    "dynamic_package_discovery": "package_discovery_tools",
+    "embedding_database_add": "embedding",
+    "embedding_database_create": "embedding",
+    "embedding_database_search": "embedding",
+    "embedding_sync_download": "embedding",
+    "embedding_sync_upload": "embedding",
+    "enrichr_gene_enrichment_analysis": "Enrichr",
+    "ensembl_get_sequence": "ensembl",
+    "ensembl_get_variants": "ensembl",
+    "ensembl_lookup_gene": "ensembl",
+    "euhealthinfo_deepdive": "euhealth",
+    "euhealthinfo_search_alcohol_tobacco_psychoactive_use": "euhealth",
+    "euhealthinfo_search_births": "euhealth",
+    "euhealthinfo_search_cancer": "euhealth",
+    "euhealthinfo_search_cancer_registry": "euhealth",
+    "euhealthinfo_search_causes_of_death": "euhealth",
+    "euhealthinfo_search_covid_19": "euhealth",
+    "euhealthinfo_search_deaths": "euhealth",
+    "euhealthinfo_search_diabetes_mellitus_epidemiology_registry": "euhealth",
+    "euhealthinfo_search_disability": "euhealth",
+    "euhealthinfo_search_healthcare_expenditure": "euhealth",
+    "euhealthinfo_search_hospital_in_patient_data": "euhealth",
+    "euhealthinfo_search_infectious_diseases": "euhealth",
+    "euhealthinfo_search_key_indicators_registries_surveys": "euhealth",
+    "euhealthinfo_search_mental_health": "euhealth",
+    "euhealthinfo_search_obesity": "euhealth",
+    "euhealthinfo_search_population_health_survey": "euhealth",
+    "euhealthinfo_search_primary_care_workforce": "euhealth",
+    "euhealthinfo_search_surveillance": "euhealth",
+    "euhealthinfo_search_surveillance_mortality_rates": "euhealth",
+    "euhealthinfo_search_vaccination": "euhealth",
+    "europepmc_disease_target_score": "disease_target_score",
+    "eva_disease_target_score": "disease_target_score",
+    "eva_somatic_disease_target_score": "disease_target_score",
+    "execute_tool": "compact_mode",
+    "expression_atlas_disease_target_score": "disease_target_score",
+    "extract_clinical_trial_adverse_events": "clinical_trials",
+    "extract_clinical_trial_outcomes": "clinical_trials",
+    "genomics_england_disease_target_score": "disease_target_score",
+    "geo_get_dataset_info": "geo",
+    "geo_get_sample_info": "geo",
+    "geo_search_datasets": "geo",
+    "get_HPO_ID_by_phenotype": "monarch",
+    "get_albumentations_info": "software_image_processing",
+    "get_altair_info": "software_visualization",
+    "get_anndata_info": "software_single_cell",
+    "get_arboreto_info": "software_genomics",
+    "get_arxiv_info": "software_bioinformatics",
+    "get_ase_info": "software_structural_biology",
+    "get_assembly_info_by_pdb_id": "rcsb_pdb",
+    "get_assembly_summary": "rcsb_pdb",
+    "get_associated_documents_metadata": "uspto",
+    "get_astropy_info": "software_physics_astronomy",
+    "get_binding_affinity_by_pdb_id": "rcsb_pdb",
+    "get_biopandas_info": "software_structural_biology",
+    "get_biopython_info": "software_bioinformatics",
+    "get_bioservices_info": "software_bioinformatics",
+    "get_biotite_info": "software_bioinformatics",
+    "get_bokeh_info": "software_visualization",
+    "get_brian2_info": "software_neuroscience",
+    "get_cartopy_info": "software_earth_sciences",
+    "get_catboost_info": "software_machine_learning",
+    "get_cellpose_info": "software_visualization",
+    "get_cellrank_info": "software_single_cell",
+    "get_cellxgene_census_info": "software_genomics",
+    "get_cftime_info": "software_earth_sciences",
+    "get_chem_comp_audit_info": "rcsb_pdb",
+    "get_chem_comp_charge_and_ambiguity": "rcsb_pdb",
+    "get_chembl_webresource_client_info": "software_cheminformatics",
+    "get_citation_info_by_pdb_id": "rcsb_pdb",
+    "get_clair3_info": "software_genomics",
+    "get_clinical_trial_conditions_and_interventions": "clinical_trials",
+    "get_clinical_trial_descriptions": "clinical_trials",
+    "get_clinical_trial_eligibility_criteria": "clinical_trials",
+    "get_clinical_trial_locations": "clinical_trials",
+    "get_clinical_trial_outcome_measures": "clinical_trials",
+    "get_clinical_trial_references": "clinical_trials",
+    "get_clinical_trial_status_and_dates": "clinical_trials",
+    "get_cobra_info": "software_cheminformatics",
+    "get_cobrapy_info": "software_machine_learning",
+    "get_cooler_info": "software_scientific_computing",
+    "get_core_refinement_statistics": "rcsb_pdb",
+    "get_cryosparc_tools_info": "software_bioinformatics",
+    "get_crystal_growth_conditions_by_pdb_id": "rcsb_pdb",
+    "get_crystallization_ph_by_pdb_id": "rcsb_pdb",
+    "get_crystallographic_properties_by_pdb_id": "rcsb_pdb",
+    "get_cupy_info": "software_scientific_computing",
+    "get_cyvcf2_info": "software_genomics",
+    "get_dask_info": "software_scientific_computing",
+    "get_datamol_info": "software_cheminformatics",
+    "get_datashader_info": "software_visualization",
+    "get_deepchem_info": "software_cheminformatics",
+    "get_deeppurpose_info": "software_machine_learning",
+    "get_deeptools_info": "software_genomics",
+    "get_deepxde_info": "software_machine_learning",
+    "get_dendropy_info": "software_bioinformatics",
+    "get_descriptastorus_info": "software_structural_biology",
+    "get_diffdock_info": "software_structural_biology",
+    "get_dscribe_info": "software_cheminformatics",
+    "get_ec_number_by_entity_id": "rcsb_pdb",
+    "get_elephant_info": "software_neuroscience",
+    "get_em_3d_fitting_and_reconstruction_details": "rcsb_pdb",
+    "get_emdb_ids_by_pdb_id": "rcsb_pdb",
+    "get_episcanpy_info": "software_single_cell",
+    "get_ete3_info": "software_bioinformatics",
+    "get_faiss_info": "software_machine_learning",
+    "get_fanc_info": "software_bioinformatics",
+    "get_flask_info": "software_bioinformatics",
+    "get_flowio_info": "software_bioinformatics",
+    "get_flowkit_info": "software_bioinformatics",
+    "get_flowutils_info": "software_scientific_computing",
+    "get_freesasa_info": "software_structural_biology",
+    "get_galpy_info": "software_physics_astronomy",
+    "get_gene_name_by_entity_id": "rcsb_pdb",
+    "get_geopandas_info": "software_earth_sciences",
+    "get_gget_info": "software_bioinformatics",
+    "get_googlesearch_python_info": "software_bioinformatics",
+    "get_gseapy_info": "software_genomics",
+    "get_h5py_info": "software_scientific_computing",
+    "get_harmony_pytorch_info": "software_machine_learning",
+    "get_hmmlearn_info": "software_machine_learning",
+    "get_holoviews_info": "software_visualization",
+    "get_host_organism_by_pdb_id": "rcsb_pdb",
+    "get_htmd_info": "software_structural_biology",
+    "get_igraph_info": "software_visualization",
+    "get_imageio_info": "software_image_processing",
+    "get_imbalanced_learn_info": "software_machine_learning",
+    "get_jcvi_info": "software_genomics",
+    "get_joblib_info": "software_scientific_computing",
+    "get_joint_associated_diseases_by_HPO_ID_list": "monarch",
+    "get_khmer_info": "software_bioinformatics",
+    "get_kipoiseq_info": "software_genomics",
+    "get_lifelines_info": "software_bioinformatics",
+    "get_ligand_bond_count_by_pdb_id": "rcsb_pdb",
+    "get_ligand_smiles_by_chem_comp_id": "rcsb_pdb",
+    "get_lightgbm_info": "software_machine_learning",
+    "get_loompy_info": "software_bioinformatics",
+    "get_mageck_info": "software_bioinformatics",
+    "get_matplotlib_info": "software_visualization",
+    "get_mdanalysis_info": "software_structural_biology",
+    "get_mdtraj_info": "software_structural_biology",
+    "get_mne_info": "software_neuroscience",
+    "get_molfeat_info": "software_cheminformatics",
+    "get_molvs_info": "software_cheminformatics",
+    "get_mordred_info": "software_cheminformatics",
+    "get_msprime_info": "software_bioinformatics",
+    "get_mudata_info": "software_single_cell",
+    "get_mutation_annotations_by_pdb_id": "rcsb_pdb",
+    "get_neo_info": "software_neuroscience",
+    "get_netcdf4_info": "software_earth_sciences",
+    "get_networkx_info": "software_bioinformatics",
+    "get_nglview_info": "software_structural_biology",
+    "get_nilearn_info": "software_neuroscience",
+    "get_numba_info": "software_bioinformatics",
+    "get_numpy_info": "software_scientific_computing",
+    "get_oligosaccharide_descriptors_by_entity_id": "rcsb_pdb",
+    "get_openbabel_info": "software_cheminformatics",
+    "get_openchem_info": "software_cheminformatics",
+    "get_opencv_info": "software_visualization",
+    "get_openmm_info": "software_structural_biology",
+    "get_optlang_info": "software_scientific_computing",
+    "get_optuna_info": "software_machine_learning",
+    "get_palantir_info": "software_single_cell",
+    "get_pandas_info": "software_scientific_computing",
+    "get_patent_application_metadata": "uspto",
+    "get_patent_continuity_data": "uspto",
+    "get_patent_foreign_priority_data": "uspto",
+    "get_patent_overview_by_text_query": "uspto",
+    "get_patent_term_adjustment_data": "uspto",
+    "get_patsy_info": "software_scientific_computing",
+    "get_pdbfixer_info": "software_bioinformatics",
+    "get_phenotype_by_HPO_ID": "monarch",
+    "get_pillow_info": "software_image_processing",
+    "get_plantcv_info": "software_visualization",
+    "get_plip_info": "software_bioinformatics",
+    "get_plotly_info": "software_visualization",
+    "get_poliastro_info": "software_bioinformatics",
+    "get_polymer_entity_annotations": "rcsb_pdb",
+    "get_polymer_entity_count_by_pdb_id": "rcsb_pdb",
+    "get_polymer_entity_ids_by_pdb_id": "rcsb_pdb",
+    "get_polymer_entity_type_by_entity_id": "rcsb_pdb",
+    "get_polymer_molecular_weight_by_entity_id": "rcsb_pdb",
+    "get_poretools_info": "software_genomics",
+    "get_prody_info": "software_bioinformatics",
+    "get_protein_classification_by_pdb_id": "rcsb_pdb",
+    "get_protein_metadata_by_pdb_id": "rcsb_pdb",
+    "get_pubchempy_info": "software_cheminformatics",
+    "get_pybedtools_info": "software_genomics",
+    "get_pybigwig_info": "software_bioinformatics",
+    "get_pydeseq2_info": "software_genomics",
+    "get_pyensembl_info": "software_genomics",
+    "get_pyephem_info": "software_physics_astronomy",
+    "get_pyfaidx_info": "software_genomics",
+    "get_pyfasta_info": "software_genomics",
+    "get_pykalman_info": "software_bioinformatics",
+    "get_pyliftover_info": "software_genomics",
+    "get_pymassspec_info": "software_bioinformatics",
+    "get_pymed_info": "software_bioinformatics",
+    "get_pymzml_info": "software_machine_learning",
+    "get_pypdf2_info": "software_bioinformatics",
+    "get_pyranges_info": "software_genomics",
+    "get_pyrosetta_info": "software_structural_biology",
+    "get_pysam_info": "software_genomics",
+    "get_pyscenic_info": "software_single_cell",
+    "get_pyscf_info": "software_structural_biology",
+    "get_pyscreener_info": "software_bioinformatics",
+    "get_pytdc_info": "software_bioinformatics",
+    "get_python_libsbml_info": "software_machine_learning",
+    "get_pytorch_info": "software_machine_learning",
+    "get_pyvcf_info": "software_genomics",
+    "get_pyvis_info": "software_visualization",
+    "get_qutip_info": "software_physics_astronomy",
+    "get_rasterio_info": "software_earth_sciences",
+    "get_rdkit_info": "software_cheminformatics",
+    "get_refinement_resolution_by_pdb_id": "rcsb_pdb",
+    "get_release_deposit_dates_by_pdb_id": "rcsb_pdb",
+    "get_reportlab_info": "software_genomics",
+    "get_requests_info": "software_bioinformatics",
+    "get_ruptures_info": "software_bioinformatics",
+    "get_scanorama_info": "software_single_cell",
+    "get_scanpy_info": "software_single_cell",
+    "get_schnetpack_info": "software_machine_learning",
+    "get_scholarly_info": "software_bioinformatics",
+    "get_scikit_bio_info": "software_bioinformatics",
+    "get_scikit_image_info": "software_visualization",
+    "get_scikit_learn_info": "software_machine_learning",
+    "get_scipy_info": "software_scientific_computing",
+    "get_scrublet_info": "software_single_cell",
+    "get_scvelo_info": "software_single_cell",
+    "get_scvi_tools_info": "software_single_cell",
+    "get_seaborn_info": "software_visualization",
+    "get_sequence_by_pdb_id": "rcsb_pdb",
+    "get_sequence_lengths_by_pdb_id": "rcsb_pdb",
+    "get_sequence_positional_features_by_instance_id": "rcsb_pdb",
+    "get_skopt_info": "software_machine_learning",
+    "get_souporcell_info": "software_single_cell",
+    "get_source_organism_by_pdb_id": "rcsb_pdb",
+    "get_space_group_by_pdb_id": "rcsb_pdb",
+    "get_statsmodels_info": "software_machine_learning",
+    "get_structure_determination_software_by_pdb_id": "rcsb_pdb",
+    "get_structure_title_by_pdb_id": "rcsb_pdb",
+    "get_structure_validation_metrics_by_pdb_id": "rcsb_pdb",
+    "get_sunpy_info": "software_physics_astronomy",
+    "get_sympy_info": "software_scientific_computing",
+    "get_target_cofactor_info": "rcsb_pdb",
+    "get_taxonomy_by_pdb_id": "rcsb_pdb",
+    "get_tiledb_info": "software_scientific_computing",
+    "get_tiledbsoma_info": "software_single_cell",
+    "get_tool_info": "compact_mode",
+    "get_torch_geometric_info": "software_machine_learning",
+    "get_tqdm_info": "software_scientific_computing",
+    "get_trackpy_info": "software_bioinformatics",
+    "get_tskit_info": "software_bioinformatics",
+    "get_umap_learn_info": "software_machine_learning",
+    "get_uniprot_accession_by_entity_id": "rcsb_pdb",
+    "get_velocyto_info": "software_single_cell",
+    "get_viennarna_info": "software_genomics",
+    "get_webpage_text_from_url": "url",
+    "get_webpage_title": "url",
+    "get_xarray_info": "software_scientific_computing",
+    "get_xesmf_info": "software_earth_sciences",
+    "get_xgboost_info": "software_machine_learning",
+    "get_zarr_info": "software_scientific_computing",
+    "gnomad_get_gene_constraints": "gnomad",
+    "grep_tools": "compact_mode",
+    "gwas_get_association_by_id": "gwas",
+    "gwas_get_associations_for_snp": "gwas",
+    "gwas_get_associations_for_study": "gwas",
+    "gwas_get_associations_for_trait": "gwas",
+    "gwas_get_snp_by_id": "gwas",
+    "gwas_get_snps_for_gene": "gwas",
+    "gwas_get_studies_for_trait": "gwas",
+    "gwas_get_study_by_id": "gwas",
+    "gwas_get_variants_for_trait": "gwas",
+    "gwas_search_associations": "gwas",
+    "gwas_search_snps": "gwas",
+    "gwas_search_studies": "gwas",
+    "humanbase_ppi_analysis": "HumanBase",
+    "icd_search_codes": "umls",
+    "kegg_find_genes": "kegg",
+    "kegg_get_gene_info": "kegg",
+    "kegg_get_pathway_info": "kegg",
+    "kegg_list_organisms": "kegg",
+    "kegg_search_pathway": "kegg",
+    "list_tools": "compact_mode",
+    "loinc_search_codes": "umls",
+    "mcp_auto_loader_boltz": "mcp_auto_loader_boltz",
+    "mcp_auto_loader_expert_feedback": "mcp_auto_loader_expert_feedback",
+    "mcp_auto_loader_txagent": "mcp_auto_loader_txagent",
+    "mcp_auto_loader_uspto_downloader": "mcp_auto_loader_uspto_downloader",
+    "mesh_get_subjects_by_pharmacological_action": "xml",
+    "mesh_get_subjects_by_subject_id": "xml",
+    "mesh_get_subjects_by_subject_name": "xml",
+    "mesh_get_subjects_by_subject_scope_or_definition": "xml",
+    "odphp_itemlist": "odphp",
+    "odphp_myhealthfinder": "odphp",
+    "odphp_outlink_fetch": "odphp",
+    "odphp_topicsearch": "odphp",
+    "ols_find_similar_terms": "ols",
+    "ols_get_ontology_info": "ols",
+    "ols_get_term_ancestors": "ols",
+    "ols_get_term_children": "ols",
+    "ols_get_term_info": "ols",
+    "ols_search_ontologies": "ols",
+    "ols_search_terms": "ols",
+    "open_deep_research_agent": "smolagents",
+    "openalex_literature_search": "OpenAlex",
+    "python_code_executor": "python_executor",
+    "python_script_runner": "python_executor",
+    "reactome_disease_target_score": "disease_target_score",
+    "search_clinical_trials": "clinical_trials",
+    "snomed_search_concepts": "umls",
+    "umls_get_concept_details": "umls",
+    "umls_search_concepts": "umls",
+    "visualize_molecule_2d": "visualization_molecule_2d",
+    "visualize_molecule_3d": "visualization_molecule_3d",
+    "visualize_protein_structure_3d": "visualization_protein_3d",
+    "web_api_documentation_search": "web_search_tools",
+    "web_search": "web_search_tools",
+    "who_gho_get_data": "who_gho",
+    "who_gho_query_health_data": "who_gho",
+}
@@ -1,4 +1,3 @@
-import requests
 import re
 from typing import Dict, Any, List
 from .base_tool import BaseTool
@@ -58,7 +57,7 @@ class AlphaFoldRESTTool(BaseTool):
     def _make_request(self, url: str) -> Dict[str, Any]:
         """Perform a GET request and handle common errors."""
         try:
-            resp = requests.get(
+            resp = self.http_get(
                 url,
                 timeout=30,
                 headers={
@@ -81,7 +80,7 @@ class AlphaFoldRESTTool(BaseTool):
                     accession = qualifier_match.group(1)
                     base = ALPHAFOLD_BASE_URL
                     check_url = f"{base}/uniprot/summary/{accession}.json"
-                    check_resp = requests.get(check_url, timeout=10)
+                    check_resp = self.http_get(check_url, timeout=10)
                     if check_resp.status_code == 200:
                         return {
                             "error": "No MUTAGEN annotations available",
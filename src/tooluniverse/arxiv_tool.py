@@ -41,7 +41,7 @@ class ArXivTool(BaseTool):
         }
 
         try:
-            response = requests.get(self.base_url, params=params, timeout=20)
+            response = self.http_get(self.base_url, params=params, timeout=20)
         except requests.RequestException as e:
             return {
                 "error": "Network error calling arXiv API",
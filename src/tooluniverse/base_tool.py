@@ -1,4 +1,8 @@
-from .utils import extract_function_call_json, evaluate_function_call
+from .utils import (
+    extract_function_call_json,
+    evaluate_function_call,
+    coerce_value_to_type,
+)
 from .exceptions import (
     ToolError,
     ToolValidationError,
@@ -9,6 +13,12 @@ from .exceptions import (
     ToolDependencyError,
     ToolServerError,
 )
+from . import http_client
+from .cache.upstream_cache import get_upstream_cache
+from .job_scheduler import deferring
+from .pagination import PaginationSpec
+from .rate_limiter import host_of
+import copy
 import json
 from pathlib import Path
 from typing import no_type_check, Optional, Dict, Any
@@ -16,6 +26,70 @@ import hashlib
 import inspect
 
 
+def _normalize_case_upper(value):
+    return value.upper() if isinstance(value, str) else value
+
+
+def _normalize_case_lower(value):
+    return value.lower() if isinstance(value, str) else value
+
+
+def _normalize_strip(value):
+    return value.strip() if isinstance(value, str) else value
+
+
+def _normalize_sorted(value):
+    if isinstance(value, list):
+        try:
+            return sorted(value)
+        except TypeError:
+            return value
+    return value
+
+
+# Per-parameter normalizers that tool configs can reference by name in
+# ``cache_key_normalizers``. String normalizers also apply to list items.
+CACHE_KEY_NORMALIZERS = {
+    "upper": _normalize_case_upper,
+    "lower": _normalize_case_lower,
+    "strip": _normalize_strip,
+    "sorted": _normalize_sorted,
+}
+
+
+# Per-class state shared by all instances: (defaults file, stamp, defaults)
+# and the cache-version hasher primed with the class source
+_DEFAULTS_CACHE: Dict[type, tuple] = {}
+_VERSION_HASHERS: Dict[type, Any] = {}
+
+
+def _file_stamp(path) -> Optional[tuple]:
+    """Return ``(mtime_ns, size)`` of ``path``, or None if it cannot be stat'ed.
+
+    Package resources that are not plain files never change, so they get a
+    constant stamp.
+    """
+    if not hasattr(path, "stat"):
+        return ("resource",)
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def _static_class_fingerprint(cls: type) -> Optional[str]:
+    """Source digest recorded in the static registry, if ``cls`` is listed."""
+    try:
+        from ._lazy_registry_static import STATIC_CLASS_FINGERPRINTS
+    except ImportError:
+        return None
+    module = cls.__module__
+    if module.startswith("tooluniverse."):
+        module = module[len("tooluniverse.") :]
+    return STATIC_CLASS_FINGERPRINTS.get(f"{module}.{cls.__qualname__}")
+
+
 class BaseTool:
     STATIC_CACHE_VERSION = "1"
 
@@ -73,9 +147,26 @@ class BaseTool:
 
     @classmethod
     def load_defaults_from_file(cls):
-        """Load defaults from the configuration file"""
-        defaults_file = cls.get_default_config_file()
+        """Load defaults from the configuration file.
+
+        The parsed defaults are kept per class and re-read only when the
+        file's mtime or size changes.
+        """
+        cached = _DEFAULTS_CACHE.get(cls)
+        defaults_file = (
+            cached[0] if cached is not None else cls.get_default_config_file()
+        )
+        stamp = _file_stamp(defaults_file)
+        if cached is not None and stamp is not None and cached[1] == stamp:
+            return copy.deepcopy(cached[2])
+
+        defaults = cls._read_defaults_file(defaults_file)
+        _DEFAULTS_CACHE[cls] = (defaults_file, stamp, defaults)
+        return copy.deepcopy(defaults)
 
+    @classmethod
+    def _read_defaults_file(cls, defaults_file):
+        """Parse ``defaults_file`` and return this class's defaults."""
         # Handle both regular Path objects and importlib resource objects
         try:
             # Check if it's a regular Path object
@@ -161,13 +252,34 @@ class BaseTool:
         required_params = schema.get("required", [])
         return required_params
 
+    def _get_parameter_validator(self, schema: Dict[str, Any]):
+        """Return a compiled jsonschema validator for ``schema``.
+
+        The validator class is chosen from the schema's ``$schema`` (Draft 7
+        by default), ``check_schema`` runs once, and the instance is memoized
+        on the tool until ``tool_config["parameter"]`` is replaced.
+        """
+        cached = getattr(self, "_parameter_validator", None)
+        if cached is not None and cached[0] is schema:
+            return cached[1]
+
+        import jsonschema
+
+        validator_cls = jsonschema.validators.validator_for(
+            schema, default=jsonschema.Draft7Validator
+        )
+        validator_cls.check_schema(schema)
+        validator = validator_cls(schema)
+        self._parameter_validator = (schema, validator)
+        return validator
+
     def validate_parameters(self, arguments: Dict[str, Any]) -> Optional[ToolError]:
         """
         Validate parameters against tool schema.
 
         This method provides standard parameter validation using jsonschema.
-        Subclasses can override this method to implement custom validation
-        logic.
+        The compiled validator is cached per tool instance. Subclasses can
+        override this method to implement custom validation logic.
 
         Args:
             arguments: Dictionary of arguments to validate
@@ -183,6 +295,8 @@ class BaseTool:
         try:
             import jsonschema
 
+            validator = self._get_parameter_validator(schema)
+
             # Filter out internal control parameters before validation
             # Only filter known internal parameters, not all underscore-prefixed params
             # to allow optional streaming parameter _tooluniverse_stream
@@ -191,7 +305,12 @@ class BaseTool:
                 k: v for k, v in arguments.items() if k not in internal_params
             }
 
-            jsonschema.validate(filtered_arguments, schema)
+            # Same error selection as jsonschema.validate()
+            error = jsonschema.exceptions.best_match(
+                validator.iter_errors(filtered_arguments)
+            )
+            if error is not None:
+                raise error
             return None
         except jsonschema.ValidationError as e:
             return ToolValidationError(
@@ -218,6 +337,10 @@ class BaseTool:
         Returns
             Structured ToolError instance
         """
+        if isinstance(exception, ToolError):
+            # Already classified, e.g. by the shared HTTP transport
+            return exception
+
         error_str = str(exception).lower()
 
         if any(
@@ -259,12 +382,73 @@ class BaseTool:
         else:
             return ToolServerError(f"Unexpected error: {exception}")
 
+    def canonicalize_arguments(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Return the canonical form of ``arguments`` used for cache keys.
+
+        Equivalent calls map to the same arguments: schema defaults are filled
+        in, string values are coerced to the declared type, ``None`` values are
+        dropped, and the per-parameter normalizers named in the tool config's
+        ``cache_key_normalizers`` (for example ``{"gene": "upper"}``) are
+        applied. The arguments passed to ``run`` are not changed.
+
+        Args:
+            arguments: Dictionary of arguments for the tool call
+
+        Returns
+            New dictionary of canonical arguments
+        """
+        properties = (self.tool_config.get("parameter") or {}).get("properties") or {}
+        normalizers = self.tool_config.get("cache_key_normalizers") or {}
+
+        canonical: Dict[str, Any] = {}
+        for name, value in arguments.items():
+            if value is None:
+                continue
+            prop_schema = properties.get(name)
+            if isinstance(prop_schema, dict):
+                if isinstance(value, list) and isinstance(
+                    prop_schema.get("items"), dict
+                ):
+                    value = [
+                        coerce_value_to_type(item, prop_schema["items"])
+                        for item in value
+                    ]
+                else:
+                    value = coerce_value_to_type(value, prop_schema)
+            canonical[name] = value
+
+        for name, prop_schema in properties.items():
+            if (
+                name not in canonical
+                and isinstance(prop_schema, dict)
+                and prop_schema.get("default") is not None
+            ):
+                canonical[name] = prop_schema["default"]
+
+        for name, spec in normalizers.items():
+            if name not in canonical:
+                continue
+            for normalizer_name in [spec] if isinstance(spec, str) else spec:
+                normalizer = CACHE_KEY_NORMALIZERS.get(normalizer_name)
+                if normalizer is None:
+                    continue
+                value = canonical[name]
+                if isinstance(value, list) and normalizer_name != "sorted":
+                    canonical[name] = [normalizer(item) for item in value]
+                else:
+                    canonical[name] = normalizer(value)
+
+        return canonical
+
     def get_cache_key(self, arguments: Dict[str, Any]) -> str:
         """
         Generate a cache key for this tool call.
 
-        This method provides standard cache key generation. Subclasses can
-        override this method to implement custom caching logic.
+        The key is computed from :meth:`canonicalize_arguments`, so calls that
+        differ only in defaults, string-typed numbers, ``None`` values or
+        normalized identifiers share one cache entry. Subclasses can override
+        this method to implement custom caching logic.
 
         Args:
             arguments: Dictionary of arguments for the tool call
@@ -275,7 +459,7 @@ class BaseTool:
         # Include tool name and arguments in cache key
         cache_data = {
             "tool_name": self.tool_config.get("name", self.__class__.__name__),
-            "arguments": arguments,
+            "arguments": self.canonicalize_arguments(arguments),
         }
         serialized = json.dumps(cache_data, sort_keys=True)
         return hashlib.md5(serialized.encode()).hexdigest()
@@ -309,23 +493,158 @@ class BaseTool:
             return 0
         return max(0, parsed)
 
+    def prepare_batch(self, arguments_list) -> None:
+        """Hook called once before a batch runs this tool on ``arguments_list``.
+
+        Tools whose upstream supports bulk lookups can override this to load
+        the shared data for the whole batch up front. The default does
+        nothing. Errors are logged and do not stop the batch.
+        """
+        return None
+
+    def get_rate_limit(self) -> Optional[Dict[str, Any]]:
+        """Return the ``rate_limit`` block from the tool config, if any.
+
+        Keys are ``host``, ``requests_per_second``, ``burst``,
+        ``max_in_flight``, ``api_key_env`` and
+        ``requests_per_second_with_key``; see :mod:`tooluniverse.rate_limiter`.
+        """
+        rate_limit = self.tool_config.get("rate_limit")
+        return dict(rate_limit) if isinstance(rate_limit, dict) else None
+
+    def get_upstream_host(self) -> Optional[str]:
+        """Return the host this tool sends requests to, if it can be told.
+
+        Used to apply per-host rate limits and to spread batch jobs across
+        hosts. Taken from ``rate_limit.host`` or the tool's base URL.
+        """
+        rate_limit = self.get_rate_limit() or {}
+        candidates = (
+            rate_limit.get("host"),
+            getattr(self, "base_url", None),
+            getattr(self, "endpoint_url", None),
+            self.tool_config.get("base_url"),
+            self.tool_config.get("endpoint_url"),
+        )
+        for candidate in candidates:
+            if isinstance(candidate, str) and candidate:
+                host = host_of(candidate)
+                if host:
+                    return host
+        return None
+
+    def get_pagination(self, **overrides) -> Optional[PaginationSpec]:
+        """Return the tool's pagination spec, or None if it declares none.
+
+        Built from the ``pagination`` block of the tool config; ``overrides``
+        that are not None replace config values. See
+        :mod:`tooluniverse.pagination` for the keys.
+        """
+        config = self.tool_config.get("pagination")
+        if not isinstance(config, dict):
+            return None
+        return PaginationSpec.from_config(config, **overrides)
+
+    def http_request(self, method: str, url: str, **kwargs):
+        """Send an HTTP request through the shared pooled transport.
+
+        Keyword arguments are those of :func:`requests.request`. When no
+        ``timeout`` is given, the tool's ``timeout`` attribute or config entry
+        is used before the transport default. A ``hedge_requests`` config
+        entry turns hedging of idempotent requests on or off for this tool.
+        """
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = getattr(self, "timeout", None) or self.tool_config.get(
+                "timeout"
+            )
+        if "hedge" not in kwargs and "hedge_requests" in self.tool_config:
+            kwargs["hedge"] = bool(self.tool_config["hedge_requests"])
+        return http_client.request(method, url, **kwargs)
+
+    def http_get(self, url: str, **kwargs):
+        """Shortcut for :meth:`http_request` with ``GET``."""
+        return self.http_request("GET", url, **kwargs)
+
+    def http_post(self, url: str, **kwargs):
+        """Shortcut for :meth:`http_request` with ``POST``."""
+        return self.http_request("POST", url, **kwargs)
+
+    def get_upstream_cache_policy(self) -> Dict[str, Any]:
+        """Return this tool's upstream cache settings from its config.
+
+        ``upstream_cache_ttl`` overrides the cache's TTL (``0`` bypasses the
+        cache) and ``upstream_revalidate: false`` refetches expired documents
+        instead of revalidating them with conditional requests.
+        """
+        return {
+            "ttl": self.tool_config.get("upstream_cache_ttl"),
+            "revalidate": self.tool_config.get("upstream_revalidate"),
+        }
+
+    def http_get_json(self, url: str, *, params=None, **kwargs):
+        """GET ``url`` and return its JSON body through the upstream cache.
+
+        Tools that read the same upstream document (keyed by canonical URL)
+        share one fetch and one parsed copy; see
+        :mod:`tooluniverse.cache.upstream_cache`. The returned document is
+        shared and must not be modified. The tool's
+        :meth:`get_upstream_cache_policy` applies. Non-2xx responses raise
+        :class:`requests.HTTPError`.
+        """
+        return get_upstream_cache().get_json(
+            url,
+            params=params,
+            get=self.http_get,
+            **self.get_upstream_cache_policy(),
+            **kwargs,
+        )
+
+    def defer(self, future):
+        """Return ``future`` from :meth:`run` when the caller can wait on it.
+
+        ToolUniverse's parallel batches accept a future for a tool's result
+        and release the worker thread until it completes (see
+        :meth:`JobHandle.then <tooluniverse.job_scheduler.JobHandle.then>`).
+        Any other caller gets the finished value, as if ``run`` had blocked.
+        """
+        if deferring(self):
+            return future
+        return future.result()
+
     def get_cache_namespace(self) -> str:
         """Return cache namespace identifier for this tool."""
         return self.tool_config.get("name", self.__class__.__name__)
 
+    @classmethod
+    def _version_hasher(cls):
+        """Return a sha256 primed with this class's version and source.
+
+        Built-in tools use the source digest recorded in the static registry
+        (kept in sync by the test suite), so no source is read at runtime.
+        Other classes hash their source, read once per class; instances copy
+        the primed hasher.
+        """
+        hasher = _VERSION_HASHERS.get(cls)
+        if hasher is None:
+            hasher = hashlib.sha256()
+            hasher.update(cls.STATIC_CACHE_VERSION.encode("utf-8"))
+            fingerprint = _static_class_fingerprint(cls)
+            if fingerprint:
+                hasher.update(fingerprint.encode("utf-8"))
+            else:
+                try:
+                    hasher.update(inspect.getsource(cls).encode("utf-8"))
+                except (OSError, TypeError):
+                    pass
+            _VERSION_HASHERS[cls] = hasher
+        return hasher.copy()
+
     def get_cache_version(self) -> str:
         """Return a stable cache version fingerprint for this tool."""
         if self._cached_version_hash:
             return self._cached_version_hash
 
-        hasher = hashlib.sha256()
-        hasher.update(self.STATIC_CACHE_VERSION.encode("utf-8"))
-
-        try:
-            source = inspect.getsource(self.__class__)
-            hasher.update(source.encode("utf-8"))
-        except (OSError, TypeError):
-            pass
+        hasher = self._version_hasher()
 
         try:
             schema = json.dumps(self.tool_config.get("parameter", {}), sort_keys=True)
@@ -341,6 +660,22 @@ class BaseTool:
         ttl = self.tool_config.get("cache_ttl")
         return int(ttl) if ttl is not None else None
 
+    def get_cache_stale_ttl(self) -> Optional[int]:
+        """Return seconds an expired result may still be served while it is
+        refreshed in the background; None disables stale-while-revalidate."""
+        stale_ttl = self.tool_config.get("stale_ttl")
+        return int(stale_ttl) if stale_ttl else None
+
+    def get_error_cache_ttl(self, error: ToolError) -> Optional[int]:
+        """Return TTL (seconds) for caching a classified error result.
+
+        Negative caching is off unless the tool config sets
+        ``error_cache_ttl``. Subclasses can override this to cache only some
+        error types.
+        """
+        ttl = self.tool_config.get("error_cache_ttl")
+        return int(ttl) if ttl else None
+
     def get_tool_info(self) -> Dict[str, Any]:
         """
         Get comprehensive information about this tool.
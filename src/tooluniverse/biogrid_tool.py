@@ -90,7 +90,7 @@ class BioGRIDRESTTool(BaseTool):
     def _make_request(self, url: str, params: Dict[str, Any]) -> Dict[str, Any]:
         """Perform a GET request and handle common errors."""
         try:
-            response = requests.get(url, params=params, timeout=30)
+            response = self.http_get(url, params=params, timeout=30)
             response.raise_for_status()
 
             if self.output_format == "JSON":
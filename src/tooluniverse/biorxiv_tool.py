@@ -45,7 +45,7 @@ class BioRxivTool(BaseTool):
         )
 
         try:
-            resp = requests.get(url, timeout=20)
+            resp = self.http_get(url, timeout=20)
             resp.raise_for_status()
             data = resp.json()
         except requests.RequestException as e:
@@ -1,69 +1,183 @@
 """
 In-memory cache utilities for ToolUniverse.
 
-Provides a lightweight, thread-safe LRU cache with optional singleflight
-deduplication for expensive misses.
+Provides a lightweight, thread-safe LRU cache with optional byte budgeting and
+singleflight deduplication for expensive misses.
 """
 
 from __future__ import annotations
 
+import sys
 import threading
 import time
 from collections import OrderedDict
 from contextlib import contextmanager
-from typing import Any, Dict, Iterator, Optional, Tuple
+from typing import Any, Dict, Iterator, NamedTuple, Optional, Tuple
+
+
+def estimate_size(value: Any, _max_nodes: int = 1_000_000) -> int:
+    """Approximate the in-memory footprint of ``value`` in bytes.
+
+    Walks JSON-like containers (dict/list/tuple/set) and sums
+    ``sys.getsizeof`` of every reachable object once. The walk is bounded to
+    ``_max_nodes`` objects so pathological payloads cannot stall an insert.
+    """
+    seen = set()
+    stack = [value]
+    total = 0
+    nodes = 0
+    while stack and nodes < _max_nodes:
+        obj = stack.pop()
+        obj_id = id(obj)
+        if obj_id in seen:
+            continue
+        seen.add(obj_id)
+        nodes += 1
+        try:
+            total += sys.getsizeof(obj)
+        except TypeError:
+            continue
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
+    return total
 
 
-class LRUCache:
-    """Thread-safe LRU cache with basic telemetry."""
+class _Slot(NamedTuple):
+    value: Any
+    timestamp: float
+    size: int
+    namespace: Optional[str]
+
 
-    def __init__(self, max_size: int = 128):
-        self.max_size = max(1, int(max_size))
-        self._data: "OrderedDict[str, Tuple[Any, float]]" = OrderedDict()
+class LRUCache:
+    """Thread-safe LRU cache with basic telemetry.
+
+    The cache is bounded by entry count (``max_size``), by an approximate byte
+    budget (``max_bytes``), or both. When a byte budget or per-entry limit is
+    configured, each value's size is estimated once at insert; values larger
+    than ``max_entry_bytes`` are not admitted.
+    """
+
+    def __init__(
+        self,
+        max_size: Optional[int] = 128,
+        *,
+        max_bytes: Optional[int] = None,
+        max_entry_bytes: Optional[int] = None,
+    ):
+        self.max_size = max(1, int(max_size)) if max_size is not None else None
+        self.max_bytes = max(1, int(max_bytes)) if max_bytes else None
+        self.max_entry_bytes = int(max_entry_bytes) if max_entry_bytes else None
+        self.track_bytes = (
+            self.max_bytes is not None or self.max_entry_bytes is not None
+        )
+        self._data: "OrderedDict[str, _Slot]" = OrderedDict()
         self._lock = threading.RLock()
         self.hits = 0
         self.misses = 0
+        self.evictions = 0
+        self.rejected = 0
+        self.current_bytes = 0
+        self._namespace_bytes: Dict[str, int] = {}
 
     def get(self, key: str) -> Optional[Any]:
         with self._lock:
-            if key not in self._data:
+            slot = self._data.get(key)
+            if slot is None:
                 self.misses += 1
                 return None
 
-            value, timestamp = self._data.pop(key)
-            self._data[key] = (value, timestamp)
+            self._data.move_to_end(key)
             self.hits += 1
-            return value
-
-    def set(self, key: str, value: Any):
+            return slot.value
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        *,
+        size: Optional[int] = None,
+        namespace: Optional[str] = None,
+    ) -> bool:
+        """Insert ``value``; returns False when it is too large to admit."""
+        if self.track_bytes and size is None:
+            size = estimate_size(value)
+        size = size or 0
         with self._lock:
-            if key in self._data:
-                self._data.pop(key)
-            self._data[key] = (value, time.time())
+            self._remove(key)
+            if self.max_entry_bytes is not None and size > self.max_entry_bytes:
+                self.rejected += 1
+                return False
+            if self.max_bytes is not None and size > self.max_bytes:
+                self.rejected += 1
+                return False
+            self._data[key] = _Slot(value, time.time(), size, namespace)
+            self._account(namespace, size)
             self._evict_if_needed()
+            return True
 
     def delete(self, key: str):
         with self._lock:
-            self._data.pop(key, None)
+            self._remove(key)
 
     def clear(self):
         with self._lock:
             self._data.clear()
+            self._namespace_bytes.clear()
+            self.current_bytes = 0
             self.hits = 0
             self.misses = 0
+            self.evictions = 0
+            self.rejected = 0
+
+    def _remove(self, key: str) -> None:
+        slot = self._data.pop(key, None)
+        if slot is not None:
+            self._account(slot.namespace, -slot.size)
+
+    def _account(self, namespace: Optional[str], delta: int) -> None:
+        if not delta:
+            return
+        self.current_bytes += delta
+        if namespace is not None:
+            remaining = self._namespace_bytes.get(namespace, 0) + delta
+            if remaining > 0:
+                self._namespace_bytes[namespace] = remaining
+            else:
+                self._namespace_bytes.pop(namespace, None)
 
     def _evict_if_needed(self):
-        while len(self._data) > self.max_size:
-            self._data.popitem(last=False)
+        while self._data and (
+            (self.max_size is not None and len(self._data) > self.max_size)
+            or (self.max_bytes is not None and self.current_bytes > self.max_bytes)
+        ):
+            _, slot = self._data.popitem(last=False)
+            self._account(slot.namespace, -slot.size)
+            self.evictions += 1
 
     def stats(self) -> Dict[str, Any]:
         with self._lock:
-            return {
+            stats = {
                 "max_size": self.max_size,
                 "current_size": len(self._data),
                 "hits": self.hits,
                 "misses": self.misses,
+                "evictions": self.evictions,
             }
+            if self.track_bytes:
+                stats.update(
+                    {
+                        "max_bytes": self.max_bytes,
+                        "max_entry_bytes": self.max_entry_bytes,
+                        "current_bytes": self.current_bytes,
+                        "rejected": self.rejected,
+                        "namespace_bytes": dict(self._namespace_bytes),
+                    }
+                )
+            return stats
 
     def __len__(self) -> int:
         with self._lock:
@@ -71,8 +185,8 @@ class LRUCache:
 
     def items(self) -> Iterator[Tuple[str, Any]]:
         with self._lock:
-            for key, (value, _) in list(self._data.items()):
-                yield key, value
+            for key, slot in list(self._data.items()):
+                yield key, slot.value
 
 
 class SingleFlight:
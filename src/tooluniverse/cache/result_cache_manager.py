@@ -8,13 +8,28 @@ import atexit
 import logging
 import os
 import queue
+import socket
 import threading
 import time
+import uuid
 import weakref
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import Any, Dict, Iterator, Optional, Sequence
-
-from .memory_cache import LRUCache, SingleFlight
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
+
+from .memory_cache import LRUCache, SingleFlight, estimate_size
+from .serialization import DEFAULT_COMPRESS_MIN_BYTES
 from .sqlite_backend import CacheEntry, PersistentCache
 
 logger = logging.getLogger(__name__)
@@ -36,12 +51,49 @@ def _cleanup_all_cache_managers():
 atexit.register(_cleanup_all_cache_managers)
 
 
+def _parse_namespace_budgets(spec: str) -> Dict[str, int]:
+    """Parse ``"ToolA=1000000,ToolB=50000"`` into a namespace->bytes mapping."""
+    budgets: Dict[str, int] = {}
+    for item in spec.split(","):
+        name, sep, limit = item.strip().rpartition("=")
+        if not sep or not name:
+            continue
+        try:
+            budgets[name.strip()] = int(limit)
+        except ValueError:
+            logger.warning("Ignoring invalid namespace cache budget: %s", item)
+    return budgets
+
+
 @dataclass
 class CacheRecord:
     value: Any
     expires_at: Optional[float]
     namespace: str
     version: str
+    # End of the fresh window; between fresh_until and expires_at the value
+    # may only be served stale (stale-while-revalidate).
+    fresh_until: Optional[float] = None
+
+    def is_stale(self, now: float) -> bool:
+        return self.fresh_until is not None and self.fresh_until <= now
+
+    @classmethod
+    def from_entry(
+        cls, entry: CacheEntry, namespace: str, version: str
+    ) -> "CacheRecord":
+        # Use expires_at from entry (stored in database) or calculate from ttl
+        expires_at = entry.expires_at
+        fresh_until = entry.created_at + entry.ttl if entry.ttl else None
+        if expires_at is None:
+            expires_at = fresh_until
+        return cls(
+            value=entry.value,
+            expires_at=expires_at,
+            namespace=namespace,
+            version=version,
+            fresh_until=fresh_until,
+        )
 
 
 class ResultCacheManager:
@@ -50,7 +102,9 @@ class ResultCacheManager:
     def __init__(
         self,
         *,
-        memory_size: int = 256,
+        memory_size: Optional[int] = 256,
+        memory_max_bytes: Optional[int] = None,
+        memory_max_entry_bytes: Optional[int] = None,
         persistent_path: Optional[str] = None,
         enabled: bool = True,
         persistence_enabled: bool = True,
@@ -58,11 +112,21 @@ class ResultCacheManager:
         default_ttl: Optional[int] = None,
         async_persist: Optional[bool] = None,
         async_queue_size: int = 10000,
+        async_batch_size: Optional[int] = None,
+        async_max_latency: Optional[float] = None,
+        persistent_max_bytes: Optional[int] = None,
+        persistent_namespace_max_bytes: Optional[Dict[str, int]] = None,
+        cross_process: Optional[bool] = None,
+        lease_ttl: Optional[float] = None,
     ):
         self.enabled = enabled
         self.default_ttl = default_ttl
 
-        self.memory = LRUCache(max_size=memory_size)
+        self.memory = LRUCache(
+            max_size=memory_size,
+            max_bytes=memory_max_bytes,
+            max_entry_bytes=memory_max_entry_bytes,
+        )
         persistence_path = persistent_path
         if persistence_path is None:
             cache_dir = os.environ.get("TOOLUNIVERSE_CACHE_DIR")
@@ -70,14 +134,42 @@ class ResultCacheManager:
                 persistence_path = os.path.join(cache_dir, "tooluniverse_cache.sqlite")
         self.persistent = None
         if persistence_enabled and persistence_path:
+            compress_env = os.getenv("TOOLUNIVERSE_CACHE_COMPRESS_MIN_BYTES")
+            compress_min_bytes = (
+                int(compress_env) if compress_env else DEFAULT_COMPRESS_MIN_BYTES
+            )
+            if persistent_max_bytes is None:
+                max_bytes_env = os.getenv("TOOLUNIVERSE_CACHE_MAX_BYTES")
+                persistent_max_bytes = int(max_bytes_env) if max_bytes_env else None
+            if persistent_namespace_max_bytes is None:
+                persistent_namespace_max_bytes = _parse_namespace_budgets(
+                    os.getenv("TOOLUNIVERSE_CACHE_NAMESPACE_MAX_BYTES", "")
+                )
             try:
-                self.persistent = PersistentCache(persistence_path, enable=True)
+                self.persistent = PersistentCache(
+                    persistence_path,
+                    enable=True,
+                    compress_min_bytes=(
+                        compress_min_bytes if compress_min_bytes > 0 else None
+                    ),
+                    max_bytes=persistent_max_bytes,
+                    namespace_max_bytes=persistent_namespace_max_bytes,
+                )
             except Exception as exc:
                 logger.warning("Failed to initialize persistent cache: %s", exc)
                 self.persistent = None
 
         self.singleflight = SingleFlight() if singleflight else None
-        self._init_async_persistence(async_persist, async_queue_size)
+        self._init_cross_process(cross_process, lease_ttl)
+        self._refresh_lock = threading.Lock()
+        self._refreshing: Set[str] = set()
+        self._refresh_executor: Optional[ThreadPoolExecutor] = None
+        self._refresh_workers = max(
+            1, int(os.getenv("TOOLUNIVERSE_CACHE_REFRESH_WORKERS", "4"))
+        )
+        self._init_async_persistence(
+            async_persist, async_queue_size, async_batch_size, async_max_latency
+        )
 
         # Register this instance for cleanup on exit
         _active_cache_managers.add(self)
@@ -95,9 +187,40 @@ class ResultCacheManager:
     def _ttl_or_default(self, ttl: Optional[int]) -> Optional[int]:
         return ttl if ttl is not None else self.default_ttl
 
+    def _memory_set(self, composed: str, record: CacheRecord) -> bool:
+        # Size the payload itself, not the CacheRecord wrapper
+        size = estimate_size(record.value) if self.memory.track_bytes else None
+        return self.memory.set(composed, record, size=size, namespace=record.namespace)
+
     def _init_async_persistence(
-        self, async_persist: Optional[bool], async_queue_size: int
+        self,
+        async_persist: Optional[bool],
+        async_queue_size: int,
+        async_batch_size: Optional[int] = None,
+        async_max_latency: Optional[float] = None,
     ) -> None:
+        if async_batch_size is None:
+            async_batch_size = int(
+                os.getenv("TOOLUNIVERSE_CACHE_ASYNC_BATCH_SIZE", "256")
+            )
+        if async_max_latency is None:
+            async_max_latency = float(
+                os.getenv("TOOLUNIVERSE_CACHE_ASYNC_MAX_LATENCY", "0.05")
+            )
+        # Upper bound on entries committed per SQLite transaction
+        self.async_batch_size = max(1, int(async_batch_size))
+        # Seconds the writer waits for more entries before committing a batch
+        self.async_max_latency = max(0.0, float(async_max_latency))
+        self._writer_stats_lock = threading.Lock()
+        self._writer_stats: Dict[str, Any] = {
+            "batches_committed": 0,
+            "entries_written": 0,
+            "last_batch_size": 0,
+            "total_commit_seconds": 0.0,
+            "max_commit_seconds": 0.0,
+            "max_queue_depth": 0,
+        }
+
         if async_persist is None:
             async_persist = os.getenv(
                 "TOOLUNIVERSE_CACHE_ASYNC_PERSIST", "true"
@@ -124,48 +247,82 @@ class ResultCacheManager:
         )
         self._worker_thread.start()
 
+    def _init_cross_process(
+        self, cross_process: Optional[bool], lease_ttl: Optional[float]
+    ) -> None:
+        if cross_process is None:
+            cross_process = os.getenv(
+                "TOOLUNIVERSE_CACHE_CROSS_PROCESS", "false"
+            ).lower() in ("true", "1", "yes")
+        if lease_ttl is None:
+            lease_ttl = float(os.getenv("TOOLUNIVERSE_CACHE_LEASE_TTL", "60"))
+        # Leases live in the shared SQLite file, so they need persistence
+        self.cross_process = bool(cross_process) and self.persistent is not None
+        # Upper bound on how long a fetch may hold a key (and how long other
+        # processes wait) before the lease is considered abandoned
+        self.lease_ttl = max(1.0, float(lease_ttl))
+        self._lease_owner_prefix = (
+            f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        )
+        self._lease_stats = {"acquired": 0, "waited": 0, "timeouts": 0}
+
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
     def get(self, *, namespace: str, version: str, cache_key: str) -> Optional[Any]:
+        value, _stale = self.lookup(
+            namespace=namespace, version=version, cache_key=cache_key
+        )
+        return value
+
+    def lookup(
+        self,
+        *,
+        namespace: str,
+        version: str,
+        cache_key: str,
+        allow_stale: bool = False,
+    ) -> Tuple[Optional[Any], bool]:
+        """Return ``(value, is_stale)`` for a cache entry.
+
+        Stale values (past their TTL but inside the ``stale_ttl`` grace window)
+        are only returned when ``allow_stale`` is True; otherwise they count as
+        a miss. Misses return ``(None, False)``.
+        """
         if not self.enabled:
-            return None
+            return None, False
 
         composed = self.compose_key(namespace, version, cache_key)
+        now = self._now()
         record = self.memory.get(composed)
         if record:
-            if record.expires_at and record.expires_at <= self._now():
+            if record.expires_at and record.expires_at <= now:
                 self.memory.delete(composed)
             else:
-                return record.value
+                stale = record.is_stale(now)
+                if stale and not allow_stale:
+                    return None, False
+                return record.value, stale
 
         entry = self._get_from_persistent(composed)
         if entry:
-            # Use expires_at from entry (stored in database) or calculate from ttl
-            expires_at = entry.expires_at
-            if expires_at is None and entry.ttl:
-                expires_at = entry.created_at + entry.ttl
+            record = CacheRecord.from_entry(entry, namespace, version)
             # Check if entry has expired before returning
-            if expires_at and expires_at <= self._now():
+            if record.expires_at and record.expires_at <= now:
                 # Entry has expired, delete from persistent cache and return None
                 if self.persistent:
                     try:
                         self.persistent.delete(composed)
                     except Exception:
                         pass
-                return None
+                return None, False
             # Entry is still valid, restore to memory cache and return
-            self.memory.set(
-                composed,
-                CacheRecord(
-                    value=entry.value,
-                    expires_at=expires_at,
-                    namespace=namespace,
-                    version=version,
-                ),
-            )
-            return entry.value
-        return None
+            self._memory_set(composed, record)
+            stale = record.is_stale(now)
+            if stale and not allow_stale:
+                return None, False
+            return entry.value, stale
+        return None, False
 
     def set(
         self,
@@ -175,28 +332,46 @@ class ResultCacheManager:
         cache_key: str,
         value: Any,
         ttl: Optional[int] = None,
+        stale_ttl: Optional[int] = None,
+        persist: bool = True,
+        arguments: Optional[Dict[str, Any]] = None,
     ):
+        """Store a value.
+
+        Args:
+            ttl: Seconds the value is fresh (falls back to ``default_ttl``).
+            stale_ttl: Extra seconds after ``ttl`` during which the value may
+                still be served stale while it is refreshed.
+            persist: Set False to keep the entry in memory only (used for
+                short-lived negative cache entries).
+            arguments: Call arguments that produced ``value``; persisted so
+                hot entries can be prefetched before they expire.
+        """
         if not self.enabled:
             return
 
         effective_ttl = self._ttl_or_default(ttl)
-        expires_at = self._now() + effective_ttl if effective_ttl else None
+        now = self._now()
+        fresh_until = now + effective_ttl if effective_ttl else None
+        expires_at = fresh_until
+        if fresh_until is not None and stale_ttl:
+            expires_at = fresh_until + stale_ttl
         composed = self.compose_key(namespace, version, cache_key)
 
-        self.memory.set(
+        self._memory_set(
             composed,
             CacheRecord(
                 value=value,
                 expires_at=expires_at,
                 namespace=namespace,
                 version=version,
+                fresh_until=fresh_until,
             ),
         )
 
-        if self.persistent:
+        if self.persistent and persist:
             # Calculate expires_at and created_at here to ensure consistency
             # between memory and persistent cache
-            now = self._now()
             payload = {
                 "composed": composed,
                 "value": value,
@@ -205,10 +380,50 @@ class ResultCacheManager:
                 "ttl": effective_ttl,
                 "created_at": now,
                 "expires_at": expires_at,
+                "arguments": arguments,
             }
             if not self._schedule_persist("set", payload):
                 self._perform_persist_set(**payload)
 
+    def schedule_refresh(self, composed_key: str, refresh: Callable[[], Any]) -> bool:
+        """Run ``refresh`` in the background unless one is already in flight.
+
+        The callable runs under the singleflight guard for ``composed_key`` so
+        foreground misses for the same key wait for it instead of issuing a
+        duplicate upstream call.
+
+        Returns
+            True if a refresh was scheduled, False if one is already running.
+        """
+        with self._refresh_lock:
+            if composed_key in self._refreshing:
+                return False
+            if self._refresh_executor is None:
+                self._refresh_executor = ThreadPoolExecutor(
+                    max_workers=self._refresh_workers,
+                    thread_name_prefix="ResultCacheRefresh",
+                )
+            self._refreshing.add(composed_key)
+
+        def _run():
+            try:
+                with self.singleflight_guard(composed_key):
+                    refresh()
+            except Exception as exc:
+                logger.warning("Background cache refresh failed: %s", exc)
+            finally:
+                with self._refresh_lock:
+                    self._refreshing.discard(composed_key)
+
+        try:
+            self._refresh_executor.submit(_run)
+        except RuntimeError:
+            # Executor already shut down (manager closing)
+            with self._refresh_lock:
+                self._refreshing.discard(composed_key)
+            return False
+        return True
+
     def delete(self, *, namespace: str, version: str, cache_key: str):
         composed = self.compose_key(namespace, version, cache_key)
         self.memory.delete(composed)
@@ -252,21 +467,94 @@ class ResultCacheManager:
             return {}
 
         hits: Dict[str, Any] = {}
+        pending: Dict[str, Dict[str, str]] = {}
+        now = self._now()
         for request in requests:
             namespace = request["namespace"]
             version = request["version"]
-            cache_key = request["cache_key"]
-            value = self.get(
-                namespace=namespace,
-                version=version,
-                cache_key=cache_key,
+            composed = self.compose_key(namespace, version, request["cache_key"])
+            if composed in hits or composed in pending:
+                continue
+            record = self.memory.get(composed)
+            if record:
+                if record.expires_at and record.expires_at <= now:
+                    self.memory.delete(composed)
+                elif record.is_stale(now):
+                    # Leave stale entries to run_one_function's revalidation
+                    continue
+                else:
+                    hits[composed] = record.value
+                    continue
+            pending[composed] = request
+
+        if not pending:
+            return hits
+
+        # One IN (...) query for everything the memory tier could not answer
+        entries = self._get_many_from_persistent(list(pending))
+        for composed, entry in entries.items():
+            request = pending[composed]
+            record = CacheRecord.from_entry(
+                entry, request["namespace"], request["version"]
             )
-            if value is not None:
-                composed = self.compose_key(namespace, version, cache_key)
-                hits[composed] = value
+            if record.expires_at and record.expires_at <= now:
+                continue
+            self._memory_set(composed, record)
+            if entry.value is not None and not record.is_stale(now):
+                hits[composed] = entry.value
 
         return hits
 
+    def warm(self, top_n: int, namespace: Optional[str] = None) -> int:
+        """Preload the ``top_n`` most-hit persistent entries into memory.
+
+        Uses a single query ordered by ``hit_count``/``last_accessed`` instead
+        of refilling the memory tier one miss at a time.
+
+        Returns
+            Number of entries loaded.
+        """
+        if not self.enabled or not self.persistent:
+            return 0
+        self.flush()
+        try:
+            entries = self.persistent.hottest(top_n, namespace=namespace)
+        except Exception as exc:
+            logger.warning("Persistent cache warm-up failed: %s", exc)
+            return 0
+        loaded = 0
+        # Insert coldest first so the hottest end up most-recently-used
+        for entry in reversed(entries):
+            if self._memory_set(
+                entry.key,
+                CacheRecord.from_entry(entry, entry.namespace, entry.version),
+            ):
+                loaded += 1
+        return loaded
+
+    def expiring_entries(self, within: float, limit: int) -> List[Dict[str, Any]]:
+        """Hot persistent entries whose TTL ends within ``within`` seconds."""
+        if not self.persistent:
+            return []
+        self.flush()
+        try:
+            return self.persistent.expiring(within, limit)
+        except Exception as exc:
+            logger.warning("Persistent cache expiry scan failed: %s", exc)
+            return []
+
+    def compact(self) -> Dict[str, int]:
+        """Enforce persistent disk budgets now instead of waiting for the
+        background compaction task."""
+        if not self.persistent:
+            return {"evicted_entries": 0, "evicted_bytes": 0}
+        self.flush()
+        try:
+            return self.persistent.compact()
+        except Exception as exc:
+            logger.warning("Persistent cache compaction failed: %s", exc)
+            return {"evicted_entries": 0, "evicted_bytes": 0}
+
     def stats(self) -> Dict[str, Any]:
         return {
             "enabled": self.enabled,
@@ -280,8 +568,38 @@ class ResultCacheManager:
                 if self.async_persist and self._persist_queue is not None
                 else 0
             ),
+            "async_writer": self._writer_stats_snapshot(),
+            "cross_process": (
+                {"lease_ttl": self.lease_ttl, **self._lease_stats}
+                if self.cross_process
+                else {"enabled": False}
+            ),
         }
 
+    def _writer_stats_snapshot(self) -> Dict[str, Any]:
+        with self._writer_stats_lock:
+            stats = dict(self._writer_stats)
+        batches = stats.pop("batches_committed")
+        total_seconds = stats.pop("total_commit_seconds")
+        max_seconds = stats.pop("max_commit_seconds")
+        stats.update(
+            {
+                "queue_depth": (
+                    self._persist_queue.qsize()
+                    if self._persist_queue is not None
+                    else 0
+                ),
+                "max_batch_size": self.async_batch_size,
+                "max_latency": self.async_max_latency,
+                "batches_committed": batches,
+                "avg_commit_latency_ms": (
+                    (total_seconds / batches) * 1000.0 if batches else 0.0
+                ),
+                "max_commit_latency_ms": max_seconds * 1000.0,
+            }
+        )
+        return stats
+
     def dump(self, namespace: Optional[str] = None) -> Iterator[Dict[str, Any]]:
         if not self.persistent:
             return iter([])
@@ -310,6 +628,18 @@ class ResultCacheManager:
             self.persistent = None
             return None
 
+    def _get_many_from_persistent(
+        self, composed_keys: Sequence[str]
+    ) -> Dict[str, CacheEntry]:
+        if not self.persistent:
+            return {}
+        try:
+            return self.persistent.get_many(composed_keys)
+        except Exception as exc:
+            logger.warning("Persistent cache bulk read failed: %s", exc)
+            self.persistent = None
+            return {}
+
     def _iter_persistent(self, namespace: Optional[str]):
         if not self.persistent:
             return iter([])
@@ -323,12 +653,74 @@ class ResultCacheManager:
     # Context manager for singleflight
     # ------------------------------------------------------------------
     def singleflight_guard(self, composed_key: str):
+        if self.cross_process and self.persistent:
+            return self._cross_process_guard(composed_key)
         if self.singleflight:
             return self.singleflight.acquire(composed_key)
         return _DummyContext()
 
+    @contextmanager
+    def _cross_process_guard(self, composed_key: str):
+        """Singleflight across processes sharing the SQLite file.
+
+        Threads in this process first serialize on the in-process lock; the
+        winner then claims a lease row in SQLite. Other processes poll until
+        the lease holder has published a fresh value, the lease is released,
+        or ``lease_ttl`` passes (a crashed holder's lease simply expires).
+        """
+        local_guard = (
+            self.singleflight.acquire(composed_key)
+            if self.singleflight
+            else _DummyContext()
+        )
+        with local_guard:
+            owner = f"{self._lease_owner_prefix}:{threading.get_ident()}"
+            acquired = self._wait_for_lease(composed_key, owner)
+            try:
+                yield
+            finally:
+                if acquired:
+                    # Publish pending writes before letting waiters re-read
+                    self.flush()
+                    try:
+                        self.persistent.release_lease(composed_key, owner)
+                    except Exception as exc:
+                        logger.warning("Cache lease release failed: %s", exc)
+
+    def _wait_for_lease(self, composed_key: str, owner: str) -> bool:
+        deadline = time.monotonic() + self.lease_ttl
+        delay = 0.05
+        waited = False
+        while True:
+            persistent = self.persistent
+            if persistent is None:
+                return False
+            try:
+                if persistent.try_acquire_lease(composed_key, owner, self.lease_ttl):
+                    self._lease_stats["acquired"] += 1
+                    return True
+                if persistent.has_fresh(composed_key):
+                    # Another process fetched it; caller re-reads the cache
+                    return False
+            except Exception as exc:
+                logger.warning("Cross-process cache lease failed: %s", exc)
+                return False
+            if not waited:
+                waited = True
+                self._lease_stats["waited"] += 1
+            if time.monotonic() >= deadline:
+                self._lease_stats["timeouts"] += 1
+                return False
+            time.sleep(delay)
+            delay = min(delay * 2, 0.5)
+
     def close(self):
         """Close the cache manager and cleanup resources."""
+        executor = getattr(self, "_refresh_executor", None)
+        if executor is not None:
+            # Do not block shutdown on slow upstream refreshes
+            executor.shutdown(wait=False, cancel_futures=True)
+            self._refresh_executor = None
         self.flush()
         self._shutdown_async_worker()
         if self.persistent:
@@ -375,54 +767,119 @@ class ResultCacheManager:
             return False
         try:
             self._persist_queue.put_nowait((op, payload))
-            return True
         except queue.Full:
             logger.warning(
                 "Async cache queue full; falling back to synchronous persistence"
             )
             return False
+        depth = self._persist_queue.qsize()
+        with self._writer_stats_lock:
+            if depth > self._writer_stats["max_queue_depth"]:
+                self._writer_stats["max_queue_depth"] = depth
+        return True
 
     def _async_worker(self):
         queue_ref = self._persist_queue
         if queue_ref is None:
             return
 
-        # Use longer timeout to reduce CPU wakeups, but Event can wake immediately
-        # Event.wait() can be interrupted immediately by setting the event
-        TIMEOUT = 1.0  # Check every second, but Event can wake immediately
-
-        while True:
-            # Wait for shutdown event or timeout
-            # If shutdown is set, wait() returns immediately (True)
-            # Otherwise, wait up to TIMEOUT seconds
-            if self._shutdown_event.wait(timeout=TIMEOUT):
-                # Shutdown was signaled
-                break
+        # Idle wake-up interval used only to notice shutdown when the stop
+        # sentinel could not be enqueued (queue full). A blocking get() returns
+        # as soon as work or the sentinel arrives.
+        IDLE_POLL = 0.5
 
-            # Timeout occurred - check queue for work
-            # Use non-blocking get to avoid blocking when shutdown is signaled
+        while not self._shutdown_event.is_set():
             try:
-                op, payload = queue_ref.get_nowait()
+                first = queue_ref.get(timeout=IDLE_POLL)
             except queue.Empty:
-                # No work available, continue loop to check shutdown again
                 continue
 
+            batch, stop = self._collect_batch(queue_ref, first)
+            if batch:
+                self._commit_batch(queue_ref, batch)
+            if stop:
+                break
+
+    def _collect_batch(self, queue_ref: "queue.Queue", first) -> tuple:
+        """Drain up to ``async_batch_size`` queued operations.
+
+        Waits at most ``async_max_latency`` seconds (measured from the first
+        item) for further entries; already-queued entries are drained without
+        waiting. Returns ``(batch, stop_requested)``.
+        """
+        batch = []
+        deadline = time.monotonic() + self.async_max_latency
+        item = first
+        while True:
+            op, _payload = item
             if op == "__STOP__":
                 queue_ref.task_done()
-                break
+                return batch, True
+            batch.append(item)
+            if len(batch) >= self.async_batch_size:
+                return batch, False
 
+            remaining = deadline - time.monotonic()
             try:
-                if op == "set":
-                    self._perform_persist_set(**payload)
+                if remaining <= 0 or self._shutdown_event.is_set():
+                    item = queue_ref.get_nowait()
                 else:
-                    logger.warning("Unknown async cache operation: %s", op)
-            except Exception as exc:
-                logger.warning("Async cache write failed: %s", exc)
-                # Disable async persistence to avoid repeated failures
-                self.async_persist = False
-            finally:
+                    item = queue_ref.get(timeout=remaining)
+            except queue.Empty:
+                return batch, False
+
+    def _commit_batch(self, queue_ref: "queue.Queue", batch) -> None:
+        payloads = []
+        for op, payload in batch:
+            if op == "set":
+                payloads.append(payload)
+            else:
+                logger.warning("Unknown async cache operation: %s", op)
+
+        started = time.perf_counter()
+        try:
+            if payloads:
+                self._perform_persist_batch(payloads)
+        except Exception as exc:
+            logger.warning("Async cache write failed: %s", exc)
+            # Disable async persistence to avoid repeated failures
+            self.async_persist = False
+        else:
+            elapsed = time.perf_counter() - started
+            with self._writer_stats_lock:
+                stats = self._writer_stats
+                stats["batches_committed"] += 1
+                stats["entries_written"] += len(payloads)
+                stats["last_batch_size"] = len(payloads)
+                stats["total_commit_seconds"] += elapsed
+                if elapsed > stats["max_commit_seconds"]:
+                    stats["max_commit_seconds"] = elapsed
+        finally:
+            for _ in batch:
                 queue_ref.task_done()
 
+    def _perform_persist_batch(self, payloads: Sequence[Dict[str, Any]]):
+        if not self.persistent:
+            return
+        try:
+            self.persistent.set_many(
+                {
+                    "cache_key": payload["composed"],
+                    "value": payload["value"],
+                    "namespace": payload["namespace"],
+                    "version": payload["version"],
+                    "ttl": payload["ttl"],
+                    "created_at": payload.get("created_at"),
+                    "expires_at": payload.get("expires_at"),
+                    "arguments": payload.get("arguments"),
+                }
+                for payload in payloads
+            )
+        except Exception as exc:
+            logger.warning("Persistent cache batch write failed: %s", exc)
+            self.persistent = None
+            raise
+
     def _perform_persist_set(
         self,
         *,
@@ -433,6 +890,7 @@ class ResultCacheManager:
         ttl: Optional[int],
         created_at: Optional[float] = None,
         expires_at: Optional[float] = None,
+        arguments: Optional[Dict[str, Any]] = None,
     ):
         if not self.persistent:
             return
@@ -447,6 +905,7 @@ class ResultCacheManager:
                 ttl=ttl,
                 created_at=created_at,
                 expires_at=expires_at,
+                arguments=arguments,
             )
         except Exception as exc:
             logger.warning("Persistent cache write failed: %s", exc)
@@ -460,7 +919,8 @@ class ResultCacheManager:
         if not hasattr(self, "_persist_queue") or self._persist_queue is None:
             return
 
-        # Signal shutdown first - this will cause worker to exit on next timeout check
+        # Signal shutdown first - the worker stops waiting for batch companions
+        # and exits after its current commit
         if hasattr(self, "_shutdown_event"):
             self._shutdown_event.set()
 
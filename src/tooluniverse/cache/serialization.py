@@ -0,0 +1,103 @@
+"""
+Value codecs for the persistent result cache.
+
+Values are stored as compact JSON when they are plain JSON data (dicts with
+string keys, lists, strings, numbers, booleans and ``None``) and fall back to
+pickle otherwise. Payloads above a size threshold are compressed with zstd
+when the optional ``zstandard`` package is installed, or zlib otherwise.
+
+The codec name written next to each row (for example ``"json+zlib"``) is all
+that is needed to decode it again; rows written before codecs existed have no
+codec and are treated as raw pickle.
+"""
+
+from __future__ import annotations
+
+import json
+import pickle
+import zlib
+from typing import Any, Optional, Tuple
+
+try:  # Optional dependency: better ratio and much faster than zlib
+    import zstandard as _zstd
+except ImportError:  # pragma: no cover - depends on environment
+    _zstd = None
+
+LEGACY_CODEC = "pickle"
+DEFAULT_COMPRESS_MIN_BYTES = 4096
+
+_JSON_SCALARS = (str, int, float, bool, type(None))
+
+
+def is_json_compatible(value: Any, _max_depth: int = 200) -> bool:
+    """Return True if ``value`` survives a JSON round trip unchanged."""
+    stack = [(value, 0)]
+    while stack:
+        obj, depth = stack.pop()
+        if depth > _max_depth:
+            return False
+        # Exact types only: subclasses (IntEnum, numpy.float64, ...) would
+        # come back from JSON as the plain base type
+        if type(obj) in _JSON_SCALARS:
+            continue
+        if type(obj) is dict:
+            for key, item in obj.items():
+                if type(key) is not str:
+                    return False
+                stack.append((item, depth + 1))
+        elif type(obj) is list:
+            stack.extend((item, depth + 1) for item in obj)
+        else:
+            return False
+    return True
+
+
+def _compress(payload: bytes) -> Tuple[str, bytes]:
+    if _zstd is not None:
+        return "zstd", _zstd.ZstdCompressor(level=3).compress(payload)
+    return "zlib", zlib.compress(payload, 6)
+
+
+def _decompress(method: str, payload: bytes) -> bytes:
+    if method == "zlib":
+        return zlib.decompress(payload)
+    if method == "zstd":
+        if _zstd is None:
+            raise ValueError(
+                "Cache entry is zstd-compressed but 'zstandard' is not installed"
+            )
+        return _zstd.ZstdDecompressor().decompress(payload)
+    raise ValueError(f"Unknown cache compression method: {method}")
+
+
+def encode_value(
+    value: Any, compress_min_bytes: Optional[int] = DEFAULT_COMPRESS_MIN_BYTES
+) -> Tuple[str, bytes]:
+    """Serialize ``value`` and return ``(codec, payload)``."""
+    if is_json_compatible(value):
+        codec = "json"
+        payload = json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode(
+            "utf-8"
+        )
+    else:
+        codec = "pickle"
+        payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+    if compress_min_bytes is not None and len(payload) >= compress_min_bytes:
+        method, compressed = _compress(payload)
+        if len(compressed) < len(payload):
+            return f"{codec}+{method}", compressed
+    return codec, payload
+
+
+def decode_value(payload: bytes, codec: Optional[str]) -> Any:
+    """Inverse of :func:`encode_value`; ``codec=None`` means legacy pickle."""
+    codec = codec or LEGACY_CODEC
+    base, _, method = codec.partition("+")
+    if method:
+        payload = _decompress(method, payload)
+    if base == "json":
+        return json.loads(payload)
+    if base == "pickle":
+        return pickle.loads(payload)
+    raise ValueError(f"Unknown cache codec: {codec}")
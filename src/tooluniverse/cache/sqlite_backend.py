@@ -7,13 +7,15 @@ Designed to be a drop-in persistent layer behind the in-memory cache.
 
 from __future__ import annotations
 
+import json
 import os
-import pickle
 import sqlite3
 import threading
 import time
 from dataclasses import dataclass
-from typing import Any, Dict, Iterator, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from .serialization import DEFAULT_COMPRESS_MIN_BYTES, decode_value, encode_value
 
 
 @dataclass
@@ -32,14 +34,49 @@ class CacheEntry:
 class PersistentCache:
     """SQLite-backed cache layer with TTL support."""
 
-    def __init__(self, path: str, *, enable: bool = True):
+    # SQLite's default limit on host parameters per statement is 999
+    _MAX_SQL_VARIABLES = 900
+
+    def __init__(
+        self,
+        path: str,
+        *,
+        enable: bool = True,
+        access_flush_interval: float = 5.0,
+        compress_min_bytes: Optional[int] = DEFAULT_COMPRESS_MIN_BYTES,
+        max_bytes: Optional[int] = None,
+        namespace_max_bytes: Optional[Dict[str, int]] = None,
+        compaction_interval: float = 60.0,
+    ):
         self.enabled = enable
         self.path = path
+        # Payloads at least this large are compressed; None disables it
+        self.compress_min_bytes = compress_min_bytes
         self._lock = threading.RLock()
         self._conn: Optional[sqlite3.Connection] = None
 
+        # Hits only touch this buffer; a background flusher applies the
+        # accumulated last_accessed/hit_count updates in one transaction.
+        self.access_flush_interval = max(0.1, float(access_flush_interval))
+        self._access_lock = threading.Lock()
+        self._pending_access: Dict[str, List[float]] = {}
+        self._flusher_stop = threading.Event()
+        self._flusher: Optional[threading.Thread] = None
+
+        # Disk budget enforced by compact(); evicts least-recently-used rows
+        # down to COMPACTION_LOW_WATER of the budget to avoid thrashing.
+        self.max_bytes = int(max_bytes) if max_bytes else None
+        self.namespace_max_bytes = {
+            ns: int(limit) for ns, limit in (namespace_max_bytes or {}).items() if limit
+        }
+        self.compaction_interval = max(1.0, float(compaction_interval))
+        self._last_compaction: Optional[float] = None
+        self.evicted_entries = 0
+        self.evicted_bytes = 0
+
         if self.enabled:
             self._init_storage()
+            self._start_access_flusher()
 
     def _init_storage(self):
         directory = os.path.dirname(self.path)
@@ -51,12 +88,30 @@ class PersistentCache:
             check_same_thread=False,
             isolation_level=None,  # autocommit
         )
+        self._enable_incremental_vacuum()
         self._conn.execute("PRAGMA journal_mode=WAL;")
         self._conn.execute("PRAGMA synchronous=NORMAL;")
         self._conn.execute("PRAGMA foreign_keys=ON;")
         self._ensure_schema()
         self.cleanup_expired()
 
+    def _enable_incremental_vacuum(self):
+        """Let compact() return freed pages to the OS with incremental_vacuum.
+
+        The mode only applies to new files as set; an existing file keeps
+        ``auto_vacuum=NONE`` until it is rebuilt with a full VACUUM. That
+        one-time rebuild runs only when a disk budget is configured, since
+        without one compact() never evicts.
+        """
+        assert self._conn is not None
+        (mode,) = self._conn.execute("PRAGMA auto_vacuum;").fetchone()
+        if mode == 2:  # INCREMENTAL
+            return
+        self._conn.execute("PRAGMA auto_vacuum=INCREMENTAL;")
+        (pages,) = self._conn.execute("PRAGMA page_count;").fetchone()
+        if pages and (self.max_bytes or self.namespace_max_bytes):
+            self._conn.execute("VACUUM;")
+
     def _ensure_schema(self):
         assert self._conn is not None
         self._conn.execute(
@@ -70,28 +125,137 @@ class PersistentCache:
                 created_at REAL NOT NULL,
                 last_accessed REAL NOT NULL,
                 expires_at REAL,
-                hit_count INTEGER NOT NULL DEFAULT 0
+                hit_count INTEGER NOT NULL DEFAULT 0,
+                codec TEXT,
+                call_arguments TEXT
             )
             """
         )
+        columns = {
+            row[1] for row in self._conn.execute("PRAGMA table_info(cache_entries)")
+        }
+        if "codec" not in columns:
+            # Databases created before codecs existed hold raw pickle (NULL codec)
+            self._conn.execute("ALTER TABLE cache_entries ADD COLUMN codec TEXT")
+        if "call_arguments" not in columns:
+            # JSON arguments of the originating call, used to prefetch hot keys
+            self._conn.execute(
+                "ALTER TABLE cache_entries ADD COLUMN call_arguments TEXT"
+            )
         self._conn.execute(
             "CREATE INDEX IF NOT EXISTS idx_cache_namespace ON cache_entries(namespace)"
         )
         self._conn.execute(
             "CREATE INDEX IF NOT EXISTS idx_cache_expires ON cache_entries(expires_at)"
         )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_cache_last_accessed "
+            "ON cache_entries(last_accessed)"
+        )
+        # Cross-process singleflight leases (see ResultCacheManager)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS cache_leases (
+                cache_key TEXT PRIMARY KEY,
+                owner TEXT NOT NULL,
+                expires_at REAL NOT NULL
+            )
+            """
+        )
 
-    def _serialize(self, value: Any) -> bytes:
-        return pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+    def _serialize(self, value: Any) -> tuple:
+        """Return ``(codec, payload)`` for ``value``."""
+        return encode_value(value, self.compress_min_bytes)
 
-    def _deserialize(self, payload: bytes) -> Any:
-        return pickle.loads(payload)
+    def _deserialize(self, payload: bytes, codec: Optional[str] = None) -> Any:
+        return decode_value(payload, codec)
 
     def close(self):
+        self._stop_access_flusher()
         if self._conn:
+            try:
+                self.flush_access_stats()
+            except sqlite3.Error:
+                pass
             self._conn.close()
             self._conn = None
 
+    # ------------------------------------------------------------------
+    # Access statistics buffering
+    # ------------------------------------------------------------------
+    def _start_access_flusher(self):
+        self._flusher = threading.Thread(
+            target=self._access_flush_loop,
+            name="PersistentCacheAccessFlusher",
+            daemon=True,
+        )
+        self._flusher.start()
+
+    def _stop_access_flusher(self):
+        self._flusher_stop.set()
+        if self._flusher is not None and self._flusher.is_alive():
+            self._flusher.join(timeout=2.0)
+        self._flusher = None
+
+    def _access_flush_loop(self):
+        while not self._flusher_stop.wait(self.access_flush_interval):
+            try:
+                self.flush_access_stats()
+            except Exception:
+                # Access statistics are best-effort; never kill the flusher
+                pass
+            if self._compaction_due():
+                try:
+                    self.compact()
+                except Exception:
+                    pass
+
+    def _record_access(self, cache_keys: Iterable[str]):
+        now = time.time()
+        with self._access_lock:
+            for key in cache_keys:
+                pending = self._pending_access.get(key)
+                if pending is None:
+                    self._pending_access[key] = [now, 1]
+                else:
+                    pending[0] = now
+                    pending[1] += 1
+
+    def flush_access_stats(self) -> int:
+        """Apply buffered ``last_accessed``/``hit_count`` updates.
+
+        Returns
+            Number of cache keys updated.
+        """
+        with self._access_lock:
+            pending = self._pending_access
+            self._pending_access = {}
+        if not pending or not self._conn:
+            return 0
+        rows = [
+            (last_accessed, int(hits), key)
+            for key, (last_accessed, hits) in pending.items()
+        ]
+        with self._lock:
+            if not self._conn:
+                return 0
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.executemany(
+                    """
+                    UPDATE cache_entries
+                    SET last_accessed = MAX(last_accessed, ?),
+                        hit_count = hit_count + ?
+                    WHERE cache_key = ?
+                    """,
+                    rows,
+                )
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+        return len(rows)
+
     def cleanup_expired(self):
         if not self.enabled or not self._conn:
             return
@@ -101,18 +265,42 @@ class PersistentCache:
                 "DELETE FROM cache_entries WHERE expires_at IS NOT NULL AND expires_at <= ?",
                 (now,),
             )
+            self._conn.execute("DELETE FROM cache_leases WHERE expires_at <= ?", (now,))
+
+    _SELECT_COLUMNS = """
+        SELECT cache_key, namespace, version, value, ttl, created_at,
+               last_accessed, expires_at, hit_count, codec
+        FROM cache_entries
+    """
+
+    def _row_to_entry(self, row) -> CacheEntry:
+        return CacheEntry(
+            key=row[0],
+            namespace=row[1],
+            version=row[2] or "",
+            value=self._deserialize(row[3], row[9]),
+            ttl=row[4],
+            created_at=row[5],
+            last_accessed=row[6],
+            hit_count=row[8],
+            expires_at=row[7],  # Store expires_at from database
+        )
+
+    def _delete_keys(self, cache_keys: List[str]):
+        for start in range(0, len(cache_keys), self._MAX_SQL_VARIABLES):
+            chunk = cache_keys[start : start + self._MAX_SQL_VARIABLES]
+            placeholders = ",".join("?" * len(chunk))
+            self._conn.execute(
+                f"DELETE FROM cache_entries WHERE cache_key IN ({placeholders})",
+                chunk,
+            )
 
     def get(self, cache_key: str) -> Optional[CacheEntry]:
         if not self.enabled or not self._conn:
             return None
         with self._lock:
             cur = self._conn.execute(
-                """
-                SELECT cache_key, namespace, version, value, ttl, created_at,
-                       last_accessed, expires_at, hit_count
-                FROM cache_entries WHERE cache_key = ?
-                """,
-                (cache_key,),
+                self._SELECT_COLUMNS + " WHERE cache_key = ?", (cache_key,)
             )
             row = cur.fetchone()
             if not row:
@@ -125,27 +313,98 @@ class PersistentCache:
                 )
                 return None
 
-            entry = CacheEntry(
-                key=row[0],
-                namespace=row[1],
-                version=row[2] or "",
-                value=self._deserialize(row[3]),
-                ttl=row[4],
-                created_at=row[5],
-                last_accessed=row[6],
-                hit_count=row[8],
-                expires_at=row[7],  # Store expires_at from database
-            )
+        self._record_access((cache_key,))
+        return self._row_to_entry(row)
 
-            self._conn.execute(
-                """
-                UPDATE cache_entries
-                SET last_accessed = ?, hit_count = hit_count + 1
-                WHERE cache_key = ?
-                """,
-                (time.time(), cache_key),
-            )
-            return entry
+    def get_many(self, cache_keys: Iterable[str]) -> Dict[str, CacheEntry]:
+        """Fetch several entries with ``SELECT ... WHERE cache_key IN (...)``.
+
+        Expired rows are dropped from the result and deleted. Missing keys are
+        simply absent from the returned mapping.
+        """
+        if not self.enabled or not self._conn:
+            return {}
+        keys = list(dict.fromkeys(cache_keys))
+        if not keys:
+            return {}
+
+        rows = []
+        expired: List[str] = []
+        with self._lock:
+            now = time.time()
+            for start in range(0, len(keys), self._MAX_SQL_VARIABLES):
+                chunk = keys[start : start + self._MAX_SQL_VARIABLES]
+                placeholders = ",".join("?" * len(chunk))
+                cur = self._conn.execute(
+                    self._SELECT_COLUMNS + f" WHERE cache_key IN ({placeholders})",
+                    chunk,
+                )
+                for row in cur.fetchall():
+                    if row[7] is not None and row[7] <= now:
+                        expired.append(row[0])
+                    else:
+                        rows.append(row)
+            if expired:
+                self._delete_keys(expired)
+
+        entries = {row[0]: self._row_to_entry(row) for row in rows}
+        self._record_access(entries.keys())
+        return entries
+
+    _UPSERT_SQL = """
+        INSERT INTO cache_entries(cache_key, namespace, version, value, ttl,
+                                  created_at, last_accessed, expires_at, hit_count,
+                                  codec, call_arguments)
+        VALUES(?, ?, ?, ?, ?, ?, ?, ?, 0, ?, ?)
+        ON CONFLICT(cache_key) DO UPDATE SET
+            namespace=excluded.namespace,
+            version=excluded.version,
+            value=excluded.value,
+            codec=excluded.codec,
+            ttl=excluded.ttl,
+            created_at=excluded.created_at,
+            last_accessed=excluded.last_accessed,
+            expires_at=excluded.expires_at,
+            call_arguments=COALESCE(excluded.call_arguments,
+                                    cache_entries.call_arguments)
+    """
+
+    def _build_row(
+        self,
+        cache_key: str,
+        value: Any,
+        *,
+        namespace: str,
+        version: str,
+        ttl: Optional[int],
+        created_at: Optional[float] = None,
+        expires_at: Optional[float] = None,
+        arguments: Optional[Dict[str, Any]] = None,
+    ) -> tuple:
+        # Use provided timestamps if available, otherwise calculate them
+        if created_at is None:
+            created_at = time.time()
+        if expires_at is None and ttl is not None:
+            expires_at = created_at + ttl
+        codec, payload = self._serialize(value)
+        call_arguments = None
+        if arguments is not None:
+            try:
+                call_arguments = json.dumps(arguments, sort_keys=True)
+            except (TypeError, ValueError):
+                call_arguments = None
+        return (
+            cache_key,
+            namespace,
+            version,
+            payload,
+            ttl,
+            created_at,
+            time.time(),
+            expires_at,
+            codec,
+            call_arguments,
+        )
 
     def set(
         self,
@@ -157,43 +416,48 @@ class PersistentCache:
         ttl: Optional[int],
         created_at: Optional[float] = None,
         expires_at: Optional[float] = None,
+        arguments: Optional[Dict[str, Any]] = None,
     ):
         if not self.enabled or not self._conn:
             return
+        row = self._build_row(
+            cache_key,
+            value,
+            namespace=namespace,
+            version=version,
+            ttl=ttl,
+            created_at=created_at,
+            expires_at=expires_at,
+            arguments=arguments,
+        )
         with self._lock:
-            # Use provided timestamps if available, otherwise calculate them
-            if created_at is None:
-                created_at = time.time()
-            if expires_at is None and ttl is not None:
-                expires_at = created_at + ttl
-            now = time.time()
-            payload = self._serialize(value)
-            self._conn.execute(
-                """
-                INSERT INTO cache_entries(cache_key, namespace, version, value, ttl,
-                                          created_at, last_accessed, expires_at, hit_count)
-                VALUES(?, ?, ?, ?, ?, ?, ?, ?, 0)
-                ON CONFLICT(cache_key) DO UPDATE SET
-                    namespace=excluded.namespace,
-                    version=excluded.version,
-                    value=excluded.value,
-                    ttl=excluded.ttl,
-                    created_at=excluded.created_at,
-                    last_accessed=excluded.last_accessed,
-                    expires_at=excluded.expires_at,
-                    hit_count=excluded.hit_count
-                """,
-                (
-                    cache_key,
-                    namespace,
-                    version,
-                    payload,
-                    ttl,
-                    created_at,
-                    now,
-                    expires_at,
-                ),
-            )
+            self._conn.execute(self._UPSERT_SQL, row)
+
+    def set_many(self, entries: Iterable[Dict[str, Any]]) -> int:
+        """Write several entries in a single transaction.
+
+        Args:
+            entries: Iterable of dicts accepted by :meth:`set` as keyword
+                arguments (``cache_key``, ``value``, ``namespace``, ...).
+
+        Returns
+            Number of rows written.
+        """
+        if not self.enabled or not self._conn:
+            return 0
+        # Serialize outside the lock so readers are not blocked on pickling
+        rows = [self._build_row(**entry) for entry in entries]
+        if not rows:
+            return 0
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.executemany(self._UPSERT_SQL, rows)
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+        return len(rows)
 
     def delete(self, cache_key: str):
         if not self.enabled or not self._conn:
@@ -217,12 +481,13 @@ class PersistentCache:
     def iter_entries(self, namespace: Optional[str] = None) -> Iterator[CacheEntry]:
         if not self.enabled or not self._conn:
             return iter([])
+        self.flush_access_stats()
         with self._lock:
             if namespace:
                 cur = self._conn.execute(
                     """
                     SELECT cache_key, namespace, version, value, ttl,
-                           created_at, last_accessed, hit_count
+                           created_at, last_accessed, hit_count, codec
                     FROM cache_entries WHERE namespace = ?
                     """,
                     (namespace,),
@@ -231,7 +496,7 @@ class PersistentCache:
                 cur = self._conn.execute(
                     """
                     SELECT cache_key, namespace, version, value, ttl,
-                           created_at, last_accessed, hit_count
+                           created_at, last_accessed, hit_count, codec
                     FROM cache_entries
                     """
                 )
@@ -242,13 +507,205 @@ class PersistentCache:
                 key=row[0],
                 namespace=row[1],
                 version=row[2] or "",
-                value=self._deserialize(row[3]),
+                value=self._deserialize(row[3], row[8]),
                 ttl=row[4],
                 created_at=row[5],
                 last_accessed=row[6],
                 hit_count=row[7],
             )
 
+    def has_fresh(self, cache_key: str) -> bool:
+        """Return True if a non-expired entry within its TTL exists.
+
+        Cheap existence check that does not deserialize or count as a hit.
+        """
+        if not self.enabled or not self._conn:
+            return False
+        with self._lock:
+            row = self._conn.execute(
+                """
+                SELECT 1 FROM cache_entries
+                WHERE cache_key = ? AND (ttl IS NULL OR created_at + ttl > ?)
+                """,
+                (cache_key, time.time()),
+            ).fetchone()
+        return row is not None
+
+    def hottest(self, limit: int, namespace: Optional[str] = None) -> List[CacheEntry]:
+        """Return up to ``limit`` unexpired entries ordered by hit count, then
+        recency."""
+        if not self.enabled or not self._conn or limit <= 0:
+            return []
+        self.flush_access_stats()
+        where = "WHERE (expires_at IS NULL OR expires_at > ?)"
+        params: list = [time.time()]
+        if namespace is not None:
+            where += " AND namespace = ?"
+            params.append(namespace)
+        with self._lock:
+            rows = self._conn.execute(
+                self._SELECT_COLUMNS
+                + f" {where} ORDER BY hit_count DESC, last_accessed DESC LIMIT ?",
+                params + [int(limit)],
+            ).fetchall()
+        return [self._row_to_entry(row) for row in rows]
+
+    def expiring(self, within: float, limit: int) -> List[Dict[str, Any]]:
+        """Describe hot entries whose TTL ends in the next ``within`` seconds.
+
+        Only rows that recorded their call arguments are returned, since those
+        are the only ones that can be re-fetched.
+        """
+        if not self.enabled or not self._conn or limit <= 0:
+            return []
+        self.flush_access_stats()
+        now = time.time()
+        with self._lock:
+            rows = self._conn.execute(
+                """
+                SELECT cache_key, namespace, version, call_arguments, hit_count
+                FROM cache_entries
+                WHERE ttl IS NOT NULL AND call_arguments IS NOT NULL
+                  AND created_at + ttl BETWEEN ? AND ?
+                ORDER BY hit_count DESC LIMIT ?
+                """,
+                (now, now + within, int(limit)),
+            ).fetchall()
+        return [
+            {
+                "cache_key": row[0],
+                "namespace": row[1],
+                "version": row[2] or "",
+                "arguments": json.loads(row[3]),
+                "hit_count": row[4],
+            }
+            for row in rows
+        ]
+
+    # ------------------------------------------------------------------
+    # Leases
+    # ------------------------------------------------------------------
+    def try_acquire_lease(self, cache_key: str, owner: str, ttl: float) -> bool:
+        """Atomically claim ``cache_key`` for ``owner`` for ``ttl`` seconds.
+
+        Succeeds if nobody holds the lease, the holder's lease has expired
+        (for example because its process crashed), or ``owner`` already holds
+        it.
+        """
+        if not self.enabled or not self._conn:
+            return False
+        with self._lock:
+            now = time.time()
+            cur = self._conn.execute(
+                """
+                INSERT INTO cache_leases(cache_key, owner, expires_at)
+                VALUES(?, ?, ?)
+                ON CONFLICT(cache_key) DO UPDATE SET
+                    owner=excluded.owner,
+                    expires_at=excluded.expires_at
+                WHERE cache_leases.expires_at <= ?
+                   OR cache_leases.owner = excluded.owner
+                """,
+                (cache_key, owner, now + ttl, now),
+            )
+            return cur.rowcount == 1
+
+    def release_lease(self, cache_key: str, owner: str):
+        if not self.enabled or not self._conn:
+            return
+        with self._lock:
+            self._conn.execute(
+                "DELETE FROM cache_leases WHERE cache_key = ? AND owner = ?",
+                (cache_key, owner),
+            )
+
+    # ------------------------------------------------------------------
+    # Size-based eviction
+    # ------------------------------------------------------------------
+    COMPACTION_LOW_WATER = 0.9
+
+    def _compaction_due(self) -> bool:
+        if self.max_bytes is None and not self.namespace_max_bytes:
+            return False
+        if self._last_compaction is None:
+            return True
+        return time.time() - self._last_compaction >= self.compaction_interval
+
+    def _evict_lru(self, excess: int, namespace: Optional[str] = None) -> tuple:
+        """Delete least-recently-used rows until ``excess`` bytes are freed."""
+        freed_bytes = 0
+        freed_rows = 0
+        where = "WHERE namespace = ?" if namespace is not None else ""
+        params: tuple = (namespace,) if namespace is not None else ()
+        while freed_bytes < excess:
+            rows = self._conn.execute(
+                f"""
+                SELECT cache_key, LENGTH(value) FROM cache_entries {where}
+                ORDER BY last_accessed ASC LIMIT ?
+                """,
+                params + (self._MAX_SQL_VARIABLES,),
+            ).fetchall()
+            if not rows:
+                break
+            victims = []
+            for key, size in rows:
+                victims.append(key)
+                freed_bytes += size or 0
+                if freed_bytes >= excess:
+                    break
+            self._delete_keys(victims)
+            freed_rows += len(victims)
+        return freed_rows, freed_bytes
+
+    def compact(self) -> Dict[str, int]:
+        """Enforce the disk budgets and reclaim free pages.
+
+        Expired rows are removed first, then least-recently-used rows are
+        evicted (per namespace, then globally) until usage is back under
+        ``COMPACTION_LOW_WATER`` of each budget.
+
+        Returns
+            ``{"evicted_entries": ..., "evicted_bytes": ...}`` for this run.
+        """
+        if not self.enabled or not self._conn:
+            return {"evicted_entries": 0, "evicted_bytes": 0}
+        self.flush_access_stats()
+        self.cleanup_expired()
+
+        evicted_rows = 0
+        evicted_bytes = 0
+        with self._lock:
+            for namespace, limit in self.namespace_max_bytes.items():
+                (used,) = self._conn.execute(
+                    "SELECT COALESCE(SUM(LENGTH(value)), 0) FROM cache_entries "
+                    "WHERE namespace = ?",
+                    (namespace,),
+                ).fetchone()
+                if used > limit:
+                    target = int(limit * self.COMPACTION_LOW_WATER)
+                    rows, freed = self._evict_lru(used - target, namespace)
+                    evicted_rows += rows
+                    evicted_bytes += freed
+
+            if self.max_bytes is not None:
+                (used,) = self._conn.execute(
+                    "SELECT COALESCE(SUM(LENGTH(value)), 0) FROM cache_entries"
+                ).fetchone()
+                if used > self.max_bytes:
+                    target = int(self.max_bytes * self.COMPACTION_LOW_WATER)
+                    rows, freed = self._evict_lru(used - target)
+                    evicted_rows += rows
+                    evicted_bytes += freed
+
+            if evicted_rows:
+                # execute() steps the pragma once, freeing a single page;
+                # executescript() runs it to completion.
+                self._conn.executescript("PRAGMA incremental_vacuum;")
+            self.evicted_entries += evicted_rows
+            self.evicted_bytes += evicted_bytes
+            self._last_compaction = time.time()
+        return {"evicted_entries": evicted_rows, "evicted_bytes": evicted_bytes}
+
     def stats(self) -> Dict[str, Any]:
         if not self.enabled or not self._conn:
             return {"enabled": False}
@@ -257,9 +714,24 @@ class PersistentCache:
                 "SELECT COUNT(*), SUM(LENGTH(value)) FROM cache_entries"
             )
             count, total_bytes = cur.fetchone()
-            return {
-                "enabled": True,
-                "entries": count or 0,
-                "approx_bytes": total_bytes or 0,
-                "path": self.path,
-            }
+            codecs = dict(
+                self._conn.execute(
+                    "SELECT COALESCE(codec, 'pickle') AS name, COUNT(*) "
+                    "FROM cache_entries GROUP BY name"
+                ).fetchall()
+            )
+        with self._access_lock:
+            pending_access = len(self._pending_access)
+        return {
+            "enabled": True,
+            "entries": count or 0,
+            "approx_bytes": total_bytes or 0,
+            "path": self.path,
+            "codecs": codecs,
+            "pending_access_updates": pending_access,
+            "max_bytes": self.max_bytes,
+            "namespace_max_bytes": dict(self.namespace_max_bytes),
+            "evicted_entries": self.evicted_entries,
+            "evicted_bytes": self.evicted_bytes,
+            "last_compaction": self._last_compaction,
+        }
@@ -0,0 +1,391 @@
+"""
+Upstream response cache shared by tools that read the same remote document.
+
+Several tool families fetch one upstream document and each return a different
+slice of it (the UniProt ``*_by_accession`` tools all download the full
+UniProtKB entry, for example). The result cache cannot help them because
+every tool has its own cache key. This cache sits below the result cache and
+is keyed by the canonical request URL instead (plus how the response is parsed
+and the ``Accept`` header it was requested with), so the first tool pays for
+the fetch and the parse and the others reuse the parsed document. Concurrent
+misses for the same URL are collapsed into one fetch.
+
+Cached documents are shared between tools: callers must treat them as
+read-only and copy whatever they return or modify.
+
+When a response carries an ``ETag`` or ``Last-Modified`` header, the entry is
+kept after its TTL expires. The next request for it is sent with
+``If-None-Match`` / ``If-Modified-Since``, and a ``304 Not Modified`` reply
+renews the entry without downloading or parsing the document again. TTLs can
+therefore stay short: most refreshes cost one small round trip.
+
+Configuration (environment variables):
+
+``TOOLUNIVERSE_UPSTREAM_CACHE``
+    Set to ``0`` to disable the cache (default on).
+``TOOLUNIVERSE_UPSTREAM_CACHE_TTL``
+    Seconds a document stays fresh (default 600).
+``TOOLUNIVERSE_UPSTREAM_CACHE_MB``
+    Approximate memory budget in megabytes (default 64). Documents larger
+    than a quarter of the budget are not cached.
+``TOOLUNIVERSE_UPSTREAM_REVALIDATE``
+    Set to ``0`` to refetch expired documents instead of revalidating them
+    (default on).
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import requests
+
+from .memory_cache import LRUCache, SingleFlight, estimate_size
+
+DEFAULT_TTL = 600.0
+DEFAULT_BUDGET_MB = 64
+# Rough ratio of a parsed JSON document's memory footprint to its wire size
+PARSED_SIZE_FACTOR = 6
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, default))
+    except ValueError:
+        return default
+
+
+def _env_flag(name: str, default: str = "1") -> bool:
+    return os.getenv(name, default).lower() not in ("0", "false", "no", "off")
+
+
+def _validators(response: requests.Response) -> Optional[Dict[str, str]]:
+    """Return the conditional-request headers that revalidate ``response``."""
+    validators = {}
+    etag = response.headers.get("ETag")
+    if etag:
+        validators["If-None-Match"] = etag
+    last_modified = response.headers.get("Last-Modified")
+    if last_modified:
+        validators["If-Modified-Since"] = last_modified
+    return validators or None
+
+
+def canonical_url(url: str, params: Optional[Mapping[str, Any]] = None) -> str:
+    """Return ``url`` with ``params`` merged in and the query sorted.
+
+    The scheme and host are lower-cased and the fragment dropped, so requests
+    that differ only in spelling share a cache entry.
+    """
+    parts = urlsplit(url)
+    query = parse_qsl(parts.query, keep_blank_values=True)
+    if params:
+        for key, value in params.items():
+            if value is None:
+                continue
+            if isinstance(value, (list, tuple)):
+                query.extend((key, str(v)) for v in value)
+            else:
+                query.append((key, str(value)))
+    return urlunsplit(
+        (
+            parts.scheme.lower(),
+            parts.netloc.lower(),
+            parts.path or "/",
+            urlencode(sorted(query)),
+            "",
+        )
+    )
+
+
+def document_key(
+    url: str,
+    params: Optional[Mapping[str, Any]] = None,
+    *,
+    kind: str = "json",
+    headers: Optional[Mapping[str, str]] = None,
+) -> str:
+    """Return the cache key of ``url`` parsed as ``kind``.
+
+    The same URL parsed two ways, or requested with a different ``Accept``
+    header, is a different document.
+    """
+    key = f"{kind} {canonical_url(url, params)}"
+    for name, value in (headers or {}).items():
+        if name.lower() == "accept" and value:
+            key += f" accept={value}"
+    return key
+
+
+def _parser_kind(parse: Callable[..., Any]) -> str:
+    module = getattr(parse, "__module__", None) or ""
+    name = getattr(parse, "__qualname__", None) or type(parse).__qualname__
+    return f"{module}.{name}"
+
+
+class UpstreamCache:
+    """TTL- and byte-bounded LRU of parsed upstream documents."""
+
+    def __init__(
+        self,
+        *,
+        ttl: Optional[float] = None,
+        max_bytes: Optional[int] = None,
+        enabled: Optional[bool] = None,
+        revalidate: Optional[bool] = None,
+    ):
+        self.enabled = (
+            enabled if enabled is not None else _env_flag("TOOLUNIVERSE_UPSTREAM_CACHE")
+        )
+        self.revalidate = (
+            revalidate
+            if revalidate is not None
+            else _env_flag("TOOLUNIVERSE_UPSTREAM_REVALIDATE")
+        )
+        self.ttl = (
+            ttl
+            if ttl is not None
+            else _env_float("TOOLUNIVERSE_UPSTREAM_CACHE_TTL", DEFAULT_TTL)
+        )
+        if max_bytes is None:
+            max_bytes = int(
+                _env_float("TOOLUNIVERSE_UPSTREAM_CACHE_MB", DEFAULT_BUDGET_MB)
+                * 1024
+                * 1024
+            )
+        self._lru = LRUCache(
+            max_size=None,
+            max_bytes=max_bytes,
+            max_entry_bytes=max(1, max_bytes // 4),
+        )
+        self._singleflight = SingleFlight()
+        self._lock = threading.Lock()
+        self.fetches = 0
+        self.shared = 0
+        self.revalidated = 0
+
+    # Entries are stored as (value, expires_at, validators, size)
+    def _lookup(self, key: str) -> Any:
+        slot = self._lru.get(key)
+        if slot is None:
+            return None
+        if time.monotonic() >= slot[1]:
+            # Expired entries with validators stay for revalidation
+            if not slot[2]:
+                self._lru.delete(key)
+            return None
+        return slot
+
+    def _store(self, key, value, ttl, validators=None, size=None) -> None:
+        if size is None:
+            size = estimate_size(value)
+        self._lru.set(key, (value, time.monotonic() + ttl, validators, size), size=size)
+
+    def get_or_fetch(
+        self,
+        key: str,
+        fetch: Callable[[], Any],
+        *,
+        ttl: Optional[float] = None,
+        size: Optional[int] = None,
+    ) -> Any:
+        """Return the cached value for ``key``, calling ``fetch`` on a miss.
+
+        Only one thread fetches a given key at a time; the others wait and
+        reuse its result. Exceptions from ``fetch`` are not cached and
+        propagate to the caller. ``size`` is the value's size in bytes when
+        the caller knows it; otherwise it is estimated.
+        """
+        return self._get_or_fetch(key, lambda stale: (fetch(), size, None), ttl)
+
+    def peek(self, key: str) -> Any:
+        """Return the fresh cached value for ``key``, or ``None``."""
+        slot = self._lookup(key) if self.enabled else None
+        return None if slot is None else slot[0]
+
+    def put(
+        self,
+        key: str,
+        value: Any,
+        *,
+        ttl: Optional[float] = None,
+        size: Optional[int] = None,
+    ) -> None:
+        """Store ``value`` under ``key``, e.g. a record from a bulk response."""
+        ttl = self.ttl if ttl is None else ttl
+        if self.enabled and ttl > 0:
+            self._store(key, value, ttl, size=size)
+
+    def _get_or_fetch(
+        self,
+        key: str,
+        fetch: Callable[[Any], Tuple[Any, Optional[int], Optional[Dict[str, str]]]],
+        ttl: Optional[float],
+    ) -> Any:
+        """Serve ``key`` or call ``fetch(stale)`` under single-flight.
+
+        ``stale`` is the expired slot kept for revalidation (or None).
+        ``fetch`` returns ``(value, size, validators)``; returning the stale
+        slot's value renews that entry.
+        """
+        ttl = self.ttl if ttl is None else ttl
+        if not self.enabled or ttl <= 0:
+            return fetch(None)[0]
+        slot = self._lookup(key)
+        if slot is not None:
+            return slot[0]
+        with self._singleflight.acquire(key):
+            slot = self._lookup(key)
+            if slot is not None:
+                with self._lock:
+                    self.shared += 1
+                return slot[0]
+            stale = self._lru.get(key)
+            value, size, validators = fetch(stale)
+            if stale is not None and value is stale[0]:
+                with self._lock:
+                    self.revalidated += 1
+                self._store(key, value, ttl, stale[2], stale[3])
+                return value
+            with self._lock:
+                self.fetches += 1
+            self._store(key, value, ttl, validators, size)
+            return value
+
+    def get_json(
+        self,
+        url: str,
+        *,
+        params: Optional[Mapping[str, Any]] = None,
+        ttl: Optional[float] = None,
+        get: Optional[Callable[..., Any]] = None,
+        revalidate: Optional[bool] = None,
+        **kwargs: Any,
+    ) -> Any:
+        """GET ``url`` and return its decoded JSON body, cached by URL.
+
+        ``get`` sends the request (default: the shared HTTP transport) and
+        receives ``params`` and ``kwargs``. Non-2xx responses raise
+        :class:`requests.HTTPError` and are not cached. ``revalidate=False``
+        refetches expired entries instead of sending a conditional request.
+        """
+        return self.get_document(
+            url,
+            lambda response: response.json(),
+            kind="json",
+            params=params,
+            ttl=ttl,
+            get=get,
+            revalidate=revalidate,
+            **kwargs,
+        )
+
+    def get_document(
+        self,
+        url: str,
+        parse: Callable[[requests.Response], Any],
+        *,
+        kind: Optional[str] = None,
+        params: Optional[Mapping[str, Any]] = None,
+        ttl: Optional[float] = None,
+        get: Optional[Callable[..., Any]] = None,
+        revalidate: Optional[bool] = None,
+        **kwargs: Any,
+    ) -> Any:
+        """Like :meth:`get_json`, with ``parse`` turning the response into
+        the cached value (e.g. an XML tree).
+
+        ``kind`` names the parsed form in the cache key (default: the
+        qualified name of ``parse``); callers that parse the same URL the
+        same way should pass the same ``kind`` to share the entry.
+        """
+        if get is None:
+            from .. import http_client
+
+            get = http_client.get
+        if revalidate is None:
+            revalidate = self.revalidate
+
+        def fetch(stale):
+            request_kwargs = dict(kwargs)
+            if revalidate and stale is not None and stale[2]:
+                request_kwargs["headers"] = {
+                    **(request_kwargs.get("headers") or {}),
+                    **stale[2],
+                }
+            response = get(url, params=params, **request_kwargs)
+            if response.status_code == 304 and stale is not None:
+                return stale[0], stale[3], stale[2]
+            response.raise_for_status()
+            # Sizing from the body is far cheaper than walking the parsed tree
+            size = len(response.content or b"") * PARSED_SIZE_FACTOR
+            return (
+                parse(response),
+                size,
+                _validators(response) if revalidate else None,
+            )
+
+        key = document_key(
+            url,
+            params,
+            kind=kind or _parser_kind(parse),
+            headers=kwargs.get("headers"),
+        )
+        return self._get_or_fetch(key, fetch, ttl)
+
+    def invalidate(self, key: str) -> None:
+        self._lru.delete(key)
+
+    def clear(self) -> None:
+        self._lru.clear()
+        with self._lock:
+            self.fetches = 0
+            self.shared = 0
+            self.revalidated = 0
+
+    def stats(self) -> Dict[str, Any]:
+        stats = self._lru.stats()
+        stats.update(
+            {
+                "enabled": self.enabled,
+                "revalidate": self.revalidate,
+                "ttl": self.ttl,
+                "fetches": self.fetches,
+                "shared": self.shared,
+                "revalidated": self.revalidated,
+            }
+        )
+        return stats
+
+
+_cache: Optional[UpstreamCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_upstream_cache() -> UpstreamCache:
+    """Return the process-wide upstream cache, creating it on first use."""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = UpstreamCache()
+    return _cache
+
+
+def reset_upstream_cache() -> None:
+    """Drop all cached documents; the next call re-reads configuration."""
+    global _cache
+    with _cache_lock:
+        _cache = None
+
+
+__all__ = [
+    "UpstreamCache",
+    "canonical_url",
+    "document_key",
+    "get_upstream_cache",
+    "reset_upstream_cache",
+]
@@ -72,7 +72,7 @@ class CDCRESTTool(BaseTool):
             return {"error": str(e)}
 
         try:
-            resp = requests.get(url, timeout=30)
+            resp = self.http_get(url, timeout=30)
             resp.raise_for_status()
             data = resp.json()
 
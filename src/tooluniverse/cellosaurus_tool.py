@@ -38,7 +38,7 @@ class CellosaurusSearchTool(BaseTool):
 
             url = f"{self.base_url}/search/cell-line"
             headers = {"Accept": "application/json"}
-            resp = requests.get(
+            resp = self.http_get(
                 url,
                 params=params,
                 headers=headers,
@@ -1262,7 +1262,7 @@ class CellosaurusGetCellLineInfoTool(BaseTool):
             url = f"{self.base_url}/cell-line/{accession}"
             headers = {"Accept": f"application/{format_type}"}
 
-            resp = requests.get(
+            resp = self.http_get(
                 url,
                 params=params,
                 headers=headers,
@@ -1,4 +1,3 @@
-import requests
 from urllib.parse import quote
 
 # from rdkit import Chem
@@ -39,7 +38,7 @@ class ChEMBLTool(BaseTool):
         headers = {"Accept": "application/json"}
         search_url = f"{self.base_url}/molecule/search.json?q={quote(compound_name)}"
         print(search_url)
-        response = requests.get(search_url, headers=headers)
+        response = self.http_get(search_url, headers=headers)
         response.raise_for_status()
         results = response.json().get("molecules", [])
         if not results or not isinstance(results, list):
@@ -63,7 +62,7 @@ class ChEMBLTool(BaseTool):
         headers = {"Accept": "application/json"}
         if query.upper().startswith("CHEMBL"):
             molecule_url = f"{self.base_url}/molecule/{quote(query)}.json"
-            response = requests.get(molecule_url, headers=headers)
+            response = self.http_get(molecule_url, headers=headers)
             response.raise_for_status()
             molecule = response.json()
             if not molecule or not isinstance(molecule, dict):
@@ -87,7 +86,7 @@ class ChEMBLTool(BaseTool):
         """
         headers = {"Accept": "application/json"}
         search_url = f"{self.base_url}/molecule/search.json?q={quote(compound_name)}"
-        response = requests.get(search_url, headers=headers)
+        response = self.http_get(search_url, headers=headers)
         response.raise_for_status()
         results = response.json().get("molecules", [])
         if not results or not isinstance(results, list):
@@ -201,7 +200,7 @@ class ChEMBLTool(BaseTool):
                 headers = {"Accept": "application/json"}
                 search_url = f"{self.base_url}/molecule/search.json?q={quote(query)}"
                 try:
-                    response = requests.get(search_url, headers=headers)
+                    response = self.http_get(search_url, headers=headers)
                     response.raise_for_status()
                     results = response.json().get("molecules", [])
                     if results and len(results) > 0:
@@ -251,7 +250,7 @@ class ChEMBLTool(BaseTool):
 
             encoded_smiles = quote(smiles)
             similarity_url = f"{self.base_url}/similarity/{encoded_smiles}/{similarity_threshold}.json?limit={max_results}"
-            sim_response = requests.get(similarity_url, headers=headers)
+            sim_response = self.http_get(similarity_url, headers=headers)
             sim_response.raise_for_status()
             sim_results = sim_response.json().get("molecules", [])
             similar_molecules = []
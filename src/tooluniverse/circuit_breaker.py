@@ -0,0 +1,315 @@
+"""
+Per-upstream circuit breakers for the shared HTTP transport.
+
+Each host gets a :class:`CircuitBreaker` that watches the outcome and latency
+of recent requests. When too many of them fail (connection errors, timeouts,
+5xx responses, or calls slower than a configured threshold) the circuit opens
+and further requests fail immediately with :class:`CircuitOpenError` (a
+``ToolUnavailableError``) instead of each waiting for its full timeout. After a cool-down a single probe
+request is let through (half-open); if it succeeds the circuit closes again.
+Only the probe decides: calls that started before the circuit opened and
+finish while it is half-open do not close or re-open it.
+
+The latency samples also provide the per-host p95 used for hedged requests.
+
+Configuration (environment variables):
+
+``TOOLUNIVERSE_CIRCUIT_BREAKER``
+    Set to ``0``/``false`` to disable circuit breaking (default enabled).
+``TOOLUNIVERSE_CIRCUIT_FAILURE_RATE``
+    Failure ratio over the recent window that opens the circuit (default 0.5).
+``TOOLUNIVERSE_CIRCUIT_MIN_CALLS``
+    Calls needed in the window before the ratio is evaluated (default 10).
+``TOOLUNIVERSE_CIRCUIT_OPEN_SECONDS``
+    Cool-down before a probe is allowed through (default 30).
+``TOOLUNIVERSE_CIRCUIT_SLOW_CALL_SECONDS``
+    Calls slower than this count as failures (default unset).
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional
+
+import requests
+
+from .exceptions import ToolUnavailableError
+from .logging_config import get_logger
+from .rate_limiter import host_of
+
+logger = get_logger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+DEFAULT_FAILURE_RATE = 0.5
+DEFAULT_MIN_CALLS = 10
+DEFAULT_WINDOW = 20
+DEFAULT_OPEN_SECONDS = 30.0
+LATENCY_SAMPLES = 200
+
+
+class CircuitOpenError(ToolUnavailableError, requests.exceptions.ConnectionError):
+    """Raised instead of sending a request while a host's circuit is open.
+
+    It is a :class:`ToolUnavailableError` for ToolUniverse's error reporting
+    and a ``requests`` ``ConnectionError`` so existing ``except
+    RequestException`` handlers in tools treat it like any network failure.
+    """
+
+
+def _env_float(name: str, default: Optional[float]) -> Optional[float]:
+    value = os.getenv(name)
+    if value in (None, ""):
+        return default
+    try:
+        return float(value)
+    except ValueError:
+        return default
+
+
+class CircuitBreaker:
+    """Closed / open / half-open breaker for one upstream host."""
+
+    def __init__(
+        self,
+        host: str,
+        *,
+        failure_rate: float = DEFAULT_FAILURE_RATE,
+        min_calls: int = DEFAULT_MIN_CALLS,
+        window: int = DEFAULT_WINDOW,
+        open_seconds: float = DEFAULT_OPEN_SECONDS,
+        slow_call_seconds: Optional[float] = None,
+    ):
+        self.host = host
+        self.failure_rate = failure_rate
+        self.min_calls = max(1, min_calls)
+        self.open_seconds = open_seconds
+        self.slow_call_seconds = slow_call_seconds
+        self.state = CLOSED
+        self._outcomes: Deque[bool] = deque(maxlen=max(window, self.min_calls))
+        self._latencies: Deque[float] = deque(maxlen=LATENCY_SAMPLES)
+        self._opened_at = 0.0
+        self._probe: Optional[object] = None
+        self._lock = threading.Lock()
+        self.rejected = 0
+        self.times_opened = 0
+
+    def before_call(self) -> Optional[object]:
+        """Raise :class:`CircuitOpenError` if the circuit rejects the call.
+
+        Returns a probe token when this call is the half-open probe, otherwise
+        ``None``. Pass it back to :meth:`record`.
+        """
+        with self._lock:
+            if self.state == CLOSED:
+                return None
+            remaining = self._opened_at + self.open_seconds - time.monotonic()
+            if self.state == OPEN and remaining <= 0:
+                self.state = HALF_OPEN
+            if self.state == HALF_OPEN and self._probe is None:
+                self._probe = object()
+                return self._probe
+            self.rejected += 1
+        raise CircuitOpenError(
+            f"Upstream {self.host} is failing; requests are paused (circuit open)",
+            next_steps=[
+                f"Retry after {max(0.0, remaining):.0f} seconds",
+                "Check the upstream service status",
+            ],
+            details={
+                "host": self.host,
+                "circuit": OPEN,
+                "retry_after": round(max(0.0, remaining), 1),
+            },
+        )
+
+    def record(
+        self,
+        success: Optional[bool],
+        latency: Optional[float] = None,
+        probe: Optional[object] = None,
+    ) -> None:
+        """Record a finished call.
+
+        ``probe`` is the token :meth:`before_call` returned; only the probe's
+        result closes or re-opens a half-open circuit. ``success=None`` marks a
+        call that says nothing about the host (for example an invalid URL); it
+        only frees a half-open probe slot.
+        """
+        with self._lock:
+            is_probe = probe is not None and probe is self._probe
+            if is_probe:
+                self._probe = None
+            if success is None:
+                return
+            if (
+                success
+                and latency is not None
+                and self.slow_call_seconds
+                and latency > self.slow_call_seconds
+            ):
+                success = False
+            if success and latency is not None:
+                self._latencies.append(latency)
+
+            if is_probe:
+                if success:
+                    self.state = CLOSED
+                    self._outcomes.clear()
+                    logger.info(
+                        "Circuit for %s closed after successful probe", self.host
+                    )
+                else:
+                    self._open()
+                return
+            if self.state != CLOSED:
+                # Started before the circuit opened; the probe decides
+                return
+
+            self._outcomes.append(success)
+            if self.state == CLOSED and len(self._outcomes) >= self.min_calls:
+                failures = self._outcomes.count(False)
+                if failures / len(self._outcomes) >= self.failure_rate:
+                    self._open()
+
+    def _open(self) -> None:
+        self.state = OPEN
+        self._opened_at = time.monotonic()
+        self.times_opened += 1
+        logger.warning(
+            "Circuit for %s opened; failing fast for %.0fs",
+            self.host,
+            self.open_seconds,
+        )
+
+    def latency_quantile(
+        self, quantile: float, min_samples: int = 20
+    ) -> Optional[float]:
+        """Return the given latency quantile of recent successful calls."""
+        with self._lock:
+            if len(self._latencies) < min_samples:
+                return None
+            samples = sorted(self._latencies)
+        index = min(len(samples) - 1, int(quantile * len(samples)))
+        return samples[index]
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            failures = self._outcomes.count(False)
+            calls = len(self._outcomes)
+            state = self.state
+        return {
+            "state": state,
+            "recent_calls": calls,
+            "recent_failures": failures,
+            "times_opened": self.times_opened,
+            "rejected": self.rejected,
+            "p95_latency": self.latency_quantile(0.95),
+        }
+
+
+class CircuitBreakerRegistry:
+    """Creates one :class:`CircuitBreaker` per host with shared settings."""
+
+    def __init__(
+        self,
+        *,
+        enabled: Optional[bool] = None,
+        failure_rate: Optional[float] = None,
+        min_calls: Optional[int] = None,
+        open_seconds: Optional[float] = None,
+        slow_call_seconds: Optional[float] = None,
+    ):
+        if enabled is None:
+            enabled = os.getenv("TOOLUNIVERSE_CIRCUIT_BREAKER", "true").lower() not in (
+                "0",
+                "false",
+                "no",
+                "off",
+            )
+        self.enabled = enabled
+        self.failure_rate = (
+            failure_rate
+            if failure_rate is not None
+            else _env_float("TOOLUNIVERSE_CIRCUIT_FAILURE_RATE", DEFAULT_FAILURE_RATE)
+        )
+        self.min_calls = int(
+            min_calls
+            if min_calls is not None
+            else _env_float("TOOLUNIVERSE_CIRCUIT_MIN_CALLS", DEFAULT_MIN_CALLS)
+        )
+        self.open_seconds = (
+            open_seconds
+            if open_seconds is not None
+            else _env_float("TOOLUNIVERSE_CIRCUIT_OPEN_SECONDS", DEFAULT_OPEN_SECONDS)
+        )
+        self.slow_call_seconds = (
+            slow_call_seconds
+            if slow_call_seconds is not None
+            else _env_float("TOOLUNIVERSE_CIRCUIT_SLOW_CALL_SECONDS", None)
+        )
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def breaker(self, url_or_host: str) -> Optional[CircuitBreaker]:
+        """Return the breaker for a URL or host (None when disabled)."""
+        if not self.enabled:
+            return None
+        host = host_of(url_or_host)
+        if not host:
+            return None
+        breaker = self._breakers.get(host)
+        if breaker is None:
+            with self._lock:
+                breaker = self._breakers.get(host)
+                if breaker is None:
+                    breaker = CircuitBreaker(
+                        host,
+                        failure_rate=self.failure_rate,
+                        min_calls=self.min_calls,
+                        open_seconds=self.open_seconds,
+                        slow_call_seconds=self.slow_call_seconds,
+                    )
+                    self._breakers[host] = breaker
+        return breaker
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        return {host: b.stats() for host, b in sorted(self._breakers.items())}
+
+
+_registry: Optional[CircuitBreakerRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_circuit_breakers() -> CircuitBreakerRegistry:
+    """Return the process-wide breaker registry, creating it on first use."""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = CircuitBreakerRegistry()
+    return _registry
+
+
+def reset_circuit_breakers() -> None:
+    """Forget all breaker state; the next request re-reads configuration."""
+    global _registry
+    with _registry_lock:
+        _registry = None
+
+
+__all__ = [
+    "CLOSED",
+    "OPEN",
+    "HALF_OPEN",
+    "CircuitBreaker",
+    "CircuitBreakerRegistry",
+    "CircuitOpenError",
+    "get_circuit_breakers",
+    "reset_circuit_breakers",
+]
@@ -6,9 +6,10 @@ disease associations, and clinical significance data.
 """
 
 import requests
-import time
 from typing import Dict, Any, Optional
+from . import deadline
 from .base_tool import BaseTool
+from .rate_limiter import get_rate_limiter, retry_after_seconds
 from .tool_registry import register_tool
 
 
@@ -32,11 +33,18 @@ class ClinVarRESTTool(BaseTool):
 
         for attempt in range(max_retries + 1):
             try:
-                response = self.session.get(url, params=params, timeout=self.timeout)
+                with get_rate_limiter().slot(url) as limiter:
+                    response = self.session.get(
+                        url,
+                        params=params,
+                        timeout=deadline.clamp_timeout(self.timeout),
+                    )
 
                 # Handle rate limiting (429 error)
                 if response.status_code == 429:
                     retry_after = response.headers.get("Retry-After")
+                    if limiter is not None:
+                        limiter.penalize(retry_after_seconds(retry_after))
                     if retry_after:
                         wait_time = int(retry_after)
                     else:
@@ -47,7 +55,7 @@ class ClinVarRESTTool(BaseTool):
                         print(
                             f"Rate limited (429). Waiting {wait_time} seconds before retry {attempt + 1}/{max_retries}..."
                         )
-                        time.sleep(wait_time)
+                        deadline.sleep(wait_time)
                         continue
                     else:
                         return {
@@ -80,12 +88,12 @@ class ClinVarRESTTool(BaseTool):
                 }
 
             except requests.exceptions.RequestException as e:
-                if attempt < max_retries:
+                if attempt < max_retries and not deadline.expired():
                     wait_time = 2**attempt
                     print(
                         f"Request failed: {str(e)}. Retrying in {wait_time} seconds..."
                     )
-                    time.sleep(wait_time)
+                    deadline.sleep(wait_time)
                     continue
                 else:
                     return {
@@ -32,7 +32,7 @@ class CrossrefTool(BaseTool):
             params["filter"] = filter_str
 
         try:
-            response = requests.get(self.base_url, params=params, timeout=20)
+            response = self.http_get(self.base_url, params=params, timeout=20)
         except requests.RequestException as e:
             return {
                 "error": "Network error calling Crossref API",
@@ -31,7 +31,7 @@ class DBLPTool(BaseTool):
             "format": "json",
         }
         try:
-            response = requests.get(self.base_url, params=params, timeout=20)
+            response = self.http_get(self.base_url, params=params, timeout=20)
         except requests.RequestException as e:
             return {
                 "error": "Network error calling DBLP API",
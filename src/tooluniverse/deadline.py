@@ -0,0 +1,153 @@
+"""
+End-to-end deadlines for tool calls.
+
+A deadline is an overall wall-clock budget for a tool call or a batch. It is
+held in a :class:`contextvars.ContextVar`, so it follows the call through
+``BaseTool`` into the shared HTTP transport and polling helpers without being
+passed around explicitly:
+
+.. code-block:: python
+
+    with deadline_scope(20):
+        tu.run_one_function(call)      # every request gets <= the time left
+
+Nested scopes can only tighten the budget. Request timeouts are clamped to the
+time left (:func:`clamp_timeout`), polling loops wait at most :func:`budget`
+seconds, and once the deadline has passed new requests fail immediately with
+:class:`DeadlineExceededError`.
+
+Worker threads do not inherit context variables; code that fans work out to a
+thread pool should submit through :func:`contextvars.copy_context` (see
+``ToolUniverse._execute_batch_jobs``).
+"""
+
+from __future__ import annotations
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional, Tuple, Union
+
+import requests
+
+from .exceptions import ToolUnavailableError
+
+Timeout = Union[None, float, Tuple[Optional[float], Optional[float]]]
+
+_deadline: ContextVar[Optional[float]] = ContextVar(
+    "tooluniverse_deadline", default=None
+)
+
+
+class DeadlineExceededError(ToolUnavailableError, requests.exceptions.Timeout):
+    """The call's overall time budget ran out.
+
+    It is a :class:`ToolUnavailableError` for ToolUniverse's error reporting
+    and a ``requests`` ``Timeout`` so tools that already handle request
+    timeouts treat it the same way.
+    """
+
+    def __init__(self, message="Deadline exceeded", details=None):
+        super().__init__(
+            message,
+            retriable=True,
+            next_steps=[
+                "Retry with a larger deadline",
+                "Split the batch into smaller requests",
+            ],
+            details=details,
+        )
+
+
+def current_deadline() -> Optional[float]:
+    """Return the active deadline as a :func:`time.monotonic` timestamp."""
+    return _deadline.get()
+
+
+def remaining() -> Optional[float]:
+    """Return seconds left before the deadline, or None if there is none."""
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
+
+
+def expired() -> bool:
+    left = remaining()
+    return left is not None and left <= 0
+
+
+def check() -> None:
+    """Raise :class:`DeadlineExceededError` if the deadline has passed."""
+    left = remaining()
+    if left is not None and left <= 0:
+        raise DeadlineExceededError(
+            f"Deadline exceeded by {-left:.2f}s", details={"overrun": round(-left, 3)}
+        )
+
+
+@contextmanager
+def deadline_scope(seconds: Optional[float]) -> Iterator[Optional[float]]:
+    """Run the block with at most ``seconds`` left (None keeps the current one).
+
+    Yields the effective deadline timestamp.
+    """
+    current = _deadline.get()
+    if seconds is None:
+        yield current
+        return
+    candidate = time.monotonic() + max(0.0, float(seconds))
+    effective = candidate if current is None else min(current, candidate)
+    token = _deadline.set(effective)
+    try:
+        yield effective
+    finally:
+        _deadline.reset(token)
+
+
+def budget(seconds: Optional[float]) -> Optional[float]:
+    """Return ``seconds`` shortened to the time left (never below zero)."""
+    left = remaining()
+    if left is None:
+        return seconds
+    left = max(0.0, left)
+    return left if seconds is None else min(seconds, left)
+
+
+def clamp_timeout(timeout: Timeout) -> Timeout:
+    """Shrink a ``requests`` timeout so it ends no later than the deadline.
+
+    Accepts a number, a ``(connect, read)`` tuple or None. Raises
+    :class:`DeadlineExceededError` when no time is left.
+    """
+    left = remaining()
+    if left is None:
+        return timeout
+    check()
+    if isinstance(timeout, tuple):
+        connect, read = timeout
+        return (
+            left if connect is None else min(connect, left),
+            left if read is None else min(read, left),
+        )
+    return left if timeout is None else min(timeout, left)
+
+
+def sleep(seconds: float) -> None:
+    """Sleep for ``seconds`` or until the deadline, whichever comes first."""
+    duration = budget(seconds)
+    if duration and duration > 0:
+        time.sleep(duration)
+
+
+__all__ = [
+    "DeadlineExceededError",
+    "budget",
+    "check",
+    "clamp_timeout",
+    "current_deadline",
+    "deadline_scope",
+    "expired",
+    "remaining",
+    "sleep",
+]
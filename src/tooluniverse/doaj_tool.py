@@ -35,7 +35,7 @@ class DOAJTool(BaseTool):
             "pageSize": max(1, min(max_results, 100)),
         }
         try:
-            resp = requests.get(endpoint, params=params, timeout=20)
+            resp = self.http_get(endpoint, params=params, timeout=20)
             resp.raise_for_status()
             data = resp.json()
         except requests.RequestException as e:
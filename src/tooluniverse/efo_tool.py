@@ -23,7 +23,7 @@ class EFOTool(BaseTool):
     def _search(self, disease, rows):
         params = {"ontology": "efo", "q": disease, "rows": rows}
         try:
-            response = requests.get(self.base_url, params=params, timeout=20)
+            response = self.http_get(self.base_url, params=params, timeout=20)
             response.raise_for_status()
         except requests.RequestException as e:
             return {"error": "OLS API request failed.", "details": str(e)}
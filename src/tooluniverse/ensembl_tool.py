@@ -18,14 +18,11 @@ class EnsemblRESTTool(BaseTool):
     def __init__(self, tool_config):
         super().__init__(tool_config)
         self.base_url = "https://rest.ensembl.org"
-        self.session = requests.Session()
-        self.session.headers.update(
-            {
-                "Accept": "application/json",
-                "Content-Type": "application/json",
-                "User-Agent": "ToolUniverse/1.0",
-            }
-        )
+        self.headers = {
+            "Accept": "application/json",
+            "Content-Type": "application/json",
+            "User-Agent": "ToolUniverse/1.0",
+        }
         self.timeout = 30
 
     def _make_request(
@@ -34,7 +31,9 @@ class EnsemblRESTTool(BaseTool):
         """Make a request to the Ensembl API."""
         url = f"{self.base_url}{endpoint}"
         try:
-            response = self.session.get(url, params=params, timeout=self.timeout)
+            response = self.http_get(
+                url, params=params, headers=self.headers, timeout=self.timeout
+            )
             response.raise_for_status()
 
             data = response.json()
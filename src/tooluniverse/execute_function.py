@@ -36,10 +36,17 @@ import warnings
 import threading
 from pathlib import Path
 from contextlib import nullcontext
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from contextvars import copy_context
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
-from .utils import read_json_list, evaluate_function_call, extract_function_call_json
+from .utils import (
+    read_json_list,
+    evaluate_function_call,
+    extract_function_call_json,
+    coerce_value_to_type,
+)
 from .exceptions import (
     ToolError,
     ToolUnavailableError,
@@ -64,6 +71,12 @@ from .logging_config import (
     set_log_level,
 )
 from .cache.result_cache_manager import ResultCacheManager
+from .cache.upstream_cache import get_upstream_cache
+from .http_client import get_transport
+from .rate_limiter import get_rate_limiter
+from . import deadline as deadlines
+from .deadline import DeadlineExceededError, deadline_scope
+from .job_scheduler import accept_deferred, deferring
 from .output_hook import HookManager
 from .default_config import default_tool_files, get_default_hook_config
 
@@ -77,6 +90,20 @@ LAZY_LOADING_ENABLED = os.getenv("TOOLUNIVERSE_LAZY_LOADING", "true").lower() in
     "yes",
 )
 
+# Tool types that search or list the loaded catalog; loading one on demand
+# loads the whole catalog so they see every tool
+CATALOG_TOOL_TYPES = frozenset(
+    {
+        "ToolFinderEmbedding",
+        "ToolFinderKeyword",
+        "ToolFinderLLM",
+        "GrepTools",
+        "ListTools",
+        "GetToolInfo",
+        "ExecuteTool",
+    }
+)
+
 if LAZY_LOADING_ENABLED:
     # Use lazy auto-discovery by default (much faster)
     debug("Starting lazy tool auto-discovery...")
@@ -175,7 +202,7 @@ class ToolNamespace:
 
         # Attempt a targeted on-demand load for this tool name
         try:
-            self.engine.load_tools(include_tools=[name])
+            self.engine.load_tools_on_demand([name])
         except Exception:
             # Ignore load errors here; we'll surface a clearer error below if still missing
             pass
@@ -250,6 +277,7 @@ class ToolUniverse:
         hooks_enabled: bool = False,
         hook_config: dict = None,
         hook_type: str = None,
+        load_on_demand: bool = False,
     ):
         """
         Initialize the ToolUniverse with tool file configurations.
@@ -266,6 +294,8 @@ class ToolUniverse:
             hook_type (str or list, optional): Simple hook type selection. Can be 'SummarizationHook',
                                              'FileSaveHook', or a list of both. Defaults to 'SummarizationHook'.
                                              If both hook_config and hook_type are provided, hook_config takes precedence.
+            load_on_demand (bool, optional): Load each tool's config the first time it is called
+                                           instead of requiring load_tools(). Defaults to False.
         """
         # Set log level if specified
         if log_level is not None:
@@ -289,6 +319,13 @@ class ToolUniverse:
         self.logger.debug("Tool files:")
         self.logger.debug(json.dumps(tool_files, indent=2))
         self.callable_functions = {}
+        # Upstream host per tool name, resolved once for rate limiting
+        self._upstream_hosts: Dict[str, Optional[str]] = {}
+        # On-demand loading state: tool name -> category index, built lazily
+        self.load_on_demand = load_on_demand
+        self._tool_index: Optional[Dict[str, str]] = None
+        self._on_demand_skipped: set = set()
+        self._on_demand_lock = threading.RLock()
 
         # Refresh the global tool_type_mappings to include any tools registered during imports
         global tool_type_mappings
@@ -326,7 +363,20 @@ class ToolUniverse:
         persistence_enabled = os.getenv(
             "TOOLUNIVERSE_CACHE_PERSIST", "true"
         ).lower() in ("true", "1", "yes")
-        memory_size = int(os.getenv("TOOLUNIVERSE_CACHE_MEMORY_SIZE", "256"))
+        memory_max_bytes_env = os.getenv("TOOLUNIVERSE_CACHE_MEMORY_MAX_BYTES")
+        memory_max_bytes = int(memory_max_bytes_env) if memory_max_bytes_env else None
+        memory_max_entry_env = os.getenv("TOOLUNIVERSE_CACHE_MEMORY_MAX_ENTRY_BYTES")
+        memory_max_entry_bytes = (
+            int(memory_max_entry_env) if memory_max_entry_env else None
+        )
+        memory_size_env = os.getenv("TOOLUNIVERSE_CACHE_MEMORY_SIZE")
+        if memory_size_env:
+            memory_size = int(memory_size_env)
+        elif memory_max_bytes:
+            # A byte budget replaces the default entry-count cap
+            memory_size = None
+        else:
+            memory_size = 256
         default_ttl_env = os.getenv("TOOLUNIVERSE_CACHE_DEFAULT_TTL")
         default_ttl = int(default_ttl_env) if default_ttl_env else None
         singleflight_enabled = os.getenv(
@@ -343,6 +393,8 @@ class ToolUniverse:
 
         self.cache_manager = ResultCacheManager(
             memory_size=memory_size,
+            memory_max_bytes=memory_max_bytes,
+            memory_max_entry_bytes=memory_max_entry_bytes,
             persistent_path=cache_path if persistence_enabled else None,
             enabled=cache_enabled,
             persistence_enabled=persistence_enabled,
@@ -350,6 +402,10 @@ class ToolUniverse:
             default_ttl=default_ttl,
         )
 
+        warm_top_n = int(os.getenv("TOOLUNIVERSE_CACHE_WARM_TOP_N", "0") or 0)
+        if warm_top_n > 0:
+            self.warm_cache(top_n=warm_top_n)
+
         self._strict_validation = os.getenv(
             "TOOLUNIVERSE_STRICT_VALIDATION", "false"
         ).lower() in ("true", "1", "yes")
@@ -791,39 +847,29 @@ class ToolUniverse:
                 cat for cat in tool_type if cat not in exclude_categories_set
             ]
 
+        # Tools the filters below would drop are not materialized at all
+        select = None
+        if include_tools_set or include_tool_types_set or exclude_tool_types_set:
+
+            def select(name, tool_type):
+                if include_tools_set and name not in include_tools_set:
+                    return False
+                if include_tool_types_set and tool_type not in include_tool_types_set:
+                    return False
+                return not (
+                    exclude_tool_types_set and tool_type in exclude_tool_types_set
+                )
+
         # Load tools from specified categories
         for each in categories_to_load:
             if each in all_tool_files:
                 try:
-                    loaded_data = read_json_list(all_tool_files[each])
-
-                    # Handle different data formats
-                    if isinstance(loaded_data, dict):
-                        # Convert dict of tools to list of tools
-                        loaded_tool_list = list(loaded_data.values())
-                        self.logger.debug(
-                            f"Converted dict to list: {len(loaded_tool_list)} tools"
-                        )
-                    elif isinstance(loaded_data, list):
-                        loaded_tool_list = loaded_data
-                    else:
-                        self.logger.warning(
-                            f"Unexpected data format from {all_tool_files[each]}: {type(loaded_data)}"
-                        )
+                    loaded_tool_list = self._read_category_tools(
+                        each, all_tool_files[each], select
+                    )
+                    if loaded_tool_list is None:
                         continue
 
-                    # Add MCP annotations to each tool config
-                    from .tool_defaults import add_annotations_to_tool_config
-
-                    for tool in loaded_tool_list:
-                        if isinstance(tool, dict):
-                            # Set source_file and category for proper annotation derivation
-                            if "source_file" not in tool:
-                                tool["source_file"] = all_tool_files[each]
-                            if "category" not in tool:
-                                tool["category"] = each
-                            add_annotations_to_tool_config(tool)
-
                     self.all_tools += loaded_tool_list
                     self.tool_category_dicts[each] = loaded_tool_list
                     self.logger.debug(
@@ -853,6 +899,62 @@ class ToolUniverse:
         self.logger.debug("Checking for MCP Auto Loader tools...")
         self._process_mcp_auto_loaders()
 
+    def _read_category_tools(self, category, file_path, select=None):
+        """
+        Return the annotated tool configs of one category.
+
+        Served from the precompiled tool manifest when it covers ``file_path``
+        unchanged, otherwise read from the JSON file.
+
+        Args:
+            category (str): Category name the tools are loaded under.
+            file_path (str): Path of the category's JSON file.
+            select (callable, optional): ``select(name, tool_type)`` returning False
+                                         for tools to leave out.
+
+        Returns:
+            list or None: Tool configs, or None if the file has an unexpected format.
+        """
+        from .tool_manifest import get_tool_manifest
+
+        manifest = get_tool_manifest()
+        if manifest is not None and manifest.covers(category, file_path):
+            return manifest.configs(category, file_path, select)
+
+        loaded_data = read_json_list(file_path)
+
+        # Handle different data formats
+        if isinstance(loaded_data, dict):
+            # Convert dict of tools to list of tools
+            loaded_tool_list = list(loaded_data.values())
+            self.logger.debug(f"Converted dict to list: {len(loaded_tool_list)} tools")
+        elif isinstance(loaded_data, list):
+            loaded_tool_list = loaded_data
+        else:
+            self.logger.warning(
+                f"Unexpected data format from {file_path}: {type(loaded_data)}"
+            )
+            return None
+
+        # Add MCP annotations to each tool config
+        from .tool_defaults import add_annotations_to_tool_config
+
+        tools = []
+        for tool in loaded_tool_list:
+            if isinstance(tool, dict):
+                if select is not None and not select(
+                    tool.get("name", ""), tool.get("type", "Unknown")
+                ):
+                    continue
+                # Set source_file and category for proper annotation derivation
+                if "source_file" not in tool:
+                    tool["source_file"] = file_path
+                if "category" not in tool:
+                    tool["category"] = category
+                add_annotations_to_tool_config(tool)
+            tools.append(tool)
+        return tools
+
     def _load_tool_names_from_file(self, file_path):
         """
         Load tool names from a text file (one tool name per line).
@@ -1024,6 +1126,143 @@ class ToolUniverse:
                     self.all_tools.append(config)
                     self.logger.debug(f"Added auto-discovered config: {config['name']}")
 
+    def load_tools_on_demand(self, tool_names: List[str]) -> List[str]:
+        """
+        Load the configs of ``tool_names`` without loading the rest of the catalog.
+
+        Each name is looked up in the tool index (see :mod:`tooluniverse.tool_index`)
+        and only the file that defines it is read. Tools loaded this way are added to
+        the ones already loaded. Safe to call from several threads.
+
+        Args:
+            tool_names (list): Names of the tools to load.
+
+        Returns:
+            list: Names that could not be found in any tool file or auto-discovered
+                  config. Tools skipped for missing API keys are not included.
+        """
+        missing = [
+            name
+            for name in tool_names
+            if name not in self.all_tool_dict and name not in self._on_demand_skipped
+        ]
+        if not missing:
+            return []
+
+        with self._on_demand_lock:
+            missing = [
+                name
+                for name in missing
+                if name not in self.all_tool_dict
+                and name not in self._on_demand_skipped
+            ]
+            if not missing:
+                return []
+
+            missing = self._load_indexed_tools(missing, self._get_tool_index())
+            if missing:
+                # Names outside the prebuilt index: rebuild it from the tool files
+                from .tool_index import build_tool_index
+
+                self._tool_index = build_tool_index(self.tool_files)
+                missing = self._load_indexed_tools(missing, self._tool_index)
+
+            if missing:
+                from .tool_registry import get_config_registry
+
+                discovered = {
+                    config.get("name"): config
+                    for config in get_config_registry().values()
+                }
+                for name in list(missing):
+                    if name in discovered:
+                        self._add_on_demand_tool(discovered[name])
+                        missing.remove(name)
+
+        return missing
+
+    def _get_tool_index(self) -> Dict[str, str]:
+        if self._tool_index is None:
+            from .tool_index import load_static_tool_index
+
+            self._tool_index = load_static_tool_index() or {}
+        return self._tool_index
+
+    def _load_indexed_tools(
+        self, tool_names: List[str], index: Dict[str, str]
+    ) -> List[str]:
+        """Load ``tool_names`` from the files ``index`` points to; return the rest."""
+        by_category: Dict[str, set] = {}
+        for name in tool_names:
+            category = index.get(name)
+            if category in self.tool_files:
+                by_category.setdefault(category, set()).add(name)
+
+        found = set()
+        for category, wanted in by_category.items():
+            try:
+                configs = self._read_category_tools(
+                    category,
+                    self.tool_files[category],
+                    lambda name, _tool_type, wanted=wanted: name in wanted,
+                )
+            except Exception as e:
+                self.logger.error(
+                    f"Error loading tools from category '{category}': {e}"
+                )
+                continue
+            for tool in configs or []:
+                if not isinstance(tool, dict):
+                    continue
+                name = tool.get("name")
+                if name in found:
+                    continue
+                found.add(name)
+                if "required_api_keys" in tool:
+                    all_keys_available, missing_keys = self._check_api_key_requirements(
+                        tool
+                    )
+                    if not all_keys_available:
+                        self._on_demand_skipped.add(name)
+                        warning(
+                            f"Tool '{name}' is not loaded due to missing API keys: "
+                            f"{', '.join(missing_keys)}"
+                        )
+                        continue
+                self._add_on_demand_tool(tool)
+
+        return [name for name in tool_names if name not in found]
+
+    def _add_on_demand_tool(self, tool: Dict[str, Any]) -> None:
+        self.all_tools.append(tool)
+        self.all_tool_dict[tool["name"]] = tool
+        category = tool.get("category")
+        if category:
+            self.tool_category_dicts.setdefault(category, []).append(tool)
+        self.logger.debug(f"Loaded tool on demand: {tool['name']}")
+
+    def _ensure_tools_loaded(self, tool_names) -> None:
+        """Load ``tool_names`` on demand, falling back to a full ``load_tools()``.
+
+        The full load covers tools that only exist after it runs (MCP auto-loaded
+        and remote tools) and catalog tools such as the tool finders. After it,
+        on-demand loading is switched off for this instance.
+        """
+        missing = self.load_tools_on_demand(
+            [name for name in tool_names if name and name not in self.all_tool_dict]
+        )
+        needs_catalog = any(
+            self.all_tool_dict.get(name, {}).get("type") in CATALOG_TOOL_TYPES
+            for name in tool_names
+        )
+        if not (missing or needs_catalog):
+            return
+        with self._on_demand_lock:
+            if self.load_on_demand:
+                self.logger.debug("Loading the full tool catalog")
+                self.load_tools()
+                self.load_on_demand = False
+
     def _process_mcp_auto_loaders(self):
         """
         Process any MCPAutoLoaderTool instances to automatically discover and register MCP tools.
@@ -1850,6 +2089,7 @@ class ToolUniverse:
         stream_callback=None,
         use_cache: bool = False,
         max_workers: Optional[int] = None,
+        deadline: Optional[float] = None,
     ) -> List[Any]:
         """Execute a list of function calls, optionally in parallel.
 
@@ -1858,6 +2098,8 @@ class ToolUniverse:
             stream_callback: Optional streaming callback.
             use_cache: Whether to enable cache lookups for each call.
             max_workers: Maximum parallel workers; values <=1 fall back to sequential execution.
+            deadline: Time budget in seconds for the whole batch. Jobs not finished
+                when it passes get a timeout error instead of a result.
 
         Returns:
             List of results aligned with ``function_calls`` order.
@@ -1875,18 +2117,21 @@ class ToolUniverse:
 
         jobs = self._build_batch_jobs(function_calls)
         results: List[Any] = [None] * len(function_calls)
-
-        jobs_to_run = self._prime_batch_cache(jobs, use_cache, results)
-        if not jobs_to_run:
-            return results
-
-        self._execute_batch_jobs(
-            jobs_to_run,
-            results,
-            stream_callback=stream_callback,
-            use_cache=use_cache,
-            max_workers=max_workers,
-        )
+        if self.load_on_demand:
+            self._ensure_tools_loaded({job.function_name for job in jobs})
+
+        with deadline_scope(deadline):
+            jobs_to_run = self._prime_batch_cache(jobs, use_cache, results)
+            if not jobs_to_run:
+                return results
+
+            self._execute_batch_jobs(
+                jobs_to_run,
+                results,
+                stream_callback=stream_callback,
+                use_cache=use_cache,
+                max_workers=max_workers,
+            )
 
         return results
 
@@ -1986,34 +2231,119 @@ class ToolUniverse:
         if not jobs_to_run:
             return
 
+        self._prepare_batch_tools(jobs_to_run)
         tool_semaphores: Dict[str, Optional[threading.Semaphore]] = {}
-
-        def run_job(job: _BatchJob):
+        # Once the batch deadline passes, unfinished jobs get a timeout error
+        # and late results are dropped rather than written into ``results``
+        results_lock = threading.Lock()
+        finished: set = set()
+        timed_out = threading.Event()
+
+        def record(job: _BatchJob, result) -> None:
+            with results_lock:
+                if timed_out.is_set():
+                    return
+                finished.add(id(job))
+                for idx in job.indices:
+                    results[idx] = result
+
+        def run_job(job: _BatchJob, defer: bool = False) -> Optional[Future]:
+            """Run ``job`` and record its result, or return the future of a
+            tool that finishes later (only with ``defer``)."""
             semaphore = self._get_tool_semaphore(job, tool_semaphores)
             if semaphore:
                 semaphore.acquire()
             try:
-                result = self.run_one_function(
-                    job.call,
-                    stream_callback=stream_callback,
-                    use_cache=use_cache,
-                )
+                with accept_deferred(self if defer else None):
+                    result = self.run_one_function(
+                        job.call,
+                        stream_callback=stream_callback,
+                        use_cache=use_cache,
+                    )
             finally:
                 if semaphore:
                     semaphore.release()
 
-            for idx in job.indices:
-                results[idx] = result
+            if isinstance(result, Future):
+                return result
+            record(job, result)
+            return None
 
         if max_workers and max_workers > 1:
-            with ThreadPoolExecutor(max_workers=max_workers) as executor:
-                futures = [executor.submit(run_job, job) for job in jobs_to_run]
-                for future in as_completed(futures):
-                    future.result()
+            # Size per-host connection pools so workers never wait on a socket
+            get_transport().ensure_pool_size(max_workers)
+            jobs_to_run = self._interleave_jobs_by_host(jobs_to_run)
+            executor = ThreadPoolExecutor(max_workers=max_workers)
+            try:
+                # Workers do not inherit context variables such as the deadline.
+                # A job whose tool hands back a future (a pending upstream job)
+                # frees its worker; the future is awaited here instead.
+                jobs_by_future = {
+                    executor.submit(copy_context().run, run_job, job, True): job
+                    for job in jobs_to_run
+                }
+                deferred = set()
+                pending = set(jobs_by_future)
+                while pending:
+                    done, pending = wait(
+                        pending,
+                        timeout=deadlines.budget(None),
+                        return_when=FIRST_COMPLETED,
+                    )
+                    if not done:
+                        raise FuturesTimeoutError()
+                    for future in done:
+                        job = jobs_by_future[future]
+                        if future in deferred:
+                            record(job, future.result())
+                            continue
+                        tool_future = future.result()
+                        if tool_future is not None:
+                            jobs_by_future[tool_future] = job
+                            deferred.add(tool_future)
+                            pending.add(tool_future)
+            except FuturesTimeoutError:
+                with results_lock:
+                    timed_out.set()
+                    for job in jobs_to_run:
+                        if id(job) not in finished:
+                            error_result = self._create_dual_format_error(
+                                DeadlineExceededError(
+                                    f"Deadline passed before {job.function_name} finished",
+                                    details={"tool_name": job.function_name},
+                                )
+                            )
+                            for idx in job.indices:
+                                results[idx] = error_result
+            finally:
+                executor.shutdown(
+                    wait=not timed_out.is_set(), cancel_futures=timed_out.is_set()
+                )
         else:
             for job in jobs_to_run:
                 run_job(job)
 
+    def _prepare_batch_tools(self, jobs: List[_BatchJob]) -> None:
+        """Give each tool with several jobs a chance to bulk-load its data."""
+        arguments_by_tool: Dict[str, List[Any]] = {}
+        first_job: Dict[str, _BatchJob] = {}
+        for job in jobs:
+            if not job.function_name:
+                continue
+            arguments_by_tool.setdefault(job.function_name, []).append(job.arguments)
+            first_job.setdefault(job.function_name, job)
+
+        for function_name, arguments_list in arguments_by_tool.items():
+            if len(arguments_list) < 2:
+                continue
+            tool_instance = self._ensure_tool_instance(first_job[function_name])
+            if tool_instance is None:
+                continue
+            try:
+                tool_instance.prepare_batch(arguments_list)
+            except Exception as e:
+                self.logger.debug("prepare_batch failed for %s: %s", function_name, e)
+
     def _ensure_tool_instance(self, job: _BatchJob):
         if job.tool_instance is None and job.function_name:
             job.tool_instance = self._get_tool_instance(job.function_name, cache=True)
@@ -2048,6 +2378,7 @@ class ToolUniverse:
         stream_callback=None,
         use_cache: bool = False,
         max_workers: Optional[int] = None,
+        deadline: Optional[float] = None,
     ):
         """
         Execute function calls from input string or data.
@@ -2060,6 +2391,10 @@ class ToolUniverse:
             return_message (bool, optional): Whether to return formatted messages. Defaults to False.
             verbose (bool, optional): Whether to enable verbose output. Defaults to True.
             format (str, optional): Format type for parsing. Defaults to 'llama'.
+            deadline (float, optional): Overall time budget in seconds for the
+                call or the whole batch. Request timeouts and polling waits are
+                shortened to the time left; batch jobs still running when it
+                passes get a timeout error. Defaults to no deadline.
 
         Returns:
             list or str or None:
@@ -2084,6 +2419,7 @@ class ToolUniverse:
                     stream_callback=stream_callback,
                     use_cache=use_cache,
                     max_workers=max_workers,
+                    deadline=deadline,
                 )
 
                 call_results = []
@@ -2111,13 +2447,19 @@ class ToolUniverse:
                     function_call_json,
                     stream_callback=stream_callback,
                     use_cache=use_cache,
+                    deadline=deadline,
                 )
         else:
             error("Not a function call")
             return None
 
     def run_one_function(
-        self, function_call_json, stream_callback=None, use_cache=False, validate=True
+        self,
+        function_call_json,
+        stream_callback=None,
+        use_cache=False,
+        validate=True,
+        deadline: Optional[float] = None,
     ):
         """
         Execute a single function call.
@@ -2131,12 +2473,25 @@ class ToolUniverse:
             stream_callback (callable, optional): Callback for streaming responses.
             use_cache (bool, optional): Whether to use result caching. Defaults to False.
             validate (bool, optional): Whether to validate parameters against schema. Defaults to True.
+            deadline (float, optional): Time budget in seconds for this call, carried to
+                the shared HTTP layer and polling helpers. Nested deadlines only tighten.
 
         Returns:
             str or dict: Result from the tool execution, or error message if validation fails.
         """
+        if deadline is not None:
+            with deadline_scope(deadline):
+                return self.run_one_function(
+                    function_call_json,
+                    stream_callback=stream_callback,
+                    use_cache=use_cache,
+                    validate=validate,
+                )
+
         function_name = function_call_json.get("name", "")
         arguments = function_call_json.get("arguments", {})
+        # A parallel batch worker takes a future for tools that finish later
+        defer = deferring(self)
 
         # Handle malformed queries gracefully
         if not function_name:
@@ -2147,6 +2502,9 @@ class ToolUniverse:
                 "error": f"Arguments must be a dictionary, got {type(arguments).__name__}"
             }
 
+        if self.load_on_demand:
+            self._ensure_tools_loaded([function_name])
+
         tool_instance = None
         cache_namespace = None
         cache_version = None
@@ -2170,13 +2528,28 @@ class ToolUniverse:
                 composed_cache_key = self.cache_manager.compose_key(
                     cache_namespace, cache_version, cache_key
                 )
-                cached_value = self.cache_manager.get(
+                cached_value, is_stale = self.cache_manager.lookup(
                     namespace=cache_namespace,
                     version=cache_version,
                     cache_key=cache_key,
+                    allow_stale=tool_instance.get_cache_stale_ttl() is not None,
                 )
                 if cached_value is not None:
-                    self.logger.debug(f"Cache hit for {function_name}")
+                    if is_stale:
+                        self.logger.debug(
+                            f"Serving stale cache entry for {function_name}; "
+                            "refreshing in background"
+                        )
+                        self._schedule_cache_refresh(
+                            function_call_json,
+                            tool_instance,
+                            composed_cache_key,
+                            cache_namespace,
+                            cache_version,
+                            cache_key,
+                        )
+                    else:
+                        self.logger.debug(f"Cache hit for {function_name}")
                     return cached_value
                 cache_guard = self.cache_manager.singleflight_guard(composed_cache_key)
             else:
@@ -2218,15 +2591,27 @@ class ToolUniverse:
                         )
                     )
 
+            cache_info = (
+                _BatchCacheInfo(cache_namespace, cache_version, cache_key)
+                if cache_enabled
+                else None
+            )
+
             # Execute the tool
             tool_arguments = arguments
             try:
+                deadlines.check()
                 if tool_instance is None:
                     tool_instance = self._get_tool_instance(function_name, cache=True)
 
                 if tool_instance:
                     result, tool_arguments = self._execute_tool_with_stream(
-                        tool_instance, arguments, stream_callback, use_cache, validate
+                        tool_instance,
+                        arguments,
+                        stream_callback,
+                        use_cache,
+                        validate,
+                        defer=defer,
                     )
                 else:
                     # Try to auto-load tools if dictionary is empty
@@ -2251,6 +2636,7 @@ class ToolUniverse:
                             stream_callback,
                             use_cache,
                             validate,
+                            defer=defer,
                         )
                     else:
                         error_msg = (
@@ -2265,55 +2651,235 @@ class ToolUniverse:
                                 ],
                             )
                         )
+
+                # Callers outside a batch wait for a deferred result here
+                if isinstance(result, Future) and not defer:
+                    result = result.result()
             except Exception as e:
-                # Classify and return structured error
-                classified_error = self._classify_exception(e, function_name, arguments)
-                return self._create_dual_format_error(classified_error)
+                return self._tool_error_result(
+                    e, function_name, arguments, tool_instance, cache_info
+                )
 
-            # Apply output hooks if enabled
-            if self.hook_manager:
-                context = {
-                    "tool_name": function_name,
-                    "tool_type": (
-                        tool_instance.__class__.__name__
-                        if tool_instance is not None
-                        else "unknown"
+            if isinstance(result, Future):
+                # Hooks and caching run when the tool's future completes, so
+                # the batch worker is free meanwhile. The single-flight guard
+                # above is released before the result is cached.
+                return self._chain_deferred(
+                    result,
+                    lambda value: self._finish_tool_result(
+                        value,
+                        function_name,
+                        arguments,
+                        tool_arguments,
+                        tool_instance,
+                        cache_info,
+                    ),
+                    lambda error: self._tool_error_result(
+                        error, function_name, arguments, tool_instance, cache_info
                     ),
-                    "execution_time": time.time(),
-                    "arguments": tool_arguments,
-                }
-                result = self.hook_manager.apply_hooks(
-                    result, function_name, tool_arguments, context
                 )
+            return self._finish_tool_result(
+                result,
+                function_name,
+                arguments,
+                tool_arguments,
+                tool_instance,
+                cache_info,
+            )
 
-            # Cache result if enabled
-            if (
-                cache_enabled
-                and tool_instance
-                and getattr(tool_instance, "supports_caching", lambda: True)()
-            ):
-                if cache_key is None:
-                    cache_key = self._make_cache_key(function_name, arguments)
-                if cache_namespace is None:
-                    cache_namespace = tool_instance.get_cache_namespace()
-                if cache_version is None:
-                    cache_version = tool_instance.get_cache_version()
-                ttl = tool_instance.get_cache_ttl(result)
+    def _tool_error_result(
+        self,
+        error: Exception,
+        function_name: str,
+        arguments: Dict[str, Any],
+        tool_instance,
+        cache_info: Optional[_BatchCacheInfo],
+    ):
+        """Classify a tool failure into a structured error result."""
+        classified_error = self._classify_exception(error, function_name, arguments)
+        error_result = self._create_dual_format_error(classified_error)
+        if (
+            cache_info is not None
+            and tool_instance is not None
+            and not isinstance(classified_error, DeadlineExceededError)
+        ):
+            # Negative caching: briefly remember the failure so retries
+            # from other callers do not hammer a failing upstream
+            error_ttl = tool_instance.get_error_cache_ttl(classified_error)
+            if error_ttl:
                 self.cache_manager.set(
-                    namespace=cache_namespace,
-                    version=cache_version,
-                    cache_key=cache_key,
-                    value=result,
-                    ttl=ttl,
+                    namespace=cache_info.namespace,
+                    version=cache_info.version,
+                    cache_key=cache_info.cache_key,
+                    value=error_result,
+                    ttl=error_ttl,
+                    persist=False,
                 )
+        return error_result
+
+    def _finish_tool_result(
+        self,
+        result,
+        function_name: str,
+        arguments: Dict[str, Any],
+        tool_arguments,
+        tool_instance,
+        cache_info: Optional[_BatchCacheInfo],
+    ):
+        """Apply output hooks to a tool's result and cache it if enabled."""
+        if self.hook_manager:
+            context = {
+                "tool_name": function_name,
+                "tool_type": (
+                    tool_instance.__class__.__name__
+                    if tool_instance is not None
+                    else "unknown"
+                ),
+                "execution_time": time.time(),
+                "arguments": tool_arguments,
+            }
+            result = self.hook_manager.apply_hooks(
+                result, function_name, tool_arguments, context
+            )
+
+        if (
+            cache_info is not None
+            and tool_instance
+            and getattr(tool_instance, "supports_caching", lambda: True)()
+        ):
+            self.cache_manager.set(
+                namespace=cache_info.namespace,
+                version=cache_info.version,
+                cache_key=cache_info.cache_key,
+                value=result,
+                ttl=tool_instance.get_cache_ttl(result),
+                stale_ttl=tool_instance.get_cache_stale_ttl(),
+                arguments=arguments,
+            )
+
+        return result
+
+    @staticmethod
+    def _chain_deferred(future: Future, finish, fail) -> Future:
+        """Return a future for ``finish(value)`` once ``future`` resolves.
+
+        A failed tool future resolves to ``fail(error)`` like a tool that
+        raised; errors from ``finish`` itself fail the returned future.
+        """
+        chained: Future = Future()
+        context = copy_context()
+
+        def resolve(done: Future) -> None:
+            try:
+                value = done.result()
+            except Exception as e:
+                chained.set_result(context.run(fail, e))
+                return
+            except BaseException as e:
+                chained.set_exception(e)
+                return
+            try:
+                chained.set_result(context.run(finish, value))
+            except BaseException as e:
+                chained.set_exception(e)
+
+        future.add_done_callback(resolve)
+        return chained
 
-            return result
+    def _schedule_cache_refresh(
+        self,
+        function_call_json,
+        tool_instance,
+        composed_cache_key: str,
+        cache_namespace: str,
+        cache_version: str,
+        cache_key: str,
+    ) -> bool:
+        """Re-execute a call in the background to replace a stale cache entry.
+
+        Failed refreshes leave the stale value in place until it expires.
+
+        Returns:
+            True if a refresh was scheduled, False if one is already running.
+        """
+        call = copy.deepcopy(function_call_json)
+
+        def refresh():
+            result = self.run_one_function(call, use_cache=False)
+            if isinstance(result, dict) and "error_details" in result:
+                return
+            self.cache_manager.set(
+                namespace=cache_namespace,
+                version=cache_version,
+                cache_key=cache_key,
+                value=result,
+                ttl=tool_instance.get_cache_ttl(result),
+                stale_ttl=tool_instance.get_cache_stale_ttl(),
+                arguments=call.get("arguments"),
+            )
+
+        return self.cache_manager.schedule_refresh(composed_cache_key, refresh)
+
+    def _apply_rate_limit(self, tool_instance) -> Optional[str]:
+        """Register a tool's declared host budget and return its upstream host.
+
+        The host budget itself lives in the process-wide rate limiter, so
+        every tool talking to the same host shares it.
+        """
+        tool_config = getattr(tool_instance, "tool_config", None) or {}
+        name = tool_config.get("name", tool_instance.__class__.__name__)
+        if name in self._upstream_hosts:
+            return self._upstream_hosts[name]
+
+        host = None
+        get_host = getattr(tool_instance, "get_upstream_host", None)
+        if callable(get_host):
+            host = get_host()
+            rate_limit = tool_instance.get_rate_limit()
+            if host and rate_limit:
+                get_rate_limiter().declare(host, rate_limit)
+        self._upstream_hosts[name] = host
+        return host
+
+    def _interleave_jobs_by_host(self, jobs: List[_BatchJob]) -> List[_BatchJob]:
+        """Order batch jobs round-robin across upstream hosts.
+
+        Workers pick jobs in submission order, so interleaving keeps them
+        spread over hosts instead of queueing on one host's rate limit.
+        """
+        by_host: Dict[Optional[str], List[_BatchJob]] = {}
+        for job in jobs:
+            tool_instance = self._ensure_tool_instance(job)
+            host = (
+                self._apply_rate_limit(tool_instance)
+                if tool_instance is not None
+                else None
+            )
+            by_host.setdefault(host, []).append(job)
+        if len(by_host) < 2:
+            return jobs
+
+        queues = list(by_host.values())
+        ordered: List[_BatchJob] = []
+        for position in range(max(len(queue) for queue in queues)):
+            ordered.extend(queue[position] for queue in queues if position < len(queue))
+        return ordered
 
     def _execute_tool_with_stream(
-        self, tool_instance, arguments, stream_callback, use_cache=False, validate=True
+        self,
+        tool_instance,
+        arguments,
+        stream_callback,
+        use_cache=False,
+        validate=True,
+        defer=False,
     ):
-        """Invoke a tool, forwarding stream callbacks and other parameters when supported."""
+        """Invoke a tool, forwarding stream callbacks and other parameters when supported.
+
+        With ``defer`` the tool may return a future (:meth:`BaseTool.defer`).
+        """
 
+        self._apply_rate_limit(tool_instance)
         tool_arguments = arguments
         stream_flag_key = (
             getattr(tool_instance, "STREAM_FLAG_KEY", None) if stream_callback else None
@@ -2346,13 +2912,15 @@ class ToolUniverse:
                 kwargs["validate"] = validate
 
             # Call with all supported parameters
-            return tool_instance.run(tool_arguments, **kwargs), tool_arguments
+            with accept_deferred(tool_instance if defer else None):
+                return tool_instance.run(tool_arguments, **kwargs), tool_arguments
 
         except (ValueError, TypeError) as e:
             # If inspection fails or tool doesn't accept extra params,
             # fall back to simple execution with just arguments
             self.logger.debug(f"Falling back to simple run() call: {e}")
-            return tool_instance.run(tool_arguments), tool_arguments
+            with accept_deferred(tool_instance if defer else None):
+                return tool_instance.run(tool_arguments), tool_arguments
 
     def toggle_hooks(self, enabled: bool):
         """
@@ -2553,77 +3121,10 @@ class ToolUniverse:
         """
         Coerce a value to match the schema's expected type.
 
-        This function attempts to convert string values to integers, floats,
-        or booleans when the schema expects those types. This makes the
-        system more lenient with user input from LLMs that provide numeric
-        values as strings.
-
-        Args:
-            value: The value to coerce
-            schema: The JSON schema definition for this value
-
-        Returns:
-            The coerced value (or original if coercion fails or not applicable)
-        """
-        # Only coerce string values
-        if not isinstance(value, str):
-            return value
-
-        # Handle anyOf/oneOf schemas by recursively trying each option
-        if "anyOf" in schema:
-            for option in schema["anyOf"]:
-                coerced = self._coerce_value_to_type(value, option)
-                if coerced is not value:  # Coercion succeeded
-                    return coerced
-            return value
-
-        if "oneOf" in schema:
-            for option in schema["oneOf"]:
-                coerced = self._coerce_value_to_type(value, option)
-                if coerced is not value:  # Coercion succeeded
-                    return coerced
-            return value
-
-        # Handle array types
-        if schema.get("type") == "array" and "items" in schema:
-            if isinstance(value, list):
-                # Recursively coerce array items
-                items_schema = schema["items"]
-                return [
-                    self._coerce_value_to_type(item, items_schema) for item in value
-                ]
-            return value
-
-        # Get the expected type
-        expected_type = schema.get("type")
-
-        # Don't coerce if schema expects string type
-        if expected_type == "string":
-            return value
-
-        # Try to coerce based on expected type
-        if expected_type == "integer":
-            try:
-                # Only parse as int if it represents an integer (not a float)
-                if "." not in value:
-                    return int(value)
-            except (ValueError, TypeError):
-                # If coercion fails, return the original value as per function design
-                pass
-        elif expected_type == "number":
-            try:
-                return float(value)
-            except (ValueError, TypeError):
-                pass
-        elif expected_type == "boolean":
-            # Handle common boolean string representations
-            lower_value = value.lower().strip()
-            if lower_value in ("true", "1", "yes", "on"):
-                return True
-            elif lower_value in ("false", "0", "no", "off"):
-                return False
-
-        return value
+        Delegates to :func:`tooluniverse.utils.coerce_value_to_type`; kept as a
+        method for backward compatibility.
+        """
+        return coerce_value_to_type(value, schema)
 
     def _coerce_arguments_to_schema(self, function_name: str, arguments: dict) -> dict:
         """
@@ -2681,7 +3182,9 @@ class ToolUniverse:
                     f"Tool '{function_name}' not found even after loading tools"
                 )
 
-        tool_instance = self._get_tool_instance(function_name, cache=False)
+        # Use the cached instance so its compiled validator is reused; the
+        # same instance is needed to execute the call right after validation
+        tool_instance = self._get_tool_instance(function_name, cache=True)
         if not tool_instance:
             # Check if we have a recorded error for this tool
             tool_errors = get_tool_errors()
@@ -2749,21 +3252,127 @@ class ToolUniverse:
         tool_names = names or list(self.all_tool_dict.keys())
         self.logger.info(f"Eager loading {len(tool_names)} tools...")
 
-        for tool_name in tool_names:
-            if (
-                tool_name in self.all_tool_dict
-                and tool_name not in self.callable_functions
-            ):
-                try:
-                    self.init_tool(self.all_tool_dict[tool_name], add_to_cache=True)
-                    self.logger.debug(f"Eager loaded: {tool_name}")
-                except Exception as e:
-                    self.logger.warning(f"Failed to eager load {tool_name}: {e}")
+        report = self.prewarm(tool_names)
+        for tool_name, entry in report.items():
+            if entry["status"] == "failed":
+                self.logger.warning(
+                    f"Failed to eager load {tool_name}: {entry.get('error')}"
+                )
 
         self.logger.info(
             f"Eager loading completed. {len(self.callable_functions)} tools cached."
         )
 
+    def prewarm(
+        self,
+        tools: Optional[List[str]] = None,
+        max_workers: Optional[int] = None,
+        deadline: Optional[float] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Instantiate tools concurrently so their first calls skip constructor cost.
+
+        Constructors run on a pool of ``max_workers`` threads (default
+        ``TOOLUNIVERSE_PREWARM_WORKERS``, 8). Two tool config fields shape the
+        schedule:
+
+        - ``"init_bound": "cpu"`` runs the constructor on one separate thread,
+          because CPU-bound constructors do not overlap under the GIL.
+        - ``"init_group": "<name>"`` builds the tools of a group one after another
+          on the same thread, so a resource they share (a model, a dataset, a
+          tool they depend on) is set up once, by the first of them.
+
+        Constructor failures are recorded with ``mark_tool_unavailable`` by
+        :meth:`init_tool`, as they are on first use.
+
+        Args:
+            tools (list, optional): Names of the tools to build. Defaults to every
+                                    loaded tool.
+            max_workers (int, optional): Threads for I/O-bound constructors.
+            deadline (float, optional): Seconds to wait. Tools still building are
+                                        reported as ``"timeout"`` and finish in the
+                                        background.
+
+        Returns:
+            dict: Per tool name, ``status`` (``"ready"``, ``"cached"``, ``"failed"``,
+                  ``"unknown"`` or ``"timeout"``), ``seconds`` spent in the
+                  constructor and, for failures, ``error``.
+        """
+        if tools is None:
+            tool_names = list(self.all_tool_dict)
+        else:
+            tool_names = list(dict.fromkeys(tools))
+            if self.load_on_demand:
+                self._ensure_tools_loaded(tool_names)
+        if max_workers is None:
+            max_workers = int(os.getenv("TOOLUNIVERSE_PREWARM_WORKERS", "8") or 8)
+
+        report: Dict[str, Dict[str, Any]] = {}
+        groups: Dict[tuple, List[Dict[str, Any]]] = {}
+        cpu_groups = set()
+        for tool_name in tool_names:
+            config = self.all_tool_dict.get(tool_name)
+            if tool_name in self.callable_functions:
+                report[tool_name] = {"status": "cached", "seconds": 0.0}
+            elif config is None:
+                report[tool_name] = {"status": "unknown", "seconds": 0.0}
+            else:
+                group = config.get("init_group")
+                key = ("group", group) if group else ("tool", tool_name)
+                groups.setdefault(key, []).append(config)
+                if config.get("init_bound") == "cpu":
+                    cpu_groups.add(key)
+        if not groups:
+            return report
+
+        report_lock = threading.Lock()
+        closed = threading.Event()
+
+        def build(configs):
+            for config in configs:
+                if closed.is_set():
+                    return
+                tool_name = config["name"]
+                start = time.perf_counter()
+                instance = self.init_tool(config, add_to_cache=True)
+                entry = {
+                    "status": "ready" if instance is not None else "failed",
+                    "seconds": round(time.perf_counter() - start, 3),
+                }
+                if instance is None:
+                    entry["error"] = get_tool_errors().get(tool_name, {}).get("error")
+                with report_lock:
+                    if not closed.is_set():
+                        report[tool_name] = entry
+
+        io_pool = ThreadPoolExecutor(
+            max_workers=max(1, max_workers), thread_name_prefix="tu-prewarm"
+        )
+        cpu_pool = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="tu-prewarm-cpu"
+        )
+        futures = []
+        with deadline_scope(deadline):
+            for key, configs in groups.items():
+                pool = cpu_pool if key in cpu_groups else io_pool
+                futures.append(pool.submit(copy_context().run, build, configs))
+            wait(futures, timeout=deadlines.remaining())
+            with report_lock:
+                closed.set()
+                for configs in groups.values():
+                    for config in configs:
+                        report.setdefault(
+                            config["name"], {"status": "timeout", "seconds": None}
+                        )
+        io_pool.shutdown(wait=False, cancel_futures=True)
+        cpu_pool.shutdown(wait=False, cancel_futures=True)
+
+        self.logger.debug(
+            "Prewarmed %d tools",
+            sum(1 for entry in report.values() if entry["status"] == "ready"),
+        )
+        return report
+
     @property
     def _cache(self):
         """Access to the internal cache for testing purposes."""
@@ -2772,16 +3381,78 @@ class ToolUniverse:
         return {}
 
     def clear_cache(self):
-        """Clear the result cache."""
+        """Clear the result cache and the shared upstream document cache."""
         if self.cache_manager:
             self.cache_manager.clear()
+        get_upstream_cache().clear()
         self.logger.info("Result cache cleared")
 
     def get_cache_stats(self) -> Dict[str, Any]:
         """Return cache statistics."""
         if not self.cache_manager:
             return {"enabled": False}
-        return self.cache_manager.stats()
+        stats = self.cache_manager.stats()
+        stats["upstream"] = get_upstream_cache().stats()
+        return stats
+
+    def warm_cache(
+        self,
+        top_n: int = 1000,
+        namespace: Optional[str] = None,
+        prefetch_within: Optional[float] = None,
+    ) -> Dict[str, int]:
+        """Warm the result cache from the persistent access history.
+
+        Loads the ``top_n`` most frequently hit persistent entries into the
+        in-memory tier in one query. With ``prefetch_within`` (seconds), hot
+        entries whose TTL ends within that window are also re-fetched in the
+        background (bounded by ``TOOLUNIVERSE_CACHE_REFRESH_WORKERS``) so
+        callers do not hit the expiry.
+
+        Args:
+            top_n: Maximum number of entries to preload (and to prefetch).
+            namespace: Restrict warm-up to one tool's cache namespace.
+            prefetch_within: Refresh entries expiring within this many seconds.
+
+        Returns:
+            ``{"preloaded": n, "prefetch_scheduled": m}``
+        """
+        summary = {"preloaded": 0, "prefetch_scheduled": 0}
+        if not self.cache_manager or not self.cache_manager.enabled:
+            return summary
+
+        summary["preloaded"] = self.cache_manager.warm(top_n, namespace=namespace)
+        if not prefetch_within:
+            return summary
+
+        for item in self.cache_manager.expiring_entries(prefetch_within, top_n):
+            tool_name = item["namespace"]
+            if namespace and tool_name != namespace:
+                continue
+            tool_instance = self._get_tool_instance(tool_name, cache=True)
+            if not tool_instance or not tool_instance.supports_caching():
+                continue
+            cache_version = tool_instance.get_cache_version()
+            if cache_version != item["version"]:
+                # Tool code or schema changed; the old entry is already dead
+                continue
+            arguments = item["arguments"]
+            cache_key = self._make_cache_key(tool_name, arguments)
+            composed = self.cache_manager.compose_key(
+                tool_instance.get_cache_namespace(), cache_version, cache_key
+            )
+            if self._schedule_cache_refresh(
+                {"name": tool_name, "arguments": arguments},
+                tool_instance,
+                composed,
+                tool_instance.get_cache_namespace(),
+                cache_version,
+                cache_key,
+            ):
+                summary["prefetch_scheduled"] += 1
+
+        self.logger.debug(f"Cache warm-up: {summary}")
+        return summary
 
     def dump_cache(self, namespace: Optional[str] = None):
         """Iterate over cached entries (persistent layer only)."""
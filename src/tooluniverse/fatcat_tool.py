@@ -30,7 +30,7 @@ class FatcatScholarTool(BaseTool):
             "size": max(1, min(max_results, 100)),
         }
         try:
-            resp = requests.get(self.base_url, params=params, timeout=20)
+            resp = self.http_get(self.base_url, params=params, timeout=20)
             resp.raise_for_status()
             data = resp.json()
         except requests.RequestException as e:
@@ -80,7 +80,7 @@ class FileDownloadTool(BaseTool):
                 filename = "downloaded_file"
             output_path = os.path.join(temp_dir, filename)
         try:
-            response = requests.get(
+            response = self.http_get(
                 url, timeout=timeout, allow_redirects=follow_redirects, stream=True
             )
             response.raise_for_status()
@@ -192,7 +192,7 @@ class BinaryDownloadTool(BaseTool):
                 return {"error": f"Failed to create directory: {e}"}
 
         try:
-            response = requests.get(url, timeout=timeout, stream=True)
+            response = self.http_get(url, timeout=timeout, stream=True)
             response.raise_for_status()
 
             file_size = 0
@@ -249,7 +249,7 @@ class TextDownloadTool(BaseTool):
         encoding = arguments.get("encoding", None)  # Auto-detect if None
 
         try:
-            response = requests.get(url, timeout=timeout)
+            response = self.http_get(url, timeout=timeout)
             response.raise_for_status()
 
             if encoding:
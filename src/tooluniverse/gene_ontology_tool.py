@@ -132,7 +132,7 @@ class GeneOntologyTool(BaseTool):
             url = self._build_url(url_args)
 
         try:
-            resp = requests.get(
+            resp = self.http_get(
                 url,
                 params=params,
                 timeout=self.timeout,
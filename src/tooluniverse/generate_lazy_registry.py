@@ -23,6 +23,32 @@ except ImportError:
     sys.exit(1)
 
 
+def build_class_fingerprints(registry):
+    """Map ``module.ClassName`` to a digest of the class source.
+
+    BaseTool folds the class source into its cache version; bundles that ship
+    without sources use these digests instead.
+    """
+    import ast
+    import hashlib
+
+    package_path = Path(__file__).parent
+    fingerprints = {}
+    for module_name in sorted(set(registry.values())):
+        module_file = package_path.joinpath(*module_name.split(".")).with_suffix(".py")
+        try:
+            source = module_file.read_text(encoding="utf-8")
+            tree = ast.parse(source)
+        except (OSError, SyntaxError):
+            continue
+        for node in tree.body:
+            if isinstance(node, ast.ClassDef):
+                segment = ast.get_source_segment(source, node) or ""
+                digest = hashlib.sha256(segment.encode("utf-8")).hexdigest()[:16]
+                fingerprints[f"{module_name}.{node.name}"] = digest
+    return fingerprints
+
+
 def main():
     print("🔍 Scanning for tools using AST discovery...")
 
@@ -35,6 +61,8 @@ def main():
     else:
         print(f"✅ Discovered {len(registry)} tools.")
 
+    fingerprints = build_class_fingerprints(registry)
+
     # Generate the static file content
     output_path = Path(__file__).parent / "_lazy_registry_static.py"
 
@@ -46,6 +74,9 @@ This file allows lazy loading to work in frozen environments where source files
 
 # Map of tool_name -> module_name
 STATIC_LAZY_REGISTRY = {json.dumps(registry, indent=4, sort_keys=True)}
+
+# Map of module_name.ClassName -> source digest, used for cache versions
+STATIC_CLASS_FINGERPRINTS = {json.dumps(fingerprints, indent=4, sort_keys=True)}
 '''
 
     print(f"💾 Writing static registry to {output_path}...")
@@ -250,23 +250,53 @@ __all__ = ["{tool_name}"]
     return output_path
 
 
+def _module_names(tool_names: list, output_dir: Path) -> Dict[str, str]:
+    """Map each tool to its wrapper module's name.
+
+    Wrappers are written as ``<tool_name>.py``, but a file created on a
+    case-insensitive filesystem may keep an older spelling; use the name
+    actually on disk so imports also work where case matters.
+    """
+    stems = {path.stem for path in output_dir.glob("*.py")}
+    by_lower = {stem.lower(): stem for stem in stems}
+    return {
+        name: name if name in stems else by_lower.get(name.lower(), name)
+        for name in tool_names
+    }
+
+
 def generate_init(tool_names: list, output_dir: Path) -> Path:
-    """Generate __init__.py with all imports."""
-    imports = [f"from .{name} import {name}" for name in sorted(tool_names)]
+    """Generate a lazily-loading __init__.py for the tool wrappers.
 
-    # Generate the content without f-string escape sequences
-    all_names = ",\n    ".join(f'"{name}"' for name in sorted(tool_names))
+    The package imports a wrapper module on first attribute access (PEP 562
+    ``__getattr__``), so using one tool does not import all of them. The
+    ``TYPE_CHECKING`` imports keep static analysis and IDE completion working.
+    """
+    names = sorted(tool_names)
+    modules = _module_names(names, output_dir)
+    type_imports = "\n".join(
+        f"    from .{modules[name]} import {name}" for name in names
+    )
+    all_names = ",\n    ".join(f'"{name}"' for name in names)
+    renamed = "".join(
+        f'\n    "{name}": "{modules[name]}",' for name in names if modules[name] != name
+    )
     content = f'''"""
 ToolUniverse Tools
 
-Type-safe Python interface to {len(tool_names)} scientific tools.
-Each tool is in its own module for minimal import overhead.
+Type-safe Python interface to {len(names)} scientific tools.
+Each tool is in its own module and is imported on first use.
 
 Usage:
     from tooluniverse.tools import ArXiv_search_papers
     result = ArXiv_search_papers(query="machine learning")
 """
 
+import importlib
+import sys
+import types
+from typing import TYPE_CHECKING, Any, List
+
 # Import exceptions from main package
 from tooluniverse.exceptions import (
     ToolError,
@@ -282,14 +312,45 @@ from tooluniverse.exceptions import (
 # Import shared client utilities
 from ._shared_client import get_shared_client, reset_shared_client
 
-# Import all tools
-{chr(10).join(imports)}
+if TYPE_CHECKING:
+{type_imports}
 
 __all__ = [
     "get_shared_client",
     "reset_shared_client",
     {all_names}
 ]
+
+_TOOL_NAMES = frozenset(__all__[2:])
+
+# Wrappers live in the module of the same name, except for these
+_MODULE_NAMES = {{{renamed}
+}}
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _TOOL_NAMES:
+        raise AttributeError(f"module {{__name__!r}} has no attribute {{name!r}}")
+    module = importlib.import_module(f".{{_MODULE_NAMES.get(name, name)}}", __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | _TOOL_NAMES)
+
+
+class _ToolsModule(types.ModuleType):
+    def __setattr__(self, name: str, value: Any) -> None:
+        # Importing a wrapper module binds it on the package; keep the
+        # wrapper function there instead, as the eager imports used to
+        if name in _TOOL_NAMES and isinstance(value, types.ModuleType):
+            value = getattr(value, name, value)
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _ToolsModule
 '''
 
     init_path = output_dir / "__init__.py"
@@ -315,6 +376,12 @@ Configuration:
     the initial creation of the ToolUniverse instance. These parameters are
     ignored if the client has already been initialized.
 
+On-Demand Loading:
+    The shared client starts with no tools loaded and reads each tool's
+    config the first time that tool is called, so a script that uses a few
+    wrappers never loads the whole catalog. Set
+    TOOLUNIVERSE_LOAD_ON_DEMAND=false to load every tool up front instead.
+
 Custom Instance:
     You can provide your own ToolUniverse instance to be used instead of
     the shared singleton. This is useful when you need specific configurations
@@ -337,6 +404,7 @@ Examples:
         reset_shared_client()
 """
 
+import os
 import threading
 from typing import Optional
 from tooluniverse import ToolUniverse
@@ -400,11 +468,14 @@ def get_shared_client(
             # Check again inside the lock to avoid race conditions
             if _client is None:
                 # Create new instance with provided configuration
-                if config_kwargs:
-                    _client = ToolUniverse(**config_kwargs)
-                else:
-                    _client = ToolUniverse()
-                _client.load_tools()
+                config_kwargs.setdefault(
+                    "load_on_demand",
+                    os.getenv("TOOLUNIVERSE_LOAD_ON_DEMAND", "true").lower()
+                    in ("true", "1", "yes"),
+                )
+                _client = ToolUniverse(**config_kwargs)
+                if not _client.load_on_demand:
+                    _client.load_tools()
 
     return _client
 
@@ -516,6 +587,8 @@ def main(
     """
     from tooluniverse import ToolUniverse
     from .build_optimizer import cleanup_orphaned_files, get_changed_tools
+    from .tool_index import write_static_tool_index
+    from .tool_manifest import build_tool_manifest
 
     print("🔧 Generating tools...")
 
@@ -612,6 +685,13 @@ def main(
     init_path = generate_init(list(tu.all_tool_dict.keys()), output)
     generated_paths.append(str(init_path))
 
+    # Index of tool name -> config file used by the on-demand shared client
+    index_path = write_static_tool_index(tu.tool_files)
+    generated_paths.append(str(index_path))
+
+    # Precompiled configs read by load_tools; binary, so not formatted
+    build_tool_manifest(tu.tool_files)
+
     # Always ensure _shared_client.py exists
     shared_client_path = output / "_shared_client.py"
     if not shared_client_path.exists():
@@ -0,0 +1,439 @@
+"""
+Shared GraphQL execution layer with schema/query caching and request batching.
+
+GraphQL tools (OpenTargets, gnomAD, the openFDA name lookups) call
+:func:`tooluniverse.graphql_tool.execute_query`, which sends queries through
+the process-wide :class:`GraphQLClient` returned by
+:func:`get_graphql_client`:
+
+* Schemas passed to ``validate_query`` are built once per schema text and
+  parsed query documents are kept in an LRU cache.
+* Calls to the same endpoint that arrive while other calls to it are in
+  flight (for example a parallel ``tu.run`` batch) are collected for a short
+  window and sent as one request. Each call's top-level fields are aliased
+  (``b0_target``, ``b1_target``, ...) and its variables renamed, and the
+  merged response is split back so every caller sees the response it would
+  have got on its own.
+
+Only single-operation queries made of plain top-level fields are merged;
+mutations, subscriptions and documents with several operations are always
+sent on their own. If the merged request fails as a whole (for example a
+validation error caused by one call's variables) every call is retried on
+its own.
+
+Configuration (environment variables):
+
+``TOOLUNIVERSE_GRAPHQL_BATCH_WINDOW``
+    Seconds to wait for more calls before sending a merged request
+    (default 0.01, ``0`` disables batching).
+``TOOLUNIVERSE_GRAPHQL_BATCH_SIZE``
+    Maximum calls merged into one request (default 20).
+"""
+
+from __future__ import annotations
+
+import contextvars
+import threading
+import time
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
+from graphql import GraphQLSchema, build_schema
+from graphql.language import (
+    DocumentNode,
+    FieldNode,
+    NameNode,
+    Node,
+    OperationDefinitionNode,
+    OperationType,
+    SelectionSetNode,
+    Visitor,
+    parse,
+    print_ast,
+    visit,
+)
+
+from . import deadline, http_client
+from .deadline import DeadlineExceededError, deadline_scope
+from .http_client import _env_number
+from .logging_config import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_BATCH_WINDOW = 0.01
+DEFAULT_BATCH_SIZE = 20
+QUERY_CACHE_SIZE = 512
+
+# Sentinel telling a batched call to fall back to its own request
+_SEND_ALONE = object()
+
+
+@lru_cache(maxsize=32)
+def get_schema(schema_str: str) -> GraphQLSchema:
+    """Build (once per schema text) the schema used to validate queries."""
+    return build_schema(schema_str)
+
+
+@lru_cache(maxsize=QUERY_CACHE_SIZE)
+def parse_query(query: str) -> DocumentNode:
+    """Parse a query once; the returned document is shared and must not be mutated."""
+    return parse(query)
+
+
+@lru_cache(maxsize=QUERY_CACHE_SIZE)
+def _batchable(query: str) -> bool:
+    """Whether a query can be merged with others into one aliased request."""
+    try:
+        document = parse_query(query)
+    except Exception:
+        return False
+    operations = [
+        d for d in document.definitions if isinstance(d, OperationDefinitionNode)
+    ]
+    if len(operations) != 1:
+        return False
+    operation = operations[0]
+    if operation.operation != OperationType.QUERY or operation.directives:
+        return False
+    return all(isinstance(s, FieldNode) for s in operation.selection_set.selections)
+
+
+def _response_key(field: FieldNode) -> str:
+    return (field.alias or field.name).value
+
+
+def _with(node: Node, **changes: Any) -> Node:
+    """Copy an AST node with some fields replaced (nodes may be frozen)."""
+    fields = {key: getattr(node, key, None) for key in node.keys}
+    fields.update(changes)
+    return type(node)(**fields)
+
+
+class _PrefixNames(Visitor):
+    """Prefix variable and fragment names so merged queries cannot clash."""
+
+    def __init__(self, prefix: str):
+        super().__init__()
+        self.prefix = prefix
+
+    def _prefixed(self, node):
+        return _with(node, name=NameNode(value=self.prefix + node.name.value))
+
+    def enter_variable(self, node, *_):
+        return self._prefixed(node)
+
+    def enter_fragment_spread(self, node, *_):
+        return self._prefixed(node)
+
+    def enter_fragment_definition(self, node, *_):
+        return self._prefixed(node)
+
+
+@lru_cache(maxsize=QUERY_CACHE_SIZE)
+def _merged_query(queries: Tuple[str, ...]) -> Tuple[str, Tuple[Dict[str, str], ...]]:
+    """Merge batchable queries into one document.
+
+    Returns the query text and, per input query, a map from merged alias to
+    the field's original response key.
+    """
+    operation_definitions = []
+    selections = []
+    fragments = []
+    aliases = []
+    for index, query in enumerate(queries):
+        prefix = f"b{index}_"
+        document = visit(parse_query(query), _PrefixNames(prefix))
+        mapping = {}
+        for definition in document.definitions:
+            if isinstance(definition, OperationDefinitionNode):
+                operation_definitions.extend(definition.variable_definitions or ())
+                for field in definition.selection_set.selections:
+                    original = _response_key(field)
+                    mapping[prefix + original] = original
+                    selections.append(
+                        _with(field, alias=NameNode(value=prefix + original))
+                    )
+            else:
+                fragments.append(definition)
+        aliases.append(mapping)
+    operation = OperationDefinitionNode(
+        operation=OperationType.QUERY,
+        name=NameNode(value="ToolUniverseBatch"),
+        variable_definitions=tuple(operation_definitions),
+        directives=(),
+        selection_set=SelectionSetNode(selections=tuple(selections)),
+    )
+    merged = DocumentNode(definitions=(operation, *fragments))
+    return print_ast(merged), tuple(aliases)
+
+
+def _declared_variables(query: str) -> List[str]:
+    operation = next(
+        d
+        for d in parse_query(query).definitions
+        if isinstance(d, OperationDefinitionNode)
+    )
+    return [v.variable.name.value for v in operation.variable_definitions or ()]
+
+
+class _PendingCall:
+    __slots__ = ("query", "variables", "deadline", "done", "result", "error")
+
+    def __init__(self, query: str, variables: Optional[Dict[str, Any]]):
+        self.query = query
+        self.variables = variables or {}
+        self.deadline = deadline.current_deadline()
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class _Batch:
+    __slots__ = ("calls", "full")
+
+    def __init__(self):
+        self.calls: List[_PendingCall] = []
+        self.full = threading.Event()
+
+
+class GraphQLClient:
+    """Sends GraphQL queries, merging concurrent calls per endpoint."""
+
+    def __init__(
+        self,
+        *,
+        batch_window: Optional[float] = None,
+        max_batch_size: Optional[int] = None,
+    ):
+        self.batch_window = (
+            batch_window
+            if batch_window is not None
+            else _env_number(
+                "TOOLUNIVERSE_GRAPHQL_BATCH_WINDOW", DEFAULT_BATCH_WINDOW, float
+            )
+        )
+        self.max_batch_size = max(
+            1,
+            (
+                max_batch_size
+                if max_batch_size is not None
+                else _env_number(
+                    "TOOLUNIVERSE_GRAPHQL_BATCH_SIZE", DEFAULT_BATCH_SIZE, int
+                )
+            ),
+        )
+        self._lock = threading.Lock()
+        self._active: Dict[str, int] = {}
+        self._open: Dict[str, _Batch] = {}
+        self.calls = 0
+        self.requests_sent = 0
+        self.merged_calls = 0
+        self.fallbacks = 0
+
+    def execute(
+        self,
+        endpoint_url: str,
+        query: str,
+        variables: Optional[Dict[str, Any]] = None,
+    ) -> Any:
+        """Run one query and return the decoded JSON response.
+
+        Raises the transport's exceptions and ``requests``' JSON decode error
+        exactly as a direct ``POST`` would.
+        """
+        batching = self.batch_window > 0 and self.max_batch_size > 1
+        if not batching or not _batchable(query):
+            with self._lock:
+                self.calls += 1
+            return self._send_one(endpoint_url, query, variables)
+
+        call = _PendingCall(query, variables)
+        with self._lock:
+            self.calls += 1
+            others = self._active.get(endpoint_url, 0)
+            self._active[endpoint_url] = others + 1
+            batch = None
+            leader = False
+            if others:
+                batch = self._open.get(endpoint_url)
+                if batch is None:
+                    batch = _Batch()
+                    self._open[endpoint_url] = batch
+                    leader = True
+                batch.calls.append(call)
+                if len(batch.calls) >= self.max_batch_size:
+                    self._open.pop(endpoint_url, None)
+                    batch.full.set()
+        try:
+            if batch is None:
+                # Nothing else in flight: do not delay a lone call
+                return self._send_one(endpoint_url, query, variables)
+            if leader:
+                batch.full.wait(deadline.budget(self.batch_window))
+                with self._lock:
+                    if self._open.get(endpoint_url) is batch:
+                        del self._open[endpoint_url]
+                # The merged request may outlive the leader's deadline, so
+                # it goes out on its own thread and the leader waits for its
+                # share like every other caller
+                threading.Thread(
+                    target=self._dispatch,
+                    args=(endpoint_url, batch.calls),
+                    name="tooluniverse-graphql-batch",
+                    daemon=True,
+                ).start()
+            if not call.done.wait(deadline.budget(None)):
+                raise DeadlineExceededError(
+                    "Deadline passed while waiting for a batched GraphQL request",
+                    details={"endpoint": endpoint_url},
+                )
+        finally:
+            with self._lock:
+                self._active[endpoint_url] -= 1
+                if not self._active[endpoint_url]:
+                    del self._active[endpoint_url]
+
+        if call.error is not None:
+            raise call.error
+        if call.result is _SEND_ALONE:
+            return self._send_one(endpoint_url, query, variables)
+        return call.result
+
+    def _send_one(self, endpoint_url, query, variables) -> Any:
+        with self._lock:
+            self.requests_sent += 1
+        response = http_client.post(
+            endpoint_url, json={"query": query, "variables": variables}
+        )
+        return response.json()
+
+    def _dispatch(self, endpoint_url: str, calls: List[_PendingCall]) -> None:
+        """Send a batch and hand each waiting call its share of the response."""
+        if len(calls) == 1:
+            calls[0].result = _SEND_ALONE
+            calls[0].done.set()
+            return
+        # The merged request serves every caller, so it runs under the
+        # loosest of their deadlines rather than the leader's
+        deadlines = [c.deadline for c in calls]
+        latest = None if None in deadlines else max(deadlines)
+        seconds = None if latest is None else latest - time.monotonic()
+        try:
+            results = contextvars.Context().run(
+                self._send_merged, endpoint_url, calls, seconds
+            )
+        except Exception as exc:
+            results = [exc] * len(calls)
+        for call, result in zip(calls, results):
+            if isinstance(result, Exception):
+                call.error = result
+            else:
+                call.result = result
+            call.done.set()
+
+    def _send_merged(
+        self,
+        endpoint_url: str,
+        calls: List[_PendingCall],
+        seconds: Optional[float],
+    ) -> List[Any]:
+        query, aliases = _merged_query(tuple(c.query for c in calls))
+        variables = {}
+        for index, call in enumerate(calls):
+            for name in _declared_variables(call.query):
+                if name in call.variables:
+                    variables[f"b{index}_{name}"] = call.variables[name]
+        with deadline_scope(seconds):
+            with self._lock:
+                self.requests_sent += 1
+            response = http_client.post(
+                endpoint_url, json={"query": query, "variables": variables}
+            )
+        try:
+            payload = response.json()
+        except ValueError:
+            payload = None
+        split = self._split(payload, aliases)
+        with self._lock:
+            if split is None:
+                self.fallbacks += 1
+            else:
+                self.merged_calls += len(calls)
+        if split is None:
+            logger.debug(
+                "Merged GraphQL request to %s failed; sending %d calls separately",
+                endpoint_url,
+                len(calls),
+            )
+            return [_SEND_ALONE] * len(calls)
+        return split
+
+    @staticmethod
+    def _split(
+        payload: Any, aliases: Tuple[Dict[str, str], ...]
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Split a merged response per call, or None if it cannot be split."""
+        if not isinstance(payload, dict) or not isinstance(payload.get("data"), dict):
+            return None
+        data = payload["data"]
+        owner = {alias: i for i, mapping in enumerate(aliases) for alias in mapping}
+        errors: List[List[Dict[str, Any]]] = [[] for _ in aliases]
+        for error in payload.get("errors") or ():
+            path = error.get("path") if isinstance(error, dict) else None
+            if not path or path[0] not in owner:
+                # Not attributable to one call (e.g. a validation error)
+                return None
+            index = owner[path[0]]
+            error = dict(error, path=[aliases[index][path[0]], *path[1:]])
+            errors[index].append(error)
+
+        results = []
+        for mapping, call_errors in zip(aliases, errors):
+            result: Dict[str, Any] = {
+                "data": {
+                    original: data.get(alias) for alias, original in mapping.items()
+                }
+            }
+            if call_errors:
+                result["errors"] = call_errors
+            results.append(result)
+        return results
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "requests_sent": self.requests_sent,
+                "merged_calls": self.merged_calls,
+                "fallbacks": self.fallbacks,
+            }
+
+
+_client: Optional[GraphQLClient] = None
+_client_lock = threading.Lock()
+
+
+def get_graphql_client() -> GraphQLClient:
+    """Return the process-wide GraphQL client, creating it on first use."""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = GraphQLClient()
+    return _client
+
+
+def reset_graphql_client() -> None:
+    """Drop the shared client; the next query re-reads configuration."""
+    global _client
+    with _client_lock:
+        _client = None
+
+
+__all__ = [
+    "GraphQLClient",
+    "get_graphql_client",
+    "get_schema",
+    "parse_query",
+    "reset_graphql_client",
+]
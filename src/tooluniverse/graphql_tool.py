@@ -1,19 +1,19 @@
-from graphql import build_schema
-from graphql.language import parse
 from graphql.validation import validate
 from .base_tool import BaseTool
 from .tool_registry import register_tool
+from .graphql_client import get_graphql_client, get_schema, parse_query
+from .pagination import Page, PaginationSpec, paginate
 import requests
 import copy
 
 
 def validate_query(query_str, schema_str):
     try:
-        # Build the GraphQL schema object from the provided schema string
-        schema = build_schema(schema_str)
+        # Build the GraphQL schema object (cached per schema string)
+        schema = get_schema(schema_str)
 
-        # Parse the query string into an AST (Abstract Syntax Tree)
-        query_ast = parse(query_str)
+        # Parse the query string into an AST (Abstract Syntax Tree), cached
+        query_ast = parse_query(query_str)
 
         # Validate the query AST against the schema
         validation_errors = validate(schema, query_ast)
@@ -47,11 +47,9 @@ def remove_none_and_empty_values(json_obj):
 
 
 def execute_query(endpoint_url, query, variables=None):
-    response = requests.post(
-        endpoint_url, json={"query": query, "variables": variables}
-    )
     try:
-        result = response.json()
+        # Concurrent calls to the same endpoint are merged into one request
+        result = get_graphql_client().execute(endpoint_url, query, variables)
         # result = json.dumps(result, ensure_ascii=False)
         result = remove_none_and_empty_values(result)
         # Check if the response contains errors
@@ -185,59 +183,45 @@ class DiseaseTargetScoreTool(GraphQLTool):
         if not datasource_id:
             return {"error": "datasourceId is required"}
 
-        results = []
-        page_index = 0
-        total_fetched = 0
-        total_count = None
-        disease_info = None
-
-        while True:
-            variables = {"efoId": efo_id, "index": page_index, "size": page_size}
+        disease_info = {}
 
+        def fetch_page(request):
+            variables = {"efoId": efo_id, "index": request.index, "size": request.size}
             response_data = execute_query(
                 self.endpoint_url, self.query_schema, variables
             )
             if not response_data or "data" not in response_data:
-                break
-
+                return None
             disease_data = response_data["data"]["disease"]
             if not disease_data:
-                break
-
-            if disease_info is None:
-                disease_info = {
-                    "disease_id": disease_data["id"],
-                    "disease_name": disease_data["name"],
-                }
-
-            rows = disease_data["associatedTargets"]["rows"]
-            if total_count is None:
-                total_count = disease_data["associatedTargets"]["count"]
-
-            for row in rows:
-                symbol = row["target"]["approvedSymbol"]
-                target_id = row["target"]["id"]
-                score_entry = next(
-                    (ds for ds in row["datasourceScores"] if ds["id"] == datasource_id),
-                    None,
+                return None
+            disease_info.setdefault("disease_id", disease_data["id"])
+            disease_info.setdefault("disease_name", disease_data["name"])
+            associated = disease_data["associatedTargets"]
+            return Page(associated["rows"], associated["count"])
+
+        # Pages after the first are fetched concurrently once the count is known
+        spec = self.get_pagination(page_size=page_size) or PaginationSpec(
+            "page", page_size=page_size
+        )
+        results = []
+        for row in paginate(fetch_page, spec, host=self.endpoint_url):
+            score_entry = next(
+                (ds for ds in row["datasourceScores"] if ds["id"] == datasource_id),
+                None,
+            )
+            if score_entry:
+                results.append(
+                    {
+                        "target_symbol": row["target"]["approvedSymbol"],
+                        "target_id": row["target"]["id"],
+                        "datasource": datasource_id,
+                        "score": score_entry["score"],
+                    }
                 )
-                if score_entry:
-                    results.append(
-                        {
-                            "target_symbol": symbol,
-                            "target_id": target_id,
-                            "datasource": datasource_id,
-                            "score": score_entry["score"],
-                        }
-                    )
-
-            total_fetched += len(rows)
-            if total_fetched >= total_count or len(rows) == 0:
-                break
-            page_index += 1
 
         return {
-            "disease_info": disease_info,
+            "disease_info": disease_info or None,
             "datasource": datasource_id,
             "total_targets_with_scores": len(results),
             "target_scores": results,
@@ -40,7 +40,7 @@ class HALTool(BaseTool):
             ),
         }
         try:
-            resp = requests.get(f"{self.base_url}", params=params, timeout=20)
+            resp = self.http_get(f"{self.base_url}", params=params, timeout=20)
             resp.raise_for_status()
             data = resp.json()
         except requests.RequestException as e:
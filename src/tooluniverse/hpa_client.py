@@ -0,0 +1,288 @@
+"""
+Shared data access for the Human Protein Atlas tools.
+
+The HPA tools each used to fetch their own copy of the same per-gene data: the
+search API with a handful of columns per tool, and the ``/{ensembl_id}.json``
+and ``.xml`` documents. :class:`HPAClient` fetches each of these once per gene
+and keeps it in the shared upstream cache
+(:mod:`tooluniverse.cache.upstream_cache`):
+
+* Gene records from the search API are requested with every column the HPA
+  tools read (:data:`GENE_RECORD_COLUMNS`), so one request serves all of them.
+  If the upstream rejects the combined column list, the client falls back to
+  the columns each tool asked for.
+* Gene JSON documents and parsed XML trees are cached by URL. Parsing the XML
+  is expensive, so the parsed tree is what is kept.
+* :meth:`HPAClient.prefetch_genes` loads many gene records with multi-term
+  search queries. Batch runs call it through the HPA tools'
+  ``prepare_batch`` hook.
+
+Cached documents are shared between tools and must not be modified.
+"""
+
+from __future__ import annotations
+
+import threading
+import xml.etree.ElementTree as ET
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+import requests
+
+from .cache.upstream_cache import get_upstream_cache
+from .logging_config import get_logger
+
+logger = get_logger(__name__)
+
+HPA_SEARCH_API = "https://www.proteinatlas.org/api/search_download.php"
+HPA_JSON_API_TEMPLATE = "https://www.proteinatlas.org/{ensembl_id}.json"
+HPA_XML_API_TEMPLATE = "https://www.proteinatlas.org/{ensembl_id}.xml"
+
+# Every search API column read by the gene-level HPA tools
+GENE_RECORD_COLUMNS = (
+    "g",
+    "gs",
+    "eg",
+    "up",
+    "upbp",
+    "scml",
+    "scal",
+    "ppi",
+    "rnatsm",
+    "rnablm",
+    "rnabrm",
+    "rnascm",
+    "cell_RNA_ishikawa_heraklio",
+    "cell_RNA_hela",
+    "cell_RNA_mcf7",
+    "cell_RNA_a549",
+    "cell_RNA_hepg2",
+    "cell_RNA_jurkat",
+    "cell_RNA_pc3",
+    "cell_RNA_rh30",
+    "cell_RNA_siha",
+    "cell_RNA_u251",
+    "cancer_RNA_brain_cancer",
+    "cancer_RNA_breast_cancer",
+    "cancer_RNA_colon_cancer",
+    "cancer_RNA_lung_cancer",
+    "cancer_RNA_liver_cancer",
+    "cancer_RNA_prostate_cancer",
+    "cancer_RNA_kidney_cancer",
+    "cancer_RNA_pancreatic_cancer",
+    "cancer_RNA_stomach_cancer",
+    "cancer_RNA_ovarian_cancer",
+)
+
+# Genes per multi-term search query
+PREFETCH_CHUNK = 20
+
+Get = Callable[..., requests.Response]
+
+
+def _search_params(term: str, columns: str) -> Dict[str, str]:
+    return {"search": term, "format": "json", "columns": columns, "compress": "no"}
+
+
+def _record_key(gene: str) -> str:
+    return f"hpa:gene-record:{gene.strip().upper()}"
+
+
+def _exact_match_first(gene: str, records: Any) -> Any:
+    """Return ``records`` with the exact match for ``gene`` moved to the front.
+
+    The search is fuzzy and HPA does not promise to list the gene asked for
+    first, but the gene-level tools read ``records[0]``. A new list is
+    returned so a cached search response is never modified.
+    """
+    if not isinstance(records, list):
+        return records
+    name = gene.strip().upper()
+    for index, record in enumerate(records):
+        if isinstance(record, dict) and any(
+            isinstance(record.get(field), str) and record[field].upper() == name
+            for field in ("Gene", "Ensembl")
+        ):
+            if index == 0:
+                return records
+            return [record, *records[:index], *records[index + 1 :]]
+    return records
+
+
+class HPAClient:
+    """Fetches HPA gene data once and shares it between the HPA tools."""
+
+    def __init__(self, columns: Iterable[str] = GENE_RECORD_COLUMNS):
+        self.columns = tuple(columns)
+        self._record_columns = ",".join(self.columns)
+        self._record_columns_ok = True
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # Search API
+    # ------------------------------------------------------------------
+    def search(self, term: str, columns: str, get: Get, **kwargs: Any) -> Any:
+        """Return the search API's JSON for ``term`` with ``columns``."""
+        return get_upstream_cache().get_json(
+            HPA_SEARCH_API, params=_search_params(term, columns), get=get, **kwargs
+        )
+
+    def gene_records(self, gene: str, columns: str, get: Get, **kwargs: Any) -> Any:
+        """Return the search API records for ``gene``.
+
+        The records carry every column in :data:`GENE_RECORD_COLUMNS`, so all
+        gene-level tools share one request per gene. ``columns`` is what the
+        caller needs and is used on its own if the combined request fails.
+        The record whose gene symbol or Ensembl ID is ``gene`` comes first;
+        the other fuzzy matches follow in HPA's order. Raises
+        :class:`requests.HTTPError` like the search API.
+        """
+        if self._record_columns_ok and set(columns.split(",")) <= set(self.columns):
+            try:
+                return get_upstream_cache().get_or_fetch(
+                    _record_key(gene),
+                    lambda: _exact_match_first(
+                        gene, self.search(gene, self._record_columns, get, **kwargs)
+                    ),
+                )
+            except requests.HTTPError as e:
+                status = e.response.status_code if e.response is not None else None
+                if status is None or status == 404 or status >= 500:
+                    raise
+                # The upstream rejected a column; stop asking for all of them
+                logger.warning(
+                    "HPA rejected combined gene columns (HTTP %s); "
+                    "falling back to per-tool columns",
+                    status,
+                )
+                with self._lock:
+                    self._record_columns_ok = False
+        return _exact_match_first(gene, self.search(gene, columns, get, **kwargs))
+
+    def prefetch_genes(self, genes: Iterable[str], get: Get, **kwargs: Any) -> int:
+        """Load gene records for ``genes`` with multi-term search queries.
+
+        Records are matched back to the requested names by gene symbol or
+        Ensembl ID; genes that do not match are left for a later single-gene
+        request. Returns the number of genes loaded. Failures are logged and
+        never raised.
+
+        A prefetched entry holds only the exact match, whereas a single-gene
+        request caches every record the fuzzy search returned with the exact
+        match moved first. The gene-level tools read only the first record,
+        so both give the same answer.
+        """
+        if not self._record_columns_ok:
+            return 0
+        cache = get_upstream_cache()
+        pending: List[str] = []
+        seen = set()
+        for gene in genes:
+            if not isinstance(gene, str) or not gene.strip():
+                continue
+            name = gene.strip()
+            if name.upper() in seen or cache.peek(_record_key(name)) is not None:
+                continue
+            seen.add(name.upper())
+            pending.append(name)
+
+        loaded = 0
+        for start in range(0, len(pending), PREFETCH_CHUNK):
+            chunk = pending[start : start + PREFETCH_CHUNK]
+            if len(chunk) < 2:
+                break
+            try:
+                records = self.search(
+                    " OR ".join(chunk), self._record_columns, get, **kwargs
+                )
+            except (requests.RequestException, ValueError) as e:
+                logger.debug("HPA prefetch failed: %s", e)
+                continue
+            if not isinstance(records, list):
+                continue
+            by_name: Dict[str, Dict[str, Any]] = {}
+            for record in records:
+                if not isinstance(record, dict):
+                    continue
+                for field in ("Gene", "Ensembl"):
+                    value = record.get(field)
+                    if isinstance(value, str):
+                        by_name.setdefault(value.upper(), record)
+            for name in chunk:
+                record = by_name.get(name.upper())
+                if record is not None:
+                    cache.put(_record_key(name), [record])
+                    loaded += 1
+        return loaded
+
+    # ------------------------------------------------------------------
+    # Per-gene documents
+    # ------------------------------------------------------------------
+    def gene_json(
+        self,
+        ensembl_id: str,
+        get: Get,
+        *,
+        ttl: Optional[float] = None,
+        revalidate: Optional[bool] = None,
+        **kwargs: Any,
+    ) -> Any:
+        """Return the parsed ``/{ensembl_id}.json`` document."""
+        return get_upstream_cache().get_json(
+            HPA_JSON_API_TEMPLATE.format(ensembl_id=ensembl_id),
+            ttl=ttl,
+            get=get,
+            revalidate=revalidate,
+            **kwargs,
+        )
+
+    def gene_xml(
+        self,
+        ensembl_id: str,
+        get: Get,
+        *,
+        ttl: Optional[float] = None,
+        revalidate: Optional[bool] = None,
+        **kwargs: Any,
+    ) -> ET.Element:
+        """Return the parsed ``/{ensembl_id}.xml`` tree.
+
+        Raises :class:`requests.HTTPError` for error responses and
+        :class:`xml.etree.ElementTree.ParseError` for malformed XML.
+        """
+        return get_upstream_cache().get_document(
+            HPA_XML_API_TEMPLATE.format(ensembl_id=ensembl_id),
+            lambda response: ET.fromstring(response.content),
+            kind="xml",
+            ttl=ttl,
+            get=get,
+            revalidate=revalidate,
+            **kwargs,
+        )
+
+
+_client: Optional[HPAClient] = None
+_client_lock = threading.Lock()
+
+
+def get_hpa_client() -> HPAClient:
+    """Return the process-wide HPA client, creating it on first use."""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = HPAClient()
+    return _client
+
+
+def reset_hpa_client() -> None:
+    global _client
+    with _client_lock:
+        _client = None
+
+
+__all__ = [
+    "GENE_RECORD_COLUMNS",
+    "HPAClient",
+    "get_hpa_client",
+    "reset_hpa_client",
+]
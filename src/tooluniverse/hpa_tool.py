@@ -1,15 +1,19 @@
 # hpa_tool.py
 
+import copy
 import requests
 import xml.etree.ElementTree as ET
 from typing import Dict, Any, List
 from .base_tool import BaseTool
+from .hpa_client import (
+    HPA_JSON_API_TEMPLATE,
+    HPA_SEARCH_API,
+    HPA_XML_API_TEMPLATE,
+    get_hpa_client,
+)
 from .tool_registry import register_tool
 
-HPA_SEARCH_API = "https://www.proteinatlas.org/api/search_download.php"
 HPA_BASE = "https://www.proteinatlas.org"
-HPA_JSON_API_TEMPLATE = "https://www.proteinatlas.org/{ensembl_id}.json"
-HPA_XML_API_TEMPLATE = "https://www.proteinatlas.org/{ensembl_id}.xml"
 
 # --- Base Tool Classes ---
 
@@ -38,7 +42,7 @@ class HPASearchApiTool(BaseTool):
         }
 
         try:
-            resp = requests.get(self.base_url, params=params, timeout=self.timeout)
+            resp = self.http_get(self.base_url, params=params, timeout=self.timeout)
             if resp.status_code == 404:
                 return {"error": f"No data found for gene '{search_term}'"}
             if resp.status_code != 200:
@@ -64,6 +68,40 @@ class HPASearchApiTool(BaseTool):
                 "content": resp.text,
             }
 
+    def _get_gene_data(self, gene_name: str, columns: str) -> Any:
+        """Return the search records for one gene, shared with other HPA tools.
+
+        Same result shape as :meth:`_make_api_request` in JSON format. The
+        records may carry more columns than requested.
+        """
+        try:
+            data = get_hpa_client().gene_records(
+                gene_name, columns, self.http_get, timeout=self.timeout
+            )
+        except requests.HTTPError as e:
+            if e.response.status_code == 404:
+                return {"error": f"No data found for gene '{gene_name}'"}
+            return {
+                "error": f"HPA API request failed, HTTP {e.response.status_code}",
+                "detail": e.response.text,
+            }
+        except requests.RequestException as e:
+            return {"error": f"HPA API request failed: {str(e)}"}
+        except ValueError as e:
+            return {"error": f"Failed to parse HPA response data: {str(e)}"}
+        if not isinstance(data, list):
+            return {"error": "API did not return expected list format"}
+        return copy.deepcopy(data)
+
+    def prepare_batch(self, arguments_list: List[Dict[str, Any]]) -> None:
+        """Load the records of every gene in a batch with bulk searches."""
+        genes = [
+            arguments.get("gene_name")
+            for arguments in arguments_list
+            if isinstance(arguments, dict)
+        ]
+        get_hpa_client().prefetch_genes(genes, self.http_get, timeout=self.timeout)
+
 
 @register_tool("HPAJsonApiTool")
 class HPAJsonApiTool(BaseTool):
@@ -79,26 +117,26 @@ class HPAJsonApiTool(BaseTool):
 
     def _make_api_request(self, ensembl_id: str) -> Dict[str, Any]:
         """Make HPA JSON API request for a specific gene"""
-        url = self.base_url_template.format(ensembl_id=ensembl_id)
         try:
-            resp = requests.get(url, timeout=self.timeout)
-            if resp.status_code == 404:
+            data = get_hpa_client().gene_json(
+                ensembl_id,
+                self.http_get,
+                timeout=self.timeout,
+                **self.get_upstream_cache_policy(),
+            )
+        except requests.HTTPError as e:
+            if e.response.status_code == 404:
                 return {"error": f"No data found for Ensembl ID '{ensembl_id}'"}
-            if resp.status_code != 200:
-                return {
-                    "error": f"HPA JSON API request failed, HTTP {resp.status_code}",
-                    "detail": resp.text,
-                }
-
-            return resp.json()
-
+            return {
+                "error": f"HPA JSON API request failed, HTTP {e.response.status_code}",
+                "detail": e.response.text,
+            }
         except requests.RequestException as e:
             return {"error": f"HPA JSON API request failed: {str(e)}"}
         except ValueError as e:
-            return {
-                "error": f"Failed to parse HPA JSON response: {str(e)}",
-                "content": resp.text,
-            }
+            return {"error": f"Failed to parse HPA JSON response: {str(e)}"}
+        # The document is shared with other HPA tools
+        return copy.deepcopy(data)
 
 
 @register_tool("HPAXmlApiTool")
@@ -115,15 +153,20 @@ class HPAXmlApiTool(BaseTool):
 
     def _make_api_request(self, ensembl_id: str) -> ET.Element:
         """Make HPA XML API request for a specific gene"""
-        url = self.base_url_template.format(ensembl_id=ensembl_id)
         try:
-            resp = requests.get(url, timeout=self.timeout)
-            if resp.status_code == 404:
+            # The parsed tree is shared with other HPA tools; read it only
+            return get_hpa_client().gene_xml(
+                ensembl_id,
+                self.http_get,
+                timeout=self.timeout,
+                **self.get_upstream_cache_policy(),
+            )
+        except requests.HTTPError as e:
+            if e.response.status_code == 404:
                 raise Exception(f"No XML data found for Ensembl ID '{ensembl_id}'")
-            if resp.status_code != 200:
-                raise Exception(f"HPA XML API request failed, HTTP {resp.status_code}")
-
-            return ET.fromstring(resp.content)
+            raise Exception(
+                f"HPA XML API request failed, HTTP {e.response.status_code}"
+            )
         except requests.RequestException as e:
             raise Exception(f"HPA XML API request failed: {str(e)}")
         except ET.ParseError as e:
@@ -317,7 +360,7 @@ class HPAGetRnaExpressionBySourceTool(HPASearchApiTool):
             columns = f"g,gs,{api_column}"
 
             # Call the search API
-            response_data = self._make_api_request(gene_name, columns)
+            response_data = self._get_gene_data(gene_name, columns)
 
             if "error" in response_data:
                 return response_data
@@ -435,7 +478,7 @@ class HPAGetSubcellularLocationTool(HPASearchApiTool):
             return {"error": "Parameter 'gene_name' is required"}
 
         # Use specific columns for subcellular location data
-        result = self._make_api_request(gene_name, "g,gs,scml,scal")
+        result = self._get_gene_data(gene_name, "g,gs,scml,scal")
 
         if "error" in result:
             return result
@@ -600,13 +643,13 @@ class HPAGetComparativeExpressionTool(HPASearchApiTool):
 
         # Request expression data for the cell line
         cell_columns = f"g,gs,{cell_column}"
-        cell_result = self._make_api_request(gene_name, cell_columns)
+        cell_result = self._get_gene_data(gene_name, cell_columns)
         if "error" in cell_result:
             return cell_result
 
         # Request expression data for healthy tissues
         tissue_columns = "g,gs,rnatsm"
-        tissue_result = self._make_api_request(gene_name, tissue_columns)
+        tissue_result = self._get_gene_data(gene_name, tissue_columns)
         if "error" in tissue_result:
             return tissue_result
 
@@ -729,7 +772,7 @@ class HPAGetDiseaseExpressionTool(HPASearchApiTool):
 
         # Build request columns
         columns = f"g,gs,{cancer_column},rnatsm"
-        result = self._make_api_request(gene_name, columns)
+        result = self._get_gene_data(gene_name, columns)
 
         if "error" in result:
             return result
@@ -810,7 +853,7 @@ class HPAGetBiologicalProcessTool(HPASearchApiTool):
 
         # Request biological process data for the gene
         columns = "g,gs,upbp"
-        result = self._make_api_request(gene_name, columns)
+        result = self._get_gene_data(gene_name, columns)
 
         if "error" in result:
             return result
@@ -927,7 +970,7 @@ class HPAGetProteinInteractionsTool(HPASearchApiTool):
 
         # Use 'ppi' column to retrieve protein-protein interactions
         columns = "g,gs,ppi"
-        result = self._make_api_request(gene_name, columns)
+        result = self._get_gene_data(gene_name, columns)
 
         if "error" in result:
             return result
@@ -1070,6 +1113,10 @@ class HPAGetContextualBiologicalProcessTool(BaseTool):
     Enhanced with intelligent context validation and recommendation.
     """
 
+    def prepare_batch(self, arguments_list: List[Dict[str, Any]]) -> None:
+        """Load the records of every gene in a batch with bulk searches."""
+        HPASearchApiTool({}).prepare_batch(arguments_list)
+
     def __init__(self, tool_config):
         super().__init__(tool_config)
         # Define all valid context options
@@ -1193,7 +1240,7 @@ class HPAGetContextualBiologicalProcessTool(BaseTool):
         try:
             # Step 1: Get gene basic info and Ensembl ID
             search_api = HPASearchApiTool({})
-            search_result = search_api._make_api_request(gene_name, "g,gs,eg,upbp")
+            search_result = search_api._get_gene_data(gene_name, "g,gs,eg,upbp")
 
             if "error" in search_result or not search_result:
                 return {"error": f"Could not find gene information for '{gene_name}'"}
@@ -1254,7 +1301,7 @@ class HPAGetContextualBiologicalProcessTool(BaseTool):
 
                     cell_column = cell_line_columns.get(context_name.lower())
                     if cell_column:
-                        cell_result = search_api._make_api_request(
+                        cell_result = search_api._get_gene_data(
                             gene_name, f"g,{cell_column}"
                         )
                         if "error" not in cell_result and cell_result:
@@ -0,0 +1,533 @@
+"""
+Shared HTTP transport for REST-backed tools.
+
+Tools that talk to remote APIs should send requests through this module rather
+than calling ``requests.get``/``requests.post`` directly. Sessions are pooled
+per upstream host so TCP and TLS connections are kept alive and reused across
+calls, batch workers and tool instances, and every request gets the same retry
+policy and default timeout. Requests are also paced by the per-host limits
+in :mod:`tooluniverse.rate_limiter`.
+
+Configuration (environment variables):
+
+``TOOLUNIVERSE_HTTP_POOL_SIZE``
+    Connections kept per host (default 32). Batch runs grow the pool to their
+    ``max_workers`` automatically.
+``TOOLUNIVERSE_HTTP_TIMEOUT``
+    Default timeout in seconds for requests that do not pass one (default 30).
+``TOOLUNIVERSE_HTTP_RETRIES``
+    Retries for connection errors and retryable status codes (default 3).
+    Every retry draws its own token from the host's rate limit, and a 429 is
+    retried only after the limiter has paused the host for its Retry-After.
+    Read timeouts are never retried, and under an active deadline a retry is
+    only made if its backoff and a full attempt still fit in the time left.
+``TOOLUNIVERSE_HTTP_BACKOFF``
+    Exponential backoff factor between retries in seconds (default 0.5).
+``TOOLUNIVERSE_HTTP_HEDGE``
+    Set to ``1`` to hedge idempotent requests: once a GET has been running
+    longer than the host's recent p95 latency, a duplicate is sent and the
+    first response wins (default off).
+``TOOLUNIVERSE_HTTP_HEDGE_QUANTILE``
+    Latency quantile that triggers the hedge (default 0.95).
+
+Sessions never store cookies, since they are shared by every caller; pass
+``cookies=`` per request where an API needs them.
+
+Each host also has a circuit breaker (:mod:`tooluniverse.circuit_breaker`);
+while it is open, requests fail fast with ``ToolUnavailableError``.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import os
+from http.cookiejar import DefaultCookiePolicy
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Dict, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import MaxRetryError, ResponseError
+from urllib3.util.retry import Retry
+
+from . import deadline
+from .circuit_breaker import get_circuit_breakers
+from .rate_limiter import get_rate_limiter, retry_after_seconds
+
+try:
+    from urllib3.exceptions import NameResolutionError
+except ImportError:  # pragma: no cover - urllib3 < 2
+    NameResolutionError = None
+
+DEFAULT_POOL_SIZE = 32
+DEFAULT_TIMEOUT = 30.0
+DEFAULT_RETRIES = 3
+DEFAULT_BACKOFF = 0.5
+# 429 is retried by HTTPTransport._send, through the rate limiter
+RETRY_STATUS_CODES = (500, 502, 503, 504)
+DEFAULT_HEDGE_QUANTILE = 0.95
+HEDGE_METHODS = frozenset({"GET", "HEAD"})
+USER_AGENT = "ToolUniverse (+https://github.com/mims-harvard/ToolUniverse)"
+
+# Longest one attempt of the request in flight may take, set while a deadline
+# is active so the retry policy can tell whether another attempt still fits.
+_attempt_seconds: contextvars.ContextVar[Optional[float]] = contextvars.ContextVar(
+    "tooluniverse_http_attempt_seconds", default=None
+)
+# Limiter of the request in flight; each retry urllib3 makes is charged to it
+_attempt_limiter: contextvars.ContextVar[Optional[Any]] = contextvars.ContextVar(
+    "tooluniverse_http_attempt_limiter", default=None
+)
+
+
+def _env_number(name: str, default, cast):
+    value = os.getenv(name)
+    if value in (None, ""):
+        return default
+    try:
+        return cast(value)
+    except ValueError:
+        return default
+
+
+def _timeout_seconds(timeout) -> Optional[float]:
+    """Return the longest a request with ``timeout`` may wait, if bounded."""
+    if isinstance(timeout, tuple):
+        if None in timeout:
+            return None
+        return sum(timeout)
+    return timeout
+
+
+def _close_response(future) -> None:
+    """Release the connection held by a hedged request that lost the race."""
+    if future.exception() is None:
+        future.result().close()
+
+
+class _TransportRetry(Retry):
+    """Retry policy that gives up at once on DNS failures and on retries
+    that would overrun the caller's deadline.
+
+    An unknown host will not resolve a few hundred milliseconds later, and
+    retrying only stalls offline runs behind the backoff schedule. Under a
+    deadline, a retry is made only if its backoff plus one more full attempt
+    ends before the deadline does. Each retry waits for its own token from
+    the host's rate limiter.
+    """
+
+    # 429 is retried by HTTPTransport._send, through the rate limiter
+    RETRY_AFTER_STATUS_CODES = frozenset({413, 503})
+
+    def increment(
+        self,
+        method=None,
+        url=None,
+        response=None,
+        error=None,
+        _pool=None,
+        _stacktrace=None,
+    ):
+        if NameResolutionError is not None and isinstance(error, NameResolutionError):
+            raise MaxRetryError(_pool, url, error) from error
+        new_retry = super().increment(method, url, response, error, _pool, _stacktrace)
+        limiter = _attempt_limiter.get()
+        token_wait = limiter.charge() if limiter is not None else 0.0
+        left = deadline.remaining()
+        if left is not None:
+            wait_for = new_retry.get_backoff_time()
+            if response is not None and self.respect_retry_after_header:
+                wait_for = max(wait_for, new_retry.get_retry_after(response) or 0)
+            attempt = _attempt_seconds.get()
+            if attempt is None or token_wait + wait_for + attempt >= left:
+                reason = error or ResponseError("retry would overrun the deadline")
+                raise MaxRetryError(_pool, url, reason) from error
+        if token_wait > 0:
+            time.sleep(token_wait)
+        return new_retry
+
+
+class HTTPTransport:
+    """Per-host pool of keep-alive :class:`requests.Session` objects."""
+
+    def __init__(
+        self,
+        *,
+        pool_size: Optional[int] = None,
+        timeout: Optional[float] = None,
+        retries: Optional[int] = None,
+        backoff_factor: Optional[float] = None,
+        hedge: Optional[bool] = None,
+    ):
+        self.pool_size = max(
+            1,
+            (
+                pool_size
+                if pool_size is not None
+                else _env_number("TOOLUNIVERSE_HTTP_POOL_SIZE", DEFAULT_POOL_SIZE, int)
+            ),
+        )
+        self.timeout = (
+            timeout
+            if timeout is not None
+            else _env_number("TOOLUNIVERSE_HTTP_TIMEOUT", DEFAULT_TIMEOUT, float)
+        )
+        self.retries = max(
+            0,
+            (
+                retries
+                if retries is not None
+                else _env_number("TOOLUNIVERSE_HTTP_RETRIES", DEFAULT_RETRIES, int)
+            ),
+        )
+        self.backoff_factor = (
+            backoff_factor
+            if backoff_factor is not None
+            else _env_number("TOOLUNIVERSE_HTTP_BACKOFF", DEFAULT_BACKOFF, float)
+        )
+        self.hedge = (
+            hedge
+            if hedge is not None
+            else os.getenv("TOOLUNIVERSE_HTTP_HEDGE", "").lower()
+            in ("1", "true", "yes", "on")
+        )
+        self.hedge_quantile = _env_number(
+            "TOOLUNIVERSE_HTTP_HEDGE_QUANTILE", DEFAULT_HEDGE_QUANTILE, float
+        )
+        self._sessions: Dict[str, requests.Session] = {}
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._hedges_sent = 0
+        self._hedges_won = 0
+        self._requests = 0
+        self._sessions_created = 0
+
+    # ------------------------------------------------------------------
+    # Session management
+    # ------------------------------------------------------------------
+    @staticmethod
+    def host_key(url: str) -> str:
+        """Return the ``scheme://host[:port]`` key used to pool ``url``."""
+        parts = urlsplit(url)
+        return f"{parts.scheme.lower()}://{parts.netloc.lower()}"
+
+    def _retry_policy(self) -> Retry:
+        # Read errors are re-raised, not retried: the request reached a slow
+        # upstream, and retrying would multiply the caller's timeout.
+        return _TransportRetry(
+            total=self.retries,
+            connect=self.retries,
+            read=False,
+            status=self.retries,
+            backoff_factor=self.backoff_factor,
+            status_forcelist=RETRY_STATUS_CODES,
+            allowed_methods=Retry.DEFAULT_ALLOWED_METHODS,
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+
+    def _mount(self, session: requests.Session) -> None:
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=self.pool_size,
+            max_retries=self._retry_policy(),
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+
+    def session_for(self, url: str) -> requests.Session:
+        """Return the pooled session for the host of ``url``."""
+        key = self.host_key(url)
+        session = self._sessions.get(key)
+        if session is not None:
+            return session
+        with self._lock:
+            session = self._sessions.get(key)
+            if session is None:
+                session = requests.Session()
+                session.headers["User-Agent"] = USER_AGENT
+                # The session is shared by every caller in the process; a
+                # cookie set for one must not be sent with another's requests
+                session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+                self._mount(session)
+                self._sessions[key] = session
+                self._sessions_created += 1
+        return session
+
+    def ensure_pool_size(self, size: Optional[int]) -> None:
+        """Grow per-host pools so ``size`` concurrent workers never block."""
+        if not size or size <= self.pool_size:
+            return
+        with self._lock:
+            if size <= self.pool_size:
+                return
+            self.pool_size = size
+            # In-flight connections finish on the old adapter; new requests
+            # pick up the larger pool.
+            for session in self._sessions.values():
+                self._mount(session)
+
+    # ------------------------------------------------------------------
+    # Requests
+    # ------------------------------------------------------------------
+    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        """Send a request through the pooled session for ``url``'s host.
+
+        Accepts the same keyword arguments as :func:`requests.request`; a
+        missing or ``None`` ``timeout`` falls back to the transport default,
+        and any timeout is shortened to the time left before the active
+        deadline (:mod:`tooluniverse.deadline`). ``hedge=True``/``False``
+        overrides the transport's hedging setting for this call.
+
+        Raises :class:`ToolUnavailableError` without sending anything while
+        the host's circuit breaker is open, and
+        :class:`~tooluniverse.deadline.DeadlineExceededError` once the
+        deadline has passed, including when it runs out mid-request.
+        """
+        hedge = kwargs.pop("hedge", None)
+        timeout = kwargs.get("timeout")
+        if timeout is None:
+            timeout = self.timeout
+        # Never wait past the caller's deadline; raises once it has passed
+        kwargs["timeout"] = deadline.clamp_timeout(timeout)
+        deadline_bound = kwargs["timeout"] != timeout
+        self._requests += 1
+        try:
+            return self._request(method, url, kwargs, hedge, deadline_bound)
+        except deadline.DeadlineExceededError:
+            raise
+        except (
+            requests.exceptions.Timeout,
+            requests.exceptions.ConnectionError,
+        ) as exc:
+            timed_out = deadline_bound and isinstance(exc, requests.exceptions.Timeout)
+            if not (timed_out or deadline.expired()):
+                raise
+            raise deadline.DeadlineExceededError(
+                f"Deadline exceeded during {method.upper()} {url}",
+                details={"url": url, "error": str(exc)},
+            ) from exc
+
+    def _request(
+        self,
+        method: str,
+        url: str,
+        kwargs: Dict[str, Any],
+        hedge: Optional[bool],
+        deadline_bound: bool,
+    ) -> requests.Response:
+        breaker = get_circuit_breakers().breaker(url)
+        if breaker is None:
+            return self._send(method, url, kwargs)
+
+        probe = breaker.before_call()
+        start = time.monotonic()
+        try:
+            hedge_after = self._hedge_delay(method, breaker, hedge, kwargs)
+            if hedge_after is not None:
+                response = self._send_hedged(method, url, kwargs, hedge_after)
+            else:
+                response = self._send(method, url, kwargs)
+        except deadline.DeadlineExceededError:
+            # Raised before or instead of a reply (e.g. while queued for the
+            # host's rate limit); it says nothing about the host's health
+            breaker.record(None, probe=probe)
+            raise
+        except requests.exceptions.Timeout:
+            # A timeout shortened by the caller's deadline says nothing
+            # about the host's health
+            breaker.record(None if deadline_bound else False, probe=probe)
+            raise
+        except requests.exceptions.ConnectionError:
+            breaker.record(False, time.monotonic() - start, probe)
+            raise
+        except BaseException:
+            breaker.record(None, probe=probe)
+            raise
+        breaker.record(response.status_code < 500, time.monotonic() - start, probe)
+        return response
+
+    def _send(self, method: str, url: str, kwargs: Dict[str, Any]) -> requests.Response:
+        """Send one request, retrying 429 responses through the rate limiter.
+
+        Each attempt takes a fresh limiter slot, and a 429 first pauses the
+        whole host for its Retry-After, so throttled retries stay within the
+        host's budget. Only idempotent methods are retried.
+        """
+        attempts = 0
+        while True:
+            response = self._send_once(method, url, kwargs)
+            if response.status_code != 429:
+                return response
+            delay = retry_after_seconds(response.headers.get("Retry-After"))
+            limiter = get_rate_limiter().limiter(url)
+            if limiter is not None:
+                limiter.penalize(delay)
+            if (
+                attempts >= self.retries
+                or method.upper() not in Retry.DEFAULT_ALLOWED_METHODS
+                or not self._retry_fits_deadline(delay or 1.0, kwargs["timeout"])
+            ):
+                return response
+            attempts += 1
+            response.close()
+            if limiter is None:
+                deadline.sleep(delay or 1.0)
+
+    @staticmethod
+    def _retry_fits_deadline(delay: float, timeout) -> bool:
+        left = deadline.remaining()
+        if left is None:
+            return True
+        attempt = _timeout_seconds(timeout)
+        return attempt is not None and delay + attempt < left
+
+    def _send_once(
+        self, method: str, url: str, kwargs: Dict[str, Any]
+    ) -> requests.Response:
+        with get_rate_limiter().slot(url) as limiter:
+            limiter_token = _attempt_limiter.set(limiter)
+            seconds_token = None
+            if deadline.remaining() is not None:
+                seconds_token = _attempt_seconds.set(
+                    _timeout_seconds(kwargs["timeout"])
+                )
+            try:
+                return self.session_for(url).request(method, url, **kwargs)
+            finally:
+                if seconds_token is not None:
+                    _attempt_seconds.reset(seconds_token)
+                _attempt_limiter.reset(limiter_token)
+
+    # ------------------------------------------------------------------
+    # Hedged requests
+    # ------------------------------------------------------------------
+    def _hedge_delay(
+        self, method: str, breaker, hedge: Optional[bool], kwargs: Dict[str, Any]
+    ) -> Optional[float]:
+        """Return when to send a hedge for this call, or None for no hedge."""
+        if not (self.hedge if hedge is None else hedge):
+            return None
+        if method.upper() not in HEDGE_METHODS or kwargs.get("stream"):
+            return None
+        return breaker.latency_quantile(self.hedge_quantile)
+
+    def _hedge_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.pool_size * 2,
+                        thread_name_prefix="tooluniverse-http-hedge",
+                    )
+        return self._executor
+
+    def _send_hedged(
+        self, method: str, url: str, kwargs: Dict[str, Any], hedge_after: float
+    ) -> requests.Response:
+        """Send ``method url``; if it is still running after ``hedge_after``
+        seconds, send a duplicate and return whichever finishes first."""
+        executor = self._hedge_executor()
+        # Each send runs in a copy of the caller's context so the deadline
+        # follows it onto the hedge thread
+        primary = executor.submit(
+            contextvars.copy_context().run, self._send, method, url, kwargs
+        )
+        done, _ = wait([primary], timeout=hedge_after)
+        if done:
+            return primary.result()
+
+        self._hedges_sent += 1
+        backup = executor.submit(
+            contextvars.copy_context().run, self._send, method, url, dict(kwargs)
+        )
+        pending = {primary, backup}
+        error: Optional[BaseException] = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is not None:
+                    error = future.exception()
+                    continue
+                if future is backup:
+                    self._hedges_won += 1
+                for loser in pending:
+                    loser.add_done_callback(_close_response)
+                return future.result()
+        raise error
+
+    def get(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request("POST", url, **kwargs)
+
+    def close(self) -> None:
+        with self._lock:
+            sessions, self._sessions = self._sessions, {}
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+        for session in sessions.values():
+            session.close()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "hosts": sorted(self._sessions),
+            "sessions_created": self._sessions_created,
+            "requests": self._requests,
+            "pool_size": self.pool_size,
+            "timeout": self.timeout,
+            "retries": self.retries,
+            "hedge": self.hedge,
+            "hedges_sent": self._hedges_sent,
+            "hedges_won": self._hedges_won,
+        }
+
+
+_transport: Optional[HTTPTransport] = None
+_transport_lock = threading.Lock()
+
+
+def get_transport() -> HTTPTransport:
+    """Return the process-wide transport, creating it on first use."""
+    global _transport
+    if _transport is None:
+        with _transport_lock:
+            if _transport is None:
+                _transport = HTTPTransport()
+    return _transport
+
+
+def reset_transport() -> None:
+    """Close all pooled sessions; the next request builds a fresh transport."""
+    global _transport
+    with _transport_lock:
+        transport, _transport = _transport, None
+    if transport is not None:
+        transport.close()
+
+
+def request(method: str, url: str, **kwargs: Any) -> requests.Response:
+    return get_transport().request(method, url, **kwargs)
+
+
+def get(url: str, **kwargs: Any) -> requests.Response:
+    return get_transport().request("GET", url, **kwargs)
+
+
+def post(url: str, **kwargs: Any) -> requests.Response:
+    return get_transport().request("POST", url, **kwargs)
+
+
+__all__ = [
+    "HTTPTransport",
+    "get_transport",
+    "reset_transport",
+    "request",
+    "get",
+    "post",
+]
@@ -0,0 +1,409 @@
+"""
+Central poller for upstream APIs that run submitted jobs.
+
+Some services (UniProt ID mapping, for example) accept a job, return an ID and
+expect the client to poll a status endpoint until the job finishes. Polling
+from the calling thread ties up a worker for as long as the job runs and sends
+one status request per job per interval. Instead, a tool submits a *poll
+function* to the :class:`JobScheduler` and waits on the returned handle. A
+single background loop polls all outstanding jobs, backing off exponentially
+(with jitter) while a job is pending, and completes the handle's future when
+the poll function returns a result:
+
+.. code-block:: python
+
+    def poll():
+        status = self.http_get(status_url).json()["status"]
+        return status if status in ("FINISHED", "FAILED") else PENDING
+
+    status = get_job_scheduler().submit(poll, timeout=30).result()
+
+Work that should follow the job (fetching its results, say) can be chained with
+:meth:`JobHandle.then`. A tool that returns ``self.defer(job.then(...))`` lets
+ToolUniverse's parallel batches release the worker thread while the job is
+pending; every other caller still gets the finished value.
+
+A poll function returns :data:`PENDING` while the job is running and any other
+value once it is done; exceptions fail the job. Polls run with the
+submitter's context variables, so deadlines (:mod:`tooluniverse.deadline`)
+still apply, and a job never outlives the caller's deadline. Jobs still
+pending when their timeout passes fail with :class:`JobTimeoutError`.
+
+Configuration (environment variables):
+
+``TOOLUNIVERSE_JOB_POLL_WORKERS``
+    Threads that run due polls (default 4).
+``TOOLUNIVERSE_JOB_CONTINUE_WORKERS``
+    Threads that run :meth:`JobHandle.then` continuations (default 8). They
+    are kept apart from the poll threads so slow result downloads never
+    delay other jobs' polls.
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import os
+import random
+import threading
+import time
+from concurrent.futures import Future, InvalidStateError, ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar, copy_context
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+import requests
+
+from . import deadline
+from .exceptions import ToolUnavailableError
+
+PENDING = object()
+
+DEFAULT_POLL_WORKERS = 4
+DEFAULT_CONTINUE_WORKERS = 8
+DEFAULT_INTERVAL = 1.0
+DEFAULT_MAX_INTERVAL = 10.0
+DEFAULT_BACKOFF = 1.5
+DEFAULT_JITTER = 0.2
+
+# The object (a ToolUniverse or a tool) whose caller takes a future in place
+# of a finished result
+_deferring: ContextVar[Optional[object]] = ContextVar(
+    "tooluniverse_job_deferring", default=None
+)
+
+
+@contextmanager
+def accept_deferred(owner: Optional[object]) -> Iterator[None]:
+    """Let ``owner`` return a future instead of waiting on it in the block.
+
+    ``None`` withdraws the permission, e.g. for nested calls.
+    """
+    token = _deferring.set(owner)
+    try:
+        yield
+    finally:
+        _deferring.reset(token)
+
+
+def deferring(owner: object) -> bool:
+    """Return whether ``owner``'s caller accepts a future for its result."""
+    return owner is not None and _deferring.get() is owner
+
+
+def _env_workers(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, default))
+    except ValueError:
+        return default
+
+
+class JobTimeoutError(ToolUnavailableError, requests.exceptions.Timeout):
+    """A submitted job was still pending when its timeout passed.
+
+    Like :class:`~tooluniverse.deadline.DeadlineExceededError` it is also a
+    ``requests`` ``Timeout``, so existing timeout handlers apply.
+    """
+
+    def __init__(self, message="Job did not finish in time", details=None):
+        super().__init__(
+            message,
+            retriable=True,
+            next_steps=["Retry later", "Allow a longer wait time"],
+            details=details,
+        )
+
+
+class JobHandle:
+    """A submitted job; wait for it with :meth:`result`."""
+
+    def __init__(
+        self,
+        poll: Callable[[], Any],
+        *,
+        scheduler: "JobScheduler",
+        name: str,
+        expires_at: Optional[float],
+        interval: float,
+        max_interval: float,
+        backoff: float,
+        jitter: float,
+    ):
+        self.name = name
+        self.future: Future = Future()
+        self.polls = 0
+        self._poll = poll
+        self._scheduler = scheduler
+        self._context = copy_context()
+        self._expires_at = expires_at
+        self._interval = interval
+        self._max_interval = max_interval
+        self._backoff = backoff
+        self._jitter = jitter
+
+    def result(self, timeout: Optional[float] = None) -> Any:
+        """Block until the job finishes and return the poll function's result."""
+        return self.future.result(timeout=timeout)
+
+    def then(self, fn: Callable[["JobHandle"], Any]) -> Future:
+        """Return a future for ``fn(handle)``, called once the job is done.
+
+        ``fn`` runs on a continuation thread (not a poll thread, so it may be
+        slow) with the submitter's context variables,
+        where :meth:`result` returns (or raises) without waiting. Exceptions
+        from ``fn`` fail the returned future.
+        """
+        chained: Future = Future()
+        self.future.add_done_callback(
+            lambda _: self._scheduler._continue(self, fn, chained)
+        )
+        return chained
+
+    def done(self) -> bool:
+        return self.future.done()
+
+    def cancel(self) -> bool:
+        """Stop polling the job. Returns False if it had already finished."""
+        return self.future.cancel()
+
+    def _next_delay(self) -> float:
+        delay = self._interval
+        self._interval = min(self._interval * self._backoff, self._max_interval)
+        return delay * random.uniform(1 - self._jitter, 1 + self._jitter)
+
+    def _run_poll(self) -> Any:
+        self.polls += 1
+        return self._context.run(self._poll)
+
+
+class JobScheduler:
+    """Polls every outstanding job from one background loop."""
+
+    def __init__(
+        self,
+        *,
+        max_workers: Optional[int] = None,
+        continue_workers: Optional[int] = None,
+    ):
+        if max_workers is None:
+            max_workers = _env_workers(
+                "TOOLUNIVERSE_JOB_POLL_WORKERS", DEFAULT_POLL_WORKERS
+            )
+        if continue_workers is None:
+            continue_workers = _env_workers(
+                "TOOLUNIVERSE_JOB_CONTINUE_WORKERS", DEFAULT_CONTINUE_WORKERS
+            )
+        self.max_workers = max(1, max_workers)
+        self.continue_workers = max(1, continue_workers)
+        self._queue: List[Tuple[float, int, JobHandle]] = []
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._continuations: Optional[ThreadPoolExecutor] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = False
+        self.polls = 0
+
+    def submit(
+        self,
+        poll: Callable[[], Any],
+        *,
+        timeout: Optional[float] = None,
+        interval: float = DEFAULT_INTERVAL,
+        max_interval: float = DEFAULT_MAX_INTERVAL,
+        backoff: float = DEFAULT_BACKOFF,
+        jitter: float = DEFAULT_JITTER,
+        first_poll: float = 0.0,
+        name: str = "job",
+    ) -> JobHandle:
+        """Start polling a job and return its handle.
+
+        ``poll`` is first called after ``first_poll`` seconds, then after
+        ``interval`` seconds growing by ``backoff`` up to ``max_interval``.
+        ``timeout`` (shortened to the caller's deadline) bounds the whole wait.
+        """
+        timeout = deadline.budget(timeout)
+        expires_at = None if timeout is None else time.monotonic() + timeout
+        handle = JobHandle(
+            poll,
+            scheduler=self,
+            name=name,
+            expires_at=expires_at,
+            interval=interval,
+            max_interval=max_interval,
+            backoff=backoff,
+            jitter=jitter,
+        )
+        self._schedule(handle, first_poll)
+        return handle
+
+    def pending(self) -> int:
+        with self._condition:
+            return sum(1 for _, _, handle in self._queue if not handle.done())
+
+    def stats(self) -> Dict[str, Any]:
+        return {"pending": self.pending(), "polls": self.polls}
+
+    def shutdown(self) -> None:
+        """Stop the loop; jobs still pending are cancelled."""
+        with self._condition:
+            self._stopped = True
+            queue, self._queue = self._queue, []
+            self._condition.notify_all()
+        for _, _, handle in queue:
+            handle.cancel()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+        if self._continuations is not None:
+            # Queued continuations still run so no caller is left waiting
+            self._continuations.shutdown(wait=False)
+
+    # ------------------------------------------------------------------
+    # Loop
+    # ------------------------------------------------------------------
+    def _schedule(self, handle: JobHandle, delay: float) -> None:
+        due = time.monotonic() + max(0.0, delay)
+        if handle._expires_at is not None:
+            # Wake up in time to report the timeout
+            due = min(due, handle._expires_at)
+        with self._condition:
+            if self._stopped:
+                handle.cancel()
+                return
+            heapq.heappush(self._queue, (due, next(self._sequence), handle))
+            if self._thread is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="tooluniverse-job-poll",
+                )
+                self._thread = threading.Thread(
+                    target=self._loop, name="tooluniverse-job-scheduler", daemon=True
+                )
+                self._thread.start()
+            self._condition.notify()
+
+    def _loop(self) -> None:
+        while True:
+            with self._condition:
+                while not self._stopped and (
+                    not self._queue or self._queue[0][0] > time.monotonic()
+                ):
+                    wait = self._queue[0][0] - time.monotonic() if self._queue else None
+                    self._condition.wait(wait)
+                if self._stopped:
+                    return
+                _, _, handle = heapq.heappop(self._queue)
+            if handle.done():
+                continue
+            if (
+                handle._expires_at is not None
+                and time.monotonic() >= handle._expires_at
+            ):
+                self._finish(
+                    handle,
+                    error=JobTimeoutError(
+                        f"{handle.name} still pending after {handle.polls} polls",
+                        details={"job": handle.name, "polls": handle.polls},
+                    ),
+                )
+                continue
+            try:
+                self._executor.submit(self._poll, handle)
+            except RuntimeError:
+                # Executor shut down underneath us
+                return
+
+    def _poll(self, handle: JobHandle) -> None:
+        with self._condition:
+            self.polls += 1
+        try:
+            result = handle._run_poll()
+        except BaseException as e:
+            self._finish(handle, error=e)
+            return
+        if result is PENDING:
+            self._schedule(handle, handle._next_delay())
+        else:
+            self._finish(handle, result=result)
+
+    def _continue(
+        self, handle: JobHandle, fn: Callable[[JobHandle], Any], chained: Future
+    ) -> None:
+        """Run a :meth:`JobHandle.then` continuation on its own pool.
+
+        Continuations often download results; on the poll threads they would
+        hold back every other job's polls.
+        """
+
+        def run():
+            if not chained.set_running_or_notify_cancel():
+                return
+            try:
+                result = handle._context.copy().run(fn, handle)
+            except BaseException as e:
+                chained.set_exception(e)
+            else:
+                chained.set_result(result)
+
+        with self._condition:
+            if self._continuations is None and not self._stopped:
+                self._continuations = ThreadPoolExecutor(
+                    max_workers=self.continue_workers,
+                    thread_name_prefix="tooluniverse-job-continue",
+                )
+            executor = self._continuations
+        if executor is not None:
+            try:
+                executor.submit(run)
+                return
+            except RuntimeError:
+                pass  # shut down; finish here rather than strand the caller
+        run()
+
+    @staticmethod
+    def _finish(
+        handle: JobHandle, result: Any = None, error: Optional[BaseException] = None
+    ) -> None:
+        # The caller may have cancelled the job meanwhile
+        try:
+            if error is not None:
+                handle.future.set_exception(error)
+            else:
+                handle.future.set_result(result)
+        except InvalidStateError:
+            pass
+
+
+_scheduler: Optional[JobScheduler] = None
+_scheduler_lock = threading.Lock()
+
+
+def get_job_scheduler() -> JobScheduler:
+    """Return the process-wide job scheduler, creating it on first use."""
+    global _scheduler
+    if _scheduler is None:
+        with _scheduler_lock:
+            if _scheduler is None:
+                _scheduler = JobScheduler()
+    return _scheduler
+
+
+def reset_job_scheduler() -> None:
+    """Stop the scheduler; the next call re-reads configuration."""
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is not None:
+            _scheduler.shutdown()
+        _scheduler = None
+
+
+__all__ = [
+    "PENDING",
+    "JobHandle",
+    "JobScheduler",
+    "JobTimeoutError",
+    "accept_deferred",
+    "deferring",
+    "get_job_scheduler",
+    "reset_job_scheduler",
+]
@@ -256,7 +256,7 @@ class MedlinePlusRESTTool(BaseTool):
 
         # Make request
         try:
-            resp = requests.get(url, timeout=self.timeout)
+            resp = self.http_get(url, timeout=self.timeout)
             if resp.status_code != 200:
                 return {
                     "error": f"MedlinePlus returned non-200 status code: {resp.status_code}",
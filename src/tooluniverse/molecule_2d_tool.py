@@ -7,7 +7,6 @@ Supports SMILES, InChI, molecule names, and various output formats.
 """
 
 import base64
-import requests
 import io
 import warnings
 from typing import Any, Dict, Optional
@@ -147,7 +146,7 @@ class Molecule2DTool(VisualizationTool):
                 f"https://pubchem.ncbi.nlm.nih.gov/rest/pug/compound/name/"
                 f"{name}/property/IsomericSMILES/JSON"
             )
-            response = requests.get(url, timeout=10)
+            response = self.http_get(url, timeout=10)
             if response.status_code == 200:
                 data = response.json()
                 if "PropertyTable" in data and "Properties" in data["PropertyTable"]:
@@ -2,13 +2,16 @@
 NCBI E-utilities Tool with Rate Limiting
 
 This module provides a base class for NCBI E-utilities API tools with
-built-in rate limiting and retry logic to handle 429 errors.
+built-in rate limiting and retry logic to handle 429 errors. The rate limit is
+the process-wide E-utilities budget from :mod:`tooluniverse.rate_limiter`
+(3 requests/second, 10 with ``NCBI_API_KEY`` set), shared by all NCBI tools.
 """
 
-import time
 import requests
 from typing import Dict, Any, Optional
+from . import deadline
 from .base_tool import BaseTool
+from .rate_limiter import get_rate_limiter, retry_after_seconds
 
 
 class NCBIEUtilsTool(BaseTool):
@@ -17,8 +20,6 @@ class NCBIEUtilsTool(BaseTool):
     def __init__(self, tool_config):
         super().__init__(tool_config)
         self.base_url = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils"
-        self.last_request_time = 0
-        self.min_interval = 0.34  # ~3 requests/second (NCBI limit without API key)
         self.max_retries = 3
         self.initial_retry_delay = 1
         self.session = requests.Session()
@@ -34,14 +35,18 @@ class NCBIEUtilsTool(BaseTool):
         url = f"{self.base_url}{endpoint}"
 
         for attempt in range(self.max_retries):
-            # Rate limiting
-            elapsed = time.time() - self.last_request_time
-            if elapsed < self.min_interval:
-                time.sleep(self.min_interval - elapsed)
-
             try:
-                response = self.session.get(url, params=params, timeout=self.timeout)
-                self.last_request_time = time.time()
+                # Shared per-host budget: every NCBI tool draws from it
+                with get_rate_limiter().slot(url) as limiter:
+                    response = self.session.get(
+                        url,
+                        params=params,
+                        timeout=deadline.clamp_timeout(self.timeout),
+                    )
+                if response.status_code == 429 and limiter is not None:
+                    limiter.penalize(
+                        retry_after_seconds(response.headers.get("Retry-After"))
+                    )
                 response.raise_for_status()
 
                 # Try to parse JSON response
@@ -67,7 +72,7 @@ class NCBIEUtilsTool(BaseTool):
                     print(
                         f"Rate limited, retrying in {delay} seconds... (attempt {attempt + 1}/{self.max_retries})"
                     )
-                    time.sleep(delay)
+                    deadline.sleep(delay)
                     continue
                 else:
                     return {
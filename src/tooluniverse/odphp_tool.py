@@ -23,7 +23,7 @@ class ODPHPRESTTool(BaseTool):
     def _make_request(self, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         url = f"{ODPHP_BASE_URL}{self.endpoint}"
         try:
-            resp = requests.get(url, params=params, timeout=30)
+            resp = self.http_get(url, params=params, timeout=30)
             resp.raise_for_status()
             data = resp.json()
             return {
@@ -224,7 +224,7 @@ class ODPHPOutlinkFetch(BaseTool):
         out: List[Dict[str, Any]] = []
         for u in urls[:3]:
             try:
-                resp = requests.get(u, timeout=self.timeout, allow_redirects=True)
+                resp = self.http_get(u, timeout=self.timeout, allow_redirects=True)
                 ct = resp.headers.get("Content-Type", "")
                 item: Dict[str, Any] = {
                     "url": u,
@@ -39,7 +39,7 @@ class OpenAIRETool(BaseTool):
             "query": query,
         }
         try:
-            resp = requests.get(endpoint, params=params, timeout=20)
+            resp = self.http_get(endpoint, params=params, timeout=20)
             resp.raise_for_status()
             data = resp.json()
         except requests.RequestException as e:
@@ -73,7 +73,7 @@ class OpenAlexTool(BaseTool):
             params["filter"] = ",".join(filters)
 
         try:
-            response = requests.get(self.base_url, params=params)
+            response = self.http_get(self.base_url, params=params)
             response.raise_for_status()
             data = response.json()
 
@@ -212,7 +212,7 @@ class OpenAlexTool(BaseTool):
             url = f"https://api.openalex.org/works/https://doi.org/{doi}"
             params = {"mailto": "support@openalex.org"}
 
-            response = requests.get(url, params=params)
+            response = self.http_get(url, params=params)
             response.raise_for_status()
             work = response.json()
 
@@ -241,7 +241,7 @@ class OpenAlexTool(BaseTool):
                 "mailto": "support@openalex.org",
             }
 
-            response = requests.get(self.base_url, params=params)
+            response = self.http_get(self.base_url, params=params)
             response.raise_for_status()
             data = response.json()
 
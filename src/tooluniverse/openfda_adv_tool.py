@@ -206,7 +206,7 @@ class FDADrugAdverseEventTool(BaseTool):
 
         # API request
         try:
-            response = requests.get(url)
+            response = self.http_get(url)
             # Handle 404 as "no matches found" - return empty list instead of error
             if response.status_code == 404:
                 try:
@@ -334,7 +334,7 @@ class FDACountAdditiveReactionsTool(FDADrugAdverseEventTool):
             )
 
         try:
-            resp = requests.get(url)
+            resp = self.http_get(url)
             # Handle 404 as "no matches found" - return empty list instead of error
             if resp.status_code == 404:
                 try:
@@ -465,7 +465,7 @@ class FDADrugAdverseEventDetailTool(BaseTool):
 
         # API request
         try:
-            response = requests.get(url)
+            response = self.http_get(url)
             # Handle 404 as "no matches found" - return empty list instead of error
             if response.status_code == 404:
                 try:
@@ -804,7 +804,7 @@ class FDADrugInteractionDetailTool(BaseTool):
 
         # API request
         try:
-            response = requests.get(url)
+            response = self.http_get(url)
             # Handle 404 as "no matches found" - return empty list instead of error
             if response.status_code == 404:
                 try:
@@ -1,5 +1,6 @@
-import requests
 from .base_tool import BaseTool
+from . import http_client
+from .pagination import Page, PaginationSpec, paginate
 from .tool_registry import register_tool
 import copy
 import re
@@ -34,11 +35,9 @@ def _execute_opentargets_query(chembl_id):
         )
     except ImportError:
         # Fallback if graphql_tool not available
-        import requests
-
         query = _get_drug_names_query()
         variables = {"chemblId": chembl_id}
-        response = requests.post(
+        response = http_client.post(
             _OPENTARGETS_ENDPOINT, json={"query": query, "variables": variables}
         )
         try:
@@ -265,7 +264,7 @@ def search_openfda(
 
     print(full_url)
 
-    response = requests.get(full_url)
+    response = http_client.get(full_url)
 
     # Get the JSON response
     response_data = response.json()
@@ -800,7 +799,8 @@ class FDADrugLabelGetDrugGenericNameTool(FDADrugLabelTool):
 class FDADrugLabelGetDrugNamesByIndicationAggregated(FDADrugLabelTool):
     """
     Enhanced version of FDA_get_drug_names_by_indication that:
-    - Iterates through all results in batches of 100 (no limit)
+    - Iterates through all results in batches of 1000 (no limit), fetching
+      the batches after the first concurrently
     - Aggregates results by generic name
     - Returns one entry per generic name with indication and all brand names
     """
@@ -812,7 +812,7 @@ class FDADrugLabelGetDrugNamesByIndicationAggregated(FDADrugLabelTool):
         """
         Run the aggregated drug names search by indication.
 
-        Iterates through all results in batches of 100, aggregates by
+        Iterates through all results in batches of 1000, aggregates by
         generic name, and returns a list where each entry contains:
         - generic_name: The generic drug name
         - indication: The indication (from input)
@@ -828,85 +828,65 @@ class FDADrugLabelGetDrugNamesByIndicationAggregated(FDADrugLabelTool):
         # Key: generic_name (normalized), Value: set of brand names
         aggregated_results = {}
 
-        # Iterate through results in batches of 1000
-        step = 1000
-        skip = 0
-        total_fetched = 0
-        max_iterations = 1000  # Safety limit to prevent infinite loops
-
-        iteration = 0
-        while iteration < max_iterations:
-            iteration += 1
-
-            # Prepare arguments for this batch
-            batch_arguments = {"indication": indication, "limit": step, "skip": skip}
+        first_error = []
+        run_batch = super().run
 
+        def fetch_page(request):
+            batch_arguments = {
+                "indication": indication,
+                "limit": request.size,
+                "skip": request.offset,
+            }
             # Call parent run method to get results
-            batch_result = super().run(batch_arguments)
-
-            # Check for errors
+            batch_result = run_batch(batch_arguments)
             if batch_result is None or "error" in batch_result:
-                # If we've already fetched some results, return what we have
-                if total_fetched > 0:
-                    break
-                # Otherwise return the error
-                error_msg = "No results returned"
-                return batch_result if batch_result else {"error": error_msg}
-
-            # Extract results
-            results = batch_result.get("results", [])
+                if request.index == 0:
+                    first_error.append(batch_result)
+                # Later failures end the listing with what was fetched
+                return None
             meta = batch_result.get("meta", {})
+            return Page(batch_result.get("results", []), meta.get("total"))
 
-            # Process each result
-            for result in results:
-                generic_names = result.get("openfda.generic_name", [])
-                brand_names = result.get("openfda.brand_name", [])
-
-                # Handle both list and single value cases
-                if not isinstance(generic_names, list):
-                    generic_names = [generic_names] if generic_names else []
-                if not isinstance(brand_names, list):
-                    brand_names = [brand_names] if brand_names else []
-
-                # Normalize and process generic names
-                for generic_name in generic_names:
-                    if not generic_name:
-                        continue
-
-                    # Normalize generic name (uppercase, strip whitespace)
-                    normalized_generic = str(generic_name).upper().strip()
-
-                    if normalized_generic:
-                        # Initialize if not exists
-                        if normalized_generic not in aggregated_results:
-                            aggregated_results[normalized_generic] = set()
-
-                        # Add all brand names for this generic name
-                        for brand_name in brand_names:
-                            if brand_name:
-                                normalized_brand = str(brand_name).strip()
-                                if normalized_brand:
-                                    aggregated_results[normalized_generic].add(
-                                        normalized_brand
-                                    )
-
-            total_fetched += len(results)
-
-            # Check if we've reached the end
-            # If we got fewer results than requested, we've reached the end
-            if len(results) < step:
-                # No more results to fetch
-                break
-
-            # Also check meta for total if available
-            total_available = meta.get("total", None)
-            if total_available is not None:
-                if skip + len(results) >= total_available:
-                    # Reached the total available
-                    break
-
-            # Move to next batch
-            skip += step
+        # Batches of 1000; after the first, the remaining batches are fetched
+        # concurrently since the first response reports the total
+        spec = self.get_pagination() or PaginationSpec("offset", page_size=1000)
+        total_fetched = 0
+        for result in paginate(fetch_page, spec, host=self.endpoint_url):
+            total_fetched += 1
+            generic_names = result.get("openfda.generic_name", [])
+            brand_names = result.get("openfda.brand_name", [])
+
+            # Handle both list and single value cases
+            if not isinstance(generic_names, list):
+                generic_names = [generic_names] if generic_names else []
+            if not isinstance(brand_names, list):
+                brand_names = [brand_names] if brand_names else []
+
+            # Normalize and process generic names
+            for generic_name in generic_names:
+                if not generic_name:
+                    continue
+
+                # Normalize generic name (uppercase, strip whitespace)
+                normalized_generic = str(generic_name).upper().strip()
+
+                if normalized_generic:
+                    # Initialize if not exists
+                    if normalized_generic not in aggregated_results:
+                        aggregated_results[normalized_generic] = set()
+
+                    # Add all brand names for this generic name
+                    for brand_name in brand_names:
+                        if brand_name:
+                            normalized_brand = str(brand_name).strip()
+                            if normalized_brand:
+                                aggregated_results[normalized_generic].add(
+                                    normalized_brand
+                                )
+
+        if first_error:
+            batch_result = first_error[0]
+            return batch_result if batch_result else {"error": "No results returned"}
 
         # Convert aggregated results to list format
         result_list = []
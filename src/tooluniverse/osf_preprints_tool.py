@@ -35,7 +35,7 @@ class OSFPreprintsTool(BaseTool):
             params["filter[provider]"] = provider
 
         try:
-            resp = requests.get(self.base_url, params=params, timeout=20)
+            resp = self.http_get(self.base_url, params=params, timeout=20)
             resp.raise_for_status()
             data = resp.json()
         except requests.RequestException as e:
@@ -56,7 +56,7 @@ class PackageTool(BaseTool):
         url = f"https://pypi.org/pypi/{self.package_name}/json"
 
         try:
-            response = requests.get(url, timeout=self.pypi_timeout)
+            response = self.http_get(url, timeout=self.pypi_timeout)
             response.raise_for_status()
             pypi_data = response.json()
 
@@ -0,0 +1,369 @@
+"""
+Concurrent pagination for paginated upstream APIs.
+
+Many upstream APIs return results a page at a time and report the total
+number of matches in the first response. Fetching the pages one after another
+makes a large listing as slow as the sum of all round trips. :func:`paginate`
+fetches the first page, works out how many pages remain, and fetches them
+concurrently, bounded by the per-host limits of
+:mod:`tooluniverse.rate_limiter`. Items are yielded in order as soon as the
+pages before them have arrived, and fetching stops once ``max_results`` items
+have been produced.
+
+Three pagination styles are supported:
+
+``offset``
+    Pages are addressed by an item offset and a page size (``skip``/``limit``,
+    ``offset``/``size``, ...).
+``page``
+    Pages are addressed by a page number and a page size.
+``cursor``
+    Each response carries a token for the next page. These pages can only be
+    fetched one after another.
+
+Offset and page styles fall back to sequential fetching when the first
+response does not report a total.
+
+Tool configs declare their style in a ``pagination`` block, for example::
+
+    "pagination": {
+        "style": "offset",
+        "offset_param": "skip",
+        "limit_param": "limit",
+        "page_size": 1000,
+        "results_path": "results",
+        "total_path": "meta.results.total"
+    }
+
+``TOOLUNIVERSE_PAGINATION_WORKERS`` sets how many pages of one listing are
+fetched at a time (default 4, ``1`` fetches sequentially).
+"""
+
+from __future__ import annotations
+
+import inspect
+import math
+import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from typing import Any, Callable, Dict, Iterator, List, Mapping, NamedTuple, Optional
+
+from .logging_config import get_logger
+from .rate_limiter import get_rate_limiter
+
+logger = get_logger(__name__)
+
+STYLES = ("offset", "page", "cursor")
+DEFAULT_PAGE_SIZE = 100
+DEFAULT_MAX_PAGES = 1000
+DEFAULT_WORKERS = 4
+
+
+class PageRequest(NamedTuple):
+    """Address of one page: its 0-based number, item offset and size."""
+
+    index: int
+    offset: int
+    size: int
+    cursor: Optional[Any] = None
+
+
+class Page(NamedTuple):
+    """One fetched page.
+
+    ``total`` is the number of matching items reported by the upstream (None
+    if unknown) and ``next_cursor`` the token for the next page in cursor
+    style.
+    """
+
+    items: List[Any]
+    total: Optional[int] = None
+    next_cursor: Optional[Any] = None
+
+
+FetchPage = Callable[[PageRequest], Optional[Page]]
+
+
+def _default_workers() -> int:
+    try:
+        return max(
+            1, int(os.getenv("TOOLUNIVERSE_PAGINATION_WORKERS", DEFAULT_WORKERS))
+        )
+    except ValueError:
+        return DEFAULT_WORKERS
+
+
+def get_path(data: Any, path: Optional[str]) -> Any:
+    """Return the value at a dotted ``path`` in nested dicts (None if missing)."""
+    if not path:
+        return data
+    for key in path.split("."):
+        if not isinstance(data, Mapping):
+            return None
+        data = data.get(key)
+    return data
+
+
+class PaginationSpec:
+    """How a tool's upstream paginates and how much of it to fetch."""
+
+    def __init__(
+        self,
+        style: str = "offset",
+        *,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        max_results: Optional[int] = None,
+        max_pages: Optional[int] = DEFAULT_MAX_PAGES,
+        max_workers: Optional[int] = None,
+        first_page: int = 0,
+        limit_param: str = "limit",
+        offset_param: str = "offset",
+        page_param: str = "page",
+        cursor_param: str = "cursor",
+        results_path: Optional[str] = "results",
+        total_path: Optional[str] = None,
+        next_cursor_path: Optional[str] = None,
+    ):
+        if style not in STYLES:
+            raise ValueError(
+                f"Unknown pagination style {style!r}; expected one of {STYLES}"
+            )
+        self.style = style
+        self.page_size = max(1, int(page_size))
+        self.max_results = int(max_results) if max_results else None
+        self.max_pages = int(max_pages) if max_pages else None
+        self.max_workers = int(max_workers) if max_workers else None
+        self.first_page = first_page
+        self.limit_param = limit_param
+        self.offset_param = offset_param
+        self.page_param = page_param
+        self.cursor_param = cursor_param
+        self.results_path = results_path
+        self.total_path = total_path
+        self.next_cursor_path = next_cursor_path
+
+    @classmethod
+    def from_config(
+        cls, config: Optional[Mapping[str, Any]], **overrides: Any
+    ) -> "PaginationSpec":
+        """Build a spec from a tool's ``pagination`` block.
+
+        ``overrides`` that are not None (e.g. a page size passed as a tool
+        argument) take precedence over the config.
+        """
+        options = dict(config or {})
+        options.update({k: v for k, v in overrides.items() if v is not None})
+        style = options.pop("style", "offset")
+        known = set(inspect.signature(cls).parameters) - {"style"}
+        unknown = set(options) - known
+        if unknown:
+            logger.debug("Ignoring unknown pagination options: %s", sorted(unknown))
+        return cls(style, **{k: v for k, v in options.items() if k in known})
+
+    def params_for(self, request: PageRequest) -> Dict[str, Any]:
+        """Return the query parameters that address ``request``."""
+        params: Dict[str, Any] = {self.limit_param: request.size}
+        if self.style == "offset":
+            params[self.offset_param] = request.offset
+        elif self.style == "page":
+            params[self.page_param] = self.first_page + request.index
+        elif request.cursor is not None:
+            params[self.cursor_param] = request.cursor
+        return params
+
+    def page_from(self, data: Any) -> Optional[Page]:
+        """Pull items, total and next cursor out of a decoded JSON response."""
+        items = get_path(data, self.results_path)
+        if not isinstance(items, list):
+            return None
+        total = get_path(data, self.total_path) if self.total_path else None
+        next_cursor = (
+            get_path(data, self.next_cursor_path) if self.next_cursor_path else None
+        )
+        return Page(
+            items, int(total) if isinstance(total, (int, float)) else None, next_cursor
+        )
+
+
+def _page_limit(spec: PaginationSpec, total: Optional[int], size: int) -> float:
+    """Return how many pages the listing has, capped by the spec's limits."""
+    wanted = total if total is not None else math.inf
+    if spec.max_results is not None:
+        wanted = min(wanted, spec.max_results)
+    pages = math.ceil(wanted / size) if wanted != math.inf else math.inf
+    if spec.max_pages is not None:
+        pages = min(pages, spec.max_pages)
+    return pages
+
+
+def _worker_count(spec: PaginationSpec, host: Optional[str], pages: int) -> int:
+    workers = spec.max_workers or _default_workers()
+    if host:
+        # More threads than the host lets through would only queue
+        host_cap = get_rate_limiter().max_in_flight(host)
+        if host_cap:
+            workers = min(workers, host_cap)
+    return max(1, min(workers, pages))
+
+
+def paginate(
+    fetch_page: FetchPage,
+    spec: PaginationSpec,
+    *,
+    host: Optional[str] = None,
+) -> Iterator[Any]:
+    """Yield the items of every page, in order.
+
+    ``fetch_page`` receives a :class:`PageRequest` and returns a
+    :class:`Page`, or None when the page could not be fetched, which ends the
+    listing after the items already produced. Exceptions raised by
+    ``fetch_page`` propagate to the caller. ``host`` is the upstream host
+    whose in-flight limit bounds the number of concurrent fetches.
+
+    Closing the iterator early cancels the pages not yet started.
+    """
+    first = fetch_page(PageRequest(0, 0, spec.page_size))
+    if first is None:
+        return
+    remaining = spec.max_results
+    for item in first.items[:remaining]:
+        yield item
+    if remaining is not None:
+        remaining -= min(len(first.items), remaining)
+        if remaining <= 0:
+            return
+    if not first.items:
+        return
+
+    if spec.style == "cursor":
+        yield from _sequential(fetch_page, spec, first, remaining)
+        return
+
+    # Servers may cap the page size below the one requested
+    size = spec.page_size
+    if first.total is not None and len(first.items) < min(size, first.total):
+        size = len(first.items)
+    elif first.total is None and len(first.items) < size:
+        return
+
+    pages = _page_limit(spec, first.total, size)
+    if first.total is None or _worker_count(spec, host, int(pages) - 1) == 1:
+        yield from _sequential(fetch_page, spec, first, remaining, size, pages)
+        return
+    yield from _concurrent(fetch_page, spec, host, int(pages), size, remaining)
+
+
+def _sequential(
+    fetch_page: FetchPage,
+    spec: PaginationSpec,
+    page: Page,
+    remaining: Optional[int],
+    size: Optional[int] = None,
+    pages: float = math.inf,
+) -> Iterator[Any]:
+    size = size or spec.page_size
+    limit = min(pages, spec.max_pages or math.inf)
+    index = 0
+    offset = len(page.items)
+    while True:
+        index += 1
+        if index >= limit:
+            return
+        if spec.style == "cursor":
+            if page.next_cursor is None:
+                return
+            request = PageRequest(index, offset, size, page.next_cursor)
+        else:
+            if page.total is not None and offset >= page.total:
+                return
+            request = PageRequest(index, index * size, size)
+        next_page = fetch_page(request)
+        if next_page is None or not next_page.items:
+            return
+        if next_page.total is None and page.total is not None:
+            next_page = next_page._replace(total=page.total)
+        page = next_page
+        offset += len(page.items)
+        for item in page.items[:remaining]:
+            yield item
+        if remaining is not None:
+            remaining -= min(len(page.items), remaining)
+            if remaining <= 0:
+                return
+        if spec.style != "cursor" and len(page.items) < size:
+            return
+
+
+def _concurrent(
+    fetch_page: FetchPage,
+    spec: PaginationSpec,
+    host: Optional[str],
+    pages: int,
+    size: int,
+    remaining: Optional[int],
+) -> Iterator[Any]:
+    workers = _worker_count(spec, host, pages - 1)
+    page_requests = iter(PageRequest(i, i * size, size) for i in range(1, pages))
+    executor = ThreadPoolExecutor(
+        max_workers=workers, thread_name_prefix="tooluniverse-pagination"
+    )
+    pending: deque = deque()
+
+    def submit_next() -> None:
+        request = next(page_requests, None)
+        if request is not None:
+            # Workers do not inherit context variables such as the deadline
+            pending.append(executor.submit(copy_context().run, fetch_page, request))
+
+    try:
+        # Keep a bounded window in flight so an early stop wastes little work
+        for _ in range(workers * 2):
+            submit_next()
+        while pending:
+            page = pending.popleft().result()
+            if page is None or not page.items:
+                return
+            submit_next()
+            for item in page.items[:remaining]:
+                yield item
+            if remaining is not None:
+                remaining -= min(len(page.items), remaining)
+                if remaining <= 0:
+                    return
+            if len(page.items) < size:
+                return
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def paginate_json(
+    request_page: Callable[[Dict[str, Any]], Any],
+    spec: PaginationSpec,
+    *,
+    params: Optional[Mapping[str, Any]] = None,
+    host: Optional[str] = None,
+) -> Iterator[Any]:
+    """Paginate a JSON endpoint described entirely by ``spec``.
+
+    ``request_page`` is called with the query parameters for one page (the
+    fixed ``params`` plus the page's addressing parameters) and returns the
+    decoded JSON body, or None on failure.
+    """
+    base = dict(params or {})
+
+    def fetch_page(request: PageRequest) -> Optional[Page]:
+        data = request_page({**base, **spec.params_for(request)})
+        return spec.page_from(data) if data is not None else None
+
+    return paginate(fetch_page, spec, host=host)
+
+
+__all__ = [
+    "Page",
+    "PageRequest",
+    "PaginationSpec",
+    "get_path",
+    "paginate",
+    "paginate_json",
+]
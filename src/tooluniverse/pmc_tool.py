@@ -20,10 +20,9 @@ class PMCTool(BaseTool):
     def __init__(self, tool_config=None):
         super().__init__(tool_config)
         self.base_url = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils"
-        self.session = requests.Session()
-        self.session.headers.update(
-            {"User-Agent": "ToolUniverse/1.0", "Accept": "application/json"}
-        )
+        # Requests go through the shared transport, so every NCBI tool draws
+        # from one E-utilities budget (see tooluniverse.rate_limiter)
+        self.headers = {"Accept": "application/json"}
 
     def _search(
         self,
@@ -72,8 +71,11 @@ class PMCTool(BaseTool):
                 search_params["term"] += f" AND {article_type}[PT]"
 
             # Make search request
-            search_response = self.session.get(
-                f"{self.base_url}/esearch.fcgi", params=search_params, timeout=30
+            search_response = self.http_get(
+                f"{self.base_url}/esearch.fcgi",
+                params=search_params,
+                headers=self.headers,
+                timeout=30,
             )
             search_response.raise_for_status()
 
@@ -86,8 +88,11 @@ class PMCTool(BaseTool):
             # Step 2: Get detailed information for each article
             summary_params = {"db": "pmc", "id": ",".join(pmc_ids), "retmode": "json"}
 
-            summary_response = self.session.get(
-                f"{self.base_url}/esummary.fcgi", params=summary_params, timeout=30
+            summary_response = self.http_get(
+                f"{self.base_url}/esummary.fcgi",
+                params=summary_params,
+                headers=self.headers,
+                timeout=30,
             )
             summary_response.raise_for_status()
 
@@ -156,7 +156,7 @@ class ProteinStructure3DTool(VisualizationTool):
         """Fetch PDB content from RCSB PDB database."""
         try:
             url = f"https://files.rcsb.org/view/{pdb_id.upper()}.pdb"
-            response = requests.get(url, timeout=30)
+            response = self.http_get(url, timeout=30)
             response.raise_for_status()
             return response.text
         except requests.RequestException as e:
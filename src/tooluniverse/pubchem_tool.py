@@ -110,7 +110,7 @@ class PubChemRESTTool(BaseTool):
                 else:
                     url += "?MaxRecords=10"
 
-            resp = requests.get(url, timeout=30)
+            resp = self.http_get(url, timeout=30)
         except requests.Timeout:
             return {
                 "error": "Request to PubChem PUG-REST timed out, try reducing query scope or retry later."
@@ -36,7 +36,7 @@ class PubMedTool(BaseTool):
             params["api_key"] = api_key
 
         try:
-            r = requests.get(self.esearch_url, params=params, timeout=20)
+            r = self.http_get(self.esearch_url, params=params, timeout=20)
         except requests.RequestException as e:
             return {
                 "error": "Network error calling PubMed esearch",
@@ -62,7 +62,7 @@ class PubMedTool(BaseTool):
             summary_params["api_key"] = api_key
 
         try:
-            s = requests.get(
+            s = self.http_get(
                 self.esummary_url,
                 params=summary_params,
                 timeout=20,
@@ -0,0 +1,365 @@
+"""
+Process-wide rate limiting and concurrency control per upstream host.
+
+Every host gets a :class:`HostLimiter` combining a token bucket (sustained
+requests per second plus a burst allowance) with a cap on requests in flight.
+Limiters are shared by all tools and threads in the process, so the dozen NCBI
+tools draw from a single E-utilities budget instead of one each, and batch
+workers cannot pile ``max_workers`` concurrent requests onto one host.
+
+Budgets come from, in increasing order of precedence:
+
+1. :data:`DEFAULT_HOST_LIMITS` (known public API limits, API-key aware).
+2. A ``rate_limit`` block in a tool's JSON config, for example::
+
+       "rate_limit": {
+           "host": "eutils.ncbi.nlm.nih.gov",
+           "requests_per_second": 3,
+           "max_in_flight": 3,
+           "api_key_env": "NCBI_API_KEY",
+           "requests_per_second_with_key": 10
+       }
+
+   When several tools declare a budget for the same host the strictest wins.
+3. ``TOOLUNIVERSE_RATE_LIMITS``, a JSON object mapping host names to the same
+   keys (without ``host``).
+
+Hosts without an explicit budget have no rate limit and at most
+``TOOLUNIVERSE_HOST_MAX_IN_FLIGHT`` concurrent requests (default 8, ``0``
+disables the cap).
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Mapping, Optional
+from urllib.parse import urlsplit
+
+from . import deadline
+from .logging_config import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_MAX_IN_FLIGHT = 8
+
+DEFAULT_HOST_LIMITS: Dict[str, Dict[str, Any]] = {
+    # https://www.ncbi.nlm.nih.gov/books/NBK25497/ - 3 rps, 10 rps with a key
+    "eutils.ncbi.nlm.nih.gov": {
+        "requests_per_second": 3,
+        "max_in_flight": 3,
+        "api_key_env": "NCBI_API_KEY",
+        "requests_per_second_with_key": 10,
+    },
+}
+
+
+def host_of(url_or_host: str) -> str:
+    """Return the lower-cased host name of a URL (or a bare host name)."""
+    if "://" not in url_or_host:
+        host = url_or_host.strip().lower()
+        return host if "/" not in host and " " not in host else ""
+    return (urlsplit(url_or_host).hostname or "").lower()
+
+
+def resolve_budget(config: Mapping[str, Any]) -> Dict[str, Optional[float]]:
+    """Turn a ``rate_limit`` config block into ``rate``/``burst``/``max_in_flight``."""
+    rate = config.get("requests_per_second")
+    key_env = config.get("api_key_env")
+    if key_env and os.getenv(key_env):
+        rate = config.get("requests_per_second_with_key", rate)
+    max_in_flight = config.get("max_in_flight")
+    burst = config.get("burst")
+    return {
+        "rate": float(rate) if rate else None,
+        "burst": float(burst) if burst else None,
+        "max_in_flight": int(max_in_flight) if max_in_flight else None,
+    }
+
+
+class HostLimiter:
+    """Token bucket plus in-flight cap for one upstream host."""
+
+    def __init__(
+        self,
+        host: str,
+        *,
+        rate: Optional[float] = None,
+        burst: Optional[float] = None,
+        max_in_flight: Optional[int] = None,
+    ):
+        self.host = host
+        self._cond = threading.Condition()
+        self._in_flight = 0
+        self._tokens = 0.0
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self.requests = 0
+        self.throttled = 0
+        self.wait_seconds = 0.0
+        self.update(rate=rate, burst=burst, max_in_flight=max_in_flight)
+        self._tokens = self.burst if self.rate else 0.0
+
+    def update(
+        self,
+        *,
+        rate: Optional[float] = None,
+        burst: Optional[float] = None,
+        max_in_flight: Optional[int] = None,
+    ) -> None:
+        with self._cond:
+            self.rate = rate if rate and rate > 0 else None
+            self.burst = max(1.0, burst or (self.rate or 1.0))
+            self.max_in_flight = (
+                max_in_flight if max_in_flight and max_in_flight > 0 else None
+            )
+            self._tokens = min(self._tokens, self.burst) if self.rate else 0.0
+            self._cond.notify_all()
+
+    def _reserve_token(self) -> float:
+        """Take one token and return how long the caller must wait for it.
+
+        The bucket may go negative: callers queue up behind each other and
+        each sleeps only for its own share, so no thread busy-waits.
+        """
+        now = time.monotonic()
+        wait = max(0.0, self._blocked_until - now)
+        if self.rate is not None:
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= 1.0
+            if self._tokens < 0:
+                wait = max(wait, -self._tokens / self.rate)
+        return wait
+
+    def acquire(self) -> None:
+        """Block until a request to this host may be sent.
+
+        Raises :class:`~tooluniverse.deadline.DeadlineExceededError` if the
+        caller's deadline would pass before a slot and a token are free; the
+        slot and token it had reserved are given back.
+        """
+        with self._cond:
+            while (
+                self.max_in_flight is not None and self._in_flight >= self.max_in_flight
+            ):
+                timeout = deadline.budget(None)
+                if timeout is not None and timeout <= 0:
+                    raise self._deadline_error("a free slot")
+                self._cond.wait(timeout)
+            self._in_flight += 1
+            self.requests += 1
+            wait = self._reserve_token()
+            if wait > 0 and deadline.budget(wait) < wait:
+                # Sleeping for the token would end past the deadline
+                self._in_flight -= 1
+                self.requests -= 1
+                if self.rate is not None:
+                    self._tokens += 1.0
+                self._cond.notify()
+                raise self._deadline_error(f"a token ({wait:.2f}s)")
+            self.wait_seconds += wait
+        if wait > 0:
+            time.sleep(wait)
+
+    def _deadline_error(self, waiting_for: str) -> deadline.DeadlineExceededError:
+        return deadline.DeadlineExceededError(
+            f"Deadline passed while waiting for {waiting_for} to {self.host}",
+            details={"host": self.host},
+        )
+
+    def charge(self) -> float:
+        """Take a token for a retry sent under a slot already held.
+
+        Returns how long the caller must wait before sending it.
+        """
+        with self._cond:
+            self.requests += 1
+            wait = self._reserve_token()
+            self.wait_seconds += wait
+        return wait
+
+    def release(self) -> None:
+        with self._cond:
+            self._in_flight -= 1
+            self._cond.notify()
+
+    def penalize(self, retry_after: Optional[float] = None) -> None:
+        """Record a 429 and hold back all callers for ``retry_after`` seconds."""
+        delay = retry_after if retry_after and retry_after > 0 else 1.0
+        with self._cond:
+            self.throttled += 1
+            self._blocked_until = max(self._blocked_until, time.monotonic() + delay)
+            if self.rate is not None:
+                self._tokens = min(self._tokens, 0.0)
+        logger.debug("Host %s throttled; pausing %.1fs", self.host, delay)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._cond:
+            return {
+                "requests_per_second": self.rate,
+                "burst": self.burst if self.rate else None,
+                "max_in_flight": self.max_in_flight,
+                "in_flight": self._in_flight,
+                "requests": self.requests,
+                "throttled": self.throttled,
+                "wait_seconds": round(self.wait_seconds, 3),
+            }
+
+
+class RateLimiterRegistry:
+    """Lazily creates and configures one :class:`HostLimiter` per host."""
+
+    def __init__(
+        self,
+        defaults: Optional[Mapping[str, Mapping[str, Any]]] = None,
+        overrides: Optional[Mapping[str, Mapping[str, Any]]] = None,
+        default_max_in_flight: Optional[int] = None,
+    ):
+        if default_max_in_flight is None:
+            try:
+                default_max_in_flight = int(
+                    os.getenv(
+                        "TOOLUNIVERSE_HOST_MAX_IN_FLIGHT", str(DEFAULT_MAX_IN_FLIGHT)
+                    )
+                )
+            except ValueError:
+                default_max_in_flight = DEFAULT_MAX_IN_FLIGHT
+        if overrides is None:
+            overrides = self._parse_env_overrides(os.getenv("TOOLUNIVERSE_RATE_LIMITS"))
+        self.default_max_in_flight = default_max_in_flight
+        self._defaults = {
+            host_of(h): dict(c) for h, c in (defaults or DEFAULT_HOST_LIMITS).items()
+        }
+        self._overrides = {host_of(h): dict(c) for h, c in overrides.items()}
+        self._declared: Dict[str, Dict[str, Optional[float]]] = {}
+        self._limiters: Dict[str, HostLimiter] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _parse_env_overrides(raw: Optional[str]) -> Dict[str, Dict[str, Any]]:
+        if not raw:
+            return {}
+        try:
+            parsed = json.loads(raw)
+        except json.JSONDecodeError:
+            logger.warning("Ignoring invalid TOOLUNIVERSE_RATE_LIMITS: %s", raw)
+            return {}
+        if not isinstance(parsed, dict):
+            return {}
+        return {h: c for h, c in parsed.items() if isinstance(c, dict)}
+
+    def _budget_for(self, host: str) -> Dict[str, Optional[float]]:
+        if host in self._overrides:
+            budget = resolve_budget(self._overrides[host])
+        elif host in self._declared:
+            budget = dict(self._declared[host])
+        elif host in self._defaults:
+            budget = resolve_budget(self._defaults[host])
+        else:
+            budget = {"rate": None, "burst": None, "max_in_flight": None}
+        if budget["max_in_flight"] is None and self.default_max_in_flight > 0:
+            budget["max_in_flight"] = self.default_max_in_flight
+        return budget
+
+    def limiter(self, url_or_host: str) -> Optional[HostLimiter]:
+        """Return the limiter for a URL or host name (None if it has no host)."""
+        host = host_of(url_or_host)
+        if not host:
+            return None
+        limiter = self._limiters.get(host)
+        if limiter is None:
+            with self._lock:
+                limiter = self._limiters.get(host)
+                if limiter is None:
+                    limiter = HostLimiter(host, **self._budget_for(host))
+                    self._limiters[host] = limiter
+        return limiter
+
+    def declare(self, host: str, config: Mapping[str, Any]) -> None:
+        """Register a tool-declared budget; the strictest declaration wins."""
+        host = host_of(host)
+        if not host:
+            return
+        budget = resolve_budget(config)
+        with self._lock:
+            current = self._declared.get(host)
+            if current is not None:
+                for key, value in budget.items():
+                    if current.get(key) is not None and (
+                        value is None or current[key] < value
+                    ):
+                        budget[key] = current[key]
+                if budget == current:
+                    return
+            self._declared[host] = budget
+            limiter = self._limiters.get(host)
+        if limiter is not None:
+            limiter.update(**self._budget_for(host))
+
+    @contextmanager
+    def slot(self, url_or_host: str) -> Iterator[Optional[HostLimiter]]:
+        """Hold a rate-limited slot for one request to ``url_or_host``."""
+        limiter = self.limiter(url_or_host)
+        if limiter is None:
+            yield None
+            return
+        limiter.acquire()
+        try:
+            yield limiter
+        finally:
+            limiter.release()
+
+    def max_in_flight(self, url_or_host: str) -> Optional[int]:
+        limiter = self.limiter(url_or_host)
+        return limiter.max_in_flight if limiter is not None else None
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        return {host: lim.stats() for host, lim in sorted(self._limiters.items())}
+
+
+def retry_after_seconds(value: Optional[str]) -> Optional[float]:
+    """Parse a numeric ``Retry-After`` header value (HTTP dates are ignored)."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        return None
+
+
+_registry: Optional[RateLimiterRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_rate_limiter() -> RateLimiterRegistry:
+    """Return the process-wide limiter registry, creating it on first use."""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = RateLimiterRegistry()
+    return _registry
+
+
+def reset_rate_limiter() -> None:
+    """Drop all limiters; the next request re-reads configuration."""
+    global _registry
+    with _registry_lock:
+        _registry = None
+
+
+__all__ = [
+    "DEFAULT_HOST_LIMITS",
+    "HostLimiter",
+    "RateLimiterRegistry",
+    "get_rate_limiter",
+    "reset_rate_limiter",
+    "host_of",
+    "retry_after_seconds",
+]
@@ -345,7 +345,7 @@ class RCSBSearchTool(BaseTool):
 
         # Make API request
         try:
-            response = requests.post(
+            response = self.http_post(
                 self.api_url,
                 json=api_query,
                 headers={"Content-Type": "application/json"},
@@ -1,6 +1,5 @@
 # reactome_graph_tool.py
 
-import requests
 import re
 from .base_tool import BaseTool
 from .tool_registry import register_tool
@@ -71,10 +70,10 @@ class ReactomeRESTTool(BaseTool):
         # 4. Make HTTP request
         try:
             if self.method == "GET":
-                resp = requests.get(url, params=query_params, timeout=10)
+                resp = self.http_get(url, params=query_params, timeout=10)
             else:
                 # If POST support needed in future, can extend here
-                resp = requests.post(url, json=query_params, timeout=10)
+                resp = self.http_post(url, json=query_params, timeout=10)
         except Exception as e:
             return {"error": f"Failed to request Reactome Content Service: {str(e)}"}
 
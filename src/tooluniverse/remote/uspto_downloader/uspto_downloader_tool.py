@@ -1,4 +1,3 @@
-import requests
 import fitz
 import easyocr
 from io import BytesIO
@@ -71,7 +70,7 @@ class USPTOPatentDocumentDownloader(USPTOOpenDataPortalTool):
 
             if word_opt:
                 url = word_opt["downloadUrl"]
-                resp = requests.get(url, headers=self.headers, timeout=30)
+                resp = self.http_get(url, headers=self.headers, timeout=30)
                 resp.raise_for_status()
                 buf = BytesIO(resp.content)
                 docx = Document(buf)
@@ -81,7 +80,7 @@ class USPTOPatentDocumentDownloader(USPTOOpenDataPortalTool):
 
             if not plain_text and pdf_opt:
                 url = pdf_opt["downloadUrl"]
-                resp = requests.get(url, headers=self.headers, timeout=30)
+                resp = self.http_get(url, headers=self.headers, timeout=30)
                 resp.raise_for_status()
                 pdf_bytes = resp.content
                 pdf_doc = fitz.open(stream=pdf_bytes, filetype="pdf")
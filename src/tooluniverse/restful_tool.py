@@ -1,11 +1,13 @@
 from .graphql_tool import GraphQLTool
 import requests
 import copy
+from . import http_client
+from .pagination import get_path, paginate_json
 from .tool_registry import register_tool
 
 
 def execute_RESTful_query(endpoint_url, variables=None):
-    response = requests.get(endpoint_url, params=variables)
+    response = http_client.get(endpoint_url, params=variables)
     try:
         result = response.json()
 
@@ -31,10 +33,44 @@ class RESTfulTool(GraphQLTool):
 
     def run(self, arguments):
         arguments = copy.deepcopy(arguments)
+        spec = self.get_pagination()
+        if spec is not None:
+            return self._run_paginated(arguments, spec)
         return execute_RESTful_query(
             endpoint_url=self.endpoint_url, variables=arguments
         )
 
+    def _run_paginated(self, arguments, spec):
+        """Fetch every page declared by the config's ``pagination`` block.
+
+        Returns the first response with the items of all pages merged under
+        ``results_path``.
+        """
+        first_response = []
+
+        def request_page(params):
+            result = execute_RESTful_query(
+                endpoint_url=self.endpoint_url, variables=params
+            )
+            if not first_response:
+                first_response.append(result)
+            return result or None
+
+        items = list(
+            paginate_json(request_page, spec, params=arguments, host=self.endpoint_url)
+        )
+        response = first_response[0]
+        if not isinstance(get_path(response, spec.results_path), list):
+            return response
+        if not spec.results_path:
+            return items
+        container = response
+        *parents, leaf = spec.results_path.split(".")
+        for key in parents:
+            container = container[key]
+        container[leaf] = items
+        return response
+
 
 @register_tool("Monarch")
 class MonarchTool(RESTfulTool):
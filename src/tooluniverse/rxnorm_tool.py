@@ -98,7 +98,7 @@ class RxNormTool(BaseTool):
         params = {"name": drug_name}
 
         try:
-            response = requests.get(url, params=params, timeout=self.timeout)
+            response = self.http_get(url, params=params, timeout=self.timeout)
             response.raise_for_status()
             data = response.json()
 
@@ -147,7 +147,7 @@ class RxNormTool(BaseTool):
         try:
             url = f"{self.base_url}/rxcui/{rxcui}/allProperties.json"
             params = {"prop": "names"}
-            response = requests.get(url, params=params, timeout=self.timeout)
+            response = self.http_get(url, params=params, timeout=self.timeout)
             response.raise_for_status()
             data = response.json()
 
@@ -174,7 +174,7 @@ class RxNormTool(BaseTool):
         try:
             url = f"{self.base_url}/rxcui/{rxcui}/related.json"
             params = {"rela": "has_tradename"}
-            response = requests.get(url, params=params, timeout=self.timeout)
+            response = self.http_get(url, params=params, timeout=self.timeout)
             response.raise_for_status()
             data = response.json()
 
@@ -204,7 +204,7 @@ class RxNormTool(BaseTool):
         # Method 3: Get properties to get the main name
         try:
             url = f"{self.base_url}/rxcui/{rxcui}/properties.json"
-            response = requests.get(url, timeout=self.timeout)
+            response = self.http_get(url, timeout=self.timeout)
             response.raise_for_status()
             data = response.json()
 
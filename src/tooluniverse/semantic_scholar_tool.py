@@ -1,4 +1,3 @@
-import requests
 from .base_tool import BaseTool
 from .tool_registry import register_tool
 
@@ -32,7 +31,7 @@ class SemanticScholarTool(BaseTool):
             "fields": "title,abstract,year,venue,url",
         }
         headers = {"x-api-key": api_key} if api_key else {}
-        response = requests.get(
+        response = self.http_get(
             self.base_url, params=params, headers=headers, timeout=20
         )
         if response.status_code == 429:
@@ -43,7 +42,7 @@ class SemanticScholarTool(BaseTool):
                 f"Semantic Scholar API rate limited, waiting {retry_after} seconds..."
             )
             time.sleep(retry_after)
-            response = requests.get(
+            response = self.http_get(
                 self.base_url, params=params, headers=headers, timeout=20
             )
         if response.status_code != 200:
@@ -94,6 +94,7 @@ AI Agent Interface:
 import asyncio
 import functools
 import json
+import os
 import sys
 from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional, Union, Callable, Literal
@@ -1118,6 +1119,16 @@ class SMCP(FastMCP):
         # Add utility tools
         self._add_utility_tools()
 
+        # Optionally build tool instances now so first calls skip constructors
+        if os.getenv("TOOLUNIVERSE_PREWARM", "false").lower() in ("true", "1", "yes"):
+            report = self.tooluniverse.prewarm(max_workers=self.max_workers)
+            statuses = [entry["status"] for entry in report.values()]
+            self.logger.info(
+                f"Prewarmed {statuses.count('ready')} tools "
+                f"({statuses.count('failed')} failed, "
+                f"{statuses.count('timeout')} timed out)"
+            )
+
     def _expose_tooluniverse_tools(self):
         """
         Automatically expose ToolUniverse tools as MCP-compatible tools.
@@ -0,0 +1,83 @@
+"""
+Index of which tool config file defines each tool.
+
+The typed wrappers in ``tooluniverse.tools`` call one tool at a time through
+a shared client. Loading every category to serve one call reads, annotates
+and checks API keys for the whole catalog, so the shared client instead looks
+the tool up here and reads only the file that defines it.
+
+``_tool_index_static.py`` holds the index for the default tool files and is
+regenerated by ``generate_tools``. When a name is missing from it (custom tool
+files, a stale index) the index is rebuilt by scanning the configured files.
+"""
+
+import json
+from pathlib import Path
+from typing import Dict, Mapping, Optional
+
+from .utils import read_json_list
+
+
+def read_tool_configs(file_path: str) -> list:
+    """Return the tool configs in ``file_path`` as a list (dict files allowed)."""
+    data = read_json_list(file_path)
+    if isinstance(data, dict):
+        return list(data.values())
+    if isinstance(data, list):
+        return data
+    return []
+
+
+def build_tool_index(tool_files: Mapping[str, str]) -> Dict[str, str]:
+    """Map every tool name in ``tool_files`` to its category.
+
+    Categories are read in order and the first definition of a name wins,
+    matching the de-duplication done by ``ToolUniverse.load_tools``.
+    Unreadable files are skipped.
+    """
+    index: Dict[str, str] = {}
+    for category, file_path in tool_files.items():
+        try:
+            configs = read_tool_configs(file_path)
+        except (OSError, ValueError):
+            continue
+        for config in configs:
+            if isinstance(config, dict) and isinstance(config.get("name"), str):
+                index.setdefault(config["name"], category)
+    return index
+
+
+def load_static_tool_index() -> Optional[Dict[str, str]]:
+    """Return the prebuilt index, or ``None`` if it has not been generated."""
+    try:
+        from ._tool_index_static import STATIC_TOOL_INDEX
+    except ImportError:
+        return None
+    return STATIC_TOOL_INDEX
+
+
+def write_static_tool_index(
+    tool_files: Mapping[str, str], output_path: Optional[Path] = None
+) -> Path:
+    """Write the index for ``tool_files`` to ``_tool_index_static.py``."""
+    if output_path is None:
+        output_path = Path(__file__).parent / "_tool_index_static.py"
+    index = build_tool_index(tool_files)
+    content = f'''"""
+STATIC TOOL INDEX - GENERATED FILE
+Do not edit manually. Generated by generate_tools.py from the default tool files.
+"""
+
+# Map of tool_name -> tool file category
+STATIC_TOOL_INDEX = {json.dumps(index, indent=4, sort_keys=True)}
+'''
+    output_path.write_text(content, encoding="utf-8")
+    return output_path
+
+
+__all__ = [
+    "build_tool_index",
+    "load_static_tool_index",
+    "read_tool_configs",
+    "write_static_tool_index",
+]
@@ -0,0 +1,232 @@
+"""
+Precompiled manifest of the built-in tool configs.
+
+Without it, ``load_tools`` parses every JSON file under ``data/`` and annotates
+every tool on each start. The manifest holds the annotated configs of the
+default tool files in one file, ``data/tool_manifest.bin``, written by
+``generate_tools``::
+
+    TOOLUNIVERSE-MANIFEST <format>
+    <header JSON>
+    <one JSON array of tool configs per category, back to back>
+
+The header lists each category's tools with their name, type and position in
+the body, so a load reads the file once, parses the header and decodes only the
+tools it needs. It also records the size, mtime and digest of every source
+file. A category is served from the manifest only while its file is unchanged;
+changed files, files the manifest does not cover (such as ``tool_config_files``)
+and manifests built with other annotation defaults fall back to the JSON files.
+
+Set ``TOOLUNIVERSE_TOOL_MANIFEST=0`` to always read the JSON files.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Mapping, Optional
+
+from .logging_config import get_logger
+from .tool_defaults import add_annotations_to_tool_config, get_tool_defaults
+from .tool_index import read_tool_configs
+
+MANIFEST_FORMAT = 1
+MANIFEST_MAGIC = b"TOOLUNIVERSE-MANIFEST"
+DATA_DIR = Path(__file__).parent / "data"
+DEFAULT_MANIFEST_PATH = DATA_DIR / "tool_manifest.bin"
+
+logger = get_logger("ToolManifest")
+
+
+def _digest(content: bytes) -> str:
+    return hashlib.blake2b(content, digest_size=16).hexdigest()
+
+
+def _defaults_digest() -> str:
+    """Digest of the annotation defaults baked into the manifest."""
+    return _digest(repr(get_tool_defaults()).encode("utf-8"))
+
+
+def _same_file(a: str, b: str) -> bool:
+    return os.path.normcase(os.path.abspath(a)) == os.path.normcase(os.path.abspath(b))
+
+
+class ToolManifest:
+    """Read-only view of a manifest file."""
+
+    def __init__(self, path: Path, data_dir: Path = DATA_DIR):
+        with open(path, "rb") as f:
+            content = f.read()
+        magic_end = content.index(b"\n")
+        header_end = content.index(b"\n", magic_end + 1)
+        if content[:magic_end] != MANIFEST_MAGIC + b" %d" % MANIFEST_FORMAT:
+            raise ValueError(f"Unsupported manifest format in {path}")
+        header = json.loads(content[magic_end + 1 : header_end])
+        if header.get("defaults") != _defaults_digest():
+            raise ValueError("Manifest was built with different tool defaults")
+
+        self.path = path
+        self._data_dir = data_dir
+        self._body = content[header_end + 1 :]
+        self._files: Dict[str, Dict[str, Any]] = header["files"]
+        self._tools: Dict[str, List[list]] = header["tools"]
+        # (size, mtime_ns) per category whose file matched the digest
+        self._verified: Dict[str, tuple] = {}
+
+        self.names: Dict[str, str] = {}
+        self.types: Dict[str, List[str]] = {}
+        for category, entries in self._tools.items():
+            for name, tool_type, _offset, _length in entries:
+                self.names.setdefault(name, category)
+                self.types.setdefault(tool_type, []).append(name)
+
+    def covers(self, category: str, file_path: str) -> bool:
+        """Whether ``category`` can be served from the manifest for ``file_path``."""
+        entry = self._files.get(category)
+        if entry is None or not _same_file(
+            str(self._data_dir / entry["file"]), file_path
+        ):
+            return False
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return False
+        if stat.st_size != entry["size"]:
+            return False
+        key = (stat.st_size, stat.st_mtime_ns)
+        if stat.st_mtime_ns == entry["mtime_ns"] or self._verified.get(category) == key:
+            return True
+        # Installed copies keep the content but not the mtime
+        with open(file_path, "rb") as f:
+            if _digest(f.read()) != entry["digest"]:
+                return False
+        self._verified[category] = key
+        return True
+
+    def configs(
+        self,
+        category: str,
+        file_path: str,
+        select: Optional[Callable[[str, str], bool]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Decode the tools of ``category``, optionally only where ``select(name, type)``.
+
+        Every call returns new dicts, so callers may modify them.
+        """
+        if select is None:
+            start, length = self._files[category]["span"]
+            tools = json.loads(self._body[start : start + length])
+        else:
+            tools = [
+                json.loads(self._body[offset : offset + length])
+                for name, tool_type, offset, length in self._tools[category]
+                if select(name, tool_type)
+            ]
+        for tool in tools:
+            tool.setdefault("source_file", file_path)
+        return tools
+
+
+def build_tool_manifest(
+    tool_files: Mapping[str, str],
+    output_path: Optional[Path] = None,
+    data_dir: Path = DATA_DIR,
+) -> Path:
+    """Write the manifest for the ``tool_files`` stored under ``data_dir``."""
+    output_path = Path(output_path or DEFAULT_MANIFEST_PATH)
+    files: Dict[str, Dict[str, Any]] = {}
+    tools: Dict[str, List[list]] = {}
+    body = bytearray()
+    for category, file_path in tool_files.items():
+        try:
+            relative = Path(file_path).resolve().relative_to(data_dir.resolve())
+        except ValueError:
+            continue
+        with open(file_path, "rb") as f:
+            content = f.read()
+        configs = read_tool_configs(file_path)
+        if not configs or not all(
+            isinstance(tool, dict) and isinstance(tool.get("name"), str)
+            for tool in configs
+        ):
+            # Left to the JSON loader, which reports malformed entries
+            continue
+        # Each category is one JSON array, so loading it whole is a single parse
+        start = len(body)
+        body += b"["
+        entries = []
+        for tool in configs:
+            tool.setdefault("category", category)
+            add_annotations_to_tool_config(tool)
+            encoded = json.dumps(tool, separators=(",", ":")).encode("utf-8")
+            if entries:
+                body += b","
+            entries.append(
+                [tool["name"], tool.get("type", "Unknown"), len(body), len(encoded)]
+            )
+            body += encoded
+        body += b"]"
+        stat = os.stat(file_path)
+        files[category] = {
+            "file": relative.as_posix(),
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "digest": _digest(content),
+            "span": [start, len(body) - start],
+        }
+        tools[category] = entries
+
+    header = {"defaults": _defaults_digest(), "files": files, "tools": tools}
+    with open(output_path, "wb") as f:
+        f.write(MANIFEST_MAGIC + b" %d\n" % MANIFEST_FORMAT)
+        f.write(json.dumps(header, separators=(",", ":")).encode("utf-8") + b"\n")
+        f.write(bytes(body))
+    return output_path
+
+
+_manifest: Optional[ToolManifest] = None
+_manifest_loaded = False
+_manifest_lock = threading.Lock()
+
+
+def get_tool_manifest() -> Optional[ToolManifest]:
+    """Return the built-in manifest, or ``None`` if disabled, missing or unusable."""
+    global _manifest, _manifest_loaded
+    if not _manifest_loaded:
+        with _manifest_lock:
+            if not _manifest_loaded:
+                enabled = os.getenv("TOOLUNIVERSE_TOOL_MANIFEST", "true").lower() in (
+                    "true",
+                    "1",
+                    "yes",
+                )
+                if enabled and DEFAULT_MANIFEST_PATH.exists():
+                    try:
+                        _manifest = ToolManifest(DEFAULT_MANIFEST_PATH)
+                    except (OSError, ValueError, KeyError) as e:
+                        logger.debug(f"Ignoring tool manifest: {e}")
+                _manifest_loaded = True
+    return _manifest
+
+
+def reset_tool_manifest() -> None:
+    """Forget the loaded manifest; the next call re-reads configuration."""
+    global _manifest, _manifest_loaded
+    with _manifest_lock:
+        _manifest = None
+        _manifest_loaded = False
+
+
+__all__ = [
+    "ToolManifest",
+    "build_tool_manifest",
+    "get_tool_manifest",
+    "reset_tool_manifest",
+]
+
+
+if __name__ == "__main__":
+    from .default_config import default_tool_files
+
+    print(f"Wrote {build_tool_manifest(default_tool_files)}")
@@ -2,13 +2,18 @@
 ToolUniverse Tools
 
 Type-safe Python interface to 780 scientific tools.
-Each tool is in its own module for minimal import overhead.
+Each tool is in its own module and is imported on first use.
 
 Usage:
     from tooluniverse.tools import ArXiv_search_papers
     result = ArXiv_search_papers(query="machine learning")
 """
 
+import importlib
+import sys
+import types
+from typing import TYPE_CHECKING, Any, List
+
 # Import exceptions from main package
 from tooluniverse.exceptions import (
     ToolError,
@@ -24,1229 +29,1301 @@ from tooluniverse.exceptions import (
 # Import shared client utilities
 from ._shared_client import get_shared_client, reset_shared_client
 
-# Import all tools
-from .ADMETAI_predict_BBB_penetrance import ADMETAI_predict_BBB_penetrance
-from .ADMETAI_predict_CYP_interactions import ADMETAI_predict_CYP_interactions
-from .ADMETAI_predict_bioavailability import ADMETAI_predict_bioavailability
-from .ADMETAI_predict_clearance_distribution import (
-    ADMETAI_predict_clearance_distribution,
-)
-from .ADMETAI_predict_nuclear_receptor_activity import (
-    ADMETAI_predict_nuclear_receptor_activity,
-)
-from .ADMETAI_predict_physicochemical_properties import (
-    ADMETAI_predict_physicochemical_properties,
-)
-from .ADMETAI_predict_solubility_lipophilicity_hydration import (
-    ADMETAI_predict_solubility_lipophilicity_hydration,
-)
-from .ADMETAI_predict_stress_response import ADMETAI_predict_stress_response
-from .ADMETAI_predict_toxicity import ADMETAI_predict_toxicity
-from .ADMETAnalyzerAgent import ADMETAnalyzerAgent
-from .AdvancedCodeQualityAnalyzer import AdvancedCodeQualityAnalyzer
-from .AdverseEventICDMapper import AdverseEventICDMapper
-from .AdverseEventPredictionQuestionGenerator import (
-    AdverseEventPredictionQuestionGenerator,
-)
-from .AdverseEventPredictionQuestionGeneratorWithContext import (
-    AdverseEventPredictionQuestionGeneratorWithContext,
-)
-from .ArXiv_search_papers import ArXiv_search_papers
-from .ArgumentDescriptionOptimizer import ArgumentDescriptionOptimizer
-from .BLAST_nucleotide_search import BLAST_nucleotide_search
-from .BLAST_protein_search import BLAST_protein_search
-from .BioRxiv_search_preprints import BioRxiv_search_preprints
-from .BiomarkerDiscoveryWorkflow import BiomarkerDiscoveryWorkflow
-from .CMA_Guidelines_Search import CMA_Guidelines_Search
-from .CORE_search_papers import CORE_search_papers
-from .CallAgent import CallAgent
-from .ChEMBL_search_similar_molecules import ChEMBL_search_similar_molecules
-from .ClinicalTrialDesignAgent import ClinicalTrialDesignAgent
-from .CodeQualityAnalyzer import CodeQualityAnalyzer
-from .CompoundDiscoveryAgent import CompoundDiscoveryAgent
-from .ComprehensiveDrugDiscoveryPipeline import ComprehensiveDrugDiscoveryPipeline
-from .Crossref_search_works import Crossref_search_works
-from .DBLP_search_publications import DBLP_search_publications
-from .DBpedia_SPARQL_query import DBpedia_SPARQL_query
-from .DOAJ_search_articles import DOAJ_search_articles
-from .DailyMed_get_spl_by_setid import DailyMed_get_spl_by_setid
-from .DailyMed_search_spls import DailyMed_search_spls
-from .DataAnalysisValidityReviewer import DataAnalysisValidityReviewer
-from .DescriptionAnalyzer import DescriptionAnalyzer
-from .DescriptionQualityEvaluator import DescriptionQualityEvaluator
-from .DiseaseAnalyzerAgent import DiseaseAnalyzerAgent
-from .DomainExpertValidator import DomainExpertValidator
-from .DrugInteractionAnalyzerAgent import DrugInteractionAnalyzerAgent
-from .DrugOptimizationAgent import DrugOptimizationAgent
-from .DrugSafetyAnalyzer import DrugSafetyAnalyzer
-from .EMDB_get_structure import EMDB_get_structure
-from .ENCODE_list_files import ENCODE_list_files
-from .ENCODE_search_experiments import ENCODE_search_experiments
-from .EthicalComplianceReviewer import EthicalComplianceReviewer
-from .EuropePMC_Guidelines_Search import EuropePMC_Guidelines_Search
-from .EuropePMC_search_articles import EuropePMC_search_articles
-from .ExperimentalDesignScorer import ExperimentalDesignScorer
-from .FAERS_count_additive_administration_routes import (
-    FAERS_count_additive_administration_routes,
-)
-from .FAERS_count_additive_adverse_reactions import (
-    FAERS_count_additive_adverse_reactions,
-)
-from .FAERS_count_additive_event_reports_by_country import (
-    FAERS_count_additive_event_reports_by_country,
-)
-from .FAERS_count_additive_reaction_outcomes import (
-    FAERS_count_additive_reaction_outcomes,
-)
-from .FAERS_count_additive_reports_by_reporter_country import (
-    FAERS_count_additive_reports_by_reporter_country,
-)
-from .FAERS_count_additive_seriousness_classification import (
-    FAERS_count_additive_seriousness_classification,
-)
-from .FAERS_count_country_by_drug_event import FAERS_count_country_by_drug_event
-from .FAERS_count_death_related_by_drug import FAERS_count_death_related_by_drug
-from .FAERS_count_drug_routes_by_event import FAERS_count_drug_routes_by_event
-from .FAERS_count_drugs_by_drug_event import FAERS_count_drugs_by_drug_event
-from .FAERS_count_outcomes_by_drug_event import FAERS_count_outcomes_by_drug_event
-from .FAERS_count_patient_age_distribution import FAERS_count_patient_age_distribution
-from .FAERS_count_reactions_by_drug_event import FAERS_count_reactions_by_drug_event
-from .FAERS_count_reportercountry_by_drug_event import (
-    FAERS_count_reportercountry_by_drug_event,
-)
-from .FAERS_count_seriousness_by_drug_event import FAERS_count_seriousness_by_drug_event
-from .FAERS_search_adverse_event_reports import FAERS_search_adverse_event_reports
-from .FAERS_search_reports_by_drug_and_indication import (
-    FAERS_search_reports_by_drug_and_indication,
-)
-from .FAERS_search_reports_by_drug_and_outcome import (
-    FAERS_search_reports_by_drug_and_outcome,
-)
-from .FAERS_search_reports_by_drug_and_reaction import (
-    FAERS_search_reports_by_drug_and_reaction,
-)
-from .FAERS_search_reports_by_drug_combination import (
-    FAERS_search_reports_by_drug_combination,
-)
-from .FAERS_search_serious_reports_by_drug import FAERS_search_serious_reports_by_drug
-from .FDA_get_abuse_dependence_info_by_drug_name import (
-    FDA_get_abuse_dependence_info_by_drug_name,
-)
-from .FDA_get_abuse_info_by_drug_name import FDA_get_abuse_info_by_drug_name
-from .FDA_get_accessories_info_by_drug_name import FDA_get_accessories_info_by_drug_name
-from .FDA_get_active_ingredient_info_by_drug_name import (
-    FDA_get_active_ingredient_info_by_drug_name,
-)
-from .FDA_get_adverse_reactions_by_drug_name import (
-    FDA_get_adverse_reactions_by_drug_name,
-)
-from .FDA_get_alarms_by_drug_name import FDA_get_alarms_by_drug_name
-from .FDA_get_animal_pharmacology_info_by_drug_name import (
-    FDA_get_animal_pharmacology_info_by_drug_name,
-)
-from .FDA_get_assembly_installation_info_by_drug_name import (
-    FDA_get_assembly_installation_info_by_drug_name,
-)
-from .FDA_get_boxed_warning_info_by_drug_name import (
-    FDA_get_boxed_warning_info_by_drug_name,
-)
-from .FDA_get_brand_name_generic_name import FDA_get_brand_name_generic_name
-from .FDA_get_calibration_instructions_by_drug_name import (
-    FDA_get_calibration_instructions_by_drug_name,
-)
-from .FDA_get_carcinogenic_mutagenic_fertility_by_drug_name import (
-    FDA_get_carcinogenic_mutagenic_fertility_by_drug_name,
-)
-from .FDA_get_child_safety_info_by_drug_name import (
-    FDA_get_child_safety_info_by_drug_name,
-)
-from .FDA_get_clinical_pharmacology_by_drug_name import (
-    FDA_get_clinical_pharmacology_by_drug_name,
-)
-from .FDA_get_clinical_studies_info_by_drug_name import (
-    FDA_get_clinical_studies_info_by_drug_name,
-)
-from .FDA_get_contact_for_questions_info_by_drug_name import (
-    FDA_get_contact_for_questions_info_by_drug_name,
-)
-from .FDA_get_contraindications_by_drug_name import (
-    FDA_get_contraindications_by_drug_name,
-)
-from .FDA_get_controlled_substance_DEA_schedule_info_by_drug_name import (
-    FDA_get_controlled_substance_DEA_schedule_info_by_drug_name,
-)
-from .FDA_get_dear_health_care_provider_letter_info_by_drug_name import (
-    FDA_get_dear_health_care_provider_letter_info_by_drug_name,
-)
-from .FDA_get_dependence_info_by_drug_name import FDA_get_dependence_info_by_drug_name
-from .FDA_get_disposal_info_by_drug_name import FDA_get_disposal_info_by_drug_name
-from .FDA_get_do_not_use_info_by_drug_name import FDA_get_do_not_use_info_by_drug_name
-from .FDA_get_document_id_by_drug_name import FDA_get_document_id_by_drug_name
-from .FDA_get_dosage_and_storage_information_by_drug_name import (
-    FDA_get_dosage_and_storage_information_by_drug_name,
-)
-from .FDA_get_dosage_forms_and_strengths_by_drug_name import (
-    FDA_get_dosage_forms_and_strengths_by_drug_name,
-)
-from .FDA_get_drug_generic_name import FDA_get_drug_generic_name
-from .FDA_get_drug_interactions_by_drug_name import (
-    FDA_get_drug_interactions_by_drug_name,
-)
-from .FDA_get_drug_name_by_SPL_ID import FDA_get_drug_name_by_SPL_ID
-from .FDA_get_drug_name_by_adverse_reaction import FDA_get_drug_name_by_adverse_reaction
-from .FDA_get_drug_name_by_calibration_instructions import (
-    FDA_get_drug_name_by_calibration_instructions,
-)
-from .FDA_get_drug_name_by_dependence_info import FDA_get_drug_name_by_dependence_info
-from .FDA_get_drug_name_by_document_id import FDA_get_drug_name_by_document_id
-from .FDA_get_drug_name_by_dosage_info import FDA_get_drug_name_by_dosage_info
-from .FDA_get_drug_name_by_environmental_warning import (
-    FDA_get_drug_name_by_environmental_warning,
-)
-from .FDA_get_drug_name_by_inactive_ingredient import (
-    FDA_get_drug_name_by_inactive_ingredient,
-)
-from .FDA_get_drug_name_by_info_on_conditions_for_doctor_consultation import (
-    FDA_get_drug_name_by_info_on_conditions_for_doctor_consultation,
-)
-from .FDA_get_drug_name_by_labor_and_delivery_info import (
-    FDA_get_drug_name_by_labor_and_delivery_info,
-)
-from .FDA_get_drug_name_by_microbiology import FDA_get_drug_name_by_microbiology
-from .FDA_get_drug_name_by_other_safety_info import (
-    FDA_get_drug_name_by_other_safety_info,
-)
-from .FDA_get_drug_name_by_pharmacodynamics import FDA_get_drug_name_by_pharmacodynamics
-from .FDA_get_drug_name_by_pharmacogenomics import FDA_get_drug_name_by_pharmacogenomics
-from .FDA_get_drug_name_by_precautions import FDA_get_drug_name_by_precautions
-from .FDA_get_drug_name_by_pregnancy_or_breastfeeding_info import (
-    FDA_get_drug_name_by_pregnancy_or_breastfeeding_info,
-)
-from .FDA_get_drug_name_by_principal_display_panel import (
-    FDA_get_drug_name_by_principal_display_panel,
-)
-from .FDA_get_drug_name_by_reference import FDA_get_drug_name_by_reference
-from .FDA_get_drug_name_by_set_id import FDA_get_drug_name_by_set_id
-from .FDA_get_drug_name_by_stop_use_info import FDA_get_drug_name_by_stop_use_info
-from .FDA_get_drug_name_by_storage_and_handling_info import (
-    FDA_get_drug_name_by_storage_and_handling_info,
-)
-from .FDA_get_drug_name_by_warnings import FDA_get_drug_name_by_warnings
-from .FDA_get_drug_name_from_patient_package_insert import (
-    FDA_get_drug_name_from_patient_package_insert,
-)
-from .FDA_get_drug_names_by_abuse_dependence_info import (
-    FDA_get_drug_names_by_abuse_dependence_info,
-)
-from .FDA_get_drug_names_by_abuse_info import FDA_get_drug_names_by_abuse_info
-from .FDA_get_drug_names_by_accessories import FDA_get_drug_names_by_accessories
-from .FDA_get_drug_names_by_active_ingredient import (
-    FDA_get_drug_names_by_active_ingredient,
-)
-from .FDA_get_drug_names_by_alarm import FDA_get_drug_names_by_alarm
-from .FDA_get_drug_names_by_animal_pharmacology_info import (
-    FDA_get_drug_names_by_animal_pharmacology_info,
-)
-from .FDA_get_drug_names_by_application_number_NDC_number import (
-    FDA_get_drug_names_by_application_number_NDC_number,
-)
-from .FDA_get_drug_names_by_assembly_installation_info import (
-    FDA_get_drug_names_by_assembly_installation_info,
-)
-from .FDA_get_drug_names_by_boxed_warning import FDA_get_drug_names_by_boxed_warning
-from .FDA_get_drug_names_by_child_safety_info import (
-    FDA_get_drug_names_by_child_safety_info,
-)
-from .FDA_get_drug_names_by_clinical_pharmacology import (
-    FDA_get_drug_names_by_clinical_pharmacology,
-)
-from .FDA_get_drug_names_by_clinical_studies import (
-    FDA_get_drug_names_by_clinical_studies,
-)
-from .FDA_get_drug_names_by_consulting_doctor_pharmacist_info import (
-    FDA_get_drug_names_by_consulting_doctor_pharmacist_info,
-)
-from .FDA_get_drug_names_by_contraindications import (
-    FDA_get_drug_names_by_contraindications,
-)
-from .FDA_get_drug_names_by_controlled_substance_DEA_schedule import (
-    FDA_get_drug_names_by_controlled_substance_DEA_schedule,
-)
-from .FDA_get_drug_names_by_dear_health_care_provider_letter_info import (
-    FDA_get_drug_names_by_dear_health_care_provider_letter_info,
-)
-from .FDA_get_drug_names_by_disposal_info import FDA_get_drug_names_by_disposal_info
-from .FDA_get_drug_names_by_dosage_forms_and_strengths_info import (
-    FDA_get_drug_names_by_dosage_forms_and_strengths_info,
-)
-from .FDA_get_drug_names_by_drug_interactions import (
-    FDA_get_drug_names_by_drug_interactions,
-)
-from .FDA_get_drug_names_by_effective_time import FDA_get_drug_names_by_effective_time
-from .FDA_get_drug_names_by_food_safety_warnings import (
-    FDA_get_drug_names_by_food_safety_warnings,
-)
-from .FDA_get_drug_names_by_general_precautions import (
-    FDA_get_drug_names_by_general_precautions,
-)
-from .FDA_get_drug_names_by_geriatric_use import FDA_get_drug_names_by_geriatric_use
-from .FDA_get_drug_names_by_health_claim import FDA_get_drug_names_by_health_claim
-from .FDA_get_drug_names_by_indication import FDA_get_drug_names_by_indication
-from .FDA_get_drug_names_by_indication_aggregated import (
-    FDA_get_drug_names_by_indication_aggregated,
-)
-from .FDA_get_drug_names_by_indication_stats import (
-    FDA_get_drug_names_by_indication_stats,
-)
-from .FDA_get_drug_names_by_info_for_nursing_mothers import (
-    FDA_get_drug_names_by_info_for_nursing_mothers,
-)
-from .FDA_get_drug_names_by_information_for_owners_or_caregivers import (
-    FDA_get_drug_names_by_information_for_owners_or_caregivers,
-)
-from .FDA_get_drug_names_by_ingredient import FDA_get_drug_names_by_ingredient
-from .FDA_get_drug_names_by_instructions_for_use import (
-    FDA_get_drug_names_by_instructions_for_use,
-)
-from .FDA_get_drug_names_by_lab_test_interference import (
-    FDA_get_drug_names_by_lab_test_interference,
-)
-from .FDA_get_drug_names_by_lab_tests import FDA_get_drug_names_by_lab_tests
-from .FDA_get_drug_names_by_mechanism_of_action import (
-    FDA_get_drug_names_by_mechanism_of_action,
-)
-from .FDA_get_drug_names_by_medication_guide import (
-    FDA_get_drug_names_by_medication_guide,
-)
-from .FDA_get_drug_names_by_nonclinical_toxicology_info import (
-    FDA_get_drug_names_by_nonclinical_toxicology_info,
-)
-from .FDA_get_drug_names_by_nonteratogenic_effects import (
-    FDA_get_drug_names_by_nonteratogenic_effects,
-)
-from .FDA_get_drug_names_by_overdosage_info import FDA_get_drug_names_by_overdosage_info
-from .FDA_get_drug_names_by_pediatric_use import FDA_get_drug_names_by_pediatric_use
-from .FDA_get_drug_names_by_pharmacokinetics import (
-    FDA_get_drug_names_by_pharmacokinetics,
-)
-from .FDA_get_drug_names_by_population_use import FDA_get_drug_names_by_population_use
-from .FDA_get_drug_names_by_pregnancy_effects_info import (
-    FDA_get_drug_names_by_pregnancy_effects_info,
-)
-from .FDA_get_drug_names_by_residue_warning import FDA_get_drug_names_by_residue_warning
-from .FDA_get_drug_names_by_risk import FDA_get_drug_names_by_risk
-from .FDA_get_drug_names_by_route import FDA_get_drug_names_by_route
-from .FDA_get_drug_names_by_safe_handling_warning import (
-    FDA_get_drug_names_by_safe_handling_warning,
-)
-from .FDA_get_drug_names_by_safety_summary import FDA_get_drug_names_by_safety_summary
-from .FDA_get_drug_names_by_spl_indexing_data_elements import (
-    FDA_get_drug_names_by_spl_indexing_data_elements,
-)
-from .FDA_get_drug_names_by_teratogenic_effects import (
-    FDA_get_drug_names_by_teratogenic_effects,
-)
-from .FDA_get_drug_names_by_user_safety_warning import (
-    FDA_get_drug_names_by_user_safety_warning,
-)
-from .FDA_get_drug_names_by_warnings_and_cautions import (
-    FDA_get_drug_names_by_warnings_and_cautions,
-)
-from .FDA_get_drugs_by_carcinogenic_mutagenic_fertility import (
-    FDA_get_drugs_by_carcinogenic_mutagenic_fertility,
-)
-from .FDA_get_effective_time_by_drug_name import FDA_get_effective_time_by_drug_name
-from .FDA_get_environmental_warning_by_drug_name import (
-    FDA_get_environmental_warning_by_drug_name,
-)
-from .FDA_get_general_precautions_by_drug_name import (
-    FDA_get_general_precautions_by_drug_name,
-)
-from .FDA_get_geriatric_use_info_by_drug_name import (
-    FDA_get_geriatric_use_info_by_drug_name,
-)
-from .FDA_get_health_claims_by_drug_name import FDA_get_health_claims_by_drug_name
-from .FDA_get_inactive_ingredient_info_by_drug_name import (
-    FDA_get_inactive_ingredient_info_by_drug_name,
-)
-from .FDA_get_indications_by_drug_name import FDA_get_indications_by_drug_name
-from .FDA_get_info_for_nursing_mothers_by_drug_name import (
-    FDA_get_info_for_nursing_mothers_by_drug_name,
-)
-from .FDA_get_info_for_patients_by_drug_name import (
-    FDA_get_info_for_patients_by_drug_name,
-)
-from .FDA_get_info_on_conditions_for_doctor_consultation_by_drug_name import (
-    FDA_get_info_on_conditions_for_doctor_consultation_by_drug_name,
-)
-from .FDA_get_info_on_consulting_doctor_pharmacist_by_drug_name import (
-    FDA_get_info_on_consulting_doctor_pharmacist_by_drug_name,
-)
-from .FDA_get_information_for_owners_or_caregivers_by_drug_name import (
-    FDA_get_information_for_owners_or_caregivers_by_drug_name,
-)
-from .FDA_get_ingredients_by_drug_name import FDA_get_ingredients_by_drug_name
-from .FDA_get_instructions_for_use_by_drug_name import (
-    FDA_get_instructions_for_use_by_drug_name,
-)
-from .FDA_get_lab_test_interference_info_by_drug_name import (
-    FDA_get_lab_test_interference_info_by_drug_name,
-)
-from .FDA_get_lab_tests_by_drug_name import FDA_get_lab_tests_by_drug_name
-from .FDA_get_labor_and_delivery_info_by_drug_name import (
-    FDA_get_labor_and_delivery_info_by_drug_name,
-)
-from .FDA_get_manufacturer_name_NDC_number_by_drug_name import (
-    FDA_get_manufacturer_name_NDC_number_by_drug_name,
-)
-from .FDA_get_mechanism_of_action_by_drug_name import (
-    FDA_get_mechanism_of_action_by_drug_name,
-)
-from .FDA_get_medication_guide_info_by_drug_name import (
-    FDA_get_medication_guide_info_by_drug_name,
-)
-from .FDA_get_microbiology_info_by_drug_name import (
-    FDA_get_microbiology_info_by_drug_name,
-)
-from .FDA_get_nonclinical_toxicology_info_by_drug_name import (
-    FDA_get_nonclinical_toxicology_info_by_drug_name,
-)
-from .FDA_get_nonteratogenic_effects_by_drug_name import (
-    FDA_get_nonteratogenic_effects_by_drug_name,
-)
-from .FDA_get_other_safety_info_by_drug_name import (
-    FDA_get_other_safety_info_by_drug_name,
-)
-from .FDA_get_overdosage_info_by_drug_name import FDA_get_overdosage_info_by_drug_name
-from .FDA_get_patient_package_insert_from_drug_name import (
-    FDA_get_patient_package_insert_from_drug_name,
-)
-from .FDA_get_pediatric_use_info_by_drug_name import (
-    FDA_get_pediatric_use_info_by_drug_name,
-)
-from .FDA_get_pharmacodynamics_by_drug_name import FDA_get_pharmacodynamics_by_drug_name
-from .FDA_get_pharmacogenomics_info_by_drug_name import (
-    FDA_get_pharmacogenomics_info_by_drug_name,
-)
-from .FDA_get_pharmacokinetics_by_drug_name import FDA_get_pharmacokinetics_by_drug_name
-from .FDA_get_population_use_info_by_drug_name import (
-    FDA_get_population_use_info_by_drug_name,
-)
-from .FDA_get_precautions_by_drug_name import FDA_get_precautions_by_drug_name
-from .FDA_get_pregnancy_effects_info_by_drug_name import (
-    FDA_get_pregnancy_effects_info_by_drug_name,
-)
-from .FDA_get_pregnancy_or_breastfeeding_info_by_drug_name import (
-    FDA_get_pregnancy_or_breastfeeding_info_by_drug_name,
-)
-from .FDA_get_principal_display_panel_by_drug_name import (
-    FDA_get_principal_display_panel_by_drug_name,
-)
-from .FDA_get_purpose_info_by_drug_name import FDA_get_purpose_info_by_drug_name
-from .FDA_get_recent_changes_by_drug_name import FDA_get_recent_changes_by_drug_name
-from .FDA_get_reference_info_by_drug_name import FDA_get_reference_info_by_drug_name
-from .FDA_get_residue_warning_by_drug_name import FDA_get_residue_warning_by_drug_name
-from .FDA_get_risk_info_by_drug_name import FDA_get_risk_info_by_drug_name
-from .FDA_get_route_info_by_drug_name import FDA_get_route_info_by_drug_name
-from .FDA_get_safe_handling_warnings_by_drug_name import (
-    FDA_get_safe_handling_warnings_by_drug_name,
-)
-from .FDA_get_safety_summary_by_drug_name import FDA_get_safety_summary_by_drug_name
-from .FDA_get_spl_indexing_data_elements_by_drug_name import (
-    FDA_get_spl_indexing_data_elements_by_drug_name,
-)
-from .FDA_get_spl_unclassified_section_by_drug_name import (
-    FDA_get_spl_unclassified_section_by_drug_name,
-)
-from .FDA_get_stop_use_info_by_drug_name import FDA_get_stop_use_info_by_drug_name
-from .FDA_get_storage_and_handling_info_by_drug_name import (
-    FDA_get_storage_and_handling_info_by_drug_name,
-)
-from .FDA_get_teratogenic_effects_by_drug_name import (
-    FDA_get_teratogenic_effects_by_drug_name,
-)
-from .FDA_get_user_safety_warning_by_drug_names import (
-    FDA_get_user_safety_warning_by_drug_names,
-)
-from .FDA_get_warnings_and_cautions_by_drug_name import (
-    FDA_get_warnings_and_cautions_by_drug_name,
-)
-from .FDA_get_warnings_by_drug_name import FDA_get_warnings_by_drug_name
-from .FDA_get_when_using_info import FDA_get_when_using_info
-from .FDA_retrieve_device_use_by_drug_name import FDA_retrieve_device_use_by_drug_name
-from .FDA_retrieve_drug_name_by_device_use import FDA_retrieve_drug_name_by_device_use
-from .FDA_retrieve_drug_names_by_patient_medication_info import (
-    FDA_retrieve_drug_names_by_patient_medication_info,
-)
-from .FDA_retrieve_patient_medication_info_by_drug_name import (
-    FDA_retrieve_patient_medication_info_by_drug_name,
-)
-from .Fatcat_search_scholar import Fatcat_search_scholar
-from .Finish import Finish
-from .GBIF_search_occurrences import GBIF_search_occurrences
-from .GBIF_search_species import GBIF_search_species
-from .GDC_list_files import GDC_list_files
-from .GDC_search_cases import GDC_search_cases
-from .GIN_Guidelines_Search import GIN_Guidelines_Search
-from .GO_get_annotations_for_gene import GO_get_annotations_for_gene
-from .GO_get_genes_for_term import GO_get_genes_for_term
-from .GO_get_term_by_id import GO_get_term_by_id
-from .GO_get_term_details import GO_get_term_details
-from .GO_search_terms import GO_search_terms
-from .GTEx_get_expression_summary import GTEx_get_expression_summary
-from .GTEx_query_eqtl import GTEx_query_eqtl
-from .GWAS_search_associations_by_gene import GWAS_search_associations_by_gene
-from .GtoPdb_get_targets import GtoPdb_get_targets
-from .HAL_search_archive import HAL_search_archive
-from .HPA_get_biological_processes_by_gene import HPA_get_biological_processes_by_gene
-from .HPA_get_cancer_prognostics_by_gene import HPA_get_cancer_prognostics_by_gene
-from .HPA_get_comparative_expression_by_gene_and_cellline import (
-    HPA_get_comparative_expression_by_gene_and_cellline,
-)
-from .HPA_get_comprehensive_gene_details_by_ensembl_id import (
-    HPA_get_comprehensive_gene_details_by_ensembl_id,
-)
-from .HPA_get_contextual_biological_process_analysis import (
-    HPA_get_contextual_biological_process_analysis,
-)
-from .HPA_get_disease_expression_by_gene_tissue_disease import (
-    HPA_get_disease_expression_by_gene_tissue_disease,
-)
-from .HPA_get_gene_basic_info_by_ensembl_id import HPA_get_gene_basic_info_by_ensembl_id
-from .HPA_get_gene_tsv_data_by_ensembl_id import HPA_get_gene_tsv_data_by_ensembl_id
-from .HPA_get_protein_interactions_by_gene import HPA_get_protein_interactions_by_gene
-from .HPA_get_rna_expression_by_source import HPA_get_rna_expression_by_source
-from .HPA_get_rna_expression_in_specific_tissues import (
-    HPA_get_rna_expression_in_specific_tissues,
-)
-from .HPA_get_subcellular_location import HPA_get_subcellular_location
-from .HPA_search_genes_by_query import HPA_search_genes_by_query
-from .HypothesisGenerator import HypothesisGenerator
-from .InterPro_get_domain_details import InterPro_get_domain_details
-from .InterPro_get_protein_domains import InterPro_get_protein_domains
-from .InterPro_search_domains import InterPro_search_domains
-from .JASPAR_get_transcription_factors import JASPAR_get_transcription_factors
-from .LabelGenerator import LabelGenerator
-from .LiteratureContextReviewer import LiteratureContextReviewer
-from .LiteratureSearchTool import LiteratureSearchTool
-from .LiteratureSynthesisAgent import LiteratureSynthesisAgent
-from .MGnify_list_analyses import MGnify_list_analyses
-from .MGnify_search_studies import MGnify_search_studies
-from .MPD_get_phenotype_data import MPD_get_phenotype_data
-from .MedRxiv_search_preprints import MedRxiv_search_preprints
-from .MedicalLiteratureReviewer import MedicalLiteratureReviewer
-from .MedicalTermNormalizer import MedicalTermNormalizer
-from .MedlinePlus_connect_lookup_by_code import MedlinePlus_connect_lookup_by_code
-from .MedlinePlus_get_genetics_condition_by_name import (
-    MedlinePlus_get_genetics_condition_by_name,
-)
-from .MedlinePlus_get_genetics_gene_by_name import MedlinePlus_get_genetics_gene_by_name
-from .MedlinePlus_get_genetics_index import MedlinePlus_get_genetics_index
-from .MedlinePlus_search_topics_by_keyword import MedlinePlus_search_topics_by_keyword
-from .MethodologyRigorReviewer import MethodologyRigorReviewer
-from .NICE_Clinical_Guidelines_Search import NICE_Clinical_Guidelines_Search
-from .NICE_Guideline_Full_Text import NICE_Guideline_Full_Text
-from .NoveltySignificanceReviewer import NoveltySignificanceReviewer
-from .OBIS_search_occurrences import OBIS_search_occurrences
-from .OBIS_search_taxa import OBIS_search_taxa
-from .OSF_search_preprints import OSF_search_preprints
-from .OSL_get_efo_id_by_disease_name import OSL_get_efo_id_by_disease_name
-from .OpenAIRE_search_publications import OpenAIRE_search_publications
-from .OpenAlex_Guidelines_Search import OpenAlex_Guidelines_Search
-from .OpenTargets_drug_pharmacogenomics_data import (
-    OpenTargets_drug_pharmacogenomics_data,
-)
-from .OpenTargets_get_approved_indications_by_drug_chemblId import (
-    OpenTargets_get_approved_indications_by_drug_chemblId,
-)
-from .OpenTargets_get_associated_diseases_by_drug_chemblId import (
-    OpenTargets_get_associated_diseases_by_drug_chemblId,
-)
-from .OpenTargets_get_associated_drugs_by_disease_efoId import (
-    OpenTargets_get_associated_drugs_by_disease_efoId,
-)
-from .OpenTargets_get_associated_drugs_by_target_ensemblID import (
-    OpenTargets_get_associated_drugs_by_target_ensemblID,
-)
-from .OpenTargets_get_associated_phenotypes_by_disease_efoId import (
-    OpenTargets_get_associated_phenotypes_by_disease_efoId,
-)
-from .OpenTargets_get_associated_targets_by_disease_efoId import (
-    OpenTargets_get_associated_targets_by_disease_efoId,
-)
-from .OpenTargets_get_associated_targets_by_drug_chemblId import (
-    OpenTargets_get_associated_targets_by_drug_chemblId,
-)
-from .OpenTargets_get_biological_mouse_models_by_ensemblID import (
-    OpenTargets_get_biological_mouse_models_by_ensemblID,
-)
-from .OpenTargets_get_chemical_probes_by_target_ensemblID import (
-    OpenTargets_get_chemical_probes_by_target_ensemblID,
-)
-from .OpenTargets_get_disease_ancestors_parents_by_efoId import (
-    OpenTargets_get_disease_ancestors_parents_by_efoId,
-)
-from .OpenTargets_get_disease_descendants_children_by_efoId import (
-    OpenTargets_get_disease_descendants_children_by_efoId,
-)
-from .OpenTargets_get_disease_description_by_efoId import (
-    OpenTargets_get_disease_description_by_efoId,
-)
-from .OpenTargets_get_disease_id_description_by_name import (
-    OpenTargets_get_disease_id_description_by_name,
-)
-from .OpenTargets_get_disease_ids_by_efoId import OpenTargets_get_disease_ids_by_efoId
-from .OpenTargets_get_disease_ids_by_name import OpenTargets_get_disease_ids_by_name
-from .OpenTargets_get_disease_locations_by_efoId import (
-    OpenTargets_get_disease_locations_by_efoId,
-)
-from .OpenTargets_get_disease_synonyms_by_efoId import (
-    OpenTargets_get_disease_synonyms_by_efoId,
-)
-from .OpenTargets_get_disease_therapeutic_areas_by_efoId import (
-    OpenTargets_get_disease_therapeutic_areas_by_efoId,
-)
-from .OpenTargets_get_diseases_phenotypes_by_target_ensembl import (
-    OpenTargets_get_diseases_phenotypes_by_target_ensembl,
-)
-from .OpenTargets_get_drug_adverse_events_by_chemblId import (
-    OpenTargets_get_drug_adverse_events_by_chemblId,
-)
-from .OpenTargets_get_drug_approval_status_by_chemblId import (
-    OpenTargets_get_drug_approval_status_by_chemblId,
-)
-from .OpenTargets_get_drug_chembId_by_generic_name import (
-    OpenTargets_get_drug_chembId_by_generic_name,
-)
-from .OpenTargets_get_drug_description_by_chemblId import (
-    OpenTargets_get_drug_description_by_chemblId,
-)
-from .OpenTargets_get_drug_id_description_by_name import (
-    OpenTargets_get_drug_id_description_by_name,
-)
-from .OpenTargets_get_drug_indications_by_chemblId import (
-    OpenTargets_get_drug_indications_by_chemblId,
-)
-from .OpenTargets_get_drug_mechanisms_of_action_by_chemblId import (
-    OpenTargets_get_drug_mechanisms_of_action_by_chemblId,
-)
-from .OpenTargets_get_drug_names_by_chemblId import (
-    OpenTargets_get_drug_names_by_chemblId,
-)
-from .OpenTargets_get_drug_synonyms_by_chemblId import (
-    OpenTargets_get_drug_synonyms_by_chemblId,
-)
-from .OpenTargets_get_drug_trade_names_by_chemblId import (
-    OpenTargets_get_drug_trade_names_by_chemblId,
-)
-from .OpenTargets_get_drug_warnings_by_chemblId import (
-    OpenTargets_get_drug_warnings_by_chemblId,
-)
-from .OpenTargets_get_drug_withdrawn_blackbox_status_by_chemblId import (
-    OpenTargets_get_drug_withdrawn_blackbox_status_by_chemblId,
-)
-from .OpenTargets_get_gene_ontology_terms_by_goID import (
-    OpenTargets_get_gene_ontology_terms_by_goID,
-)
-from .OpenTargets_get_known_drugs_by_drug_chemblId import (
-    OpenTargets_get_known_drugs_by_drug_chemblId,
-)
-from .OpenTargets_get_parent_child_molecules_by_drug_chembl_ID import (
-    OpenTargets_get_parent_child_molecules_by_drug_chembl_ID,
-)
-from .OpenTargets_get_publications_by_disease_efoId import (
-    OpenTargets_get_publications_by_disease_efoId,
-)
-from .OpenTargets_get_publications_by_drug_chemblId import (
-    OpenTargets_get_publications_by_drug_chemblId,
-)
-from .OpenTargets_get_publications_by_target_ensemblID import (
-    OpenTargets_get_publications_by_target_ensemblID,
-)
-from .OpenTargets_get_similar_entities_by_disease_efoId import (
-    OpenTargets_get_similar_entities_by_disease_efoId,
-)
-from .OpenTargets_get_similar_entities_by_drug_chemblId import (
-    OpenTargets_get_similar_entities_by_drug_chemblId,
-)
-from .OpenTargets_get_similar_entities_by_target_ensemblID import (
-    OpenTargets_get_similar_entities_by_target_ensemblID,
-)
-from .OpenTargets_get_target_classes_by_ensemblID import (
-    OpenTargets_get_target_classes_by_ensemblID,
-)
-from .OpenTargets_get_target_constraint_info_by_ensemblID import (
-    OpenTargets_get_target_constraint_info_by_ensemblID,
-)
-from .OpenTargets_get_target_enabling_packages_by_ensemblID import (
-    OpenTargets_get_target_enabling_packages_by_ensemblID,
-)
-from .OpenTargets_get_target_gene_ontology_by_ensemblID import (
-    OpenTargets_get_target_gene_ontology_by_ensemblID,
-)
-from .OpenTargets_get_target_genomic_location_by_ensemblID import (
-    OpenTargets_get_target_genomic_location_by_ensemblID,
-)
-from .OpenTargets_get_target_homologues_by_ensemblID import (
-    OpenTargets_get_target_homologues_by_ensemblID,
-)
-from .OpenTargets_get_target_id_description_by_name import (
-    OpenTargets_get_target_id_description_by_name,
-)
-from .OpenTargets_get_target_interactions_by_ensemblID import (
-    OpenTargets_get_target_interactions_by_ensemblID,
-)
-from .OpenTargets_get_target_safety_profile_by_ensemblID import (
-    OpenTargets_get_target_safety_profile_by_ensemblID,
-)
-from .OpenTargets_get_target_subcellular_locations_by_ensemblID import (
-    OpenTargets_get_target_subcellular_locations_by_ensemblID,
-)
-from .OpenTargets_get_target_synonyms_by_ensemblID import (
-    OpenTargets_get_target_synonyms_by_ensemblID,
-)
-from .OpenTargets_get_target_tractability_by_ensemblID import (
-    OpenTargets_get_target_tractability_by_ensemblID,
-)
-from .OpenTargets_map_any_disease_id_to_all_other_ids import (
-    OpenTargets_map_any_disease_id_to_all_other_ids,
-)
-from .OpenTargets_multi_entity_search_by_query_string import (
-    OpenTargets_multi_entity_search_by_query_string,
-)
-from .OpenTargets_search_category_counts_by_query_string import (
-    OpenTargets_search_category_counts_by_query_string,
-)
-from .OpenTargets_target_disease_evidence import OpenTargets_target_disease_evidence
-from .OutputSummarizationComposer import OutputSummarizationComposer
-from .PDB_search_similar_structures import PDB_search_similar_structures
-from .PMC_search_papers import PMC_search_papers
-from .PRIDE_search_proteomics import PRIDE_search_proteomics
-from .PackageAnalyzer import PackageAnalyzer
-from .Paleobiology_get_fossils import Paleobiology_get_fossils
-from .ProtocolOptimizer import ProtocolOptimizer
-from .PubChem_get_CID_by_SMILES import PubChem_get_CID_by_SMILES
-from .PubChem_get_CID_by_compound_name import PubChem_get_CID_by_compound_name
-from .PubChem_get_associated_patents_by_CID import PubChem_get_associated_patents_by_CID
-from .PubChem_get_compound_2D_image_by_CID import PubChem_get_compound_2D_image_by_CID
-from .PubChem_get_compound_properties_by_CID import (
-    PubChem_get_compound_properties_by_CID,
-)
-from .PubChem_get_compound_synonyms_by_CID import PubChem_get_compound_synonyms_by_CID
-from .PubChem_get_compound_xrefs_by_CID import PubChem_get_compound_xrefs_by_CID
-from .PubChem_search_compounds_by_similarity import (
-    PubChem_search_compounds_by_similarity,
-)
-from .PubChem_search_compounds_by_substructure import (
-    PubChem_search_compounds_by_substructure,
-)
-from .PubMed_Guidelines_Search import PubMed_Guidelines_Search
-from .PubMed_search_articles import PubMed_search_articles
-from .PubTator3_EntityAutocomplete import PubTator3_EntityAutocomplete
-from .PubTator3_LiteratureSearch import PubTator3_LiteratureSearch
-from .PyPIPackageInspector import PyPIPackageInspector
-from .QuestionRephraser import QuestionRephraser
-from .RNAcentral_get_by_accession import RNAcentral_get_by_accession
-from .RNAcentral_search import RNAcentral_search
-from .ReMap_get_transcription_factor_binding import (
-    ReMap_get_transcription_factor_binding,
-)
-from .Reactome_get_pathway_reactions import Reactome_get_pathway_reactions
-from .ReferenceInfoAnalyzer import ReferenceInfoAnalyzer
-from .RegulomeDB_query_variant import RegulomeDB_query_variant
-from .ReproducibilityTransparencyReviewer import ReproducibilityTransparencyReviewer
-from .ResultsInterpretationReviewer import ResultsInterpretationReviewer
-from .RxNorm_get_drug_names import RxNorm_get_drug_names
-from .SCREEN_get_regulatory_elements import SCREEN_get_regulatory_elements
-from .ScientificTextSummarizer import ScientificTextSummarizer
-from .SemanticScholar_search_papers import SemanticScholar_search_papers
-from .TRIP_Database_Guidelines_Search import TRIP_Database_Guidelines_Search
-from .TestCaseGenerator import TestCaseGenerator
-from .TestResultsAnalyzer import TestResultsAnalyzer
-from .ToolCompatibilityAnalyzer import ToolCompatibilityAnalyzer
-from .ToolDescriptionOptimizer import ToolDescriptionOptimizer
-from .ToolDiscover import ToolDiscover
-from .ToolGraphComposer import ToolGraphComposer
-from .ToolGraphGenerationPipeline import ToolGraphGenerationPipeline
-from .ToolMetadataGenerationPipeline import ToolMetadataGenerationPipeline
-from .ToolMetadataGenerator import ToolMetadataGenerator
-from .ToolMetadataStandardizer import ToolMetadataStandardizer
-from .ToolOutputSummarizer import ToolOutputSummarizer
-from .ToolQualityEvaluator import ToolQualityEvaluator
-from .ToolRelationshipDetector import ToolRelationshipDetector
-from .Tool_Finder import Tool_Finder
-from .Tool_Finder_Keyword import Tool_Finder_Keyword
-from .Tool_Finder_LLM import Tool_Finder_LLM
-from .Tool_RAG import Tool_RAG
-from .UniProt_get_alternative_names_by_accession import (
-    UniProt_get_alternative_names_by_accession,
-)
-from .UniProt_get_disease_variants_by_accession import (
-    UniProt_get_disease_variants_by_accession,
-)
-from .UniProt_get_entry_by_accession import UniProt_get_entry_by_accession
-from .UniProt_get_function_by_accession import UniProt_get_function_by_accession
-from .UniProt_get_isoform_ids_by_accession import UniProt_get_isoform_ids_by_accession
-from .UniProt_get_organism_by_accession import UniProt_get_organism_by_accession
-from .UniProt_get_ptm_processing_by_accession import (
-    UniProt_get_ptm_processing_by_accession,
-)
-from .UniProt_get_recommended_name_by_accession import (
-    UniProt_get_recommended_name_by_accession,
-)
-from .UniProt_get_sequence_by_accession import UniProt_get_sequence_by_accession
-from .UniProt_get_subcellular_location_by_accession import (
-    UniProt_get_subcellular_location_by_accession,
-)
-from .UniProt_id_mapping import UniProt_id_mapping
-from .UniProt_search import UniProt_search
-from .UnifiedToolGenerator import UnifiedToolGenerator
-from .Unpaywall_check_oa_status import Unpaywall_check_oa_status
-from .WHO_Guideline_Full_Text import WHO_Guideline_Full_Text
-from .WHO_Guidelines_Search import WHO_Guidelines_Search
-from .WikiPathways_get_pathway import WikiPathways_get_pathway
-from .WikiPathways_search import WikiPathways_search
-from .Wikidata_SPARQL_query import Wikidata_SPARQL_query
-from .Wikipedia_get_content import Wikipedia_get_content
-from .Wikipedia_get_summary import Wikipedia_get_summary
-from .Wikipedia_search import Wikipedia_search
-from .WoRMS_search_species import WoRMS_search_species
-from .WritingPresentationReviewer import WritingPresentationReviewer
-from .XMLToolOptimizer import XMLToolOptimizer
-from .Zenodo_search_records import Zenodo_search_records
-from .advanced_literature_search_agent import advanced_literature_search_agent
-from .alphafold_get_annotations import alphafold_get_annotations
-from .alphafold_get_prediction import alphafold_get_prediction
-from .alphafold_get_summary import alphafold_get_summary
-from .cBioPortal_get_cancer_studies import cBioPortal_get_cancer_studies
-from .cBioPortal_get_mutations import cBioPortal_get_mutations
-from .call_agentic_human import call_agentic_human
-from .cancer_biomarkers_disease_target_score import (
-    cancer_biomarkers_disease_target_score,
-)
-from .cancer_gene_census_disease_target_score import (
-    cancer_gene_census_disease_target_score,
-)
-from .cellosaurus_get_cell_line_info import cellosaurus_get_cell_line_info
-from .cellosaurus_query_converter import cellosaurus_query_converter
-from .cellosaurus_search_cell_lines import cellosaurus_search_cell_lines
-from .chembl_disease_target_score import chembl_disease_target_score
-from .clinvar_get_clinical_significance import clinvar_get_clinical_significance
-from .clinvar_get_variant_details import clinvar_get_variant_details
-from .clinvar_search_variants import clinvar_search_variants
-from .convert_to_markdown import convert_to_markdown
-from .dbsnp_get_frequencies import dbsnp_get_frequencies
-from .dbsnp_get_variant_by_rsid import dbsnp_get_variant_by_rsid
-from .dbsnp_search_by_gene import dbsnp_search_by_gene
-from .dict_search import dict_search
-from .dili_search import dili_search
-from .diqt_search import diqt_search
-from .disease_target_score import disease_target_score
-from .download_binary_file import download_binary_file
-from .download_file import download_file
-from .download_text_content import download_text_content
-from .drugbank_filter_drugs_by_name import drugbank_filter_drugs_by_name
-from .drugbank_full_search import drugbank_full_search
-from .drugbank_get_drug_basic_info_by_drug_name_or_drugbank_id import (
-    drugbank_get_drug_basic_info_by_drug_name_or_drugbank_id,
-)
-from .drugbank_get_drug_chemistry_by_drug_name_or_drugbank_id import (
-    drugbank_get_drug_chemistry_by_drug_name_or_drugbank_id,
-)
-from .drugbank_get_drug_desc_pharmacology_by_moa import (
-    drugbank_get_drug_desc_pharmacology_by_moa,
-)
-from .drugbank_get_drug_interactions_by_drug_name_or_drugbank_id import (
-    drugbank_get_drug_interactions_by_drug_name_or_drugbank_id,
-)
-from .drugbank_get_drug_name_and_description_by_indication import (
-    drugbank_get_drug_name_and_description_by_indication,
-)
-from .drugbank_get_drug_name_and_description_by_pathway_name import (
-    drugbank_get_drug_name_and_description_by_pathway_name,
-)
-from .drugbank_get_drug_name_and_description_by_target_name import (
-    drugbank_get_drug_name_and_description_by_target_name,
-)
-from .drugbank_get_drug_products_by_name_or_drugbank_id import (
-    drugbank_get_drug_products_by_name_or_drugbank_id,
-)
-from .drugbank_get_drug_references_by_drug_name_or_drugbank_id import (
-    drugbank_get_drug_references_by_drug_name_or_drugbank_id,
-)
-from .drugbank_get_indications_by_drug_name_or_drugbank_id import (
-    drugbank_get_indications_by_drug_name_or_drugbank_id,
-)
-from .drugbank_get_pathways_reactions_by_drug_or_id import (
-    drugbank_get_pathways_reactions_by_drug_or_id,
-)
-from .drugbank_get_pharmacology_by_drug_name_or_drugbank_id import (
-    drugbank_get_pharmacology_by_drug_name_or_drugbank_id,
-)
-from .drugbank_get_safety_by_drug_name_or_drugbank_id import (
-    drugbank_get_safety_by_drug_name_or_drugbank_id,
-)
-from .drugbank_get_targets_by_drug_name_or_drugbank_id import (
-    drugbank_get_targets_by_drug_name_or_drugbank_id,
-)
-from .drugbank_links_search import drugbank_links_search
-from .drugbank_vocab_filter import drugbank_vocab_filter
-from .drugbank_vocab_search import drugbank_vocab_search
-from .dynamic_package_discovery import dynamic_package_discovery
-from .embedding_database_add import embedding_database_add
-from .embedding_database_create import embedding_database_create
-from .embedding_database_search import embedding_database_search
-from .embedding_sync_download import embedding_sync_download
-from .embedding_sync_upload import embedding_sync_upload
-from .enrichr_gene_enrichment_analysis import enrichr_gene_enrichment_analysis
-from .ensembl_get_sequence import ensembl_get_sequence
-from .ensembl_get_variants import ensembl_get_variants
-from .ensembl_lookup_gene import ensembl_lookup_gene
-from .euhealthinfo_deepdive import euhealthinfo_deepdive
-from .euhealthinfo_search_alcohol_tobacco_psychoactive_use import (
-    euhealthinfo_search_alcohol_tobacco_psychoactive_use,
-)
-from .euhealthinfo_search_births import euhealthinfo_search_births
-from .euhealthinfo_search_cancer import euhealthinfo_search_cancer
-from .euhealthinfo_search_cancer_registry import euhealthinfo_search_cancer_registry
-from .euhealthinfo_search_causes_of_death import euhealthinfo_search_causes_of_death
-from .euhealthinfo_search_covid_19 import euhealthinfo_search_covid_19
-from .euhealthinfo_search_deaths import euhealthinfo_search_deaths
-from .euhealthinfo_search_diabetes_mellitus_epidemiology_registry import (
-    euhealthinfo_search_diabetes_mellitus_epidemiology_registry,
-)
-from .euhealthinfo_search_disability import euhealthinfo_search_disability
-from .euhealthinfo_search_healthcare_expenditure import (
-    euhealthinfo_search_healthcare_expenditure,
-)
-from .euhealthinfo_search_hospital_in_patient_data import (
-    euhealthinfo_search_hospital_in_patient_data,
-)
-from .euhealthinfo_search_infectious_diseases import (
-    euhealthinfo_search_infectious_diseases,
-)
-from .euhealthinfo_search_key_indicators_registries_surveys import (
-    euhealthinfo_search_key_indicators_registries_surveys,
-)
-from .euhealthinfo_search_mental_health import euhealthinfo_search_mental_health
-from .euhealthinfo_search_obesity import euhealthinfo_search_obesity
-from .euhealthinfo_search_population_health_survey import (
-    euhealthinfo_search_population_health_survey,
-)
-from .euhealthinfo_search_primary_care_workforce import (
-    euhealthinfo_search_primary_care_workforce,
-)
-from .euhealthinfo_search_surveillance import euhealthinfo_search_surveillance
-from .euhealthinfo_search_surveillance_mortality_rates import (
-    euhealthinfo_search_surveillance_mortality_rates,
-)
-from .euhealthinfo_search_vaccination import euhealthinfo_search_vaccination
-from .europepmc_disease_target_score import europepmc_disease_target_score
-from .eva_disease_target_score import eva_disease_target_score
-from .eva_somatic_disease_target_score import eva_somatic_disease_target_score
-from .execute_tool import execute_tool
-from .expression_atlas_disease_target_score import expression_atlas_disease_target_score
-from .extract_clinical_trial_adverse_events import extract_clinical_trial_adverse_events
-from .extract_clinical_trial_outcomes import extract_clinical_trial_outcomes
-from .genomics_england_disease_target_score import genomics_england_disease_target_score
-from .geo_get_dataset_info import geo_get_dataset_info
-from .geo_get_sample_info import geo_get_sample_info
-from .geo_search_datasets import geo_search_datasets
-from .get_HPO_ID_by_phenotype import get_HPO_ID_by_phenotype
-from .get_albumentations_info import get_albumentations_info
-from .get_altair_info import get_altair_info
-from .get_anndata_info import get_anndata_info
-from .get_arboreto_info import get_arboreto_info
-from .get_arxiv_info import get_arxiv_info
-from .get_ase_info import get_ase_info
-from .get_assembly_info_by_pdb_id import get_assembly_info_by_pdb_id
-from .get_assembly_summary import get_assembly_summary
-from .get_astropy_info import get_astropy_info
-from .get_binding_affinity_by_pdb_id import get_binding_affinity_by_pdb_id
-from .get_biopandas_info import get_biopandas_info
-from .get_biopython_info import get_biopython_info
-from .get_bioservices_info import get_bioservices_info
-from .get_biotite_info import get_biotite_info
-from .get_bokeh_info import get_bokeh_info
-from .get_brian2_info import get_brian2_info
-from .get_cartopy_info import get_cartopy_info
-from .get_catboost_info import get_catboost_info
-from .get_cellpose_info import get_cellpose_info
-from .get_cellrank_info import get_cellrank_info
-from .get_cellxgene_census_info import get_cellxgene_census_info
-from .get_cftime_info import get_cftime_info
-from .get_chem_comp_audit_info import get_chem_comp_audit_info
-from .get_chem_comp_charge_and_ambiguity import get_chem_comp_charge_and_ambiguity
-from .get_chembl_webresource_client_info import get_chembl_webresource_client_info
-from .get_citation_info_by_pdb_id import get_citation_info_by_pdb_id
-from .get_clair3_info import get_clair3_info
-from .get_clinical_trial_conditions_and_interventions import (
-    get_clinical_trial_conditions_and_interventions,
-)
-from .get_clinical_trial_descriptions import get_clinical_trial_descriptions
-from .get_clinical_trial_eligibility_criteria import (
-    get_clinical_trial_eligibility_criteria,
-)
-from .get_clinical_trial_locations import get_clinical_trial_locations
-from .get_clinical_trial_outcome_measures import get_clinical_trial_outcome_measures
-from .get_clinical_trial_references import get_clinical_trial_references
-from .get_clinical_trial_status_and_dates import get_clinical_trial_status_and_dates
-from .get_cobra_info import get_cobra_info
-from .get_cobrapy_info import get_cobrapy_info
-from .get_cooler_info import get_cooler_info
-from .get_core_refinement_statistics import get_core_refinement_statistics
-from .get_cryosparc_tools_info import get_cryosparc_tools_info
-from .get_crystal_growth_conditions_by_pdb_id import (
-    get_crystal_growth_conditions_by_pdb_id,
-)
-from .get_crystallization_ph_by_pdb_id import get_crystallization_ph_by_pdb_id
-from .get_crystallographic_properties_by_pdb_id import (
-    get_crystallographic_properties_by_pdb_id,
-)
-from .get_cupy_info import get_cupy_info
-from .get_cyvcf2_info import get_cyvcf2_info
-from .get_dask_info import get_dask_info
-from .get_datamol_info import get_datamol_info
-from .get_datashader_info import get_datashader_info
-from .get_deepchem_info import get_deepchem_info
-from .get_deeppurpose_info import get_deeppurpose_info
-from .get_deeptools_info import get_deeptools_info
-from .get_deepxde_info import get_deepxde_info
-from .get_dendropy_info import get_dendropy_info
-from .get_descriptastorus_info import get_descriptastorus_info
-from .get_diffdock_info import get_diffdock_info
-from .get_dscribe_info import get_dscribe_info
-from .get_ec_number_by_entity_id import get_ec_number_by_entity_id
-from .get_elephant_info import get_elephant_info
-from .get_em_3d_fitting_and_reconstruction_details import (
-    get_em_3d_fitting_and_reconstruction_details,
-)
-from .get_emdb_ids_by_pdb_id import get_emdb_ids_by_pdb_id
-from .get_episcanpy_info import get_episcanpy_info
-from .get_ete3_info import get_ete3_info
-from .get_faiss_info import get_faiss_info
-from .get_fanc_info import get_fanc_info
-from .get_flask_info import get_flask_info
-from .get_flowio_info import get_flowio_info
-from .get_flowkit_info import get_flowkit_info
-from .get_flowutils_info import get_flowutils_info
-from .get_freesasa_info import get_freesasa_info
-from .get_galpy_info import get_galpy_info
-from .get_gene_name_by_entity_id import get_gene_name_by_entity_id
-from .get_geopandas_info import get_geopandas_info
-from .get_gget_info import get_gget_info
-from .get_googlesearch_python_info import get_googlesearch_python_info
-from .get_gseapy_info import get_gseapy_info
-from .get_h5py_info import get_h5py_info
-from .get_harmony_pytorch_info import get_harmony_pytorch_info
-from .get_hmmlearn_info import get_hmmlearn_info
-from .get_holoviews_info import get_holoviews_info
-from .get_host_organism_by_pdb_id import get_host_organism_by_pdb_id
-from .get_htmd_info import get_htmd_info
-from .get_igraph_info import get_igraph_info
-from .get_imageio_info import get_imageio_info
-from .get_imbalanced_learn_info import get_imbalanced_learn_info
-from .get_jcvi_info import get_jcvi_info
-from .get_joblib_info import get_joblib_info
-from .get_joint_associated_diseases_by_HPO_ID_list import (
-    get_joint_associated_diseases_by_HPO_ID_list,
-)
-from .get_khmer_info import get_khmer_info
-from .get_kipoiseq_info import get_kipoiseq_info
-from .get_lifelines_info import get_lifelines_info
-from .get_ligand_bond_count_by_pdb_id import get_ligand_bond_count_by_pdb_id
-from .get_ligand_smiles_by_chem_comp_id import get_ligand_smiles_by_chem_comp_id
-from .get_lightgbm_info import get_lightgbm_info
-from .get_loompy_info import get_loompy_info
-from .get_mageck_info import get_mageck_info
-from .get_matplotlib_info import get_matplotlib_info
-from .get_mdanalysis_info import get_mdanalysis_info
-from .get_mdtraj_info import get_mdtraj_info
-from .get_mne_info import get_mne_info
-from .get_molfeat_info import get_molfeat_info
-from .get_molvs_info import get_molvs_info
-from .get_mordred_info import get_mordred_info
-from .get_msprime_info import get_msprime_info
-from .get_mudata_info import get_mudata_info
-from .get_mutation_annotations_by_pdb_id import get_mutation_annotations_by_pdb_id
-from .get_neo_info import get_neo_info
-from .get_netcdf4_info import get_netcdf4_info
-from .get_networkx_info import get_networkx_info
-from .get_nglview_info import get_nglview_info
-from .get_nilearn_info import get_nilearn_info
-from .get_numba_info import get_numba_info
-from .get_numpy_info import get_numpy_info
-from .get_oligosaccharide_descriptors_by_entity_id import (
-    get_oligosaccharide_descriptors_by_entity_id,
-)
-from .get_openbabel_info import get_openbabel_info
-from .get_openchem_info import get_openchem_info
-from .get_opencv_info import get_opencv_info
-from .get_openmm_info import get_openmm_info
-from .get_optlang_info import get_optlang_info
-from .get_optuna_info import get_optuna_info
-from .get_palantir_info import get_palantir_info
-from .get_pandas_info import get_pandas_info
-from .get_patsy_info import get_patsy_info
-from .get_pdbfixer_info import get_pdbfixer_info
-from .get_phenotype_by_HPO_ID import get_phenotype_by_HPO_ID
-from .get_pillow_info import get_pillow_info
-from .get_plantcv_info import get_plantcv_info
-from .get_plip_info import get_plip_info
-from .get_plotly_info import get_plotly_info
-from .get_poliastro_info import get_poliastro_info
-from .get_polymer_entity_annotations import get_polymer_entity_annotations
-from .get_polymer_entity_count_by_pdb_id import get_polymer_entity_count_by_pdb_id
-from .get_polymer_entity_ids_by_pdb_id import get_polymer_entity_ids_by_pdb_id
-from .get_polymer_entity_type_by_entity_id import get_polymer_entity_type_by_entity_id
-from .get_polymer_molecular_weight_by_entity_id import (
-    get_polymer_molecular_weight_by_entity_id,
-)
-from .get_poretools_info import get_poretools_info
-from .get_prody_info import get_prody_info
-from .get_protein_classification_by_pdb_id import get_protein_classification_by_pdb_id
-from .get_protein_metadata_by_pdb_id import get_protein_metadata_by_pdb_id
-from .get_pubchempy_info import get_pubchempy_info
-from .get_pybedtools_info import get_pybedtools_info
-from .get_pybigwig_info import get_pybigwig_info
-from .get_pydeseq2_info import get_pydeseq2_info
-from .get_pyensembl_info import get_pyensembl_info
-from .get_pyephem_info import get_pyephem_info
-from .get_pyfaidx_info import get_pyfaidx_info
-from .get_pyfasta_info import get_pyfasta_info
-from .get_pykalman_info import get_pykalman_info
-from .get_pyliftover_info import get_pyliftover_info
-from .get_pymassspec_info import get_pymassspec_info
-from .get_pymed_info import get_pymed_info
-from .get_pymzml_info import get_pymzml_info
-from .get_pypdf2_info import get_pypdf2_info
-from .get_pyranges_info import get_pyranges_info
-from .get_pyrosetta_info import get_pyrosetta_info
-from .get_pysam_info import get_pysam_info
-from .get_pyscenic_info import get_pyscenic_info
-from .get_pyscf_info import get_pyscf_info
-from .get_pyscreener_info import get_pyscreener_info
-from .get_pytdc_info import get_pytdc_info
-from .get_python_libsbml_info import get_python_libsbml_info
-from .get_pytorch_info import get_pytorch_info
-from .get_pyvcf_info import get_pyvcf_info
-from .get_pyvis_info import get_pyvis_info
-from .get_qutip_info import get_qutip_info
-from .get_rasterio_info import get_rasterio_info
-from .get_rdkit_info import get_rdkit_info
-from .get_refinement_resolution_by_pdb_id import get_refinement_resolution_by_pdb_id
-from .get_release_deposit_dates_by_pdb_id import get_release_deposit_dates_by_pdb_id
-from .get_reportlab_info import get_reportlab_info
-from .get_requests_info import get_requests_info
-from .get_ruptures_info import get_ruptures_info
-from .get_scanorama_info import get_scanorama_info
-from .get_scanpy_info import get_scanpy_info
-from .get_schnetpack_info import get_schnetpack_info
-from .get_scholarly_info import get_scholarly_info
-from .get_scikit_bio_info import get_scikit_bio_info
-from .get_scikit_image_info import get_scikit_image_info
-from .get_scikit_learn_info import get_scikit_learn_info
-from .get_scipy_info import get_scipy_info
-from .get_scrublet_info import get_scrublet_info
-from .get_scvelo_info import get_scvelo_info
-from .get_scvi_tools_info import get_scvi_tools_info
-from .get_seaborn_info import get_seaborn_info
-from .get_sequence_by_pdb_id import get_sequence_by_pdb_id
-from .get_sequence_lengths_by_pdb_id import get_sequence_lengths_by_pdb_id
-from .get_sequence_positional_features_by_instance_id import (
-    get_sequence_positional_features_by_instance_id,
-)
-from .get_skopt_info import get_skopt_info
-from .get_souporcell_info import get_souporcell_info
-from .get_source_organism_by_pdb_id import get_source_organism_by_pdb_id
-from .get_space_group_by_pdb_id import get_space_group_by_pdb_id
-from .get_statsmodels_info import get_statsmodels_info
-from .get_structure_determination_software_by_pdb_id import (
-    get_structure_determination_software_by_pdb_id,
-)
-from .get_structure_title_by_pdb_id import get_structure_title_by_pdb_id
-from .get_structure_validation_metrics_by_pdb_id import (
-    get_structure_validation_metrics_by_pdb_id,
-)
-from .get_sunpy_info import get_sunpy_info
-from .get_sympy_info import get_sympy_info
-from .get_target_cofactor_info import get_target_cofactor_info
-from .get_taxonomy_by_pdb_id import get_taxonomy_by_pdb_id
-from .get_tiledb_info import get_tiledb_info
-from .get_tiledbsoma_info import get_tiledbsoma_info
-from .get_tool_info import get_tool_info
-from .get_torch_geometric_info import get_torch_geometric_info
-from .get_tqdm_info import get_tqdm_info
-from .get_trackpy_info import get_trackpy_info
-from .get_tskit_info import get_tskit_info
-from .get_umap_learn_info import get_umap_learn_info
-from .get_uniprot_accession_by_entity_id import get_uniprot_accession_by_entity_id
-from .get_velocyto_info import get_velocyto_info
-from .get_viennarna_info import get_viennarna_info
-from .get_webpage_text_from_url import get_webpage_text_from_url
-from .get_webpage_title import get_webpage_title
-from .get_xarray_info import get_xarray_info
-from .get_xesmf_info import get_xesmf_info
-from .get_xgboost_info import get_xgboost_info
-from .get_zarr_info import get_zarr_info
-from .gnomad_get_gene_constraints import gnomad_get_gene_constraints
-from .grep_tools import grep_tools
-from .gwas_get_association_by_id import gwas_get_association_by_id
-from .gwas_get_associations_for_snp import gwas_get_associations_for_snp
-from .gwas_get_associations_for_study import gwas_get_associations_for_study
-from .gwas_get_associations_for_trait import gwas_get_associations_for_trait
-from .gwas_get_snp_by_id import gwas_get_snp_by_id
-from .gwas_get_snps_for_gene import gwas_get_snps_for_gene
-from .gwas_get_studies_for_trait import gwas_get_studies_for_trait
-from .gwas_get_study_by_id import gwas_get_study_by_id
-from .gwas_get_variants_for_trait import gwas_get_variants_for_trait
-from .gwas_search_associations import gwas_search_associations
-from .gwas_search_snps import gwas_search_snps
-from .gwas_search_studies import gwas_search_studies
-from .humanbase_ppi_analysis import humanbase_ppi_analysis
-from .icd_search_codes import icd_search_codes
-from .kegg_find_genes import kegg_find_genes
-from .kegg_get_gene_info import kegg_get_gene_info
-from .kegg_get_pathway_info import kegg_get_pathway_info
-from .kegg_list_organisms import kegg_list_organisms
-from .kegg_search_pathway import kegg_search_pathway
-from .list_tools import list_tools
-from .loinc_search_codes import loinc_search_codes
-from .mesh_get_subjects_by_pharmacological_action import (
-    mesh_get_subjects_by_pharmacological_action,
-)
-from .mesh_get_subjects_by_subject_id import mesh_get_subjects_by_subject_id
-from .mesh_get_subjects_by_subject_name import mesh_get_subjects_by_subject_name
-from .mesh_get_subjects_by_subject_scope_or_definition import (
-    mesh_get_subjects_by_subject_scope_or_definition,
-)
-from .odphp_itemlist import odphp_itemlist
-from .odphp_myhealthfinder import odphp_myhealthfinder
-from .odphp_outlink_fetch import odphp_outlink_fetch
-from .odphp_topicsearch import odphp_topicsearch
-from .ols_find_similar_terms import ols_find_similar_terms
-from .ols_get_ontology_info import ols_get_ontology_info
-from .ols_get_term_ancestors import ols_get_term_ancestors
-from .ols_get_term_children import ols_get_term_children
-from .ols_get_term_info import ols_get_term_info
-from .ols_search_ontologies import ols_search_ontologies
-from .ols_search_terms import ols_search_terms
-from .open_deep_research_agent import open_deep_research_agent
-from .openalex_literature_search import openalex_literature_search
-from .python_code_executor import python_code_executor
-from .python_script_runner import python_script_runner
-from .reactome_disease_target_score import reactome_disease_target_score
-from .search_clinical_trials import search_clinical_trials
-from .snomed_search_concepts import snomed_search_concepts
-from .umls_get_concept_details import umls_get_concept_details
-from .umls_search_concepts import umls_search_concepts
-from .visualize_molecule_2d import visualize_molecule_2d
-from .visualize_molecule_3d import visualize_molecule_3d
-from .visualize_protein_structure_3d import visualize_protein_structure_3d
-from .web_api_documentation_search import web_api_documentation_search
-from .web_search import web_search
-from .who_gho_get_data import who_gho_get_data
-from .who_gho_query_health_data import who_gho_query_health_data
+if TYPE_CHECKING:
+    from .ADMETAI_predict_BBB_penetrance import ADMETAI_predict_BBB_penetrance
+    from .ADMETAI_predict_CYP_interactions import ADMETAI_predict_CYP_interactions
+    from .ADMETAI_predict_bioavailability import ADMETAI_predict_bioavailability
+    from .ADMETAI_predict_clearance_distribution import (
+        ADMETAI_predict_clearance_distribution,
+    )
+    from .ADMETAI_predict_nuclear_receptor_activity import (
+        ADMETAI_predict_nuclear_receptor_activity,
+    )
+    from .ADMETAI_predict_physicochemical_properties import (
+        ADMETAI_predict_physicochemical_properties,
+    )
+    from .ADMETAI_predict_solubility_lipophilicity_hydration import (
+        ADMETAI_predict_solubility_lipophilicity_hydration,
+    )
+    from .ADMETAI_predict_stress_response import ADMETAI_predict_stress_response
+    from .ADMETAI_predict_toxicity import ADMETAI_predict_toxicity
+    from .ADMETAnalyzerAgent import ADMETAnalyzerAgent
+    from .AdvancedCodeQualityAnalyzer import AdvancedCodeQualityAnalyzer
+    from .AdverseEventICDMapper import AdverseEventICDMapper
+    from .AdverseEventPredictionQuestionGenerator import (
+        AdverseEventPredictionQuestionGenerator,
+    )
+    from .AdverseEventPredictionQuestionGeneratorWithContext import (
+        AdverseEventPredictionQuestionGeneratorWithContext,
+    )
+    from .ArXiv_search_papers import ArXiv_search_papers
+    from .ArgumentDescriptionOptimizer import ArgumentDescriptionOptimizer
+    from .BLAST_nucleotide_search import BLAST_nucleotide_search
+    from .BLAST_protein_search import BLAST_protein_search
+    from .BioRxiv_search_preprints import BioRxiv_search_preprints
+    from .BiomarkerDiscoveryWorkflow import BiomarkerDiscoveryWorkflow
+    from .CMA_Guidelines_Search import CMA_Guidelines_Search
+    from .CORE_search_papers import CORE_search_papers
+    from .CallAgent import CallAgent
+    from .ChEMBL_search_similar_molecules import ChEMBL_search_similar_molecules
+    from .ClinicalTrialDesignAgent import ClinicalTrialDesignAgent
+    from .CodeQualityAnalyzer import CodeQualityAnalyzer
+    from .CompoundDiscoveryAgent import CompoundDiscoveryAgent
+    from .ComprehensiveDrugDiscoveryPipeline import ComprehensiveDrugDiscoveryPipeline
+    from .Crossref_search_works import Crossref_search_works
+    from .DBLP_search_publications import DBLP_search_publications
+    from .DBpedia_SPARQL_query import DBpedia_SPARQL_query
+    from .DOAJ_search_articles import DOAJ_search_articles
+    from .DailyMed_get_spl_by_setid import DailyMed_get_spl_by_setid
+    from .DailyMed_search_spls import DailyMed_search_spls
+    from .DataAnalysisValidityReviewer import DataAnalysisValidityReviewer
+    from .DescriptionAnalyzer import DescriptionAnalyzer
+    from .DescriptionQualityEvaluator import DescriptionQualityEvaluator
+    from .DiseaseAnalyzerAgent import DiseaseAnalyzerAgent
+    from .DomainExpertValidator import DomainExpertValidator
+    from .DrugInteractionAnalyzerAgent import DrugInteractionAnalyzerAgent
+    from .DrugOptimizationAgent import DrugOptimizationAgent
+    from .DrugSafetyAnalyzer import DrugSafetyAnalyzer
+    from .EMDB_get_structure import EMDB_get_structure
+    from .ENCODE_list_files import ENCODE_list_files
+    from .ENCODE_search_experiments import ENCODE_search_experiments
+    from .EthicalComplianceReviewer import EthicalComplianceReviewer
+    from .EuropePMC_Guidelines_Search import EuropePMC_Guidelines_Search
+    from .EuropePMC_search_articles import EuropePMC_search_articles
+    from .ExperimentalDesignScorer import ExperimentalDesignScorer
+    from .FAERS_count_additive_administration_routes import (
+        FAERS_count_additive_administration_routes,
+    )
+    from .FAERS_count_additive_adverse_reactions import (
+        FAERS_count_additive_adverse_reactions,
+    )
+    from .FAERS_count_additive_event_reports_by_country import (
+        FAERS_count_additive_event_reports_by_country,
+    )
+    from .FAERS_count_additive_reaction_outcomes import (
+        FAERS_count_additive_reaction_outcomes,
+    )
+    from .FAERS_count_additive_reports_by_reporter_country import (
+        FAERS_count_additive_reports_by_reporter_country,
+    )
+    from .FAERS_count_additive_seriousness_classification import (
+        FAERS_count_additive_seriousness_classification,
+    )
+    from .FAERS_count_country_by_drug_event import FAERS_count_country_by_drug_event
+    from .FAERS_count_death_related_by_drug import FAERS_count_death_related_by_drug
+    from .FAERS_count_drug_routes_by_event import FAERS_count_drug_routes_by_event
+    from .FAERS_count_drugs_by_drug_event import FAERS_count_drugs_by_drug_event
+    from .FAERS_count_outcomes_by_drug_event import FAERS_count_outcomes_by_drug_event
+    from .FAERS_count_patient_age_distribution import (
+        FAERS_count_patient_age_distribution,
+    )
+    from .FAERS_count_reactions_by_drug_event import FAERS_count_reactions_by_drug_event
+    from .FAERS_count_reportercountry_by_drug_event import (
+        FAERS_count_reportercountry_by_drug_event,
+    )
+    from .FAERS_count_seriousness_by_drug_event import (
+        FAERS_count_seriousness_by_drug_event,
+    )
+    from .FAERS_search_adverse_event_reports import FAERS_search_adverse_event_reports
+    from .FAERS_search_reports_by_drug_and_indication import (
+        FAERS_search_reports_by_drug_and_indication,
+    )
+    from .FAERS_search_reports_by_drug_and_outcome import (
+        FAERS_search_reports_by_drug_and_outcome,
+    )
+    from .FAERS_search_reports_by_drug_and_reaction import (
+        FAERS_search_reports_by_drug_and_reaction,
+    )
+    from .FAERS_search_reports_by_drug_combination import (
+        FAERS_search_reports_by_drug_combination,
+    )
+    from .FAERS_search_serious_reports_by_drug import (
+        FAERS_search_serious_reports_by_drug,
+    )
+    from .FDA_get_abuse_dependence_info_by_drug_name import (
+        FDA_get_abuse_dependence_info_by_drug_name,
+    )
+    from .FDA_get_abuse_info_by_drug_name import FDA_get_abuse_info_by_drug_name
+    from .FDA_get_accessories_info_by_drug_name import (
+        FDA_get_accessories_info_by_drug_name,
+    )
+    from .FDA_get_active_ingredient_info_by_drug_name import (
+        FDA_get_active_ingredient_info_by_drug_name,
+    )
+    from .FDA_get_adverse_reactions_by_drug_name import (
+        FDA_get_adverse_reactions_by_drug_name,
+    )
+    from .FDA_get_alarms_by_drug_name import FDA_get_alarms_by_drug_name
+    from .FDA_get_animal_pharmacology_info_by_drug_name import (
+        FDA_get_animal_pharmacology_info_by_drug_name,
+    )
+    from .FDA_get_assembly_installation_info_by_drug_name import (
+        FDA_get_assembly_installation_info_by_drug_name,
+    )
+    from .FDA_get_boxed_warning_info_by_drug_name import (
+        FDA_get_boxed_warning_info_by_drug_name,
+    )
+    from .FDA_get_brand_name_generic_name import FDA_get_brand_name_generic_name
+    from .FDA_get_calibration_instructions_by_drug_name import (
+        FDA_get_calibration_instructions_by_drug_name,
+    )
+    from .FDA_get_carcinogenic_mutagenic_fertility_by_drug_name import (
+        FDA_get_carcinogenic_mutagenic_fertility_by_drug_name,
+    )
+    from .FDA_get_child_safety_info_by_drug_name import (
+        FDA_get_child_safety_info_by_drug_name,
+    )
+    from .FDA_get_clinical_pharmacology_by_drug_name import (
+        FDA_get_clinical_pharmacology_by_drug_name,
+    )
+    from .FDA_get_clinical_studies_info_by_drug_name import (
+        FDA_get_clinical_studies_info_by_drug_name,
+    )
+    from .FDA_get_contact_for_questions_info_by_drug_name import (
+        FDA_get_contact_for_questions_info_by_drug_name,
+    )
+    from .FDA_get_contraindications_by_drug_name import (
+        FDA_get_contraindications_by_drug_name,
+    )
+    from .FDA_get_controlled_substance_DEA_schedule_info_by_drug_name import (
+        FDA_get_controlled_substance_DEA_schedule_info_by_drug_name,
+    )
+    from .FDA_get_dear_health_care_provider_letter_info_by_drug_name import (
+        FDA_get_dear_health_care_provider_letter_info_by_drug_name,
+    )
+    from .FDA_get_dependence_info_by_drug_name import (
+        FDA_get_dependence_info_by_drug_name,
+    )
+    from .FDA_get_disposal_info_by_drug_name import FDA_get_disposal_info_by_drug_name
+    from .FDA_get_do_not_use_info_by_drug_name import (
+        FDA_get_do_not_use_info_by_drug_name,
+    )
+    from .FDA_get_document_id_by_drug_name import FDA_get_document_id_by_drug_name
+    from .FDA_get_dosage_and_storage_information_by_drug_name import (
+        FDA_get_dosage_and_storage_information_by_drug_name,
+    )
+    from .FDA_get_dosage_forms_and_strengths_by_drug_name import (
+        FDA_get_dosage_forms_and_strengths_by_drug_name,
+    )
+    from .FDA_get_drug_generic_name import FDA_get_drug_generic_name
+    from .FDA_get_drug_interactions_by_drug_name import (
+        FDA_get_drug_interactions_by_drug_name,
+    )
+    from .FDA_get_drug_name_by_SPL_ID import FDA_get_drug_name_by_SPL_ID
+    from .FDA_get_drug_name_by_adverse_reaction import (
+        FDA_get_drug_name_by_adverse_reaction,
+    )
+    from .FDA_get_drug_name_by_calibration_instructions import (
+        FDA_get_drug_name_by_calibration_instructions,
+    )
+    from .FDA_get_drug_name_by_dependence_info import (
+        FDA_get_drug_name_by_dependence_info,
+    )
+    from .FDA_get_drug_name_by_document_id import FDA_get_drug_name_by_document_id
+    from .FDA_get_drug_name_by_dosage_info import FDA_get_drug_name_by_dosage_info
+    from .FDA_get_drug_name_by_environmental_warning import (
+        FDA_get_drug_name_by_environmental_warning,
+    )
+    from .FDA_get_drug_name_by_inactive_ingredient import (
+        FDA_get_drug_name_by_inactive_ingredient,
+    )
+    from .FDA_get_drug_name_by_info_on_conditions_for_doctor_consultation import (
+        FDA_get_drug_name_by_info_on_conditions_for_doctor_consultation,
+    )
+    from .FDA_get_drug_name_by_labor_and_delivery_info import (
+        FDA_get_drug_name_by_labor_and_delivery_info,
+    )
+    from .FDA_get_drug_name_by_microbiology import FDA_get_drug_name_by_microbiology
+    from .FDA_get_drug_name_by_other_safety_info import (
+        FDA_get_drug_name_by_other_safety_info,
+    )
+    from .FDA_get_drug_name_by_pharmacodynamics import (
+        FDA_get_drug_name_by_pharmacodynamics,
+    )
+    from .FDA_get_drug_name_by_pharmacogenomics import (
+        FDA_get_drug_name_by_pharmacogenomics,
+    )
+    from .FDA_get_drug_name_by_precautions import FDA_get_drug_name_by_precautions
+    from .FDA_get_drug_name_by_pregnancy_or_breastfeeding_info import (
+        FDA_get_drug_name_by_pregnancy_or_breastfeeding_info,
+    )
+    from .FDA_get_drug_name_by_principal_display_panel import (
+        FDA_get_drug_name_by_principal_display_panel,
+    )
+    from .FDA_get_drug_name_by_reference import FDA_get_drug_name_by_reference
+    from .FDA_get_drug_name_by_set_id import FDA_get_drug_name_by_set_id
+    from .FDA_get_drug_name_by_stop_use_info import FDA_get_drug_name_by_stop_use_info
+    from .FDA_get_drug_name_by_storage_and_handling_info import (
+        FDA_get_drug_name_by_storage_and_handling_info,
+    )
+    from .FDA_get_drug_name_by_warnings import FDA_get_drug_name_by_warnings
+    from .FDA_get_drug_name_from_patient_package_insert import (
+        FDA_get_drug_name_from_patient_package_insert,
+    )
+    from .FDA_get_drug_names_by_abuse_dependence_info import (
+        FDA_get_drug_names_by_abuse_dependence_info,
+    )
+    from .FDA_get_drug_names_by_abuse_info import FDA_get_drug_names_by_abuse_info
+    from .FDA_get_drug_names_by_accessories import FDA_get_drug_names_by_accessories
+    from .FDA_get_drug_names_by_active_ingredient import (
+        FDA_get_drug_names_by_active_ingredient,
+    )
+    from .FDA_get_drug_names_by_alarm import FDA_get_drug_names_by_alarm
+    from .FDA_get_drug_names_by_animal_pharmacology_info import (
+        FDA_get_drug_names_by_animal_pharmacology_info,
+    )
+    from .FDA_get_drug_names_by_application_number_NDC_number import (
+        FDA_get_drug_names_by_application_number_NDC_number,
+    )
+    from .FDA_get_drug_names_by_assembly_installation_info import (
+        FDA_get_drug_names_by_assembly_installation_info,
+    )
+    from .FDA_get_drug_names_by_boxed_warning import FDA_get_drug_names_by_boxed_warning
+    from .FDA_get_drug_names_by_child_safety_info import (
+        FDA_get_drug_names_by_child_safety_info,
+    )
+    from .FDA_get_drug_names_by_clinical_pharmacology import (
+        FDA_get_drug_names_by_clinical_pharmacology,
+    )
+    from .FDA_get_drug_names_by_clinical_studies import (
+        FDA_get_drug_names_by_clinical_studies,
+    )
+    from .FDA_get_drug_names_by_consulting_doctor_pharmacist_info import (
+        FDA_get_drug_names_by_consulting_doctor_pharmacist_info,
+    )
+    from .FDA_get_drug_names_by_contraindications import (
+        FDA_get_drug_names_by_contraindications,
+    )
+    from .FDA_get_drug_names_by_controlled_substance_DEA_schedule import (
+        FDA_get_drug_names_by_controlled_substance_DEA_schedule,
+    )
+    from .FDA_get_drug_names_by_dear_health_care_provider_letter_info import (
+        FDA_get_drug_names_by_dear_health_care_provider_letter_info,
+    )
+    from .FDA_get_drug_names_by_disposal_info import FDA_get_drug_names_by_disposal_info
+    from .FDA_get_drug_names_by_dosage_forms_and_strengths_info import (
+        FDA_get_drug_names_by_dosage_forms_and_strengths_info,
+    )
+    from .FDA_get_drug_names_by_drug_interactions import (
+        FDA_get_drug_names_by_drug_interactions,
+    )
+    from .FDA_get_drug_names_by_effective_time import (
+        FDA_get_drug_names_by_effective_time,
+    )
+    from .FDA_get_drug_names_by_food_safety_warnings import (
+        FDA_get_drug_names_by_food_safety_warnings,
+    )
+    from .FDA_get_drug_names_by_general_precautions import (
+        FDA_get_drug_names_by_general_precautions,
+    )
+    from .FDA_get_drug_names_by_geriatric_use import FDA_get_drug_names_by_geriatric_use
+    from .FDA_get_drug_names_by_health_claim import FDA_get_drug_names_by_health_claim
+    from .FDA_get_drug_names_by_indication import FDA_get_drug_names_by_indication
+    from .FDA_get_drug_names_by_indication_aggregated import (
+        FDA_get_drug_names_by_indication_aggregated,
+    )
+    from .FDA_get_drug_names_by_indication_stats import (
+        FDA_get_drug_names_by_indication_stats,
+    )
+    from .FDA_get_drug_names_by_info_for_nursing_mothers import (
+        FDA_get_drug_names_by_info_for_nursing_mothers,
+    )
+    from .FDA_get_drug_names_by_information_for_owners_or_caregivers import (
+        FDA_get_drug_names_by_information_for_owners_or_caregivers,
+    )
+    from .FDA_get_drug_names_by_ingredient import FDA_get_drug_names_by_ingredient
+    from .FDA_get_drug_names_by_instructions_for_use import (
+        FDA_get_drug_names_by_instructions_for_use,
+    )
+    from .FDA_get_drug_names_by_lab_test_interference import (
+        FDA_get_drug_names_by_lab_test_interference,
+    )
+    from .FDA_get_drug_names_by_lab_tests import FDA_get_drug_names_by_lab_tests
+    from .FDA_get_drug_names_by_mechanism_of_action import (
+        FDA_get_drug_names_by_mechanism_of_action,
+    )
+    from .FDA_get_drug_names_by_medication_guide import (
+        FDA_get_drug_names_by_medication_guide,
+    )
+    from .FDA_get_drug_names_by_nonclinical_toxicology_info import (
+        FDA_get_drug_names_by_nonclinical_toxicology_info,
+    )
+    from .FDA_get_drug_names_by_nonteratogenic_effects import (
+        FDA_get_drug_names_by_nonteratogenic_effects,
+    )
+    from .FDA_get_drug_names_by_overdosage_info import (
+        FDA_get_drug_names_by_overdosage_info,
+    )
+    from .FDA_get_drug_names_by_pediatric_use import FDA_get_drug_names_by_pediatric_use
+    from .FDA_get_drug_names_by_pharmacokinetics import (
+        FDA_get_drug_names_by_pharmacokinetics,
+    )
+    from .FDA_get_drug_names_by_population_use import (
+        FDA_get_drug_names_by_population_use,
+    )
+    from .FDA_get_drug_names_by_pregnancy_effects_info import (
+        FDA_get_drug_names_by_pregnancy_effects_info,
+    )
+    from .FDA_get_drug_names_by_residue_warning import (
+        FDA_get_drug_names_by_residue_warning,
+    )
+    from .FDA_get_drug_names_by_risk import FDA_get_drug_names_by_risk
+    from .FDA_get_drug_names_by_route import FDA_get_drug_names_by_route
+    from .FDA_get_drug_names_by_safe_handling_warning import (
+        FDA_get_drug_names_by_safe_handling_warning,
+    )
+    from .FDA_get_drug_names_by_safety_summary import (
+        FDA_get_drug_names_by_safety_summary,
+    )
+    from .FDA_get_drug_names_by_spl_indexing_data_elements import (
+        FDA_get_drug_names_by_spl_indexing_data_elements,
+    )
+    from .FDA_get_drug_names_by_teratogenic_effects import (
+        FDA_get_drug_names_by_teratogenic_effects,
+    )
+    from .FDA_get_drug_names_by_user_safety_warning import (
+        FDA_get_drug_names_by_user_safety_warning,
+    )
+    from .FDA_get_drug_names_by_warnings_and_cautions import (
+        FDA_get_drug_names_by_warnings_and_cautions,
+    )
+    from .FDA_get_drugs_by_carcinogenic_mutagenic_fertility import (
+        FDA_get_drugs_by_carcinogenic_mutagenic_fertility,
+    )
+    from .FDA_get_effective_time_by_drug_name import FDA_get_effective_time_by_drug_name
+    from .FDA_get_environmental_warning_by_drug_name import (
+        FDA_get_environmental_warning_by_drug_name,
+    )
+    from .FDA_get_general_precautions_by_drug_name import (
+        FDA_get_general_precautions_by_drug_name,
+    )
+    from .FDA_get_geriatric_use_info_by_drug_name import (
+        FDA_get_geriatric_use_info_by_drug_name,
+    )
+    from .FDA_get_health_claims_by_drug_name import FDA_get_health_claims_by_drug_name
+    from .FDA_get_inactive_ingredient_info_by_drug_name import (
+        FDA_get_inactive_ingredient_info_by_drug_name,
+    )
+    from .FDA_get_indications_by_drug_name import FDA_get_indications_by_drug_name
+    from .FDA_get_info_for_nursing_mothers_by_drug_name import (
+        FDA_get_info_for_nursing_mothers_by_drug_name,
+    )
+    from .FDA_get_info_for_patients_by_drug_name import (
+        FDA_get_info_for_patients_by_drug_name,
+    )
+    from .FDA_get_info_on_conditions_for_doctor_consultation_by_drug_name import (
+        FDA_get_info_on_conditions_for_doctor_consultation_by_drug_name,
+    )
+    from .FDA_get_info_on_consulting_doctor_pharmacist_by_drug_name import (
+        FDA_get_info_on_consulting_doctor_pharmacist_by_drug_name,
+    )
+    from .FDA_get_information_for_owners_or_caregivers_by_drug_name import (
+        FDA_get_information_for_owners_or_caregivers_by_drug_name,
+    )
+    from .FDA_get_ingredients_by_drug_name import FDA_get_ingredients_by_drug_name
+    from .FDA_get_instructions_for_use_by_drug_name import (
+        FDA_get_instructions_for_use_by_drug_name,
+    )
+    from .FDA_get_lab_test_interference_info_by_drug_name import (
+        FDA_get_lab_test_interference_info_by_drug_name,
+    )
+    from .FDA_get_lab_tests_by_drug_name import FDA_get_lab_tests_by_drug_name
+    from .FDA_get_labor_and_delivery_info_by_drug_name import (
+        FDA_get_labor_and_delivery_info_by_drug_name,
+    )
+    from .FDA_get_manufacturer_name_NDC_number_by_drug_name import (
+        FDA_get_manufacturer_name_NDC_number_by_drug_name,
+    )
+    from .FDA_get_mechanism_of_action_by_drug_name import (
+        FDA_get_mechanism_of_action_by_drug_name,
+    )
+    from .FDA_get_medication_guide_info_by_drug_name import (
+        FDA_get_medication_guide_info_by_drug_name,
+    )
+    from .FDA_get_microbiology_info_by_drug_name import (
+        FDA_get_microbiology_info_by_drug_name,
+    )
+    from .FDA_get_nonclinical_toxicology_info_by_drug_name import (
+        FDA_get_nonclinical_toxicology_info_by_drug_name,
+    )
+    from .FDA_get_nonteratogenic_effects_by_drug_name import (
+        FDA_get_nonteratogenic_effects_by_drug_name,
+    )
+    from .FDA_get_other_safety_info_by_drug_name import (
+        FDA_get_other_safety_info_by_drug_name,
+    )
+    from .FDA_get_overdosage_info_by_drug_name import (
+        FDA_get_overdosage_info_by_drug_name,
+    )
+    from .FDA_get_patient_package_insert_from_drug_name import (
+        FDA_get_patient_package_insert_from_drug_name,
+    )
+    from .FDA_get_pediatric_use_info_by_drug_name import (
+        FDA_get_pediatric_use_info_by_drug_name,
+    )
+    from .FDA_get_pharmacodynamics_by_drug_name import (
+        FDA_get_pharmacodynamics_by_drug_name,
+    )
+    from .FDA_get_pharmacogenomics_info_by_drug_name import (
+        FDA_get_pharmacogenomics_info_by_drug_name,
+    )
+    from .FDA_get_pharmacokinetics_by_drug_name import (
+        FDA_get_pharmacokinetics_by_drug_name,
+    )
+    from .FDA_get_population_use_info_by_drug_name import (
+        FDA_get_population_use_info_by_drug_name,
+    )
+    from .FDA_get_precautions_by_drug_name import FDA_get_precautions_by_drug_name
+    from .FDA_get_pregnancy_effects_info_by_drug_name import (
+        FDA_get_pregnancy_effects_info_by_drug_name,
+    )
+    from .FDA_get_pregnancy_or_breastfeeding_info_by_drug_name import (
+        FDA_get_pregnancy_or_breastfeeding_info_by_drug_name,
+    )
+    from .FDA_get_principal_display_panel_by_drug_name import (
+        FDA_get_principal_display_panel_by_drug_name,
+    )
+    from .FDA_get_purpose_info_by_drug_name import FDA_get_purpose_info_by_drug_name
+    from .FDA_get_recent_changes_by_drug_name import FDA_get_recent_changes_by_drug_name
+    from .FDA_get_reference_info_by_drug_name import FDA_get_reference_info_by_drug_name
+    from .FDA_get_residue_warning_by_drug_name import (
+        FDA_get_residue_warning_by_drug_name,
+    )
+    from .FDA_get_risk_info_by_drug_name import FDA_get_risk_info_by_drug_name
+    from .FDA_get_route_info_by_drug_name import FDA_get_route_info_by_drug_name
+    from .FDA_get_safe_handling_warnings_by_drug_name import (
+        FDA_get_safe_handling_warnings_by_drug_name,
+    )
+    from .FDA_get_safety_summary_by_drug_name import FDA_get_safety_summary_by_drug_name
+    from .FDA_get_spl_indexing_data_elements_by_drug_name import (
+        FDA_get_spl_indexing_data_elements_by_drug_name,
+    )
+    from .FDA_get_spl_unclassified_section_by_drug_name import (
+        FDA_get_spl_unclassified_section_by_drug_name,
+    )
+    from .FDA_get_stop_use_info_by_drug_name import FDA_get_stop_use_info_by_drug_name
+    from .FDA_get_storage_and_handling_info_by_drug_name import (
+        FDA_get_storage_and_handling_info_by_drug_name,
+    )
+    from .FDA_get_teratogenic_effects_by_drug_name import (
+        FDA_get_teratogenic_effects_by_drug_name,
+    )
+    from .FDA_get_user_safety_warning_by_drug_names import (
+        FDA_get_user_safety_warning_by_drug_names,
+    )
+    from .FDA_get_warnings_and_cautions_by_drug_name import (
+        FDA_get_warnings_and_cautions_by_drug_name,
+    )
+    from .FDA_get_warnings_by_drug_name import FDA_get_warnings_by_drug_name
+    from .FDA_get_when_using_info import FDA_get_when_using_info
+    from .FDA_retrieve_device_use_by_drug_name import (
+        FDA_retrieve_device_use_by_drug_name,
+    )
+    from .FDA_retrieve_drug_name_by_device_use import (
+        FDA_retrieve_drug_name_by_device_use,
+    )
+    from .FDA_retrieve_drug_names_by_patient_medication_info import (
+        FDA_retrieve_drug_names_by_patient_medication_info,
+    )
+    from .FDA_retrieve_patient_medication_info_by_drug_name import (
+        FDA_retrieve_patient_medication_info_by_drug_name,
+    )
+    from .Fatcat_search_scholar import Fatcat_search_scholar
+    from .Finish import Finish
+    from .GBIF_search_occurrences import GBIF_search_occurrences
+    from .GBIF_search_species import GBIF_search_species
+    from .GDC_list_files import GDC_list_files
+    from .GDC_search_cases import GDC_search_cases
+    from .GIN_Guidelines_Search import GIN_Guidelines_Search
+    from .GO_get_annotations_for_gene import GO_get_annotations_for_gene
+    from .GO_get_genes_for_term import GO_get_genes_for_term
+    from .GO_get_term_by_id import GO_get_term_by_id
+    from .GO_get_term_details import GO_get_term_details
+    from .GO_search_terms import GO_search_terms
+    from .GTEx_get_expression_summary import GTEx_get_expression_summary
+    from .GTEx_query_eqtl import GTEx_query_eqtl
+    from .GWAS_search_associations_by_gene import GWAS_search_associations_by_gene
+    from .GtoPdb_get_targets import GtoPdb_get_targets
+    from .HAL_search_archive import HAL_search_archive
+    from .HPA_get_biological_processes_by_gene import (
+        HPA_get_biological_processes_by_gene,
+    )
+    from .HPA_get_cancer_prognostics_by_gene import HPA_get_cancer_prognostics_by_gene
+    from .HPA_get_comparative_expression_by_gene_and_cellline import (
+        HPA_get_comparative_expression_by_gene_and_cellline,
+    )
+    from .HPA_get_comprehensive_gene_details_by_ensembl_id import (
+        HPA_get_comprehensive_gene_details_by_ensembl_id,
+    )
+    from .HPA_get_contextual_biological_process_analysis import (
+        HPA_get_contextual_biological_process_analysis,
+    )
+    from .HPA_get_disease_expression_by_gene_tissue_disease import (
+        HPA_get_disease_expression_by_gene_tissue_disease,
+    )
+    from .HPA_get_gene_basic_info_by_ensembl_id import (
+        HPA_get_gene_basic_info_by_ensembl_id,
+    )
+    from .HPA_get_gene_tsv_data_by_ensembl_id import HPA_get_gene_tsv_data_by_ensembl_id
+    from .HPA_get_protein_interactions_by_gene import (
+        HPA_get_protein_interactions_by_gene,
+    )
+    from .HPA_get_rna_expression_by_source import HPA_get_rna_expression_by_source
+    from .HPA_get_rna_expression_in_specific_tissues import (
+        HPA_get_rna_expression_in_specific_tissues,
+    )
+    from .HPA_get_subcellular_location import HPA_get_subcellular_location
+    from .HPA_search_genes_by_query import HPA_search_genes_by_query
+    from .HypothesisGenerator import HypothesisGenerator
+    from .InterPro_get_domain_details import InterPro_get_domain_details
+    from .InterPro_get_protein_domains import InterPro_get_protein_domains
+    from .InterPro_search_domains import InterPro_search_domains
+    from .JASPAR_get_transcription_factors import JASPAR_get_transcription_factors
+    from .LabelGenerator import LabelGenerator
+    from .LiteratureContextReviewer import LiteratureContextReviewer
+    from .LiteratureSearchTool import LiteratureSearchTool
+    from .LiteratureSynthesisAgent import LiteratureSynthesisAgent
+    from .MGnify_list_analyses import MGnify_list_analyses
+    from .MGnify_search_studies import MGnify_search_studies
+    from .MPD_get_phenotype_data import MPD_get_phenotype_data
+    from .MedRxiv_search_preprints import MedRxiv_search_preprints
+    from .MedicalLiteratureReviewer import MedicalLiteratureReviewer
+    from .MedicalTermNormalizer import MedicalTermNormalizer
+    from .MedlinePlus_connect_lookup_by_code import MedlinePlus_connect_lookup_by_code
+    from .MedlinePlus_get_genetics_condition_by_name import (
+        MedlinePlus_get_genetics_condition_by_name,
+    )
+    from .MedlinePlus_get_genetics_gene_by_name import (
+        MedlinePlus_get_genetics_gene_by_name,
+    )
+    from .MedlinePlus_get_genetics_index import MedlinePlus_get_genetics_index
+    from .MedlinePlus_search_topics_by_keyword import (
+        MedlinePlus_search_topics_by_keyword,
+    )
+    from .MethodologyRigorReviewer import MethodologyRigorReviewer
+    from .NICE_Clinical_Guidelines_Search import NICE_Clinical_Guidelines_Search
+    from .NICE_Guideline_Full_Text import NICE_Guideline_Full_Text
+    from .NoveltySignificanceReviewer import NoveltySignificanceReviewer
+    from .OBIS_search_occurrences import OBIS_search_occurrences
+    from .OBIS_search_taxa import OBIS_search_taxa
+    from .OSF_search_preprints import OSF_search_preprints
+    from .OSL_get_efo_id_by_disease_name import OSL_get_efo_id_by_disease_name
+    from .OpenAIRE_search_publications import OpenAIRE_search_publications
+    from .OpenAlex_Guidelines_Search import OpenAlex_Guidelines_Search
+    from .OpenTargets_drug_pharmacogenomics_data import (
+        OpenTargets_drug_pharmacogenomics_data,
+    )
+    from .OpenTargets_get_approved_indications_by_drug_chemblId import (
+        OpenTargets_get_approved_indications_by_drug_chemblId,
+    )
+    from .OpenTargets_get_associated_diseases_by_drug_chemblId import (
+        OpenTargets_get_associated_diseases_by_drug_chemblId,
+    )
+    from .OpenTargets_get_associated_drugs_by_disease_efoId import (
+        OpenTargets_get_associated_drugs_by_disease_efoId,
+    )
+    from .OpenTargets_get_associated_drugs_by_target_ensemblID import (
+        OpenTargets_get_associated_drugs_by_target_ensemblID,
+    )
+    from .OpenTargets_get_associated_phenotypes_by_disease_efoId import (
+        OpenTargets_get_associated_phenotypes_by_disease_efoId,
+    )
+    from .OpenTargets_get_associated_targets_by_disease_efoId import (
+        OpenTargets_get_associated_targets_by_disease_efoId,
+    )
+    from .OpenTargets_get_associated_targets_by_drug_chemblId import (
+        OpenTargets_get_associated_targets_by_drug_chemblId,
+    )
+    from .OpenTargets_get_biological_mouse_models_by_ensemblID import (
+        OpenTargets_get_biological_mouse_models_by_ensemblID,
+    )
+    from .OpenTargets_get_chemical_probes_by_target_ensemblID import (
+        OpenTargets_get_chemical_probes_by_target_ensemblID,
+    )
+    from .OpenTargets_get_disease_ancestors_parents_by_efoId import (
+        OpenTargets_get_disease_ancestors_parents_by_efoId,
+    )
+    from .OpenTargets_get_disease_descendants_children_by_efoId import (
+        OpenTargets_get_disease_descendants_children_by_efoId,
+    )
+    from .OpenTargets_get_disease_description_by_efoId import (
+        OpenTargets_get_disease_description_by_efoId,
+    )
+    from .OpenTargets_get_disease_id_description_by_name import (
+        OpenTargets_get_disease_id_description_by_name,
+    )
+    from .OpenTargets_get_disease_ids_by_efoId import (
+        OpenTargets_get_disease_ids_by_efoId,
+    )
+    from .OpenTargets_get_disease_ids_by_name import OpenTargets_get_disease_ids_by_name
+    from .OpenTargets_get_disease_locations_by_efoId import (
+        OpenTargets_get_disease_locations_by_efoId,
+    )
+    from .OpenTargets_get_disease_synonyms_by_efoId import (
+        OpenTargets_get_disease_synonyms_by_efoId,
+    )
+    from .OpenTargets_get_disease_therapeutic_areas_by_efoId import (
+        OpenTargets_get_disease_therapeutic_areas_by_efoId,
+    )
+    from .OpenTargets_get_diseases_phenotypes_by_target_ensembl import (
+        OpenTargets_get_diseases_phenotypes_by_target_ensembl,
+    )
+    from .OpenTargets_get_drug_adverse_events_by_chemblId import (
+        OpenTargets_get_drug_adverse_events_by_chemblId,
+    )
+    from .OpenTargets_get_drug_approval_status_by_chemblId import (
+        OpenTargets_get_drug_approval_status_by_chemblId,
+    )
+    from .OpenTargets_get_drug_chembId_by_generic_name import (
+        OpenTargets_get_drug_chembId_by_generic_name,
+    )
+    from .OpenTargets_get_drug_description_by_chemblId import (
+        OpenTargets_get_drug_description_by_chemblId,
+    )
+    from .OpenTargets_get_drug_id_description_by_name import (
+        OpenTargets_get_drug_id_description_by_name,
+    )
+    from .OpenTargets_get_drug_indications_by_chemblId import (
+        OpenTargets_get_drug_indications_by_chemblId,
+    )
+    from .OpenTargets_get_drug_mechanisms_of_action_by_chemblId import (
+        OpenTargets_get_drug_mechanisms_of_action_by_chemblId,
+    )
+    from .OpenTargets_get_drug_names_by_chemblId import (
+        OpenTargets_get_drug_names_by_chemblId,
+    )
+    from .OpenTargets_get_drug_synonyms_by_chemblId import (
+        OpenTargets_get_drug_synonyms_by_chemblId,
+    )
+    from .OpenTargets_get_drug_trade_names_by_chemblId import (
+        OpenTargets_get_drug_trade_names_by_chemblId,
+    )
+    from .OpenTargets_get_drug_warnings_by_chemblId import (
+        OpenTargets_get_drug_warnings_by_chemblId,
+    )
+    from .OpenTargets_get_drug_withdrawn_blackbox_status_by_chemblId import (
+        OpenTargets_get_drug_withdrawn_blackbox_status_by_chemblId,
+    )
+    from .OpenTargets_get_gene_ontology_terms_by_goID import (
+        OpenTargets_get_gene_ontology_terms_by_goID,
+    )
+    from .OpenTargets_get_known_drugs_by_drug_chemblId import (
+        OpenTargets_get_known_drugs_by_drug_chemblId,
+    )
+    from .OpenTargets_get_parent_child_molecules_by_drug_chembl_ID import (
+        OpenTargets_get_parent_child_molecules_by_drug_chembl_ID,
+    )
+    from .OpenTargets_get_publications_by_disease_efoId import (
+        OpenTargets_get_publications_by_disease_efoId,
+    )
+    from .OpenTargets_get_publications_by_drug_chemblId import (
+        OpenTargets_get_publications_by_drug_chemblId,
+    )
+    from .OpenTargets_get_publications_by_target_ensemblID import (
+        OpenTargets_get_publications_by_target_ensemblID,
+    )
+    from .OpenTargets_get_similar_entities_by_disease_efoId import (
+        OpenTargets_get_similar_entities_by_disease_efoId,
+    )
+    from .OpenTargets_get_similar_entities_by_drug_chemblId import (
+        OpenTargets_get_similar_entities_by_drug_chemblId,
+    )
+    from .OpenTargets_get_similar_entities_by_target_ensemblID import (
+        OpenTargets_get_similar_entities_by_target_ensemblID,
+    )
+    from .OpenTargets_get_target_classes_by_ensemblID import (
+        OpenTargets_get_target_classes_by_ensemblID,
+    )
+    from .OpenTargets_get_target_constraint_info_by_ensemblID import (
+        OpenTargets_get_target_constraint_info_by_ensemblID,
+    )
+    from .OpenTargets_get_target_enabling_packages_by_ensemblID import (
+        OpenTargets_get_target_enabling_packages_by_ensemblID,
+    )
+    from .OpenTargets_get_target_gene_ontology_by_ensemblID import (
+        OpenTargets_get_target_gene_ontology_by_ensemblID,
+    )
+    from .OpenTargets_get_target_genomic_location_by_ensemblID import (
+        OpenTargets_get_target_genomic_location_by_ensemblID,
+    )
+    from .OpenTargets_get_target_homologues_by_ensemblID import (
+        OpenTargets_get_target_homologues_by_ensemblID,
+    )
+    from .OpenTargets_get_target_id_description_by_name import (
+        OpenTargets_get_target_id_description_by_name,
+    )
+    from .OpenTargets_get_target_interactions_by_ensemblID import (
+        OpenTargets_get_target_interactions_by_ensemblID,
+    )
+    from .OpenTargets_get_target_safety_profile_by_ensemblID import (
+        OpenTargets_get_target_safety_profile_by_ensemblID,
+    )
+    from .OpenTargets_get_target_subcellular_locations_by_ensemblID import (
+        OpenTargets_get_target_subcellular_locations_by_ensemblID,
+    )
+    from .OpenTargets_get_target_synonyms_by_ensemblID import (
+        OpenTargets_get_target_synonyms_by_ensemblID,
+    )
+    from .OpenTargets_get_target_tractability_by_ensemblID import (
+        OpenTargets_get_target_tractability_by_ensemblID,
+    )
+    from .OpenTargets_map_any_disease_id_to_all_other_ids import (
+        OpenTargets_map_any_disease_id_to_all_other_ids,
+    )
+    from .OpenTargets_multi_entity_search_by_query_string import (
+        OpenTargets_multi_entity_search_by_query_string,
+    )
+    from .OpenTargets_search_category_counts_by_query_string import (
+        OpenTargets_search_category_counts_by_query_string,
+    )
+    from .OpenTargets_target_disease_evidence import OpenTargets_target_disease_evidence
+    from .OutputSummarizationComposer import OutputSummarizationComposer
+    from .PDB_search_similar_structures import PDB_search_similar_structures
+    from .PMC_search_papers import PMC_search_papers
+    from .PRIDE_search_proteomics import PRIDE_search_proteomics
+    from .PackageAnalyzer import PackageAnalyzer
+    from .Paleobiology_get_fossils import Paleobiology_get_fossils
+    from .ProtocolOptimizer import ProtocolOptimizer
+    from .PubChem_get_CID_by_SMILES import PubChem_get_CID_by_SMILES
+    from .PubChem_get_CID_by_compound_name import PubChem_get_CID_by_compound_name
+    from .PubChem_get_associated_patents_by_CID import (
+        PubChem_get_associated_patents_by_CID,
+    )
+    from .PubChem_get_compound_2D_image_by_CID import (
+        PubChem_get_compound_2D_image_by_CID,
+    )
+    from .PubChem_get_compound_properties_by_CID import (
+        PubChem_get_compound_properties_by_CID,
+    )
+    from .PubChem_get_compound_synonyms_by_CID import (
+        PubChem_get_compound_synonyms_by_CID,
+    )
+    from .PubChem_get_compound_xrefs_by_CID import PubChem_get_compound_xrefs_by_CID
+    from .PubChem_search_compounds_by_similarity import (
+        PubChem_search_compounds_by_similarity,
+    )
+    from .PubChem_search_compounds_by_substructure import (
+        PubChem_search_compounds_by_substructure,
+    )
+    from .PubMed_Guidelines_Search import PubMed_Guidelines_Search
+    from .PubMed_search_articles import PubMed_search_articles
+    from .PubTator3_EntityAutocomplete import PubTator3_EntityAutocomplete
+    from .PubTator3_LiteratureSearch import PubTator3_LiteratureSearch
+    from .PyPIPackageInspector import PyPIPackageInspector
+    from .QuestionRephraser import QuestionRephraser
+    from .RNAcentral_get_by_accession import RNAcentral_get_by_accession
+    from .RNAcentral_search import RNAcentral_search
+    from .ReMap_get_transcription_factor_binding import (
+        ReMap_get_transcription_factor_binding,
+    )
+    from .Reactome_get_pathway_reactions import Reactome_get_pathway_reactions
+    from .ReferenceInfoAnalyzer import ReferenceInfoAnalyzer
+    from .RegulomeDB_query_variant import RegulomeDB_query_variant
+    from .ReproducibilityTransparencyReviewer import ReproducibilityTransparencyReviewer
+    from .ResultsInterpretationReviewer import ResultsInterpretationReviewer
+    from .RxNorm_get_drug_names import RxNorm_get_drug_names
+    from .SCREEN_get_regulatory_elements import SCREEN_get_regulatory_elements
+    from .ScientificTextSummarizer import ScientificTextSummarizer
+    from .SemanticScholar_search_papers import SemanticScholar_search_papers
+    from .TRIP_Database_Guidelines_Search import TRIP_Database_Guidelines_Search
+    from .TestCaseGenerator import TestCaseGenerator
+    from .TestResultsAnalyzer import TestResultsAnalyzer
+    from .ToolCompatibilityAnalyzer import ToolCompatibilityAnalyzer
+    from .ToolDescriptionOptimizer import ToolDescriptionOptimizer
+    from .ToolDiscover import ToolDiscover
+    from .ToolGraphComposer import ToolGraphComposer
+    from .ToolGraphGenerationPipeline import ToolGraphGenerationPipeline
+    from .ToolMetadataGenerationPipeline import ToolMetadataGenerationPipeline
+    from .ToolMetadataGenerator import ToolMetadataGenerator
+    from .ToolMetadataStandardizer import ToolMetadataStandardizer
+    from .ToolOutputSummarizer import ToolOutputSummarizer
+    from .ToolQualityEvaluator import ToolQualityEvaluator
+    from .ToolRelationshipDetector import ToolRelationshipDetector
+    from .Tool_Finder import Tool_Finder
+    from .Tool_Finder_Keyword import Tool_Finder_Keyword
+    from .Tool_Finder_LLM import Tool_Finder_LLM
+    from .Tool_RAG import Tool_RAG
+    from .UniProt_get_alternative_names_by_accession import (
+        UniProt_get_alternative_names_by_accession,
+    )
+    from .UniProt_get_disease_variants_by_accession import (
+        UniProt_get_disease_variants_by_accession,
+    )
+    from .UniProt_get_entry_by_accession import UniProt_get_entry_by_accession
+    from .UniProt_get_function_by_accession import UniProt_get_function_by_accession
+    from .UniProt_get_isoform_ids_by_accession import (
+        UniProt_get_isoform_ids_by_accession,
+    )
+    from .UniProt_get_organism_by_accession import UniProt_get_organism_by_accession
+    from .UniProt_get_ptm_processing_by_accession import (
+        UniProt_get_ptm_processing_by_accession,
+    )
+    from .UniProt_get_recommended_name_by_accession import (
+        UniProt_get_recommended_name_by_accession,
+    )
+    from .UniProt_get_sequence_by_accession import UniProt_get_sequence_by_accession
+    from .UniProt_get_subcellular_location_by_accession import (
+        UniProt_get_subcellular_location_by_accession,
+    )
+    from .UniProt_id_mapping import UniProt_id_mapping
+    from .UniProt_search import UniProt_search
+    from .UnifiedToolGenerator import UnifiedToolGenerator
+    from .Unpaywall_check_oa_status import Unpaywall_check_oa_status
+    from .WHO_Guideline_Full_Text import WHO_Guideline_Full_Text
+    from .WHO_Guidelines_Search import WHO_Guidelines_Search
+    from .WikiPathways_get_pathway import WikiPathways_get_pathway
+    from .WikiPathways_search import WikiPathways_search
+    from .Wikidata_SPARQL_query import Wikidata_SPARQL_query
+    from .Wikipedia_get_content import Wikipedia_get_content
+    from .Wikipedia_get_summary import Wikipedia_get_summary
+    from .Wikipedia_search import Wikipedia_search
+    from .WoRMS_search_species import WoRMS_search_species
+    from .WritingPresentationReviewer import WritingPresentationReviewer
+    from .XMLToolOptimizer import XMLToolOptimizer
+    from .Zenodo_search_records import Zenodo_search_records
+    from .advanced_literature_search_agent import advanced_literature_search_agent
+    from .alphafold_get_annotations import alphafold_get_annotations
+    from .alphafold_get_prediction import alphafold_get_prediction
+    from .alphafold_get_summary import alphafold_get_summary
+    from .cBioPortal_get_cancer_studies import cBioPortal_get_cancer_studies
+    from .cBioPortal_get_mutations import cBioPortal_get_mutations
+    from .call_agentic_human import call_agentic_human
+    from .cancer_biomarkers_disease_target_score import (
+        cancer_biomarkers_disease_target_score,
+    )
+    from .cancer_gene_census_disease_target_score import (
+        cancer_gene_census_disease_target_score,
+    )
+    from .cellosaurus_get_cell_line_info import cellosaurus_get_cell_line_info
+    from .cellosaurus_query_converter import cellosaurus_query_converter
+    from .cellosaurus_search_cell_lines import cellosaurus_search_cell_lines
+    from .chembl_disease_target_score import chembl_disease_target_score
+    from .clinvar_get_clinical_significance import clinvar_get_clinical_significance
+    from .clinvar_get_variant_details import clinvar_get_variant_details
+    from .ClinVar_search_variants import clinvar_search_variants
+    from .convert_to_markdown import convert_to_markdown
+    from .dbsnp_get_frequencies import dbsnp_get_frequencies
+    from .dbSNP_get_variant_by_rsid import dbsnp_get_variant_by_rsid
+    from .dbsnp_search_by_gene import dbsnp_search_by_gene
+    from .dict_search import dict_search
+    from .dili_search import dili_search
+    from .diqt_search import diqt_search
+    from .disease_target_score import disease_target_score
+    from .download_binary_file import download_binary_file
+    from .download_file import download_file
+    from .download_text_content import download_text_content
+    from .drugbank_filter_drugs_by_name import drugbank_filter_drugs_by_name
+    from .drugbank_full_search import drugbank_full_search
+    from .drugbank_get_drug_basic_info_by_drug_name_or_drugbank_id import (
+        drugbank_get_drug_basic_info_by_drug_name_or_drugbank_id,
+    )
+    from .drugbank_get_drug_chemistry_by_drug_name_or_drugbank_id import (
+        drugbank_get_drug_chemistry_by_drug_name_or_drugbank_id,
+    )
+    from .drugbank_get_drug_desc_pharmacology_by_moa import (
+        drugbank_get_drug_desc_pharmacology_by_moa,
+    )
+    from .drugbank_get_drug_interactions_by_drug_name_or_drugbank_id import (
+        drugbank_get_drug_interactions_by_drug_name_or_drugbank_id,
+    )
+    from .drugbank_get_drug_name_and_description_by_indication import (
+        drugbank_get_drug_name_and_description_by_indication,
+    )
+    from .drugbank_get_drug_name_and_description_by_pathway_name import (
+        drugbank_get_drug_name_and_description_by_pathway_name,
+    )
+    from .drugbank_get_drug_name_and_description_by_target_name import (
+        drugbank_get_drug_name_and_description_by_target_name,
+    )
+    from .drugbank_get_drug_products_by_name_or_drugbank_id import (
+        drugbank_get_drug_products_by_name_or_drugbank_id,
+    )
+    from .drugbank_get_drug_references_by_drug_name_or_drugbank_id import (
+        drugbank_get_drug_references_by_drug_name_or_drugbank_id,
+    )
+    from .drugbank_get_indications_by_drug_name_or_drugbank_id import (
+        drugbank_get_indications_by_drug_name_or_drugbank_id,
+    )
+    from .drugbank_get_pathways_reactions_by_drug_or_id import (
+        drugbank_get_pathways_reactions_by_drug_or_id,
+    )
+    from .drugbank_get_pharmacology_by_drug_name_or_drugbank_id import (
+        drugbank_get_pharmacology_by_drug_name_or_drugbank_id,
+    )
+    from .drugbank_get_safety_by_drug_name_or_drugbank_id import (
+        drugbank_get_safety_by_drug_name_or_drugbank_id,
+    )
+    from .drugbank_get_targets_by_drug_name_or_drugbank_id import (
+        drugbank_get_targets_by_drug_name_or_drugbank_id,
+    )
+    from .drugbank_links_search import drugbank_links_search
+    from .drugbank_vocab_filter import drugbank_vocab_filter
+    from .drugbank_vocab_search import drugbank_vocab_search
+    from .dynamic_package_discovery import dynamic_package_discovery
+    from .embedding_database_add import embedding_database_add
+    from .embedding_database_create import embedding_database_create
+    from .embedding_database_search import embedding_database_search
+    from .embedding_sync_download import embedding_sync_download
+    from .embedding_sync_upload import embedding_sync_upload
+    from .enrichr_gene_enrichment_analysis import enrichr_gene_enrichment_analysis
+    from .ensembl_get_sequence import ensembl_get_sequence
+    from .ensembl_get_variants import ensembl_get_variants
+    from .ensembl_lookup_gene import ensembl_lookup_gene
+    from .euhealthinfo_deepdive import euhealthinfo_deepdive
+    from .euhealthinfo_search_alcohol_tobacco_psychoactive_use import (
+        euhealthinfo_search_alcohol_tobacco_psychoactive_use,
+    )
+    from .euhealthinfo_search_births import euhealthinfo_search_births
+    from .euhealthinfo_search_cancer import euhealthinfo_search_cancer
+    from .euhealthinfo_search_cancer_registry import euhealthinfo_search_cancer_registry
+    from .euhealthinfo_search_causes_of_death import euhealthinfo_search_causes_of_death
+    from .euhealthinfo_search_covid_19 import euhealthinfo_search_covid_19
+    from .euhealthinfo_search_deaths import euhealthinfo_search_deaths
+    from .euhealthinfo_search_diabetes_mellitus_epidemiology_registry import (
+        euhealthinfo_search_diabetes_mellitus_epidemiology_registry,
+    )
+    from .euhealthinfo_search_disability import euhealthinfo_search_disability
+    from .euhealthinfo_search_healthcare_expenditure import (
+        euhealthinfo_search_healthcare_expenditure,
+    )
+    from .euhealthinfo_search_hospital_in_patient_data import (
+        euhealthinfo_search_hospital_in_patient_data,
+    )
+    from .euhealthinfo_search_infectious_diseases import (
+        euhealthinfo_search_infectious_diseases,
+    )
+    from .euhealthinfo_search_key_indicators_registries_surveys import (
+        euhealthinfo_search_key_indicators_registries_surveys,
+    )
+    from .euhealthinfo_search_mental_health import euhealthinfo_search_mental_health
+    from .euhealthinfo_search_obesity import euhealthinfo_search_obesity
+    from .euhealthinfo_search_population_health_survey import (
+        euhealthinfo_search_population_health_survey,
+    )
+    from .euhealthinfo_search_primary_care_workforce import (
+        euhealthinfo_search_primary_care_workforce,
+    )
+    from .euhealthinfo_search_surveillance import euhealthinfo_search_surveillance
+    from .euhealthinfo_search_surveillance_mortality_rates import (
+        euhealthinfo_search_surveillance_mortality_rates,
+    )
+    from .euhealthinfo_search_vaccination import euhealthinfo_search_vaccination
+    from .europepmc_disease_target_score import europepmc_disease_target_score
+    from .eva_disease_target_score import eva_disease_target_score
+    from .eva_somatic_disease_target_score import eva_somatic_disease_target_score
+    from .execute_tool import execute_tool
+    from .expression_atlas_disease_target_score import (
+        expression_atlas_disease_target_score,
+    )
+    from .extract_clinical_trial_adverse_events import (
+        extract_clinical_trial_adverse_events,
+    )
+    from .extract_clinical_trial_outcomes import extract_clinical_trial_outcomes
+    from .genomics_england_disease_target_score import (
+        genomics_england_disease_target_score,
+    )
+    from .geo_get_dataset_info import geo_get_dataset_info
+    from .geo_get_sample_info import geo_get_sample_info
+    from .geo_search_datasets import geo_search_datasets
+    from .get_HPO_ID_by_phenotype import get_HPO_ID_by_phenotype
+    from .get_albumentations_info import get_albumentations_info
+    from .get_altair_info import get_altair_info
+    from .get_anndata_info import get_anndata_info
+    from .get_arboreto_info import get_arboreto_info
+    from .get_arxiv_info import get_arxiv_info
+    from .get_ase_info import get_ase_info
+    from .get_assembly_info_by_pdb_id import get_assembly_info_by_pdb_id
+    from .get_assembly_summary import get_assembly_summary
+    from .get_astropy_info import get_astropy_info
+    from .get_binding_affinity_by_pdb_id import get_binding_affinity_by_pdb_id
+    from .get_biopandas_info import get_biopandas_info
+    from .get_biopython_info import get_biopython_info
+    from .get_bioservices_info import get_bioservices_info
+    from .get_biotite_info import get_biotite_info
+    from .get_bokeh_info import get_bokeh_info
+    from .get_brian2_info import get_brian2_info
+    from .get_cartopy_info import get_cartopy_info
+    from .get_catboost_info import get_catboost_info
+    from .get_cellpose_info import get_cellpose_info
+    from .get_cellrank_info import get_cellrank_info
+    from .get_cellxgene_census_info import get_cellxgene_census_info
+    from .get_cftime_info import get_cftime_info
+    from .get_chem_comp_audit_info import get_chem_comp_audit_info
+    from .get_chem_comp_charge_and_ambiguity import get_chem_comp_charge_and_ambiguity
+    from .get_chembl_webresource_client_info import get_chembl_webresource_client_info
+    from .get_citation_info_by_pdb_id import get_citation_info_by_pdb_id
+    from .get_clair3_info import get_clair3_info
+    from .get_clinical_trial_conditions_and_interventions import (
+        get_clinical_trial_conditions_and_interventions,
+    )
+    from .get_clinical_trial_descriptions import get_clinical_trial_descriptions
+    from .get_clinical_trial_eligibility_criteria import (
+        get_clinical_trial_eligibility_criteria,
+    )
+    from .get_clinical_trial_locations import get_clinical_trial_locations
+    from .get_clinical_trial_outcome_measures import get_clinical_trial_outcome_measures
+    from .get_clinical_trial_references import get_clinical_trial_references
+    from .get_clinical_trial_status_and_dates import get_clinical_trial_status_and_dates
+    from .get_cobra_info import get_cobra_info
+    from .get_cobrapy_info import get_cobrapy_info
+    from .get_cooler_info import get_cooler_info
+    from .get_core_refinement_statistics import get_core_refinement_statistics
+    from .get_cryosparc_tools_info import get_cryosparc_tools_info
+    from .get_crystal_growth_conditions_by_pdb_id import (
+        get_crystal_growth_conditions_by_pdb_id,
+    )
+    from .get_crystallization_ph_by_pdb_id import get_crystallization_ph_by_pdb_id
+    from .get_crystallographic_properties_by_pdb_id import (
+        get_crystallographic_properties_by_pdb_id,
+    )
+    from .get_cupy_info import get_cupy_info
+    from .get_cyvcf2_info import get_cyvcf2_info
+    from .get_dask_info import get_dask_info
+    from .get_datamol_info import get_datamol_info
+    from .get_datashader_info import get_datashader_info
+    from .get_deepchem_info import get_deepchem_info
+    from .get_deeppurpose_info import get_deeppurpose_info
+    from .get_deeptools_info import get_deeptools_info
+    from .get_deepxde_info import get_deepxde_info
+    from .get_dendropy_info import get_dendropy_info
+    from .get_descriptastorus_info import get_descriptastorus_info
+    from .get_diffdock_info import get_diffdock_info
+    from .get_dscribe_info import get_dscribe_info
+    from .get_ec_number_by_entity_id import get_ec_number_by_entity_id
+    from .get_elephant_info import get_elephant_info
+    from .get_em_3d_fitting_and_reconstruction_details import (
+        get_em_3d_fitting_and_reconstruction_details,
+    )
+    from .get_emdb_ids_by_pdb_id import get_emdb_ids_by_pdb_id
+    from .get_episcanpy_info import get_episcanpy_info
+    from .get_ete3_info import get_ete3_info
+    from .get_faiss_info import get_faiss_info
+    from .get_fanc_info import get_fanc_info
+    from .get_flask_info import get_flask_info
+    from .get_flowio_info import get_flowio_info
+    from .get_flowkit_info import get_flowkit_info
+    from .get_flowutils_info import get_flowutils_info
+    from .get_freesasa_info import get_freesasa_info
+    from .get_galpy_info import get_galpy_info
+    from .get_gene_name_by_entity_id import get_gene_name_by_entity_id
+    from .get_geopandas_info import get_geopandas_info
+    from .get_gget_info import get_gget_info
+    from .get_googlesearch_python_info import get_googlesearch_python_info
+    from .get_gseapy_info import get_gseapy_info
+    from .get_h5py_info import get_h5py_info
+    from .get_harmony_pytorch_info import get_harmony_pytorch_info
+    from .get_hmmlearn_info import get_hmmlearn_info
+    from .get_holoviews_info import get_holoviews_info
+    from .get_host_organism_by_pdb_id import get_host_organism_by_pdb_id
+    from .get_htmd_info import get_htmd_info
+    from .get_igraph_info import get_igraph_info
+    from .get_imageio_info import get_imageio_info
+    from .get_imbalanced_learn_info import get_imbalanced_learn_info
+    from .get_jcvi_info import get_jcvi_info
+    from .get_joblib_info import get_joblib_info
+    from .get_joint_associated_diseases_by_HPO_ID_list import (
+        get_joint_associated_diseases_by_HPO_ID_list,
+    )
+    from .get_khmer_info import get_khmer_info
+    from .get_kipoiseq_info import get_kipoiseq_info
+    from .get_lifelines_info import get_lifelines_info
+    from .get_ligand_bond_count_by_pdb_id import get_ligand_bond_count_by_pdb_id
+    from .get_ligand_smiles_by_chem_comp_id import get_ligand_smiles_by_chem_comp_id
+    from .get_lightgbm_info import get_lightgbm_info
+    from .get_loompy_info import get_loompy_info
+    from .get_mageck_info import get_mageck_info
+    from .get_matplotlib_info import get_matplotlib_info
+    from .get_mdanalysis_info import get_mdanalysis_info
+    from .get_mdtraj_info import get_mdtraj_info
+    from .get_mne_info import get_mne_info
+    from .get_molfeat_info import get_molfeat_info
+    from .get_molvs_info import get_molvs_info
+    from .get_mordred_info import get_mordred_info
+    from .get_msprime_info import get_msprime_info
+    from .get_mudata_info import get_mudata_info
+    from .get_mutation_annotations_by_pdb_id import get_mutation_annotations_by_pdb_id
+    from .get_neo_info import get_neo_info
+    from .get_netcdf4_info import get_netcdf4_info
+    from .get_networkx_info import get_networkx_info
+    from .get_nglview_info import get_nglview_info
+    from .get_nilearn_info import get_nilearn_info
+    from .get_numba_info import get_numba_info
+    from .get_numpy_info import get_numpy_info
+    from .get_oligosaccharide_descriptors_by_entity_id import (
+        get_oligosaccharide_descriptors_by_entity_id,
+    )
+    from .get_openbabel_info import get_openbabel_info
+    from .get_openchem_info import get_openchem_info
+    from .get_opencv_info import get_opencv_info
+    from .get_openmm_info import get_openmm_info
+    from .get_optlang_info import get_optlang_info
+    from .get_optuna_info import get_optuna_info
+    from .get_palantir_info import get_palantir_info
+    from .get_pandas_info import get_pandas_info
+    from .get_patsy_info import get_patsy_info
+    from .get_pdbfixer_info import get_pdbfixer_info
+    from .get_phenotype_by_HPO_ID import get_phenotype_by_HPO_ID
+    from .get_pillow_info import get_pillow_info
+    from .get_plantcv_info import get_plantcv_info
+    from .get_plip_info import get_plip_info
+    from .get_plotly_info import get_plotly_info
+    from .get_poliastro_info import get_poliastro_info
+    from .get_polymer_entity_annotations import get_polymer_entity_annotations
+    from .get_polymer_entity_count_by_pdb_id import get_polymer_entity_count_by_pdb_id
+    from .get_polymer_entity_ids_by_pdb_id import get_polymer_entity_ids_by_pdb_id
+    from .get_polymer_entity_type_by_entity_id import (
+        get_polymer_entity_type_by_entity_id,
+    )
+    from .get_polymer_molecular_weight_by_entity_id import (
+        get_polymer_molecular_weight_by_entity_id,
+    )
+    from .get_poretools_info import get_poretools_info
+    from .get_prody_info import get_prody_info
+    from .get_protein_classification_by_pdb_id import (
+        get_protein_classification_by_pdb_id,
+    )
+    from .get_protein_metadata_by_pdb_id import get_protein_metadata_by_pdb_id
+    from .get_pubchempy_info import get_pubchempy_info
+    from .get_pybedtools_info import get_pybedtools_info
+    from .get_pybigwig_info import get_pybigwig_info
+    from .get_pydeseq2_info import get_pydeseq2_info
+    from .get_pyensembl_info import get_pyensembl_info
+    from .get_pyephem_info import get_pyephem_info
+    from .get_pyfaidx_info import get_pyfaidx_info
+    from .get_pyfasta_info import get_pyfasta_info
+    from .get_pykalman_info import get_pykalman_info
+    from .get_pyliftover_info import get_pyliftover_info
+    from .get_pymassspec_info import get_pymassspec_info
+    from .get_pymed_info import get_pymed_info
+    from .get_pymzml_info import get_pymzml_info
+    from .get_pypdf2_info import get_pypdf2_info
+    from .get_pyranges_info import get_pyranges_info
+    from .get_pyrosetta_info import get_pyrosetta_info
+    from .get_pysam_info import get_pysam_info
+    from .get_pyscenic_info import get_pyscenic_info
+    from .get_pyscf_info import get_pyscf_info
+    from .get_pyscreener_info import get_pyscreener_info
+    from .get_pytdc_info import get_pytdc_info
+    from .get_python_libsbml_info import get_python_libsbml_info
+    from .get_pytorch_info import get_pytorch_info
+    from .get_pyvcf_info import get_pyvcf_info
+    from .get_pyvis_info import get_pyvis_info
+    from .get_qutip_info import get_qutip_info
+    from .get_rasterio_info import get_rasterio_info
+    from .get_rdkit_info import get_rdkit_info
+    from .get_refinement_resolution_by_pdb_id import get_refinement_resolution_by_pdb_id
+    from .get_release_deposit_dates_by_pdb_id import get_release_deposit_dates_by_pdb_id
+    from .get_reportlab_info import get_reportlab_info
+    from .get_requests_info import get_requests_info
+    from .get_ruptures_info import get_ruptures_info
+    from .get_scanorama_info import get_scanorama_info
+    from .get_scanpy_info import get_scanpy_info
+    from .get_schnetpack_info import get_schnetpack_info
+    from .get_scholarly_info import get_scholarly_info
+    from .get_scikit_bio_info import get_scikit_bio_info
+    from .get_scikit_image_info import get_scikit_image_info
+    from .get_scikit_learn_info import get_scikit_learn_info
+    from .get_scipy_info import get_scipy_info
+    from .get_scrublet_info import get_scrublet_info
+    from .get_scvelo_info import get_scvelo_info
+    from .get_scvi_tools_info import get_scvi_tools_info
+    from .get_seaborn_info import get_seaborn_info
+    from .get_sequence_by_pdb_id import get_sequence_by_pdb_id
+    from .get_sequence_lengths_by_pdb_id import get_sequence_lengths_by_pdb_id
+    from .get_sequence_positional_features_by_instance_id import (
+        get_sequence_positional_features_by_instance_id,
+    )
+    from .get_skopt_info import get_skopt_info
+    from .get_souporcell_info import get_souporcell_info
+    from .get_source_organism_by_pdb_id import get_source_organism_by_pdb_id
+    from .get_space_group_by_pdb_id import get_space_group_by_pdb_id
+    from .get_statsmodels_info import get_statsmodels_info
+    from .get_structure_determination_software_by_pdb_id import (
+        get_structure_determination_software_by_pdb_id,
+    )
+    from .get_structure_title_by_pdb_id import get_structure_title_by_pdb_id
+    from .get_structure_validation_metrics_by_pdb_id import (
+        get_structure_validation_metrics_by_pdb_id,
+    )
+    from .get_sunpy_info import get_sunpy_info
+    from .get_sympy_info import get_sympy_info
+    from .get_target_cofactor_info import get_target_cofactor_info
+    from .get_taxonomy_by_pdb_id import get_taxonomy_by_pdb_id
+    from .get_tiledb_info import get_tiledb_info
+    from .get_tiledbsoma_info import get_tiledbsoma_info
+    from .get_tool_info import get_tool_info
+    from .get_torch_geometric_info import get_torch_geometric_info
+    from .get_tqdm_info import get_tqdm_info
+    from .get_trackpy_info import get_trackpy_info
+    from .get_tskit_info import get_tskit_info
+    from .get_umap_learn_info import get_umap_learn_info
+    from .get_uniprot_accession_by_entity_id import get_uniprot_accession_by_entity_id
+    from .get_velocyto_info import get_velocyto_info
+    from .get_viennarna_info import get_viennarna_info
+    from .get_webpage_text_from_url import get_webpage_text_from_url
+    from .get_webpage_title import get_webpage_title
+    from .get_xarray_info import get_xarray_info
+    from .get_xesmf_info import get_xesmf_info
+    from .get_xgboost_info import get_xgboost_info
+    from .get_zarr_info import get_zarr_info
+    from .gnomad_get_gene_constraints import gnomad_get_gene_constraints
+    from .grep_tools import grep_tools
+    from .gwas_get_association_by_id import gwas_get_association_by_id
+    from .gwas_get_associations_for_snp import gwas_get_associations_for_snp
+    from .gwas_get_associations_for_study import gwas_get_associations_for_study
+    from .gwas_get_associations_for_trait import gwas_get_associations_for_trait
+    from .gwas_get_snp_by_id import gwas_get_snp_by_id
+    from .gwas_get_snps_for_gene import gwas_get_snps_for_gene
+    from .gwas_get_studies_for_trait import gwas_get_studies_for_trait
+    from .gwas_get_study_by_id import gwas_get_study_by_id
+    from .gwas_get_variants_for_trait import gwas_get_variants_for_trait
+    from .gwas_search_associations import gwas_search_associations
+    from .gwas_search_snps import gwas_search_snps
+    from .gwas_search_studies import gwas_search_studies
+    from .humanbase_ppi_analysis import humanbase_ppi_analysis
+    from .icd_search_codes import icd_search_codes
+    from .kegg_find_genes import kegg_find_genes
+    from .kegg_get_gene_info import kegg_get_gene_info
+    from .kegg_get_pathway_info import kegg_get_pathway_info
+    from .kegg_list_organisms import kegg_list_organisms
+    from .kegg_search_pathway import kegg_search_pathway
+    from .list_tools import list_tools
+    from .loinc_search_codes import loinc_search_codes
+    from .mesh_get_subjects_by_pharmacological_action import (
+        mesh_get_subjects_by_pharmacological_action,
+    )
+    from .mesh_get_subjects_by_subject_id import mesh_get_subjects_by_subject_id
+    from .mesh_get_subjects_by_subject_name import mesh_get_subjects_by_subject_name
+    from .mesh_get_subjects_by_subject_scope_or_definition import (
+        mesh_get_subjects_by_subject_scope_or_definition,
+    )
+    from .odphp_itemlist import odphp_itemlist
+    from .odphp_myhealthfinder import odphp_myhealthfinder
+    from .odphp_outlink_fetch import odphp_outlink_fetch
+    from .odphp_topicsearch import odphp_topicsearch
+    from .ols_find_similar_terms import ols_find_similar_terms
+    from .ols_get_ontology_info import ols_get_ontology_info
+    from .ols_get_term_ancestors import ols_get_term_ancestors
+    from .ols_get_term_children import ols_get_term_children
+    from .ols_get_term_info import ols_get_term_info
+    from .ols_search_ontologies import ols_search_ontologies
+    from .ols_search_terms import ols_search_terms
+    from .open_deep_research_agent import open_deep_research_agent
+    from .openalex_literature_search import openalex_literature_search
+    from .python_code_executor import python_code_executor
+    from .python_script_runner import python_script_runner
+    from .reactome_disease_target_score import reactome_disease_target_score
+    from .search_clinical_trials import search_clinical_trials
+    from .snomed_search_concepts import snomed_search_concepts
+    from .umls_get_concept_details import umls_get_concept_details
+    from .umls_search_concepts import umls_search_concepts
+    from .visualize_molecule_2d import visualize_molecule_2d
+    from .visualize_molecule_3d import visualize_molecule_3d
+    from .visualize_protein_structure_3d import visualize_protein_structure_3d
+    from .web_api_documentation_search import web_api_documentation_search
+    from .web_search import web_search
+    from .who_gho_get_data import who_gho_get_data
+    from .who_gho_query_health_data import who_gho_query_health_data
 
 __all__ = [
     "get_shared_client",
@@ -2032,3 +2109,36 @@ __all__ = [
     "who_gho_get_data",
     "who_gho_query_health_data",
 ]
+
+_TOOL_NAMES = frozenset(__all__[2:])
+
+# Wrappers live in the module of the same name, except for these
+_MODULE_NAMES = {
+    "clinvar_search_variants": "ClinVar_search_variants",
+    "dbsnp_get_variant_by_rsid": "dbSNP_get_variant_by_rsid",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _TOOL_NAMES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f".{_MODULE_NAMES.get(name, name)}", __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | _TOOL_NAMES)
+
+
+class _ToolsModule(types.ModuleType):
+    def __setattr__(self, name: str, value: Any) -> None:
+        # Importing a wrapper module binds it on the package; keep the
+        # wrapper function there instead, as the eager imports used to
+        if name in _TOOL_NAMES and isinstance(value, types.ModuleType):
+            value = getattr(value, name, value)
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _ToolsModule
@@ -14,6 +14,12 @@ Configuration:
     the initial creation of the ToolUniverse instance. These parameters are
     ignored if the client has already been initialized.
 
+On-Demand Loading:
+    The shared client starts with no tools loaded and reads each tool's
+    config the first time that tool is called, so a script that uses a few
+    wrappers never loads the whole catalog. Set
+    TOOLUNIVERSE_LOAD_ON_DEMAND=false to load every tool up front instead.
+
 Custom Instance:
     You can provide your own ToolUniverse instance to be used instead of
     the shared singleton. This is useful when you need specific configurations
@@ -36,6 +42,7 @@ Examples:
         reset_shared_client()
 """
 
+import os
 import threading
 from typing import Optional
 from tooluniverse import ToolUniverse
@@ -99,11 +106,14 @@ def get_shared_client(
             # Check again inside the lock to avoid race conditions
             if _client is None:
                 # Create new instance with provided configuration
-                if config_kwargs:
-                    _client = ToolUniverse(**config_kwargs)
-                else:
-                    _client = ToolUniverse()
-                _client.load_tools()
+                config_kwargs.setdefault(
+                    "load_on_demand",
+                    os.getenv("TOOLUNIVERSE_LOAD_ON_DEMAND", "true").lower()
+                    in ("true", "1", "yes"),
+                )
+                _client = ToolUniverse(**config_kwargs)
+                if not _client.load_on_demand:
+                    _client.load_tools()
 
     return _client
 
@@ -79,7 +79,7 @@ class UMLSRESTTool(BaseTool):
             pass
 
         try:
-            resp = requests.get(url, params=params, timeout=30)
+            resp = self.http_get(url, params=params, timeout=30)
             resp.raise_for_status()
             data = resp.json()
             return {
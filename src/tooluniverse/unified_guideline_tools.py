@@ -249,7 +249,6 @@ class PubMedGuidelinesTool(BaseTool):
     def __init__(self, tool_config):
         super().__init__(tool_config)
         self.base_url = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils"
-        self.session = requests.Session()
 
     def run(self, arguments):
         query = arguments.get("query", "")
@@ -277,7 +276,7 @@ class PubMedGuidelinesTool(BaseTool):
             if api_key:
                 search_params["api_key"] = api_key
 
-            search_response = self.session.get(
+            search_response = self.http_get(
                 f"{self.base_url}/esearch.fcgi", params=search_params, timeout=30
             )
             search_response.raise_for_status()
@@ -289,21 +288,18 @@ class PubMedGuidelinesTool(BaseTool):
             if not pmids:
                 return []
 
-            # Get details for PMIDs
-            time.sleep(0.5)  # Be respectful with API calls
-
+            # Get details for PMIDs; the shared NCBI budget paces the calls
             detail_params = {"db": "pubmed", "id": ",".join(pmids), "retmode": "json"}
             if api_key:
                 detail_params["api_key"] = api_key
 
-            detail_response = self.session.get(
+            detail_response = self.http_get(
                 f"{self.base_url}/esummary.fcgi", params=detail_params, timeout=30
             )
             detail_response.raise_for_status()
             detail_data = detail_response.json()
 
             # Fetch abstracts using efetch
-            time.sleep(0.5)
             abstract_params = {
                 "db": "pubmed",
                 "id": ",".join(pmids),
@@ -313,7 +309,7 @@ class PubMedGuidelinesTool(BaseTool):
             if api_key:
                 abstract_params["api_key"] = api_key
 
-            abstract_response = self.session.get(
+            abstract_response = self.http_get(
                 f"{self.base_url}/efetch.fcgi", params=abstract_params, timeout=30
             )
             abstract_response.raise_for_status()
@@ -610,7 +606,8 @@ class EuropePMCGuidelinesTool(BaseTool):
                 "rettype": "abstract",
             }
 
-            response = self.session.get(base_url, params=params, timeout=15)
+            # Through the shared transport, so it counts against the NCBI budget
+            response = self.http_get(base_url, params=params, timeout=15)
             response.raise_for_status()
 
             # Parse XML response
@@ -1353,7 +1350,7 @@ class OpenAlexGuidelinesTool(BaseTool):
             if filters:
                 params["filter"] = ",".join(filters)
 
-            response = requests.get(self.base_url, params=params, timeout=30)
+            response = self.http_get(self.base_url, params=params, timeout=30)
             response.raise_for_status()
 
             data = response.json()
@@ -1,7 +1,9 @@
-import time
+import copy
 import requests
 from typing import Any, Dict, Optional
+from . import deadline
 from .base_tool import BaseTool, ToolError
+from .job_scheduler import PENDING, JobTimeoutError, get_job_scheduler
 from .tool_registry import register_tool
 
 
@@ -172,7 +174,7 @@ class UniProtRESTTool(BaseTool):
         url = "https://rest.uniprot.org/uniprotkb/search"
 
         try:
-            resp = requests.get(url, params=params, timeout=self.timeout)
+            resp = self.http_get(url, params=params, timeout=self.timeout)
             resp.raise_for_status()
             data = resp.json()
 
@@ -267,72 +269,99 @@ class UniProtRESTTool(BaseTool):
         payload = {"ids": ids, "from": from_db_normalized, "to": to_db_normalized}
 
         try:
-            resp = requests.post(submit_url, json=payload, timeout=self.timeout)
+            resp = self.http_post(submit_url, json=payload, timeout=self.timeout)
             resp.raise_for_status()
             job_data = resp.json()
             job_id = job_data.get("jobId")
+        except requests.exceptions.Timeout:
+            return {"error": "Request to UniProt API timed out"}
+        except requests.exceptions.RequestException as e:
+            return {"error": f"Request to UniProt API failed: {e}"}
+        except ValueError as e:
+            return {"error": f"Failed to parse JSON response: {e}"}
+
+        if not job_id:
+            return {"error": "Failed to get job ID from UniProt ID mapping"}
+
+        # Step 2: Poll for job completion
+        status_url = f"https://rest.uniprot.org/idmapping/status/{job_id}"
+        results_url = f"https://rest.uniprot.org/idmapping/results/{job_id}"
+
+        def poll():
+            status = self.http_get(status_url, timeout=self.timeout).json()
+            status = status.get("status")
+            return status if status in ("FINISHED", "FAILED") else PENDING
+
+        # The shared scheduler polls with backoff, stopping at the caller's
+        # deadline if it comes first. Fetching the results follows the job on
+        # a continuation thread, so a batch worker is free while UniProt maps
+        # the IDs.
+        max_wait_time = deadline.budget(max_wait_time)
+        job = get_job_scheduler().submit(
+            poll, timeout=max_wait_time, name=f"UniProt ID mapping {job_id}"
+        )
+        return self.defer(
+            job.then(
+                lambda job: self._id_mapping_results(job, results_url, max_wait_time)
+            )
+        )
+
+    def _id_mapping_results(
+        self, job, results_url: str, max_wait_time: Optional[float]
+    ) -> Any:
+        """Fetch and format the results of a finished ID mapping job."""
+        try:
+            try:
+                status = job.result()
+            except JobTimeoutError:
+                return {
+                    "error": (f"ID mapping timed out after {max_wait_time:g} seconds")
+                }
 
-            if not job_id:
-                return {"error": "Failed to get job ID from UniProt ID mapping"}
-
-            # Step 2: Poll for job completion
-            status_url = f"https://rest.uniprot.org/idmapping/status/{job_id}"
-            results_url = f"https://rest.uniprot.org/idmapping/results/{job_id}"
-
-            start_time = time.time()
-            while time.time() - start_time < max_wait_time:
-                status_resp = requests.get(status_url, timeout=self.timeout)
-                status_data = status_resp.json()
-
-                if status_data.get("status") == "FINISHED":
-                    # Step 3: Retrieve results
-                    results_resp = requests.get(results_url, timeout=self.timeout)
-                    results_data = results_resp.json()
-
-                    # Format results
-                    formatted_results = []
-                    failed = []
-
-                    # Extract mappings
-                    results = results_data.get("results", [])
-                    for result in results:
-                        from_value = result.get("from", "")
-                        to_values = result.get("to", {}).get("results", [])
-
-                        if to_values:
-                            for to_item in to_values:
-                                to_info = to_item.get("to", {})
-                                gene_names = to_info.get("geneNames", [])
-                                gene_name = ""
-                                if gene_names:
-                                    gene_name = gene_names[0].get("value", "")
-
-                                formatted_results.append(
-                                    {
-                                        "from": from_value,
-                                        "to": {
-                                            "accession": to_info.get(
-                                                "primaryAccession", ""
-                                            ),
-                                            "id": to_info.get("uniProtkbId", ""),
-                                            "gene_name": gene_name,
-                                        },
-                                    }
-                                )
-                        else:
-                            failed.append(from_value)
-
-                    return {
-                        "mapped_count": len(formatted_results),
-                        "results": formatted_results,
-                        "failed": list(set(failed)) if failed else [],
-                    }
-                elif status_data.get("status") == "FAILED":
-                    return {"error": "ID mapping job failed"}
-
-                time.sleep(1)  # Wait 1 second before next poll
-
-            return {"error": (f"ID mapping timed out after {max_wait_time} seconds")}
+            if status == "FINISHED":
+                # Step 3: Retrieve results
+                results_resp = self.http_get(results_url, timeout=self.timeout)
+                results_data = results_resp.json()
+
+                # Format results
+                formatted_results = []
+                failed = []
+
+                # Extract mappings
+                results = results_data.get("results", [])
+                for result in results:
+                    from_value = result.get("from", "")
+                    to_values = result.get("to", {}).get("results", [])
+
+                    if to_values:
+                        for to_item in to_values:
+                            to_info = to_item.get("to", {})
+                            gene_names = to_info.get("geneNames", [])
+                            gene_name = ""
+                            if gene_names:
+                                gene_name = gene_names[0].get("value", "")
+
+                            formatted_results.append(
+                                {
+                                    "from": from_value,
+                                    "to": {
+                                        "accession": to_info.get(
+                                            "primaryAccession", ""
+                                        ),
+                                        "id": to_info.get("uniProtkbId", ""),
+                                        "gene_name": gene_name,
+                                    },
+                                }
+                            )
+                    else:
+                        failed.append(from_value)
+
+                return {
+                    "mapped_count": len(formatted_results),
+                    "results": formatted_results,
+                    "failed": list(set(failed)) if failed else [],
+                }
+            return {"error": "ID mapping job failed"}
 
         except requests.exceptions.Timeout:
             return {"error": "Request to UniProt API timed out"}
@@ -351,16 +380,21 @@ class UniProtRESTTool(BaseTool):
         elif mapping_type == "async":
             return self._handle_id_mapping(arguments)
 
-        # Build URL for standard accession-based queries
-        url = self._build_url(arguments)
+        # Build URL for standard accession-based queries. The entry tools
+        # each project a different part of the same document, so the fetched
+        # entry is shared through the upstream cache. The URL uses the
+        # canonical arguments, so case variants of an accession fetch the
+        # entry their cache key names.
+        url = self._build_url(self.canonicalize_arguments(arguments))
         try:
-            resp = requests.get(url, timeout=self.timeout)
-            if resp.status_code != 200:
-                return {
-                    "error": (f"UniProt API returned status code: {resp.status_code}"),
-                    "detail": resp.text,
-                }
-            data = resp.json()
+            data = self.http_get_json(url, timeout=self.timeout)
+        except requests.exceptions.HTTPError as e:
+            return {
+                "error": (
+                    f"UniProt API returned status code: {e.response.status_code}"
+                ),
+                "detail": e.response.text,
+            }
         except requests.exceptions.Timeout:
             return {"error": "Request to UniProt API timed out"}
         except requests.exceptions.RequestException as e:
@@ -378,9 +412,9 @@ class UniProtRESTTool(BaseTool):
             elif isinstance(result, dict) and "error" in result:
                 return result
 
-            return result
+            return copy.deepcopy(result)
 
-        return data
+        return copy.deepcopy(data)
 
     # Method bindings for backward compatibility
     def get_entry_by_accession(self, accession: str) -> Any:
@@ -27,7 +27,7 @@ class UnpaywallTool(BaseTool):
         url = f"{self.base_url}{doi}"
         params = {"email": email}
         try:
-            response = requests.get(
+            response = self.http_get(
                 url,
                 params=params,
                 timeout=20,
@@ -38,7 +38,7 @@ class URLHTMLTagTool(BaseTool):
 
         timeout = arguments.get("timeout", 20)
         try:
-            resp = requests.get(url, timeout=timeout)
+            resp = self.http_get(url, timeout=timeout)
         except requests.Timeout:
             return {"error": "Request timed out."}
         except Exception as e:
@@ -190,13 +190,13 @@ class URLToPDFTextTool(BaseTool):
 
         # First, check if the URL returns HTML or a downloadable file
         try:
-            resp = requests.head(url, timeout=timeout, allow_redirects=True)
+            resp = self.http_request("HEAD", url, timeout=timeout, allow_redirects=True)
             content_type = resp.headers.get("Content-Type", "").lower()
             # If it's not HTML, handle it as a simple text download
             is_html = "text/html" in content_type or "application/xhtml" in content_type
             if not is_html:
                 # Download the file directly and return its text content
-                resp = requests.get(url, timeout=timeout, allow_redirects=True)
+                resp = self.http_get(url, timeout=timeout, allow_redirects=True)
                 if resp.status_code != 200:
                     return {"error": f"HTTP {resp.status_code}"}
                 text = resp.text
@@ -468,6 +468,81 @@ def validate_query(query: Dict[str, Any]) -> bool:
     return True
 
 
+def coerce_value_to_type(value: Any, schema: dict) -> Any:
+    """
+    Coerce a value to match the schema's expected type.
+
+    This function attempts to convert string values to integers, floats,
+    or booleans when the schema expects those types. This makes the
+    system more lenient with user input from LLMs that provide numeric
+    values as strings.
+
+    Args:
+        value: The value to coerce
+        schema: The JSON schema definition for this value
+
+    Returns:
+        The coerced value (or original if coercion fails or not applicable)
+    """
+    # Only coerce string values
+    if not isinstance(value, str):
+        return value
+
+    # Handle anyOf/oneOf schemas by recursively trying each option
+    if "anyOf" in schema:
+        for option in schema["anyOf"]:
+            coerced = coerce_value_to_type(value, option)
+            if coerced is not value:  # Coercion succeeded
+                return coerced
+        return value
+
+    if "oneOf" in schema:
+        for option in schema["oneOf"]:
+            coerced = coerce_value_to_type(value, option)
+            if coerced is not value:  # Coercion succeeded
+                return coerced
+        return value
+
+    # Handle array types
+    if schema.get("type") == "array" and "items" in schema:
+        if isinstance(value, list):
+            # Recursively coerce array items
+            items_schema = schema["items"]
+            return [coerce_value_to_type(item, items_schema) for item in value]
+        return value
+
+    # Get the expected type
+    expected_type = schema.get("type")
+
+    # Don't coerce if schema expects string type
+    if expected_type == "string":
+        return value
+
+    # Try to coerce based on expected type
+    if expected_type == "integer":
+        try:
+            # Only parse as int if it represents an integer (not a float)
+            if "." not in value:
+                return int(value)
+        except (ValueError, TypeError):
+            # If coercion fails, return the original value as per function design
+            pass
+    elif expected_type == "number":
+        try:
+            return float(value)
+        except (ValueError, TypeError):
+            pass
+    elif expected_type == "boolean":
+        # Handle common boolean string representations
+        lower_value = value.lower().strip()
+        if lower_value in ("true", "1", "yes", "on"):
+            return True
+        elif lower_value in ("false", "0", "no", "off"):
+            return False
+
+    return value
+
+
 def normalize_gene_symbol(gene_symbol: str) -> str:
     """
     Normalize a gene symbol to standard format.
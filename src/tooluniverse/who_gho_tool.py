@@ -135,7 +135,7 @@ class WHOGHORESTTool(BaseTool):
                 odata_params["$skip"] = params["skip"]
 
         try:
-            resp = requests.get(url, params=odata_params, timeout=30)
+            resp = self.http_get(url, params=odata_params, timeout=30)
             resp.raise_for_status()
             data = resp.json()
             return {
@@ -351,7 +351,7 @@ class WHOGHORESTTool(BaseTool):
             odata_params["$top"] = params["top"]
 
         try:
-            resp = requests.get(url, params=odata_params, timeout=30)
+            resp = self.http_get(url, params=odata_params, timeout=30)
             resp.raise_for_status()
             data = resp.json()
             return {"data": data}
@@ -33,7 +33,7 @@ class WikidataSPARQLTool(BaseTool):
             "User-Agent": "ToolUniverse/1.0 (https://github.com)",
         }
         try:
-            resp = requests.get(
+            resp = self.http_get(
                 self.endpoint,
                 params={"query": sparql, "format": "json"},
                 headers=headers,
@@ -53,7 +53,7 @@ class WikipediaSearchTool(BaseTool):
         }
 
         try:
-            resp = requests.get(api_url, params=params, headers=headers, timeout=30)
+            resp = self.http_get(api_url, params=params, headers=headers, timeout=30)
             resp.raise_for_status()
             data = resp.json()
 
@@ -157,7 +157,7 @@ class WikipediaContentTool(BaseTool):
         }
 
         try:
-            resp = requests.get(api_url, params=params, headers=headers, timeout=30)
+            resp = self.http_get(api_url, params=params, headers=headers, timeout=30)
             resp.raise_for_status()
             data = resp.json()
 
@@ -37,7 +37,7 @@ class ZenodoTool(BaseTool):
             params["communities"] = community
 
         try:
-            resp = requests.get(self.base_url, params=params, timeout=20)
+            resp = self.http_get(self.base_url, params=params, timeout=20)
             resp.raise_for_status()
             data = resp.json()
         except requests.RequestException as e:
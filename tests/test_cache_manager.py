@@ -1,6 +1,7 @@
 import os
 import sys
 import time
+from enum import Enum, IntEnum
 from pathlib import Path
 from tempfile import TemporaryDirectory
 
@@ -12,6 +13,8 @@ if str(SRC_PATH) not in sys.path:
     sys.path.insert(0, str(SRC_PATH))
 
 from tooluniverse.cache.result_cache_manager import ResultCacheManager
+from tooluniverse.cache.serialization import is_json_compatible
+from tooluniverse.cache.sqlite_backend import PersistentCache
 
 
 def test_memory_cache_roundtrip():
@@ -85,3 +88,315 @@ def test_persistent_cache_survives_restart():
         persisted = manager2.get(namespace="tool", version="v1", cache_key="persist")
         assert persisted == {"foo": "bar"}
         manager2.close()
+
+
+def test_async_writer_commits_in_batches():
+    with TemporaryDirectory() as tmpdir:
+        cache_path = os.path.join(tmpdir, "cache.sqlite")
+        manager = ResultCacheManager(
+            memory_size=8,
+            persistent_path=cache_path,
+            enabled=True,
+            persistence_enabled=True,
+            singleflight=False,
+            async_persist=True,
+            async_batch_size=50,
+            async_max_latency=0.2,
+        )
+
+        for idx in range(200):
+            manager.set(
+                namespace="tool",
+                version="v1",
+                cache_key=f"key-{idx}",
+                value={"idx": idx},
+            )
+        manager.flush()
+
+        writer = manager.stats()["async_writer"]
+        assert writer["entries_written"] == 200
+        assert writer["batches_committed"] < 200
+        assert writer["queue_depth"] == 0
+        assert manager.persistent.stats()["entries"] == 200
+
+        started = time.monotonic()
+        manager.close()
+        assert time.monotonic() - started < 1.0
+
+
+def test_persistent_hits_are_read_only_until_flushed():
+    with TemporaryDirectory() as tmpdir:
+        cache = PersistentCache(os.path.join(tmpdir, "cache.sqlite"))
+        cache.set("a", {"v": 1}, namespace="tool", version="v1", ttl=None)
+        cache.set("b", {"v": 2}, namespace="tool", version="v1", ttl=None)
+
+        assert cache.get("a").value == {"v": 1}
+        entries = cache.get_many(["a", "b", "missing"])
+        assert set(entries) == {"a", "b"}
+        assert entries["b"].value == {"v": 2}
+
+        # Hits are buffered in memory, not written per read
+        assert cache.get("a").hit_count == 0
+        assert cache.stats()["pending_access_updates"] == 2
+
+        assert cache.flush_access_stats() == 2
+        assert cache.get("a").hit_count == 3
+        assert cache.get("b").hit_count == 1
+        cache.close()
+
+
+def test_bulk_get_reads_persistent_tier_in_one_query():
+    with TemporaryDirectory() as tmpdir:
+        cache_path = os.path.join(tmpdir, "cache.sqlite")
+        manager = ResultCacheManager(
+            memory_size=8,
+            persistent_path=cache_path,
+            enabled=True,
+            persistence_enabled=True,
+            singleflight=False,
+            async_persist=False,
+        )
+        for idx in range(3):
+            manager.set(namespace="tool", version="v1", cache_key=f"k{idx}", value=idx)
+        manager.memory.clear()
+
+        calls = []
+        original = manager.persistent.get_many
+
+        def spy(keys):
+            calls.append(list(keys))
+            return original(keys)
+
+        manager.persistent.get_many = spy
+        requests = [
+            {"namespace": "tool", "version": "v1", "cache_key": key}
+            for key in ("k0", "k1", "k2", "nope")
+        ]
+        hits = manager.bulk_get(requests)
+
+        assert len(calls) == 1
+        assert sorted(hits.values()) == [0, 1, 2]
+        assert manager.get(namespace="tool", version="v1", cache_key="k1") == 1
+        manager.close()
+
+
+def test_memory_tier_respects_byte_budget():
+    manager = ResultCacheManager(
+        memory_size=None,
+        memory_max_bytes=20_000,
+        memory_max_entry_bytes=15_000,
+        persistent_path=None,
+        enabled=True,
+        persistence_enabled=False,
+        singleflight=False,
+    )
+
+    manager.set(namespace="big", version="v1", cache_key="huge", value="x" * 50_000)
+    assert manager.get(namespace="big", version="v1", cache_key="huge") is None
+
+    for idx in range(10):
+        manager.set(
+            namespace="small" if idx % 2 else "medium",
+            version="v1",
+            cache_key=f"k{idx}",
+            value="y" * 4_000,
+        )
+
+    memory = manager.stats()["memory"]
+    assert memory["current_bytes"] <= 20_000
+    assert memory["rejected"] == 1
+    assert memory["evictions"] > 0
+    assert sum(memory["namespace_bytes"].values()) == memory["current_bytes"]
+    # Most recent entry survives, oldest was evicted
+    assert manager.get(namespace="small", version="v1", cache_key="k9") is not None
+    assert manager.get(namespace="medium", version="v1", cache_key="k0") is None
+
+
+def test_persistent_codecs_and_legacy_rows():
+    import pickle
+    import sqlite3
+
+    with TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "cache.sqlite")
+
+        # Simulate a cache file written before the codec column existed
+        conn = sqlite3.connect(path)
+        conn.execute(
+            """
+            CREATE TABLE cache_entries (
+                cache_key TEXT PRIMARY KEY, namespace TEXT NOT NULL, version TEXT,
+                value BLOB NOT NULL, ttl INTEGER, created_at REAL NOT NULL,
+                last_accessed REAL NOT NULL, expires_at REAL,
+                hit_count INTEGER NOT NULL DEFAULT 0
+            )
+            """
+        )
+        conn.execute(
+            "INSERT INTO cache_entries VALUES (?, ?, ?, ?, NULL, ?, ?, NULL, 0)",
+            ("legacy", "tool", "v1", pickle.dumps({"old": True}), 1.0, 1.0),
+        )
+        conn.commit()
+        conn.close()
+
+        cache = PersistentCache(path, compress_min_bytes=1024)
+        large = {"text": "abstract " * 2000, "ids": list(range(50))}
+        cache.set("json", large, namespace="tool", version="v1", ttl=None)
+        cache.set("tuple", (1, 2), namespace="tool", version="v1", ttl=None)
+
+        assert cache.get("legacy").value == {"old": True}
+        assert cache.get("json").value == large
+        assert cache.get("tuple").value == (1, 2)
+
+        codecs = cache.stats()["codecs"]
+        assert codecs["pickle"] == 2
+        assert any(name.startswith("json+") for name in codecs)
+        assert cache.stats()["approx_bytes"] < len(large["text"])
+        cache.close()
+
+
+class Level(IntEnum):
+    HIGH = 3
+
+
+class Color(str, Enum):
+    RED = "red"
+
+
+def test_scalar_subclasses_keep_their_type():
+    assert is_json_compatible({"a": [1, 2.5, "x", True, None]})
+    assert not is_json_compatible(Level.HIGH)
+    assert not is_json_compatible({"color": [Color.RED]})
+
+    with TemporaryDirectory() as tmpdir:
+        cache = PersistentCache(os.path.join(tmpdir, "cache.sqlite"))
+        cache.set("enum", {"level": Level.HIGH}, namespace="t", version="v1", ttl=None)
+        value = cache.get("enum").value["level"]
+        assert type(value) is Level
+        cache.close()
+
+
+def test_persistent_cache_evicts_lru_rows_over_budget():
+    with TemporaryDirectory() as tmpdir:
+        manager = ResultCacheManager(
+            memory_size=2,
+            persistent_path=os.path.join(tmpdir, "cache.sqlite"),
+            enabled=True,
+            persistence_enabled=True,
+            singleflight=False,
+            async_persist=False,
+            persistent_max_bytes=20_000,
+            persistent_namespace_max_bytes={"noisy": 5_000},
+        )
+        persistent = manager.persistent
+        # Incompressible payloads so stored size is predictable
+        for idx in range(10):
+            manager.set(
+                namespace="tool",
+                version="v1",
+                cache_key=f"k{idx}",
+                value=os.urandom(3_000),
+            )
+        for idx in range(4):
+            manager.set(
+                namespace="noisy",
+                version="v1",
+                cache_key=f"n{idx}",
+                value=os.urandom(3_000),
+            )
+        hot = manager.compose_key("tool", "v1", "k0")
+        persistent.get(hot)
+
+        result = manager.compact()
+        stats = persistent.stats()
+        assert result["evicted_entries"] > 0
+        assert stats["approx_bytes"] <= 20_000
+        assert stats["evicted_bytes"] == result["evicted_bytes"]
+        noisy = [e for e in persistent.iter_entries(namespace="noisy")]
+        assert sum(len(e.value) for e in noisy) <= 5_000
+        # Recently read entry survives eviction
+        assert persistent.get(hot) is not None
+        assert persistent.get(manager.compose_key("tool", "v1", "k1")) is None
+        manager.close()
+
+
+def test_existing_cache_file_switches_to_incremental_vacuum():
+    import sqlite3
+
+    with TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "cache.sqlite")
+
+        # A cache file created before auto_vacuum was enabled
+        conn = sqlite3.connect(path)
+        conn.execute("CREATE TABLE filler (data BLOB)")
+        conn.commit()
+        conn.close()
+        cache = PersistentCache(path)
+        for idx in range(40):
+            cache.set(
+                f"k{idx}", os.urandom(4_000), namespace="tool", version="v1", ttl=None
+            )
+        cache.close()
+        conn = sqlite3.connect(path)
+        assert conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 0
+        conn.close()
+
+        cache = PersistentCache(path, max_bytes=20_000)
+        assert cache._conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2
+        before = os.path.getsize(path)
+        assert cache.compact()["evicted_entries"] > 0
+        cache._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        assert os.path.getsize(path) < before
+        cache.close()
+
+
+def test_cross_process_singleflight_via_leases():
+    import threading
+
+    with TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "cache.sqlite")
+
+        def make_manager():
+            # Separate managers (and SQLite connections) stand in for processes
+            return ResultCacheManager(
+                memory_size=8,
+                persistent_path=path,
+                enabled=True,
+                persistence_enabled=True,
+                cross_process=True,
+                lease_ttl=5,
+            )
+
+        leader, follower = make_manager(), make_manager()
+        composed = leader.compose_key("tool", "v1", "shared")
+        fetches = []
+        follower_result = {}
+
+        def follower_call():
+            with follower.singleflight_guard(composed):
+                value = follower.get(namespace="tool", version="v1", cache_key="shared")
+                if value is None:
+                    fetches.append("follower")
+                follower_result["value"] = value
+
+        with leader.singleflight_guard(composed):
+            thread = threading.Thread(target=follower_call)
+            thread.start()
+            time.sleep(0.3)
+            assert thread.is_alive()  # blocked on the leader's lease
+            fetches.append("leader")
+            leader.set(namespace="tool", version="v1", cache_key="shared", value=42)
+        thread.join(timeout=5)
+
+        assert fetches == ["leader"]
+        assert follower_result["value"] == 42
+        assert follower.stats()["cross_process"]["waited"] == 1
+
+        # A crashed holder's lease expires and can be taken over
+        crashed = leader.compose_key("tool", "v1", "orphan")
+        assert leader.persistent.try_acquire_lease(crashed, "dead-worker", 0.2)
+        assert not follower.persistent.try_acquire_lease(crashed, "other", 5)
+        time.sleep(0.25)
+        assert follower.persistent.try_acquire_lease(crashed, "other", 5)
+
+        leader.close()
+        follower.close()
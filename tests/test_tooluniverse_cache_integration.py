@@ -235,3 +235,115 @@ def test_batch_run_deduplicates_work(tool_config):
             tu.close()
         finally:
             _restore_env(old_env)
+
+
+def test_stale_while_revalidate(tool_config):
+    with TemporaryDirectory() as tmpdir:
+        env_vars, old_env = _with_env(
+            TOOLUNIVERSE_CACHE_PATH=str(Path(tmpdir) / "cache.sqlite")
+        )
+        try:
+            CountingTool.call_count = 0
+            tu = ToolUniverse(tool_files={}, keep_default_tools=False)
+            _register_tool(tu, dict(tool_config, cache_ttl=1, stale_ttl=60))
+
+            first = _call(tu, 4)
+            assert first["calls"] == 1
+
+            import time
+
+            time.sleep(1.1)
+            stale = _call(tu, 4)
+            assert stale == first  # served immediately from the stale entry
+
+            deadline = time.time() + 5
+            while CountingTool.call_count < 2 and time.time() < deadline:
+                time.sleep(0.05)
+            tu.cache_manager.flush()
+            assert CountingTool.call_count == 2
+
+            refreshed = _call(tu, 4)
+            assert refreshed["calls"] == 2
+            assert CountingTool.call_count == 2
+
+            tu.close()
+        finally:
+            _restore_env(old_env)
+
+
+class FailingTool(BaseTool):
+    call_count = 0
+
+    def run(self, arguments, **kwargs):
+        FailingTool.call_count += 1
+        raise ConnectionError("upstream unavailable")
+
+
+def test_error_results_are_negatively_cached():
+    with TemporaryDirectory() as tmpdir:
+        env_vars, old_env = _with_env(
+            TOOLUNIVERSE_CACHE_PATH=str(Path(tmpdir) / "cache.sqlite")
+        )
+        try:
+            FailingTool.call_count = 0
+            tu = ToolUniverse(tool_files={}, keep_default_tools=False)
+            tu.register_custom_tool(
+                FailingTool,
+                tool_config={
+                    "name": "FailingToolTest",
+                    "type": "FailingTool",
+                    "description": "Always fails",
+                    "error_cache_ttl": 30,
+                    "parameter": {"type": "object", "properties": {}},
+                },
+            )
+
+            call = {"name": "FailingToolTest", "arguments": {}}
+            first = tu.run_one_function(dict(call), use_cache=True)
+            second = tu.run_one_function(dict(call), use_cache=True)
+
+            assert "error" in first
+            assert second == first
+            assert FailingTool.call_count == 1
+            # Negative entries are memory-only
+            tu.cache_manager.flush()
+            assert not list(tu.dump_cache(namespace="FailingToolTest"))
+
+            tu.close()
+        finally:
+            _restore_env(old_env)
+
+
+def test_warm_cache_preloads_and_prefetches(tool_config):
+    with TemporaryDirectory() as tmpdir:
+        env_vars, old_env = _with_env(
+            TOOLUNIVERSE_CACHE_PATH=str(Path(tmpdir) / "cache.sqlite")
+        )
+        try:
+            CountingTool.call_count = 0
+            config = dict(tool_config, cache_ttl=30)
+            tu1 = ToolUniverse(tool_files={}, keep_default_tools=False)
+            _register_tool(tu1, config)
+            _call(tu1, 11)
+            _call(tu1, 11)
+            tu1.close()
+
+            os.environ["TOOLUNIVERSE_CACHE_WARM_TOP_N"] = "10"
+            tu2 = ToolUniverse(tool_files={}, keep_default_tools=False)
+            assert tu2.get_cache_stats()["memory"]["current_size"] == 1
+
+            _register_tool(tu2, config)
+            summary = tu2.warm_cache(top_n=10, prefetch_within=60)
+            assert summary["prefetch_scheduled"] == 1
+
+            import time
+
+            deadline = time.time() + 5
+            while CountingTool.call_count < 2 and time.time() < deadline:
+                time.sleep(0.05)
+            assert CountingTool.call_count == 2  # refreshed ahead of expiry
+
+            tu2.close()
+        finally:
+            os.environ.pop("TOOLUNIVERSE_CACHE_WARM_TOP_N", None)
+            _restore_env(old_env)
@@ -0,0 +1,44 @@
+"""
+Fixtures shared by the unit tests that load a small tool catalog from disk.
+
+A test module describes its catalog with a ``tool_catalog`` fixture mapping
+each category to a list of configs (built with ``tool_config``); the
+``tool_files`` fixture writes every category to ``<category>.json`` in
+``tool_dir`` and returns the ``tool_files`` mapping ToolUniverse expects.
+Override ``tool_dir`` to write the files somewhere other than ``tmp_path``.
+"""
+
+import json
+
+import pytest
+
+
+def _tool_config(name, tool_type="EchoTool", *, properties=None, **extra):
+    return {
+        "name": name,
+        "type": tool_type,
+        "description": f"{name} tool",
+        "parameter": {"type": "object", "properties": properties or {}},
+        **extra,
+    }
+
+
+@pytest.fixture
+def tool_config():
+    """``tool_config(name, tool_type="EchoTool", properties=None, **extra)``"""
+    return _tool_config
+
+
+@pytest.fixture
+def tool_dir(tmp_path):
+    return tmp_path
+
+
+@pytest.fixture
+def tool_files(tool_dir, tool_catalog):
+    files = {}
+    for category, configs in tool_catalog.items():
+        path = tool_dir / f"{category}.json"
+        path.write_text(json.dumps(configs))
+        files[category] = str(path)
+    return files
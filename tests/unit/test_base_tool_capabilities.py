@@ -6,6 +6,7 @@ This module tests the new capabilities added to BaseTool:
 - validate_parameters()
 - handle_error()
 - get_cache_key()
+- canonicalize_arguments()
 - supports_streaming()
 - supports_caching()
 - get_tool_info()
@@ -185,6 +186,23 @@ class TestBaseToolCapabilities:
             assert isinstance(result, ToolServerError)
             assert "Unexpected error" in str(result)
 
+    def test_validate_parameters_reuses_compiled_validator(self):
+        """Test that the schema is checked and compiled only once per tool."""
+        import jsonschema
+
+        with patch.object(
+            jsonschema.Draft7Validator,
+            "check_schema",
+            wraps=jsonschema.Draft7Validator.check_schema,
+        ) as check_schema:
+            for value in ("a", "b", "c"):
+                assert self.tool.validate_parameters({"required_param": value}) is None
+            error = self.tool.validate_parameters({"optional_param": "x"})
+
+        assert check_schema.call_count == 1
+        assert isinstance(error, ToolValidationError)
+        assert "required_param" in str(error)
+
     def test_get_cache_key(self):
         """Test cache key generation."""
         arguments = {"param1": "value1", "param2": 42}
@@ -212,6 +230,57 @@ class TestBaseToolCapabilities:
         # All should be the same
         assert all(key == keys[0] for key in keys)
 
+    def test_get_cache_key_canonicalizes_equivalent_calls(self):
+        """Test that semantically equivalent calls share a cache key."""
+        tool = TestTool({
+            "name": "gene_tool",
+            "parameter": {
+                "type": "object",
+                "properties": {
+                    "gene": {"type": "string"},
+                    "limit": {"type": "integer", "default": 10},
+                    "species": {"type": ["string", "null"]},
+                },
+            },
+            "cache_key_normalizers": {"gene": ["strip", "upper"]},
+        })
+
+        base = tool.get_cache_key({"gene": "TP53", "limit": 10})
+        assert tool.get_cache_key({"gene": "TP53"}) == base
+        assert tool.get_cache_key({"gene": " tp53", "limit": "10"}) == base
+        assert tool.get_cache_key({"gene": "TP53", "species": None}) == base
+        assert tool.get_cache_key({"gene": "TP53", "limit": 20}) != base
+
+        assert tool.canonicalize_arguments({"gene": "brca1"}) == {
+            "gene": "BRCA1",
+            "limit": 10,
+        }
+
+    def test_canonicalize_arguments_null_parameter(self):
+        """Test that a tool config with "parameter": null is handled."""
+        tool = TestTool({"name": "no_schema_tool", "parameter": None})
+        assert tool.canonicalize_arguments({"x": 1, "y": None}) == {"x": 1}
+
+    @pytest.mark.parametrize(
+        "file_name, tool_name, argument",
+        [
+            ("hpa_tools.json", "HPA_get_subcellular_location", "gene_name"),
+            ("uniprot_tools.json", "UniProt_get_function_by_accession", "accession"),
+        ],
+    )
+    def test_bundled_identifier_normalizers(self, file_name, tool_name, argument):
+        """Test that case variants of bundled identifiers share a cache key."""
+        from pathlib import Path
+        import tooluniverse
+
+        data_dir = Path(tooluniverse.__file__).parent / "data"
+        configs = json.loads((data_dir / file_name).read_text())
+        config = next(c for c in configs if c["name"] == tool_name)
+        tool = TestTool(config)
+        assert tool.get_cache_key({argument: " tp53"}) == tool.get_cache_key(
+            {argument: "TP53"}
+        )
+
     def test_supports_streaming(self):
         """Test streaming support detection."""
         assert self.tool.supports_streaming() is True
@@ -323,5 +392,98 @@ class TestBackwardCompatibility:
         ToolServerError("test message")
 
 
+@pytest.mark.unit
+class TestPerClassState:
+    """Defaults files and cache-version fingerprints are read once per class."""
+
+    def test_defaults_file_read_once_until_changed(self, tmp_path):
+        """Defaults are parsed once and re-read when the file changes."""
+        import os
+
+        defaults_file = tmp_path / "defaultstool_defaults.json"
+        defaults_file.write_text(json.dumps({"defaultstool_defaults": {"a": 1}}))
+
+        class DefaultsTool(TestTool):
+            @classmethod
+            def get_default_config_file(cls):
+                return defaults_file
+
+        with patch.object(
+            DefaultsTool, "_read_defaults_file", wraps=DefaultsTool._read_defaults_file
+        ) as read:
+            first = DefaultsTool({"name": "one"})
+            first.tool_config["a"] = 99
+            second = DefaultsTool({"name": "two"})
+            assert read.call_count == 1
+            assert second.tool_config == {"a": 1, "name": "two"}
+
+            defaults_file.write_text(json.dumps({"defaultstool_defaults": {"a": 22}}))
+            stat = defaults_file.stat()
+            os.utime(defaults_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+            assert DefaultsTool({"name": "three"}).tool_config["a"] == 22
+            assert read.call_count == 2
+
+    def test_cache_version_source_read_once(self):
+        """The class source is read once and the version is unchanged."""
+
+        class VersionTool(TestTool):
+            pass
+
+        config = {"name": "v", "parameter": {"type": "object"}}
+        with patch(
+            "tooluniverse.base_tool.inspect.getsource", return_value="source"
+        ) as getsource:
+            versions = {VersionTool(config).get_cache_version() for _ in range(3)}
+        assert getsource.call_count == 1
+        assert len(versions) == 1
+
+        import hashlib
+
+        expected = hashlib.sha256()
+        for part in ("1", "source", json.dumps(config["parameter"], sort_keys=True)):
+            expected.update(part.encode("utf-8"))
+        assert versions == {expected.hexdigest()[:16]}
+
+    def test_cache_version_uses_static_fingerprint(self):
+        """Classes in the static registry use its digest without reading
+        their source; other classes fall back to the source."""
+
+        class BundledTool(TestTool):
+            pass
+
+        with patch("tooluniverse.base_tool.inspect.getsource") as getsource, patch(
+            "tooluniverse.base_tool._static_class_fingerprint", return_value="abc"
+        ):
+            version = BundledTool({"name": "b"}).get_cache_version()
+        assert getsource.call_count == 0
+
+        class UnknownTool(TestTool):
+            pass
+
+        with patch(
+            "tooluniverse.base_tool.inspect.getsource", return_value="source"
+        ) as getsource:
+            assert UnknownTool({"name": "b"}).get_cache_version() != version
+        assert getsource.call_count == 1
+
+    def test_static_fingerprints_match_sources(self):
+        """The checked-in class digests match the sources. If this fails,
+        run ``python src/tooluniverse/generate_lazy_registry.py``."""
+        from tooluniverse._lazy_registry_static import (
+            STATIC_CLASS_FINGERPRINTS,
+            STATIC_LAZY_REGISTRY,
+        )
+        from tooluniverse.base_tool import _static_class_fingerprint
+        from tooluniverse.generate_lazy_registry import build_class_fingerprints
+
+        current = build_class_fingerprints(STATIC_LAZY_REGISTRY)
+        stale = sorted(
+            name
+            for name in current.keys() | STATIC_CLASS_FINGERPRINTS.keys()
+            if current.get(name) != STATIC_CLASS_FINGERPRINTS.get(name)
+        )
+        assert stale == []
+        assert _static_class_fingerprint(BaseTool) == current["base_tool.BaseTool"]
+
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Tests for per-host circuit breakers and hedged requests in the HTTP transport.
+"""
+
+import io
+import threading
+import time
+
+import pytest
+import requests
+
+from tooluniverse.base_tool import BaseTool
+from tooluniverse.circuit_breaker import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    CircuitBreaker,
+    CircuitOpenError,
+    get_circuit_breakers,
+    reset_circuit_breakers,
+)
+from tooluniverse.exceptions import ToolUnavailableError
+from tooluniverse.http_client import HTTPTransport
+
+
+def _response(status_code=200):
+    response = requests.Response()
+    response.status_code = status_code
+    response.raw = io.BytesIO(b"")
+    return response
+
+
+@pytest.fixture(autouse=True)
+def fresh_breakers():
+    """Isolate breaker state between tests."""
+    reset_circuit_breakers()
+    yield
+    reset_circuit_breakers()
+
+
+@pytest.mark.unit
+class TestCircuitBreaker:
+    """State transitions of a single breaker."""
+
+    def test_opens_after_failure_rate_exceeded(self):
+        """Enough failures in the window open the circuit."""
+        breaker = CircuitBreaker("api.example.org", min_calls=4, failure_rate=0.5)
+        for success in (True, False, True, False):
+            breaker.before_call()
+            breaker.record(success, 0.01)
+        assert breaker.state == OPEN
+
+        with pytest.raises(ToolUnavailableError) as excinfo:
+            breaker.before_call()
+        assert excinfo.value.details["host"] == "api.example.org"
+        assert breaker.stats()["rejected"] == 1
+
+    def test_open_error_is_a_requests_connection_error(self):
+        """Tools that catch RequestException keep handling the fast failure."""
+        breaker = CircuitBreaker("api.example.org", min_calls=1)
+        breaker.record(False)
+        with pytest.raises(requests.exceptions.RequestException):
+            breaker.before_call()
+
+    def test_half_open_probe_closes_on_success(self):
+        """After the cool-down one probe is let through; success closes."""
+        breaker = CircuitBreaker("api.example.org", min_calls=1, open_seconds=0.05)
+        breaker.record(False)
+        assert breaker.state == OPEN
+        time.sleep(0.06)
+
+        probe = breaker.before_call()
+        assert probe is not None
+        assert breaker.state == HALF_OPEN
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()  # only one probe at a time
+        breaker.record(True, 0.01, probe)
+        assert breaker.state == CLOSED
+
+    def test_failed_probe_reopens(self):
+        """A failing probe sends the circuit back to open."""
+        breaker = CircuitBreaker("api.example.org", min_calls=1, open_seconds=0.01)
+        breaker.record(False)
+        time.sleep(0.02)
+        probe = breaker.before_call()
+        breaker.record(False, probe=probe)
+        assert breaker.state == OPEN
+        assert breaker.times_opened == 2
+
+    def test_only_probe_resolves_half_open(self):
+        """Calls that started before the circuit opened do not decide it."""
+        breaker = CircuitBreaker("api.example.org", min_calls=1, open_seconds=0.05)
+        assert breaker.before_call() is None  # started while closed
+        breaker.record(False)
+        assert breaker.state == OPEN
+        time.sleep(0.06)
+
+        probe = breaker.before_call()
+        breaker.record(True, 0.01)  # the earlier call finishes first
+        assert breaker.state == HALF_OPEN
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()  # the probe slot is still taken
+        breaker.record(False)
+        assert breaker.state == HALF_OPEN
+
+        breaker.record(True, 0.01, probe)
+        assert breaker.state == CLOSED
+
+    def test_slow_calls_count_as_failures(self):
+        """Responses slower than slow_call_seconds feed the failure rate."""
+        breaker = CircuitBreaker("api.example.org", min_calls=2, slow_call_seconds=1)
+        breaker.record(True, 2.0)
+        breaker.record(True, 3.0)
+        assert breaker.state == OPEN
+
+    def test_handle_error_keeps_classification(self):
+        """BaseTool.handle_error passes already-classified errors through."""
+
+        class Tool(BaseTool):
+            def run(self, arguments=None):
+                return None
+
+        error = CircuitOpenError("circuit open", details={"host": "x"})
+        assert Tool({"name": "t"}).handle_error(error) is error
+
+
+@pytest.mark.unit
+class TestTransportResilience:
+    """Breaker and hedging wired into HTTPTransport."""
+
+    def test_server_errors_trip_breaker(self, monkeypatch):
+        """Repeated 5xx responses make later calls fail without sending."""
+        monkeypatch.setenv("TOOLUNIVERSE_CIRCUIT_MIN_CALLS", "3")
+        reset_circuit_breakers()
+        sent = []
+
+        def _fake(session, method, url, **kwargs):
+            sent.append(url)
+            return _response(503)
+
+        monkeypatch.setattr(requests.sessions.Session, "request", _fake)
+        transport = HTTPTransport(retries=0)
+        for _ in range(3):
+            assert transport.get("https://down.example.org/x").status_code == 503
+        with pytest.raises(ToolUnavailableError):
+            transport.get("https://down.example.org/x")
+        assert len(sent) == 3
+        # Other hosts are unaffected
+        assert transport.get("https://up.example.org/x").status_code == 503
+
+    def test_hedged_get_returns_first_response(self, monkeypatch):
+        """A slow GET is duplicated once it passes the host's p95."""
+        calls = []
+        lock = threading.Lock()
+
+        def _fake(session, method, url, **kwargs):
+            with lock:
+                calls.append(url)
+                first = len(calls) == 1
+            if first:
+                time.sleep(0.5)
+            return _response(200)
+
+        monkeypatch.setattr(requests.sessions.Session, "request", _fake)
+        transport = HTTPTransport(hedge=True)
+        breaker = get_circuit_breakers().breaker("https://slow.example.org")
+        for _ in range(20):
+            breaker.record(True, 0.02)
+
+        start = time.monotonic()
+        response = transport.get("https://slow.example.org/item")
+        elapsed = time.monotonic() - start
+
+        assert response.status_code == 200
+        assert elapsed < 0.4
+        assert len(calls) == 2
+        assert transport.stats()["hedges_won"] == 1
+        transport.close()
+
+    def test_post_is_never_hedged(self, monkeypatch):
+        """Non-idempotent requests go out exactly once."""
+        calls = []
+
+        def _fake(session, method, url, **kwargs):
+            calls.append(method)
+            time.sleep(0.05)
+            return _response(200)
+
+        monkeypatch.setattr(requests.sessions.Session, "request", _fake)
+        transport = HTTPTransport(hedge=True)
+        breaker = get_circuit_breakers().breaker("https://slow.example.org")
+        for _ in range(20):
+            breaker.record(True, 0.001)
+
+        transport.post("https://slow.example.org/submit", json={})
+        assert calls == ["POST"]
+        assert transport.stats()["hedges_sent"] == 0
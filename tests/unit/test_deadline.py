@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Tests for end-to-end deadline propagation.
+"""
+
+import io
+import json
+import os
+import time
+
+import pytest
+import requests
+
+os.environ.setdefault("TOOLUNIVERSE_LIGHT_IMPORT", "1")
+
+from tooluniverse import ToolUniverse
+from tooluniverse import deadline
+from tooluniverse.base_tool import BaseTool
+from tooluniverse.circuit_breaker import reset_circuit_breakers
+from tooluniverse.deadline import DeadlineExceededError, deadline_scope
+from tooluniverse.exceptions import ToolUnavailableError
+from tooluniverse.http_client import HTTPTransport
+
+
+class SleepTool(BaseTool):
+    """Sleeps for ``seconds`` and echoes them back."""
+
+    def run(self, arguments=None, **kwargs):
+        seconds = float(arguments.get("seconds", 0))
+        time.sleep(seconds)
+        return {"slept": seconds}
+
+
+def _sleep_universe():
+    tu = ToolUniverse(tool_files={}, keep_default_tools=False)
+    tu.register_custom_tool(
+        SleepTool,
+        tool_config={
+            "name": "SleepTool",
+            "type": "SleepTool",
+            "description": "Sleeps for deadline tests",
+            "cacheable": False,
+            "parameter": {
+                "type": "object",
+                "properties": {"seconds": {"type": "number"}},
+                "required": ["seconds"],
+            },
+        },
+    )
+    return tu
+
+
+@pytest.fixture(autouse=True)
+def fresh_breakers():
+    """Isolate breaker state between tests."""
+    reset_circuit_breakers()
+    yield
+    reset_circuit_breakers()
+
+
+@pytest.mark.unit
+class TestDeadlineScope:
+    """Context-local deadline bookkeeping."""
+
+    def test_no_deadline_by_default(self):
+        """Outside a scope nothing is clamped."""
+        assert deadline.remaining() is None
+        assert deadline.clamp_timeout(30) == 30
+        assert deadline.budget(5) == 5
+        deadline.check()
+
+    def test_nested_scopes_only_tighten(self):
+        """An inner scope cannot extend the outer budget."""
+        with deadline_scope(0.5) as outer:
+            with deadline_scope(10) as inner:
+                assert inner == outer
+            with deadline_scope(0.1) as tighter:
+                assert tighter < outer
+            with deadline_scope(None) as unchanged:
+                assert unchanged == outer
+        assert deadline.current_deadline() is None
+
+    def test_clamp_timeout_forms(self):
+        """Numbers, (connect, read) tuples and None are all clamped."""
+        with deadline_scope(2):
+            assert deadline.clamp_timeout(30) <= 2
+            assert deadline.clamp_timeout(0.5) == 0.5
+            connect, read = deadline.clamp_timeout((1, None))
+            assert connect == 1 and 0 < read <= 2
+            assert 0 < deadline.clamp_timeout(None) <= 2
+
+    def test_expired_deadline_raises(self):
+        """With no time left requests fail fast with a retriable timeout."""
+        with deadline_scope(0):
+            assert deadline.expired()
+            with pytest.raises(DeadlineExceededError) as excinfo:
+                deadline.clamp_timeout(30)
+        error = excinfo.value
+        assert isinstance(error, ToolUnavailableError)
+        assert isinstance(error, requests.exceptions.Timeout)
+        assert error.retriable
+
+    def test_sleep_stops_at_deadline(self):
+        """Polling waits end when the deadline does."""
+        start = time.monotonic()
+        with deadline_scope(0.05):
+            deadline.sleep(5)
+        assert time.monotonic() - start < 1
+
+
+@pytest.mark.unit
+class TestTransportDeadline:
+    """The shared HTTP transport honours the active deadline."""
+
+    def test_request_timeout_clamped(self, monkeypatch):
+        """A 30 s tool timeout shrinks to the time left in the scope."""
+        seen = {}
+
+        def _fake(session, method, url, **kwargs):
+            seen["timeout"] = kwargs["timeout"]
+            response = requests.Response()
+            response.status_code = 200
+            response.raw = io.BytesIO(b"")
+            return response
+
+        monkeypatch.setattr(requests.sessions.Session, "request", _fake)
+        transport = HTTPTransport(retries=0)
+        with deadline_scope(1):
+            transport.get("https://api.example.org/x", timeout=30)
+        assert 0 < seen["timeout"] <= 1
+
+    def test_expired_deadline_sends_nothing(self, monkeypatch):
+        """Once the budget is spent no request reaches the network."""
+        sent = []
+        monkeypatch.setattr(
+            requests.sessions.Session,
+            "request",
+            lambda session, method, url, **kwargs: sent.append(url),
+        )
+        transport = HTTPTransport(retries=0)
+        with deadline_scope(0):
+            with pytest.raises(DeadlineExceededError):
+                transport.get("https://api.example.org/x")
+        assert sent == []
+
+
+@pytest.mark.unit
+@pytest.mark.timeout(10)
+class TestToolUniverseDeadline:
+    """Deadlines passed to ToolUniverse.run."""
+
+    def test_single_call_past_deadline(self):
+        """A call started after the deadline returns a timeout error."""
+        tu = _sleep_universe()
+        with deadline_scope(0):
+            result = tu.run_one_function(
+                {"name": "SleepTool", "arguments": {"seconds": 0}}, use_cache=False
+            )
+        assert isinstance(result, dict)
+        assert result["error_details"]["type"] == "ToolUnavailableError"
+
+    def test_batch_returns_partial_results(self):
+        """Slow calls past the batch deadline are reported, fast ones kept."""
+        tu = _sleep_universe()
+        calls = [
+            {"name": "SleepTool", "arguments": {"seconds": 0}},
+            {"name": "SleepTool", "arguments": {"seconds": 2}},
+        ]
+        start = time.monotonic()
+        messages = tu.run(calls, use_cache=False, max_workers=2, deadline=0.3)
+        elapsed = time.monotonic() - start
+        results = [json.loads(m["content"])["content"] for m in messages[1:]]
+
+        assert elapsed < 1.5
+        assert results[0] == {"slept": 0.0}
+        assert results[1]["error_details"]["type"] == "ToolUnavailableError"
+        assert "Deadline" in results[1]["error"]
@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared GraphQL client: caching and request batching.
+"""
+
+import json
+import threading
+import time
+
+import pytest
+import requests
+from graphql.language import FieldNode, OperationDefinitionNode, parse
+
+from tooluniverse import http_client
+from tooluniverse.circuit_breaker import reset_circuit_breakers
+from tooluniverse.deadline import DeadlineExceededError, deadline_scope
+from tooluniverse.graphql_client import (
+    GraphQLClient,
+    _batchable,
+    get_schema,
+    parse_query,
+)
+from tooluniverse.graphql_tool import validate_query
+
+ENDPOINT = "https://api.platform.opentargets.org/api/v4/graphql"
+TARGET_QUERY = """
+query targetInfo($ensemblId: String!) {
+  target(ensemblId: $ensemblId) { id ...Symbol }
+}
+fragment Symbol on Target { approvedSymbol }
+"""
+
+
+def _fake_server(requests_seen, delay=0.1, errors=None):
+    """Answer every top-level field with the id passed in its variable."""
+
+    def _respond(session, method, url, **kwargs):
+        body = kwargs["json"]
+        requests_seen.append(body)
+        time.sleep(delay)
+        operation = next(
+            d
+            for d in parse(body["query"]).definitions
+            if isinstance(d, OperationDefinitionNode)
+        )
+        data = {}
+        for field in operation.selection_set.selections:
+            assert isinstance(field, FieldNode)
+            key = (field.alias or field.name).value
+            variable = field.arguments[0].value.name.value
+            value = body["variables"][variable]
+            data[key] = {"id": value, "approvedSymbol": value.upper()}
+        response = requests.Response()
+        response.status_code = 200
+        payload = {"data": data}
+        if errors:
+            payload["errors"] = errors
+        response._content = json.dumps(payload).encode()
+        return response
+
+    return _respond
+
+
+def _run_concurrently(client, ids):
+    results = {}
+
+    def worker(ensembl_id):
+        results[ensembl_id] = client.execute(
+            ENDPOINT, TARGET_QUERY, {"ensemblId": ensembl_id, "size": 5}
+        )
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in ids]
+    for thread in threads:
+        thread.start()
+        time.sleep(0.005)
+    for thread in threads:
+        thread.join()
+    return results
+
+
+@pytest.fixture(autouse=True)
+def fresh_transport():
+    """Isolate transport and breaker state between tests."""
+    reset_circuit_breakers()
+    yield
+    http_client.reset_transport()
+    reset_circuit_breakers()
+
+
+@pytest.mark.unit
+class TestGraphQLCaching:
+    """Schema and query documents are parsed once."""
+
+    def test_schema_and_query_cached(self):
+        """Repeated validation reuses the built schema and parsed query."""
+        schema = (
+            "type Query { target(ensemblId: String!): Target } "
+            "type Target { id: String approvedSymbol: String }"
+        )
+        query = 'query { target(ensemblId: "x") { id } }'
+        assert validate_query(query, schema) is True
+        assert get_schema(schema) is get_schema(schema)
+        assert parse_query(query) is parse_query(query)
+
+    def test_only_plain_queries_are_batchable(self):
+        """Mutations and multi-operation documents are sent on their own."""
+        assert _batchable(TARGET_QUERY)
+        assert not _batchable("mutation { reset }")
+        assert not _batchable("query a { x } query b { y }")
+        assert not _batchable("query { ... on Query { x } }")
+
+
+@pytest.mark.unit
+@pytest.mark.timeout(10)
+class TestGraphQLBatching:
+    """Concurrent calls to one endpoint share a request."""
+
+    def test_concurrent_calls_are_merged_and_split(self, monkeypatch):
+        """Calls arriving while one is in flight go out as one aliased query."""
+        sent = []
+        monkeypatch.setattr(requests.sessions.Session, "request", _fake_server(sent))
+        client = GraphQLClient(batch_window=0.05)
+
+        ids = ["ensg1", "ensg2", "ensg3", "ensg4", "ensg5"]
+        results = _run_concurrently(client, ids)
+
+        # The first call goes out alone; the rest are merged
+        assert len(sent) == 2
+        assert "b0_target: target" in sent[1]["query"]
+        assert "size" not in json.dumps(sent[1]["variables"])
+        for ensembl_id in ids:
+            assert results[ensembl_id] == {
+                "data": {
+                    "target": {
+                        "id": ensembl_id,
+                        "approvedSymbol": ensembl_id.upper(),
+                    }
+                }
+            }
+        assert client.stats()["merged_calls"] == 4
+
+    def test_field_errors_go_to_their_call(self, monkeypatch):
+        """Errors with a path are returned only to the call that caused them."""
+        sent = []
+        errors = [{"message": "not found", "path": ["b1_target", "id"]}]
+        monkeypatch.setattr(
+            requests.sessions.Session, "request", _fake_server(sent, errors=errors)
+        )
+        client = GraphQLClient(batch_window=0.05)
+        client._active[ENDPOINT] = 1  # pretend another call is in flight
+        results = _run_concurrently(client, ["a", "b", "c"])
+
+        assert len(sent) == 1
+        assert "errors" not in results["a"]
+        assert results["b"]["errors"] == [
+            {"message": "not found", "path": ["target", "id"]}
+        ]
+        assert "errors" not in results["c"]
+
+    def test_unattributable_error_falls_back(self, monkeypatch):
+        """A request-level error makes every call retry on its own."""
+        sent = []
+        errors = [{"message": "Variable $b1_ensemblId got invalid value"}]
+        server = _fake_server(sent, delay=0, errors=errors)
+
+        def _respond(session, method, url, **kwargs):
+            response = server(session, method, url, **kwargs)
+            if len(sent) > 1:
+                response._content = json.dumps(
+                    {"data": {"target": {"id": "ok"}}}
+                ).encode()
+            return response
+
+        monkeypatch.setattr(requests.sessions.Session, "request", _respond)
+        client = GraphQLClient(batch_window=0.05)
+        client._active[ENDPOINT] = 1
+        results = _run_concurrently(client, ["a", "b"])
+
+        assert len(sent) == 3
+        assert all(r == {"data": {"target": {"id": "ok"}}} for r in results.values())
+        assert client.stats()["fallbacks"] == 1
+
+    def test_lone_call_is_not_delayed(self, monkeypatch):
+        """With nothing else in flight a call is sent at once."""
+        sent = []
+        monkeypatch.setattr(
+            requests.sessions.Session, "request", _fake_server(sent, delay=0)
+        )
+        client = GraphQLClient(batch_window=5)
+        start = time.monotonic()
+        client.execute(ENDPOINT, TARGET_QUERY, {"ensemblId": "x"})
+        assert time.monotonic() - start < 1
+        assert sent[0]["query"] == TARGET_QUERY
+
+    def test_leader_keeps_its_own_deadline(self, monkeypatch):
+        """The call that sends a merged request still stops at its deadline."""
+        sent = []
+        monkeypatch.setattr(
+            requests.sessions.Session, "request", _fake_server(sent, delay=1.0)
+        )
+        client = GraphQLClient(batch_window=0.05)
+        client._active[ENDPOINT] = 1
+        outcome = {}
+
+        def leader():
+            start = time.monotonic()
+            with deadline_scope(0.2):
+                try:
+                    client.execute(ENDPOINT, TARGET_QUERY, {"ensemblId": "a"})
+                except DeadlineExceededError as exc:
+                    outcome["leader"] = exc
+            outcome["leader_seconds"] = time.monotonic() - start
+
+        def follower():
+            outcome["follower"] = client.execute(
+                ENDPOINT, TARGET_QUERY, {"ensemblId": "b"}
+            )
+
+        threads = [threading.Thread(target=leader), threading.Thread(target=follower)]
+        for thread in threads:
+            thread.start()
+            time.sleep(0.005)
+        for thread in threads:
+            thread.join()
+
+        assert isinstance(outcome["leader"], DeadlineExceededError)
+        assert outcome["leader_seconds"] < 0.5
+        # The call without a deadline still gets its merged result
+        assert len(sent) == 1
+        assert outcome["follower"]["data"]["target"]["id"] == "b"
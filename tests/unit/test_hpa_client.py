@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared Human Protein Atlas data access layer.
+"""
+
+import json
+
+import pytest
+import requests
+
+from tooluniverse.cache.upstream_cache import reset_upstream_cache
+from tooluniverse.hpa_client import HPA_SEARCH_API, HPAClient, reset_hpa_client
+from tooluniverse.hpa_tool import (
+    HPAGetBiologicalProcessTool,
+    HPAGetGeneJSONTool,
+    HPAGetGenePageDetailsTool,
+    HPAGetProteinInteractionsTool,
+    HPAGetSubcellularLocationTool,
+    HPASearchApiTool,
+)
+
+RECORDS = {
+    "TP53": {
+        "Gene": "TP53",
+        "Gene synonym": ["P53"],
+        "Ensembl": "ENSG00000141510",
+        "Biological process": ["Apoptosis", "Transcription"],
+        "Subcellular main location": ["Nucleoplasm"],
+        "Subcellular additional location": [],
+        "Interactions": "MDM2",
+    },
+    "EGFR": {
+        "Gene": "EGFR",
+        "Gene synonym": ["ERBB1"],
+        "Ensembl": "ENSG00000146648",
+        "Biological process": ["Growth"],
+        "Subcellular main location": ["Plasma membrane"],
+        "Subcellular additional location": [],
+        "Interactions": "GRB2",
+    },
+    "TP53BP1": {
+        "Gene": "TP53BP1",
+        "Gene synonym": ["53BP1"],
+        "Ensembl": "ENSG00000067369",
+        "Biological process": ["DNA repair"],
+        "Subcellular main location": ["Nucleoplasm"],
+        "Subcellular additional location": [],
+        "Interactions": "TP53",
+    },
+}
+
+
+class FakeHPA:
+    """Serves search, JSON and XML documents and records each request."""
+
+    def __init__(self, reject_columns=False, exact_first=True):
+        self.reject_columns = reject_columns
+        self.exact_first = exact_first
+        self.calls = []
+
+    def __call__(self, url, params=None, **kwargs):
+        self.calls.append((url, dict(params or {})))
+        response = requests.Response()
+        response.url = url
+        response.status_code = 200
+        if url.endswith(".xml"):
+            response._content = (
+                b"<proteinAtlas><entry><name>TP53</name></entry></proteinAtlas>"
+            )
+        elif url.endswith(".json"):
+            response._content = json.dumps(
+                {"Gene": "TP53", "RNA tissue specific nTPM": {"liver": "3.1"}}
+            ).encode()
+        elif self.reject_columns and len(params["columns"].split(",")) > 4:
+            response.status_code = 400
+            response._content = b"bad column"
+        else:
+            # Like HPA, a term also matches longer gene names; the exact
+            # match usually comes first, but not always
+            terms = [t.strip().upper() for t in params["search"].split(" OR ")]
+            body = [
+                record
+                for term in terms
+                for gene, record in sorted(
+                    RECORDS.items(), key=lambda i: (i[0] != term) == self.exact_first
+                )
+                if gene.startswith(term)
+            ]
+            response._content = json.dumps(body).encode()
+        return response
+
+    def searches(self):
+        return [params for url, params in self.calls if params]
+
+
+@pytest.fixture(autouse=True)
+def fresh_caches():
+    """Each test starts with empty shared caches."""
+    reset_upstream_cache()
+    reset_hpa_client()
+    yield
+    reset_upstream_cache()
+    reset_hpa_client()
+
+
+@pytest.fixture
+def upstream(monkeypatch):
+    fake = FakeHPA()
+    monkeypatch.setattr(
+        HPASearchApiTool, "http_get", lambda tool, url, **kwargs: fake(url, **kwargs)
+    )
+    monkeypatch.setattr(
+        HPAGetGeneJSONTool, "http_get", lambda tool, url, **kwargs: fake(url, **kwargs)
+    )
+    monkeypatch.setattr(
+        HPAGetGenePageDetailsTool,
+        "http_get",
+        lambda tool, url, **kwargs: fake(url, **kwargs),
+    )
+    return fake
+
+
+def _tool(cls, name):
+    return cls({"name": name, "type": cls.__name__, "parameter": {"properties": {}}})
+
+
+@pytest.mark.unit
+class TestHPASharing:
+    """Gene-level tools share their upstream documents."""
+
+    def test_search_tools_share_one_request_per_gene(self, upstream):
+        """Three tools on the same gene make a single search request."""
+        location = _tool(HPAGetSubcellularLocationTool, "loc").run(
+            {"gene_name": "TP53"}
+        )
+        process = _tool(HPAGetBiologicalProcessTool, "bp").run({"gene_name": "TP53"})
+        interactions = _tool(HPAGetProteinInteractionsTool, "ppi").run(
+            {"gene_name": "TP53"}
+        )
+        assert "error" not in location and "error" not in process
+        assert "error" not in interactions
+        assert len(upstream.searches()) == 1
+
+    def test_batch_prefetch_uses_multi_term_search(self, upstream):
+        """A batch loads all its genes with one search query."""
+        tool = _tool(HPAGetBiologicalProcessTool, "bp")
+        tool.prepare_batch([{"gene_name": "TP53"}, {"gene_name": "egfr"}])
+        assert len(upstream.searches()) == 1
+        assert upstream.searches()[0]["search"] == "TP53 OR egfr"
+
+        tool.run({"gene_name": "TP53"})
+        tool.run({"gene_name": "egfr"})
+        assert len(upstream.searches()) == 1
+
+    def test_unmatched_prefetch_falls_back_to_single_request(self, upstream):
+        """Genes missing from a bulk response are fetched on their own."""
+        tool = _tool(HPAGetBiologicalProcessTool, "bp")
+        tool.prepare_batch([{"gene_name": "TP53"}, {"gene_name": "NOPE1"}])
+        result = tool.run({"gene_name": "NOPE1"})
+
+        assert [p["search"] for p in upstream.searches()] == ["TP53 OR NOPE1", "NOPE1"]
+        assert result == {"error": "No gene data found"}
+
+    def test_prefetch_keeps_only_exact_match(self, upstream):
+        """Prefetched entries hold the exact match; single requests keep every
+        fuzzy match. Tools read the first record, so both give one answer."""
+        client = HPAClient()
+        tool = _tool(HPAGetBiologicalProcessTool, "bp")
+        single = client.gene_records("TP53", "g,upbp", upstream)
+        single_result = tool.run({"gene_name": "TP53"})
+        assert [record["Gene"] for record in single] == ["TP53", "TP53BP1"]
+
+        reset_upstream_cache()
+        assert client.prefetch_genes(["TP53", "EGFR"], upstream) == 2
+        assert client.gene_records("TP53", "g,upbp", upstream) == [RECORDS["TP53"]]
+        assert tool.run({"gene_name": "TP53"}) == single_result
+
+    def test_exact_match_moved_first(self, monkeypatch):
+        """A single-gene request puts the exact match first even when HPA
+        lists a longer gene name before it, matching the prefetched entry."""
+        fake = FakeHPA(exact_first=False)
+        monkeypatch.setattr(
+            HPASearchApiTool,
+            "http_get",
+            lambda tool, url, **kwargs: fake(url, **kwargs),
+        )
+        client = HPAClient()
+        tool = _tool(HPAGetBiologicalProcessTool, "bp")
+        single = client.gene_records("TP53", "g,upbp", fake)
+        single_result = tool.run({"gene_name": "TP53"})
+        assert [record["Gene"] for record in single] == ["TP53", "TP53BP1"]
+        raw = fake(HPA_SEARCH_API, params={"search": "TP53", "columns": "g"})
+        assert raw.json()[0]["Gene"] == "TP53BP1"
+
+        reset_upstream_cache()
+        assert client.prefetch_genes(["TP53", "EGFR"], fake) == 2
+        assert tool.run({"gene_name": "TP53"}) == single_result
+
+    def test_rejected_columns_fall_back_to_tool_columns(self, monkeypatch):
+        """If HPA refuses the combined columns, tools ask for their own."""
+        fake = FakeHPA(reject_columns=True)
+        monkeypatch.setattr(
+            HPASearchApiTool,
+            "http_get",
+            lambda tool, url, **kwargs: fake(url, **kwargs),
+        )
+        result = _tool(HPAGetProteinInteractionsTool, "ppi").run({"gene_name": "TP53"})
+        assert "error" not in result
+        assert fake.searches()[-1]["columns"] == "g,gs,ppi"
+
+    def test_documents_cached_and_copied(self, upstream):
+        """JSON documents are fetched once and callers get their own copy."""
+        tool = _tool(HPAGetGeneJSONTool, "json")
+        first = tool.run({"ensembl_id": "ENSG00000141510"})
+        first["RNA tissue specific nTPM"]["liver"] = "changed"
+        second = tool.run({"ensembl_id": "ENSG00000141510"})
+        assert second["RNA tissue specific nTPM"] == {"liver": "3.1"}
+        assert len(upstream.calls) == 1
+
+    def test_xml_tree_parsed_once(self, upstream):
+        """The parsed XML tree is reused by later calls."""
+        client = HPAClient()
+        first = client.gene_xml("ENSG00000141510", upstream)
+        assert client.gene_xml("ENSG00000141510", upstream) is first
+        assert len(upstream.calls) == 1
+
+    def test_not_found_message_kept(self, monkeypatch):
+        """A 404 keeps the tools' existing error message."""
+
+        def missing(tool, url, **kwargs):
+            response = requests.Response()
+            response.status_code = 404
+            response._content = b""
+            return response
+
+        monkeypatch.setattr(HPASearchApiTool, "http_get", missing)
+        result = _tool(HPAGetBiologicalProcessTool, "bp").run({"gene_name": "XYZ"})
+        assert result == {"error": "No data found for gene 'XYZ'"}
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared pooled HTTP transport and its BaseTool hooks.
+"""
+
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from tooluniverse import http_client
+from tooluniverse.base_tool import BaseTool
+from tooluniverse.circuit_breaker import reset_circuit_breakers
+from tooluniverse.deadline import DeadlineExceededError, deadline_scope
+from tooluniverse.http_client import HTTPTransport
+
+
+class RecordingTool(BaseTool):
+    """Tool that only exists to exercise BaseTool.http_* helpers."""
+
+    def run(self, arguments=None):
+        return None
+
+
+@pytest.fixture
+def recorded_requests(monkeypatch):
+    """Capture requests sent through any session instead of hitting the network."""
+    calls = []
+
+    def _record(session, method, url, **kwargs):
+        calls.append({"session": session, "method": method, "url": url, **kwargs})
+        response = requests.Response()
+        response.status_code = 200
+        return response
+
+    monkeypatch.setattr(requests.sessions.Session, "request", _record)
+    reset_circuit_breakers()
+    yield calls
+    http_client.reset_transport()
+    reset_circuit_breakers()
+
+
+@pytest.fixture
+def slow_server():
+    """Local server that answers every request with ``server.status`` after
+    ``server.delay`` seconds."""
+
+    class SlowHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            server.hits += 1
+            server.cookies.append(self.headers.get("Cookie"))
+            time.sleep(server.delay)
+            try:
+                self.send_response(server.status)
+                self.send_header("Set-Cookie", f"session=client{server.hits}")
+                self.send_header("Content-Length", "2")
+                self.end_headers()
+                self.wfile.write(b"{}")
+            except OSError:
+                pass  # the client gave up
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), SlowHandler)
+    server.daemon_threads = True
+    server.delay = 3.0
+    server.status = 200
+    server.hits = 0
+    server.cookies = []
+    server.url = f"http://127.0.0.1:{server.server_port}/slow"
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    reset_circuit_breakers()
+    yield server
+    server.shutdown()
+    server.server_close()
+    reset_circuit_breakers()
+
+
+@pytest.mark.unit
+class TestHTTPTransport:
+    """Pooling, sizing and defaults of HTTPTransport."""
+
+    def test_sessions_are_pooled_per_host(self, recorded_requests):
+        """Requests to one host share a session; other hosts get their own."""
+        transport = HTTPTransport()
+        transport.get("https://rest.uniprot.org/uniprotkb/P05067")
+        transport.get("https://REST.uniprot.org/uniprotkb/search")
+        transport.get("https://www.proteinatlas.org/api/search_download.php")
+
+        sessions = [call["session"] for call in recorded_requests]
+        assert sessions[0] is sessions[1]
+        assert sessions[0] is not sessions[2]
+        assert transport.stats()["sessions_created"] == 2
+
+    def test_default_timeout_applied_when_missing(self, recorded_requests):
+        """Calls without a timeout use the transport default."""
+        transport = HTTPTransport(timeout=7)
+        transport.get("https://example.org/a")
+        transport.get("https://example.org/b", timeout=3)
+
+        assert [call["timeout"] for call in recorded_requests] == [7, 3]
+
+    def test_pool_grows_to_batch_size(self):
+        """ensure_pool_size only ever grows the per-host pools."""
+        transport = HTTPTransport(pool_size=4)
+        session = transport.session_for("https://example.org")
+        transport.ensure_pool_size(16)
+        transport.ensure_pool_size(8)
+
+        adapter = session.get_adapter("https://example.org/x")
+        assert transport.pool_size == 16
+        assert adapter._pool_maxsize == 16
+        transport.close()
+
+    def test_retry_policy_skips_post(self):
+        """Status retries cover idempotent methods only."""
+        transport = HTTPTransport(retries=2)
+        adapter = transport.session_for("https://example.org").get_adapter(
+            "https://example.org"
+        )
+        retry = adapter.max_retries
+        assert retry.total == 2
+        assert 503 in retry.status_forcelist
+        assert "POST" not in retry.allowed_methods
+        transport.close()
+
+    def test_read_timeout_is_not_retried(self, slow_server):
+        """A slow upstream costs one timeout, not one per retry."""
+        transport = HTTPTransport(retries=3, backoff_factor=0.5)
+        start = time.monotonic()
+        with pytest.raises(requests.exceptions.ReadTimeout):
+            transport.get(slow_server.url, timeout=0.5)
+        assert time.monotonic() - start < 1.5
+        assert slow_server.hits == 1
+        transport.close()
+
+    def test_deadline_bounds_slow_request(self, slow_server):
+        """A request against a slow upstream ends at the caller's deadline."""
+        transport = HTTPTransport(retries=3, backoff_factor=0.5)
+        start = time.monotonic()
+        with deadline_scope(1.0):
+            with pytest.raises(DeadlineExceededError):
+                transport.get(slow_server.url)
+        assert time.monotonic() - start < 1.5
+        assert slow_server.hits == 1
+        transport.close()
+
+    def test_retries_stop_before_deadline(self, slow_server):
+        """Status retries whose backoff would overrun the deadline are skipped."""
+        slow_server.delay = 0
+        slow_server.status = 503
+        transport = HTTPTransport(retries=3, backoff_factor=0.5)
+        start = time.monotonic()
+        with deadline_scope(1.0):
+            response = transport.get(slow_server.url, timeout=0.3)
+        assert time.monotonic() - start < 1.0
+        assert response.status_code == 503
+        assert slow_server.hits < 4
+        transport.close()
+
+    def test_cookies_not_shared_between_calls(self, slow_server):
+        """Cookies a server sets for one caller are not sent with the next."""
+        slow_server.delay = 0
+        transport = HTTPTransport(retries=0)
+        transport.get(slow_server.url)
+        transport.get(slow_server.url)
+        transport.get(slow_server.url, cookies={"explicit": "1"})
+        assert slow_server.cookies == [None, None, "explicit=1"]
+        assert len(transport.session_for(slow_server.url).cookies) == 0
+        transport.close()
+
+    def test_unresolvable_host_is_not_retried(self):
+        """DNS failures surface immediately instead of walking the backoff."""
+        transport = HTTPTransport(retries=3, backoff_factor=5)
+        start = time.monotonic()
+        with pytest.raises(requests.exceptions.ConnectionError):
+            transport.get("https://tooluniverse-test.invalid/")
+        assert time.monotonic() - start < 5
+        transport.close()
+
+    def test_tool_timeout_used_by_http_helpers(self, recorded_requests):
+        """BaseTool.http_* fall back to the tool's timeout."""
+        tool = RecordingTool({"name": "recording_tool", "timeout": 12})
+        tool.http_get("https://example.org/a")
+        tool.timeout = 5
+        tool.http_post("https://example.org/b", json={})
+
+        assert [call["method"] for call in recorded_requests] == ["GET", "POST"]
+        assert [call["timeout"] for call in recorded_requests] == [12, 5]
+        assert recorded_requests[0]["session"] is recorded_requests[1]["session"]
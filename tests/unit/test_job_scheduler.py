@@ -0,0 +1,337 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared job-polling scheduler and UniProt ID mapping.
+"""
+
+import json
+import threading
+import time
+from concurrent.futures import Future
+
+import pytest
+
+from tooluniverse import ToolUniverse
+from tooluniverse.base_tool import BaseTool
+from tooluniverse.deadline import current_deadline, deadline_scope
+from tooluniverse.job_scheduler import (
+    PENDING,
+    JobScheduler,
+    JobTimeoutError,
+    get_job_scheduler,
+    reset_job_scheduler,
+)
+from tooluniverse.uniprot_tool import UniProtRESTTool
+
+
+def _job(polls_needed, result="done"):
+    """Poll function that finishes after ``polls_needed`` calls."""
+    calls = []
+
+    def poll():
+        calls.append(time.monotonic())
+        return result if len(calls) >= polls_needed else PENDING
+
+    return poll, calls
+
+
+class PendingJobTool(BaseTool):
+    """Submits an upstream job that stays pending for ``seconds``."""
+
+    submitted = 0
+
+    def run(self, arguments=None, **kwargs):
+        PendingJobTool.submitted += 1
+        ready_at = time.monotonic() + arguments["seconds"]
+        job = get_job_scheduler().submit(
+            lambda: "done" if time.monotonic() >= ready_at else PENDING,
+            interval=0.02,
+            backoff=1,
+            jitter=0,
+        )
+        return self.defer(
+            job.then(lambda job: {"tag": arguments["tag"], "status": job.result()})
+        )
+
+
+def _pending_universe():
+    tu = ToolUniverse(tool_files={}, keep_default_tools=False)
+    tu.register_custom_tool(
+        PendingJobTool,
+        tool_config={
+            "name": "PendingJobTool",
+            "type": "PendingJobTool",
+            "description": "Waits on a pending job",
+            "parameter": {
+                "type": "object",
+                "properties": {
+                    "seconds": {"type": "number"},
+                    "tag": {"type": "integer"},
+                },
+                "required": ["seconds", "tag"],
+            },
+        },
+    )
+    return tu
+
+
+def _contents(messages):
+    return [json.loads(m["content"])["content"] for m in messages[1:]]
+
+
+@pytest.fixture
+def scheduler():
+    scheduler = JobScheduler(max_workers=2)
+    yield scheduler
+    scheduler.shutdown()
+
+
+@pytest.mark.unit
+class TestJobScheduler:
+    """Polling, backoff and failure handling."""
+
+    def test_job_result_delivered(self, scheduler):
+        """The caller gets the poll function's final value."""
+        poll, calls = _job(3)
+        handle = scheduler.submit(poll, interval=0.01, jitter=0)
+        assert handle.result(timeout=2) == "done"
+        assert len(calls) == 3
+
+    def test_interval_backs_off(self, scheduler):
+        """Gaps between polls grow by the backoff factor."""
+        poll, calls = _job(4)
+        scheduler.submit(poll, interval=0.02, backoff=2, jitter=0).result(timeout=2)
+        gaps = [b - a for a, b in zip(calls, calls[1:])]
+        assert gaps[0] >= 0.015
+        assert gaps[2] > gaps[0] * 2
+
+    def test_many_jobs_share_few_threads(self, scheduler):
+        """Thirty pending jobs do not need thirty threads."""
+        before = threading.active_count()
+        handles = [
+            scheduler.submit(_job(3, result=i)[0], interval=0.02) for i in range(30)
+        ]
+        assert [h.result(timeout=5) for h in handles] == list(range(30))
+        # One loop thread plus at most max_workers poll threads
+        assert threading.active_count() - before <= 3
+
+    def test_timeout_fails_job(self, scheduler):
+        """A job still pending at its timeout raises JobTimeoutError."""
+        handle = scheduler.submit(lambda: PENDING, timeout=0.1, interval=0.02)
+        with pytest.raises(JobTimeoutError):
+            handle.result(timeout=2)
+
+    def test_poll_exception_fails_job(self, scheduler):
+        """Errors raised while polling reach the caller."""
+
+        def poll():
+            raise ValueError("bad status")
+
+        with pytest.raises(ValueError, match="bad status"):
+            scheduler.submit(poll).result(timeout=2)
+
+    def test_deadline_bounds_wait_and_reaches_poll(self, scheduler):
+        """The caller's deadline shortens the timeout and is seen by polls."""
+        seen = []
+
+        def poll():
+            seen.append(current_deadline())
+            return PENDING
+
+        with deadline_scope(0.1) as active:
+            handle = scheduler.submit(poll, timeout=30, interval=0.02)
+        start = time.monotonic()
+        with pytest.raises(JobTimeoutError):
+            handle.result(timeout=2)
+        assert time.monotonic() - start < 1
+        assert seen and all(d == active for d in seen)
+
+    def test_then_runs_after_job(self, scheduler):
+        """A continuation sees the finished job and resolves its own future."""
+        poll, _ = _job(2)
+        handle = scheduler.submit(poll, interval=0.01, jitter=0)
+        chained = handle.then(lambda job: job.result().upper())
+        assert chained.result(timeout=2) == "DONE"
+
+    def test_then_sees_job_error(self, scheduler):
+        """A job's failure reaches the continuation through result()."""
+        handle = scheduler.submit(lambda: PENDING, timeout=0.05, interval=0.01)
+        chained = handle.then(lambda job: job.result())
+        with pytest.raises(JobTimeoutError):
+            chained.result(timeout=2)
+
+    def test_slow_continuations_do_not_block_polls(self, scheduler):
+        """Continuations run on their own threads, so other jobs keep polling."""
+        slow = [
+            scheduler.submit(_job(1)[0]).then(lambda job: time.sleep(0.5))
+            for _ in range(4)
+        ]
+        time.sleep(0.05)
+        poll, calls = _job(5)
+        start = time.monotonic()
+        scheduler.submit(poll, interval=0.02, jitter=0).result(timeout=2)
+        assert time.monotonic() - start < 0.4
+        assert len(calls) == 5
+        for chained in slow:
+            chained.result(timeout=2)
+
+    def test_cancelled_job_stops_polling(self, scheduler):
+        """A cancelled job is not polled again."""
+        calls = []
+
+        def poll():
+            calls.append(1)
+            return PENDING
+
+        handle = scheduler.submit(poll, first_poll=0.05, interval=0.01)
+        assert handle.cancel()
+        time.sleep(0.1)
+        assert calls == []
+
+
+@pytest.mark.unit
+class TestUniProtIdMapping:
+    """ID mapping waits on the scheduler instead of sleeping."""
+
+    @pytest.fixture(autouse=True)
+    def fresh_scheduler(self):
+        """Use a new process-wide scheduler per test."""
+        reset_job_scheduler()
+        yield
+        reset_job_scheduler()
+
+    def _tool(self):
+        return UniProtRESTTool(
+            {
+                "name": "UniProt_id_mapping",
+                "type": "UniProtRESTTool",
+                "parameter": {"type": "object", "properties": {}},
+                "fields": {
+                    "endpoint": "https://rest.uniprot.org/idmapping/run",
+                    "mapping_type": "async",
+                },
+            }
+        )
+
+    def _patch(self, monkeypatch, statuses):
+        class Response:
+            def __init__(self, payload):
+                self.payload = payload
+
+            def json(self):
+                return self.payload
+
+            def raise_for_status(self):
+                pass
+
+        remaining = list(statuses)
+
+        def fake_get(tool, url, **kwargs):
+            if "/status/" in url:
+                return Response({"status": remaining.pop(0)})
+            return Response(
+                {
+                    "results": [
+                        {
+                            "from": "TP53",
+                            "to": {
+                                "results": [
+                                    {
+                                        "to": {
+                                            "primaryAccession": "P04637",
+                                            "uniProtkbId": "P53_HUMAN",
+                                            "geneNames": [{"value": "TP53"}],
+                                        }
+                                    }
+                                ]
+                            },
+                        }
+                    ]
+                }
+            )
+
+        monkeypatch.setattr(UniProtRESTTool, "http_get", fake_get)
+        monkeypatch.setattr(
+            UniProtRESTTool,
+            "http_post",
+            lambda tool, url, **kwargs: Response({"jobId": "abc"}),
+        )
+
+    def test_mapping_finishes(self, monkeypatch):
+        """A finished job's results are fetched and formatted."""
+        self._patch(monkeypatch, ["RUNNING", "FINISHED"])
+        result = self._tool().run(
+            {"ids": ["TP53"], "from_db": "Gene_Name", "max_wait_time": 10}
+        )
+        assert result["mapped_count"] == 1
+        assert result["results"][0]["to"]["accession"] == "P04637"
+
+    def test_mapping_failure_reported(self, monkeypatch):
+        """A failed job keeps the existing error message."""
+        self._patch(monkeypatch, ["FAILED"])
+        result = self._tool().run({"ids": "TP53", "from_db": "Gene_Name"})
+        assert result == {"error": "ID mapping job failed"}
+
+
+@pytest.mark.unit
+@pytest.mark.timeout(20)
+class TestDeferredBatch:
+    """Pending upstream jobs release their batch worker."""
+
+    @pytest.fixture(autouse=True)
+    def fresh_scheduler(self):
+        reset_job_scheduler()
+        PendingJobTool.submitted = 0
+        yield
+        reset_job_scheduler()
+
+    def test_pending_jobs_do_not_hold_workers(self):
+        """Six half-second jobs on two workers finish together, not in three
+        rounds."""
+        tu = _pending_universe()
+        calls = [
+            {"name": "PendingJobTool", "arguments": {"seconds": 0.5, "tag": i}}
+            for i in range(6)
+        ]
+        start = time.monotonic()
+        messages = tu.run(calls, use_cache=False, max_workers=2)
+        elapsed = time.monotonic() - start
+
+        assert elapsed < 1.2
+        assert _contents(messages) == [{"tag": i, "status": "done"} for i in range(6)]
+
+    def test_sequential_and_direct_calls_wait(self):
+        """Outside a parallel batch, callers get the finished value."""
+        tu = _pending_universe()
+        tool = tu._get_tool_instance("PendingJobTool", cache=True)
+        assert tool.run({"seconds": 0.05, "tag": 1}) == {"tag": 1, "status": "done"}
+        result = tu.run_one_function(
+            {"name": "PendingJobTool", "arguments": {"seconds": 0.05, "tag": 2}}
+        )
+        assert not isinstance(result, Future)
+        assert result == {"tag": 2, "status": "done"}
+
+    def test_deferred_result_cached(self):
+        """A result that arrives later is still written to the result cache."""
+        tu = _pending_universe()
+        calls = [
+            {"name": "PendingJobTool", "arguments": {"seconds": 0.05, "tag": i}}
+            for i in range(2)
+        ]
+        tu.run(calls, use_cache=True, max_workers=2)
+        assert PendingJobTool.submitted == 2
+        cached = tu.run_one_function(calls[0], use_cache=True)
+        assert cached == {"tag": 0, "status": "done"}
+        assert PendingJobTool.submitted == 2
+
+    def test_deadline_reports_pending_jobs(self):
+        """Jobs still pending at the batch deadline get a timeout error."""
+        tu = _pending_universe()
+        calls = [
+            {"name": "PendingJobTool", "arguments": {"seconds": 5, "tag": i}}
+            for i in range(3)
+        ]
+        start = time.monotonic()
+        messages = tu.run(calls, use_cache=False, max_workers=2, deadline=0.3)
+        assert time.monotonic() - start < 2
+        for result in _contents(messages):
+            assert result["error_details"]["type"] == "ToolUnavailableError"
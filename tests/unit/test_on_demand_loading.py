@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Tests for loading tool configs on demand instead of the whole catalog.
+"""
+
+import threading
+
+import pytest
+
+from tooluniverse import ToolUniverse
+from tooluniverse.base_tool import BaseTool
+from tooluniverse.tool_index import build_tool_index
+
+
+class EchoTool(BaseTool):
+    def run(self, arguments=None, **kwargs):
+        return {"tool": self.tool_config["name"], "arguments": arguments}
+
+
+@pytest.fixture
+def tool_catalog(tool_config):
+    def echo(name, **extra):
+        return tool_config(name, properties={"x": {"type": "string"}}, **extra)
+
+    return {
+        "alpha": [echo("alpha_one"), echo("alpha_two")],
+        "beta": [
+            echo("beta_one"),
+            echo("alpha_one", description="duplicate"),
+            echo("beta_keyed", required_api_keys=["ON_DEMAND_TEST_KEY"]),
+        ],
+    }
+
+
+@pytest.fixture
+def tu(tool_files, monkeypatch):
+    monkeypatch.delenv("ON_DEMAND_TEST_KEY", raising=False)
+    tu = ToolUniverse(
+        tool_files=tool_files, keep_default_tools=False, load_on_demand=True
+    )
+    monkeypatch.setattr(
+        tu,
+        "init_tool",
+        lambda tool=None, tool_name=None, add_to_cache=True: EchoTool(tool),
+    )
+    return tu
+
+
+@pytest.mark.unit
+class TestOnDemandLoading:
+    """Only the tools that are used get loaded."""
+
+    def test_index_first_definition_wins(self, tool_files):
+        """The index matches load_tools de-duplication."""
+        index = build_tool_index(tool_files)
+        assert index["alpha_one"] == "alpha"
+        assert index["beta_one"] == "beta"
+
+    def test_loads_only_requested_tools(self, tu):
+        """Loading one tool leaves the rest of its file unloaded."""
+        assert tu.load_tools_on_demand(["alpha_two"]) == []
+        assert list(tu.all_tool_dict) == ["alpha_two"]
+        config = tu.all_tool_dict["alpha_two"]
+        assert config["category"] == "alpha"
+        assert tu.tool_category_dicts["alpha"] == [config]
+
+        assert tu.load_tools_on_demand(["beta_one", "missing"]) == ["missing"]
+        assert sorted(tu.all_tool_dict) == ["alpha_two", "beta_one"]
+
+    def test_missing_api_key_skips_tool(self, tu):
+        """Tools without their API keys are skipped, not reported as missing."""
+        assert tu.load_tools_on_demand(["beta_keyed"]) == []
+        assert "beta_keyed" not in tu.all_tool_dict
+
+    def test_run_loads_tool(self, tu):
+        """Calling a tool loads it without a full load_tools()."""
+        result = tu.run_one_function({"name": "beta_one", "arguments": {"x": "1"}})
+        assert result == {"tool": "beta_one", "arguments": {"x": "1"}}
+        assert list(tu.all_tool_dict) == ["beta_one"]
+        assert tu.load_on_demand
+
+    def test_unknown_tool_falls_back_to_full_load(self, tu):
+        """A name outside every index triggers one full load."""
+        tu.run_one_function({"name": "not_a_tool", "arguments": {}})
+        assert {"alpha_one", "alpha_two", "beta_one"} <= set(tu.all_tool_dict)
+        assert tu.all_tool_dict["alpha_one"]["description"] == "alpha_one tool"
+        assert not tu.load_on_demand
+
+    def test_concurrent_loads_add_tool_once(self, tu):
+        """Threads racing to load the same tool add it once."""
+        barrier = threading.Barrier(8)
+
+        def load():
+            barrier.wait()
+            tu.load_tools_on_demand(["alpha_one"])
+
+        threads = [threading.Thread(target=load) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert [t["name"] for t in tu.all_tools] == ["alpha_one"]
+
+    def test_shared_client_starts_empty(self, monkeypatch):
+        """The wrappers' shared client loads nothing up front."""
+        from tooluniverse.tools import get_shared_client, reset_shared_client
+
+        monkeypatch.delenv("TOOLUNIVERSE_LOAD_ON_DEMAND", raising=False)
+        reset_shared_client()
+        try:
+            client = get_shared_client()
+            assert client.load_on_demand
+            assert client.all_tool_dict == {}
+            client.load_tools_on_demand(["ArXiv_search_papers"])
+            assert list(client.all_tool_dict) == ["ArXiv_search_papers"]
+        finally:
+            reset_shared_client()
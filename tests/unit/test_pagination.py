@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+"""
+Tests for the concurrent pagination engine.
+"""
+
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from tooluniverse.deadline import current_deadline, deadline_scope
+from tooluniverse.graphql_tool import DiseaseTargetScoreTool
+from tooluniverse.openfda_tool import FDADrugLabelGetDrugNamesByIndicationAggregated
+from tooluniverse.pagination import (
+    Page,
+    PageRequest,
+    PaginationSpec,
+    paginate,
+    paginate_json,
+)
+
+
+class FakeListing:
+    """Serves ``total`` integers a page at a time and records each request."""
+
+    def __init__(self, total, delay=0.0, max_size=None):
+        self.total = total
+        self.delay = delay
+        self.max_size = max_size
+        self.requests = []
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, request: PageRequest):
+        with self._lock:
+            self.requests.append(request)
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(self.delay)
+        with self._lock:
+            self.active -= 1
+        size = min(request.size, self.max_size or request.size)
+        start = request.offset if request.cursor is None else request.cursor
+        items = list(range(start, min(start + size, self.total)))
+        next_cursor = start + size if start + size < self.total else None
+        return Page(items, self.total, next_cursor)
+
+
+@pytest.mark.unit
+class TestPaginate:
+    """Ordering, concurrency and stopping rules."""
+
+    def test_offset_pages_fetched_concurrently_in_order(self):
+        """Pages after the first overlap and items keep their order."""
+        listing = FakeListing(1000, delay=0.05)
+        spec = PaginationSpec("offset", page_size=100, max_workers=4)
+        start = time.monotonic()
+        items = list(paginate(listing, spec))
+        elapsed = time.monotonic() - start
+        assert items == list(range(1000))
+        assert listing.peak > 1
+        # Ten pages serially would take ~0.5 s
+        assert elapsed < 0.4
+
+    def test_max_results_stops_early(self):
+        """No pages past max_results are requested."""
+        listing = FakeListing(10_000)
+        spec = PaginationSpec("offset", page_size=100, max_results=250)
+        assert list(paginate(listing, spec)) == list(range(250))
+        assert len(listing.requests) == 3
+
+    def test_page_style_uses_page_numbers(self):
+        """Page style addresses pages by number."""
+        listing = FakeListing(250)
+        spec = PaginationSpec("page", page_size=100)
+        assert list(paginate(listing, spec)) == list(range(250))
+        assert sorted(r.index for r in listing.requests) == [0, 1, 2]
+
+    def test_cursor_style_is_sequential(self):
+        """Cursor pages follow the returned tokens one at a time."""
+        listing = FakeListing(350, delay=0.01)
+        spec = PaginationSpec("cursor", page_size=100, max_workers=4)
+        assert list(paginate(listing, spec)) == list(range(350))
+        assert listing.peak == 1
+        assert [r.cursor for r in listing.requests] == [None, 100, 200, 300]
+
+    def test_server_capped_page_size_is_followed(self):
+        """A page smaller than requested sets the page size."""
+        listing = FakeListing(120, max_size=50)
+        spec = PaginationSpec("offset", page_size=100)
+        assert list(paginate(listing, spec)) == list(range(120))
+
+    def test_unknown_total_falls_back_to_sequential(self):
+        """Without a total, pages are fetched until a short one."""
+        listing = FakeListing(250, delay=0.01)
+
+        def fetch(request):
+            page = listing(request)
+            return page._replace(total=None)
+
+        spec = PaginationSpec("offset", page_size=100, max_workers=4)
+        assert list(paginate(fetch, spec)) == list(range(250))
+        assert listing.peak == 1
+
+    def test_failed_page_ends_listing(self):
+        """A failed page keeps the items before it."""
+        listing = FakeListing(500)
+
+        def fetch(request):
+            return None if request.index == 2 else listing(request)
+
+        spec = PaginationSpec("offset", page_size=100)
+        assert list(paginate(fetch, spec)) == list(range(200))
+
+    def test_workers_capped_by_host_limit(self):
+        """Concurrency never exceeds the host's in-flight cap."""
+        listing = FakeListing(1000, delay=0.02)
+        spec = PaginationSpec("offset", page_size=100, max_workers=8)
+        with patch("tooluniverse.pagination.get_rate_limiter") as get_rate_limiter:
+            get_rate_limiter.return_value.max_in_flight.return_value = 2
+            assert list(paginate(listing, spec, host="example.org")) == list(
+                range(1000)
+            )
+        assert listing.peak <= 2
+
+    def test_workers_inherit_deadline(self):
+        """Page fetches in worker threads see the caller's deadline."""
+        seen = []
+
+        def fetch(request):
+            seen.append(current_deadline())
+            return Page(list(range(request.offset, request.offset + 10)), 40)
+
+        with deadline_scope(30) as active:
+            list(paginate(fetch, PaginationSpec("offset", page_size=10)))
+        assert seen == [active] * 4
+
+
+@pytest.mark.unit
+class TestPaginationSpec:
+    """Config parsing and JSON endpoints."""
+
+    def test_from_config_with_overrides(self):
+        """Overrides win over the config block."""
+        spec = PaginationSpec.from_config(
+            {"style": "page", "page_size": 50, "page_param": "p"}, page_size=20
+        )
+        assert spec.style == "page"
+        assert spec.page_size == 20
+        assert spec.params_for(PageRequest(3, 60, 20)) == {"limit": 20, "p": 3}
+
+    def test_unknown_style_rejected(self):
+        """An unknown style is a configuration error."""
+        with pytest.raises(ValueError):
+            PaginationSpec("bogus")
+
+    def test_paginate_json(self):
+        """JSON endpoints are paginated from the spec's paths."""
+        calls = []
+
+        def request_page(params):
+            calls.append(params)
+            skip = params["skip"]
+            return {
+                "meta": {"total": 25},
+                "results": list(range(skip, min(skip + params["limit"], 25))),
+            }
+
+        spec = PaginationSpec.from_config(
+            {
+                "style": "offset",
+                "offset_param": "skip",
+                "page_size": 10,
+                "total_path": "meta.total",
+            }
+        )
+        items = list(paginate_json(request_page, spec, params={"q": "x"}))
+        assert items == list(range(25))
+        assert all(call["q"] == "x" for call in calls)
+
+
+@pytest.mark.unit
+class TestPaginatedTools:
+    """Tools built on the engine."""
+
+    def test_disease_target_score_merges_pages(self):
+        """All association pages end up in the result, in order."""
+        tool = DiseaseTargetScoreTool(
+            {
+                "name": "disease_target_score",
+                "type": "DiseaseTargetScoreTool",
+                "query_schema": "query { __typename }",
+                "parameter": {"properties": {}},
+                "pagination": {"style": "page", "page_size": 2},
+            }
+        )
+
+        def fake_query(endpoint, query, variables):
+            start = variables["index"] * variables["size"]
+            rows = [
+                {
+                    "target": {"approvedSymbol": f"G{i}", "id": f"ENSG{i}"},
+                    "datasourceScores": [{"id": "chembl", "score": i / 10}],
+                }
+                for i in range(start, min(start + variables["size"], 5))
+            ]
+            return {
+                "data": {
+                    "disease": {
+                        "id": "EFO_1",
+                        "name": "disease",
+                        "associatedTargets": {"count": 5, "rows": rows},
+                    }
+                }
+            }
+
+        with patch("tooluniverse.graphql_tool.execute_query", fake_query):
+            result = tool.run(
+                {"efoId": "EFO_1", "datasourceId": "chembl", "pageSize": 2}
+            )
+        assert result["disease_info"] == {
+            "disease_id": "EFO_1",
+            "disease_name": "disease",
+        }
+        assert [r["target_symbol"] for r in result["target_scores"]] == [
+            "G0",
+            "G1",
+            "G2",
+            "G3",
+            "G4",
+        ]
+
+    def test_fda_aggregation_fetches_all_batches(self):
+        """Every batch is fetched and aggregated by generic name."""
+        tool = FDADrugLabelGetDrugNamesByIndicationAggregated(
+            {
+                "name": "FDA_get_drug_names_by_indication_aggregated",
+                "type": "FDADrugLabelAggregated",
+                "fields": {
+                    "search_fields": {"indication": ["indications_and_usage"]},
+                    "return_fields": ["openfda.brand_name", "openfda.generic_name"],
+                },
+                "parameter": {"properties": {}},
+                "pagination": {"style": "offset", "page_size": 2},
+            }
+        )
+        records = [
+            {"openfda.generic_name": ["ASPIRIN"], "openfda.brand_name": ["A"]},
+            {"openfda.generic_name": ["IBUPROFEN"], "openfda.brand_name": ["B"]},
+            {"openfda.generic_name": ["aspirin"], "openfda.brand_name": ["C"]},
+        ]
+        skips = []
+
+        def fake_search(params, **kwargs):
+            skips.append(params["skip"])
+            skip, limit = params["skip"], params["limit"]
+            return {"meta": {"total": 3}, "results": records[skip : skip + limit]}
+
+        with patch("tooluniverse.openfda_tool.search_openfda", fake_search):
+            result = tool.run({"indication": "pain"})
+        assert sorted(skips) == [0, 2]
+        assert result["meta"]["total_records_processed"] == 3
+        assert result["results"] == [
+            {
+                "generic_name": "ASPIRIN",
+                "indication": "pain",
+                "brand_names": ["A", "C"],
+            },
+            {"generic_name": "IBUPROFEN", "indication": "pain", "brand_names": ["B"]},
+        ]
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Tests for building tool instances concurrently with ToolUniverse.prewarm.
+"""
+
+import threading
+import time
+
+import pytest
+
+from tooluniverse import ToolUniverse, tool_registry
+from tooluniverse.base_tool import BaseTool
+from tooluniverse.tool_registry import get_tool_errors, mark_tool_unavailable
+
+
+class SlowTool(BaseTool):
+    def run(self, arguments=None, **kwargs):
+        return {"tool": self.tool_config["name"]}
+
+
+@pytest.fixture
+def tool_catalog(tool_config):
+    def slow(name, **extra):
+        return tool_config(name, "SlowTool", **extra)
+
+    return {
+        "slow": [
+            slow("io_one"),
+            slow("io_two"),
+            slow("io_three"),
+            slow("cpu_one", init_bound="cpu"),
+            slow("cpu_two", init_bound="cpu"),
+            slow("shared_one", init_group="shared"),
+            slow("shared_two", init_group="shared"),
+            slow("broken"),
+        ]
+    }
+
+
+@pytest.fixture
+def tu(tool_files, monkeypatch):
+    tu = ToolUniverse(tool_files=tool_files, keep_default_tools=False)
+    tu.load_tools()
+    calls = []
+    calls_lock = threading.Lock()
+    delays = {}
+
+    def init_tool(tool=None, tool_name=None, add_to_cache=True):
+        name = tool["name"]
+        with calls_lock:
+            calls.append((name, threading.current_thread().name))
+        time.sleep(delays.get(name, 0.2))
+        if name == "broken":
+            mark_tool_unavailable(name, RuntimeError("no model"))
+            return None
+        instance = SlowTool(tool)
+        if add_to_cache:
+            tu.callable_functions[name] = instance
+        return instance
+
+    monkeypatch.setattr(tu, "init_tool", init_tool)
+    tu.init_calls = calls
+    tu.init_delays = delays
+    yield tu
+    tool_registry._TOOL_ERRORS.pop("broken", None)
+
+
+@pytest.mark.unit
+class TestPrewarm:
+    """Tool constructors run concurrently and are reported per tool."""
+
+    def test_constructors_overlap(self, tu):
+        """Independent constructors run at the same time."""
+        start = time.perf_counter()
+        report = tu.prewarm(["io_one", "io_two", "io_three"], max_workers=3)
+        assert time.perf_counter() - start < 0.5
+        assert {entry["status"] for entry in report.values()} == {"ready"}
+        assert all(entry["seconds"] >= 0.2 for entry in report.values())
+        assert {"io_one", "io_two", "io_three"} <= set(tu.callable_functions)
+
+    def test_group_built_in_order_on_one_thread(self, tu):
+        """Tools sharing an init_group are built one after another."""
+        tu.prewarm(["shared_one", "shared_two", "io_one"], max_workers=4)
+        shared = [call for call in tu.init_calls if call[0].startswith("shared")]
+        assert [name for name, _ in shared] == ["shared_one", "shared_two"]
+        assert shared[0][1] == shared[1][1]
+
+    def test_cpu_bound_share_one_thread(self, tu):
+        """CPU-bound constructors use their own single thread."""
+        tu.prewarm(["cpu_one", "cpu_two", "io_one"], max_workers=4)
+        threads = dict(tu.init_calls)
+        assert threads["cpu_one"] == threads["cpu_two"]
+        assert threads["cpu_one"].startswith("tu-prewarm-cpu")
+        assert not threads["io_one"].startswith("tu-prewarm-cpu")
+
+    def test_failure_reported_and_marked(self, tu):
+        """A failing constructor is reported and the tool marked unavailable."""
+        report = tu.prewarm(["broken", "io_one"])
+        assert report["broken"]["status"] == "failed"
+        assert "no model" in report["broken"]["error"]
+        assert "broken" in get_tool_errors()
+        assert report["io_one"]["status"] == "ready"
+
+    def test_deadline_reports_timeout(self, tu):
+        """Tools still building at the deadline are reported as timeouts."""
+        tu.init_delays["io_two"] = 2.0
+        start = time.perf_counter()
+        report = tu.prewarm(["io_one", "io_two"], max_workers=2, deadline=0.5)
+        assert time.perf_counter() - start < 1.5
+        assert report["io_one"]["status"] == "ready"
+        assert report["io_two"] == {"status": "timeout", "seconds": None}
+
+    def test_cached_and_unknown(self, tu):
+        """Built tools are not rebuilt; unknown names are reported."""
+        tu.prewarm(["io_one"])
+        tu.init_calls.clear()
+        report = tu.prewarm(["io_one", "not_a_tool"])
+        assert report == {
+            "io_one": {"status": "cached", "seconds": 0.0},
+            "not_a_tool": {"status": "unknown", "seconds": 0.0},
+        }
+        assert tu.init_calls == []
+
+    def test_eager_load_tools_uses_prewarm(self, tu):
+        """eager_load_tools builds every loaded tool through prewarm."""
+        tu.eager_load_tools()
+        assert set(tu.callable_functions) == set(tu.all_tool_dict) - {"broken"}
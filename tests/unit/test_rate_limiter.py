@@ -0,0 +1,345 @@
+#!/usr/bin/env python3
+"""
+Tests for the process-wide per-host rate limiter.
+"""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from tooluniverse import http_client
+from tooluniverse.base_tool import BaseTool
+from tooluniverse.circuit_breaker import get_circuit_breakers, reset_circuit_breakers
+from tooluniverse.deadline import DeadlineExceededError, deadline_scope
+from tooluniverse.execute_function import ToolUniverse, _BatchJob
+from tooluniverse.rate_limiter import (
+    HostLimiter,
+    RateLimiterRegistry,
+    get_rate_limiter,
+    host_of,
+    reset_rate_limiter,
+    resolve_budget,
+)
+
+
+class HostTool(BaseTool):
+    """Tool whose upstream host comes from its config."""
+
+    def run(self, arguments=None):
+        return None
+
+
+@pytest.mark.unit
+class TestHostLimiter:
+    """Token bucket and in-flight cap behaviour."""
+
+    def test_token_bucket_paces_after_burst(self):
+        """Requests beyond the burst are spaced at the configured rate."""
+        limiter = HostLimiter("example.org", rate=20, burst=2)
+        start = time.monotonic()
+        for _ in range(4):
+            limiter.acquire()
+            limiter.release()
+        elapsed = time.monotonic() - start
+        # Two burst tokens are free; the next two wait ~50 ms each
+        assert 0.08 <= elapsed < 0.5
+
+    def test_max_in_flight_caps_concurrency(self):
+        """No more than max_in_flight requests run at once."""
+        limiter = HostLimiter("example.org", max_in_flight=2)
+        active = []
+        peak = []
+        lock = threading.Lock()
+
+        def worker():
+            limiter.acquire()
+            with lock:
+                active.append(1)
+                peak.append(len(active))
+            time.sleep(0.02)
+            with lock:
+                active.pop()
+            limiter.release()
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert max(peak) == 2
+        assert limiter.stats()["requests"] == 8
+
+    def test_penalize_holds_back_callers(self):
+        """A 429 pauses the host for Retry-After seconds."""
+        limiter = HostLimiter("example.org")
+        limiter.penalize(0.1)
+        start = time.monotonic()
+        limiter.acquire()
+        limiter.release()
+        assert time.monotonic() - start >= 0.09
+        assert limiter.stats()["throttled"] == 1
+
+    def test_slot_wait_bounded_by_deadline(self):
+        """A caller queued for a busy slot gives up at its deadline."""
+        limiter = HostLimiter("example.org", max_in_flight=1)
+        limiter.acquire()
+        start = time.monotonic()
+        with deadline_scope(0.2):
+            with pytest.raises(DeadlineExceededError):
+                limiter.acquire()
+        assert time.monotonic() - start < 0.5
+        assert limiter.stats()["in_flight"] == 1
+        assert limiter.stats()["requests"] == 1
+        limiter.release()
+        assert limiter.stats()["in_flight"] == 0
+
+    def test_token_wait_bounded_by_deadline(self):
+        """A token that would arrive after the deadline is handed back."""
+        limiter = HostLimiter("example.org", rate=1, burst=1)
+        limiter.acquire()
+        limiter.release()
+        start = time.monotonic()
+        with deadline_scope(0.2):
+            with pytest.raises(DeadlineExceededError):
+                limiter.acquire()
+        assert time.monotonic() - start < 0.1
+        assert limiter.stats()["in_flight"] == 0
+        assert limiter.stats()["requests"] == 1
+        # The next caller waits for one token, not for the abandoned one too
+        start = time.monotonic()
+        limiter.acquire()
+        limiter.release()
+        assert time.monotonic() - start < 1.2
+
+
+@pytest.mark.unit
+class TestRateLimiterRegistry:
+    """Budget resolution across defaults, tool configs and environment."""
+
+    def test_limiter_shared_per_host(self):
+        """Different URLs on one host share a limiter."""
+        registry = RateLimiterRegistry(overrides={})
+        a = registry.limiter(
+            "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/esearch.fcgi"
+        )
+        b = registry.limiter(
+            "https://EUTILS.ncbi.nlm.nih.gov/entrez/eutils/efetch.fcgi"
+        )
+        assert a is b
+        assert a.rate == 3
+
+    def test_api_key_raises_budget(self, monkeypatch):
+        """requests_per_second_with_key applies when the key env var is set."""
+        config = {
+            "requests_per_second": 3,
+            "api_key_env": "NCBI_API_KEY",
+            "requests_per_second_with_key": 10,
+        }
+        monkeypatch.delenv("NCBI_API_KEY", raising=False)
+        assert resolve_budget(config)["rate"] == 3
+        monkeypatch.setenv("NCBI_API_KEY", "secret")
+        assert resolve_budget(config)["rate"] == 10
+
+    def test_declared_budgets_keep_strictest(self):
+        """Tools declaring the same host cannot loosen each other's budget."""
+        registry = RateLimiterRegistry(overrides={}, default_max_in_flight=0)
+        registry.declare("api.example.org", {"requests_per_second": 5})
+        registry.declare(
+            "api.example.org", {"requests_per_second": 10, "max_in_flight": 2}
+        )
+        limiter = registry.limiter("https://api.example.org/v1")
+        assert limiter.rate == 5
+        assert limiter.max_in_flight == 2
+
+    def test_environment_overrides_win(self):
+        """TOOLUNIVERSE_RATE_LIMITS beats tool declarations and defaults."""
+        registry = RateLimiterRegistry(
+            overrides={"eutils.ncbi.nlm.nih.gov": {"requests_per_second": 1}}
+        )
+        registry.declare("eutils.ncbi.nlm.nih.gov", {"requests_per_second": 3})
+        assert registry.limiter("eutils.ncbi.nlm.nih.gov").rate == 1
+
+    def test_unknown_hosts_get_default_in_flight_cap(self):
+        """Hosts without a budget are only capped on concurrency."""
+        registry = RateLimiterRegistry(overrides={}, default_max_in_flight=4)
+        limiter = registry.limiter("https://www.ebi.ac.uk/ols4/api")
+        assert limiter.rate is None
+        assert limiter.max_in_flight == 4
+
+    def test_host_of(self):
+        """Host names are extracted from URLs; relative paths have none."""
+        assert host_of("https://Rest.UniProt.org:443/uniprotkb") == "rest.uniprot.org"
+        assert host_of("eutils.ncbi.nlm.nih.gov") == "eutils.ncbi.nlm.nih.gov"
+        assert host_of("/relative/path") == ""
+
+
+@pytest.mark.unit
+class TestSharedNCBIBudget:
+    """NCBI callers outside the E-utilities base class share its budget."""
+
+    def test_pmc_requests_use_shared_limiter(self, monkeypatch):
+        """PMCTool's esearch/esummary calls take the E-utilities slots."""
+        from tooluniverse.pmc_tool import PMCTool
+
+        def _fake(session, method, url, **kwargs):
+            response = requests.Response()
+            response.status_code = 200
+            response._content = (
+                b'{"esearchresult": {"idlist": ["123"]}}'
+                if "esearch" in url
+                else b'{"result": {}}'
+            )
+            return response
+
+        monkeypatch.setattr(requests.sessions.Session, "request", _fake)
+        reset_rate_limiter()
+        reset_circuit_breakers()
+        try:
+            PMCTool({"name": "PMC_search_papers"})._search("p53", limit=5)
+            limiter = get_rate_limiter().limiter("eutils.ncbi.nlm.nih.gov")
+            assert limiter.stats()["requests"] == 2
+        finally:
+            http_client.reset_transport()
+            reset_rate_limiter()
+            reset_circuit_breakers()
+
+
+@pytest.fixture
+def throttled_server(monkeypatch):
+    """Local server answering with the statuses in ``server.statuses`` in
+    turn (then 200), behind a 5 rps limit for its host."""
+
+    class ScriptedHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            server.sent.append(time.monotonic())
+            status = server.statuses.pop(0) if server.statuses else 200
+            self.send_response(status)
+            if status == 429:
+                self.send_header("Retry-After", "1")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        do_POST = do_GET
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), ScriptedHandler)
+    server.daemon_threads = True
+    server.statuses = []
+    server.sent = []
+    server.url = f"http://127.0.0.1:{server.server_port}/"
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setenv(
+        "TOOLUNIVERSE_RATE_LIMITS",
+        json.dumps({"127.0.0.1": {"requests_per_second": 5, "burst": 1}}),
+    )
+    reset_rate_limiter()
+    reset_circuit_breakers()
+    yield server
+    server.shutdown()
+    server.server_close()
+    reset_rate_limiter()
+    reset_circuit_breakers()
+
+
+@pytest.mark.unit
+class TestTransportRetriesShareBudget:
+    """Transport retries are paced by the host's limiter like any request."""
+
+    def test_429_retried_through_limiter(self, throttled_server):
+        """A 429 pauses the host for Retry-After and retries in a new slot."""
+        throttled_server.statuses = [429]
+        transport = http_client.HTTPTransport(retries=3, backoff_factor=0)
+        response = transport.get(throttled_server.url)
+        stats = get_rate_limiter().limiter(throttled_server.url).stats()
+
+        assert response.status_code == 200
+        assert stats["requests"] == 2
+        assert stats["throttled"] == 1
+        gap = throttled_server.sent[1] - throttled_server.sent[0]
+        assert gap >= 0.9
+        transport.close()
+
+    def test_server_error_retries_draw_tokens(self, throttled_server):
+        """Each 5xx retry waits for its own token instead of reusing one."""
+        throttled_server.statuses = [503, 503]
+        transport = http_client.HTTPTransport(retries=3, backoff_factor=0)
+        response = transport.get(throttled_server.url)
+        stats = get_rate_limiter().limiter(throttled_server.url).stats()
+
+        assert response.status_code == 200
+        assert stats["requests"] == 3
+        assert throttled_server.sent[-1] - throttled_server.sent[0] >= 0.35
+        transport.close()
+
+    def test_post_not_retried_on_429(self, throttled_server):
+        """Non-idempotent requests get the 429 back."""
+        throttled_server.statuses = [429]
+        transport = http_client.HTTPTransport(retries=3, backoff_factor=0)
+        response = transport.post(throttled_server.url)
+        assert response.status_code == 429
+        assert len(throttled_server.sent) == 1
+        transport.close()
+
+    def test_queued_request_not_sent_past_deadline(self, throttled_server):
+        """A request still queued for its slot at the deadline is never sent."""
+        limiter = get_rate_limiter().limiter(throttled_server.url)
+        limiter.update(max_in_flight=1)
+        limiter.acquire()
+        transport = http_client.HTTPTransport(retries=0)
+        start = time.monotonic()
+        with deadline_scope(0.2):
+            with pytest.raises(DeadlineExceededError):
+                # A timeout well inside the deadline: only the queue runs out
+                transport.get(throttled_server.url, timeout=0.05)
+        assert time.monotonic() - start < 0.5
+        assert throttled_server.sent == []
+        breaker = get_circuit_breakers().breaker(throttled_server.url)
+        # Queuing for the limiter is not a failure of the host
+        assert breaker is None or False not in breaker._outcomes
+        limiter.release()
+        transport.close()
+
+
+@pytest.mark.unit
+class TestBatchInterleaving:
+    """Batch jobs are spread across upstream hosts."""
+
+    def test_jobs_round_robin_across_hosts(self):
+        """Jobs for one host no longer run back to back."""
+        tu = ToolUniverse(tool_files={}, keep_default_tools=False)
+        tools = {
+            "ncbi_tool": HostTool(
+                {"name": "ncbi_tool", "base_url": "https://eutils.ncbi.nlm.nih.gov"}
+            ),
+            "uniprot_tool": HostTool(
+                {"name": "uniprot_tool", "base_url": "https://rest.uniprot.org"}
+            ),
+        }
+        jobs = []
+        for index, name in enumerate(["ncbi_tool"] * 3 + ["uniprot_tool"] * 2):
+            jobs.append(
+                _BatchJob(
+                    signature=str(index),
+                    call={"name": name, "arguments": {"i": index}},
+                    function_name=name,
+                    arguments={"i": index},
+                    tool_instance=tools[name],
+                )
+            )
+
+        ordered = tu._interleave_jobs_by_host(jobs)
+        assert [job.function_name for job in ordered] == [
+            "ncbi_tool",
+            "uniprot_tool",
+            "ncbi_tool",
+            "uniprot_tool",
+            "ncbi_tool",
+        ]
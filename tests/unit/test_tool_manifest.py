@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Tests for the precompiled tool-config manifest.
+"""
+
+import json
+import os
+
+import pytest
+
+from tooluniverse import ToolUniverse
+from tooluniverse import execute_function, tool_manifest
+from tooluniverse.tool_manifest import (
+    ToolManifest,
+    build_tool_manifest,
+    get_tool_manifest,
+    reset_tool_manifest,
+)
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    data = tmp_path / "data"
+    data.mkdir()
+    return data
+
+
+@pytest.fixture
+def tool_dir(data_dir):
+    return data_dir
+
+
+@pytest.fixture
+def tool_catalog(tool_config):
+    return {
+        "alpha": [tool_config("alpha_one"), tool_config("alpha_two", "OtherTool")],
+        "compose": [tool_config("composed", "ComposeTool")],
+    }
+
+
+@pytest.fixture
+def manifest(data_dir, tool_files):
+    path = build_tool_manifest(tool_files, data_dir / "manifest.bin", data_dir)
+    return ToolManifest(path, data_dir)
+
+
+@pytest.fixture
+def tu(tool_files, manifest, monkeypatch):
+    monkeypatch.setattr(tool_manifest, "get_tool_manifest", lambda: manifest)
+    return ToolUniverse(tool_files=tool_files, keep_default_tools=False)
+
+
+def _json_configs(tu, category):
+    """The configs load_tools builds from the JSON file."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(tool_manifest, "get_tool_manifest", lambda: None)
+        return tu._read_category_tools(category, tu.tool_files[category])
+
+
+@pytest.mark.unit
+class TestToolManifest:
+    """Manifest contents and staleness checks."""
+
+    def test_configs_match_json_load(self, tu, manifest):
+        """Precomputed configs equal the annotated JSON configs."""
+        for category, file_path in tu.tool_files.items():
+            assert manifest.covers(category, file_path)
+            assert manifest.configs(category, file_path) == _json_configs(tu, category)
+        composed = manifest.configs("compose", tu.tool_files["compose"])[0]
+        assert composed["mcp_annotations"]["readOnlyHint"] is False
+
+    def test_select_and_indexes(self, manifest, tool_files):
+        """Only selected tools are decoded; name and type indexes are built."""
+        configs = manifest.configs(
+            "alpha", tool_files["alpha"], lambda name, tool_type: name == "alpha_two"
+        )
+        assert [c["name"] for c in configs] == ["alpha_two"]
+        assert manifest.names["composed"] == "compose"
+        assert manifest.types["EchoTool"] == ["alpha_one"]
+
+    def test_changed_file_not_covered(self, manifest, tool_files):
+        """An edited file is read from JSON; a touched one is still covered."""
+        path = tool_files["alpha"]
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        assert manifest.covers("alpha", path)
+
+        with open(path, "r+") as f:
+            content = f.read().replace("alpha_one", "alpha_uno")
+            f.seek(0)
+            f.write(content)
+            f.truncate()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 2 * 10**9))
+        assert not manifest.covers("alpha", path)
+
+    def test_other_files_not_covered(self, manifest, tmp_path):
+        """Files outside the manifest, e.g. tool_config_files, are not covered."""
+        other = tmp_path / "alpha.json"
+        other.write_text("[]")
+        assert not manifest.covers("alpha", str(other))
+        assert not manifest.covers("custom", str(other))
+
+    def test_defaults_change_invalidates(self, manifest, monkeypatch):
+        """A manifest built with other annotation defaults is rejected."""
+        monkeypatch.setattr(tool_manifest, "_defaults_digest", lambda: "changed")
+        with pytest.raises(ValueError):
+            ToolManifest(manifest.path)
+
+    def test_bundled_manifest_loads(self):
+        """The manifest shipped in data/ matches this version's format."""
+        reset_tool_manifest()
+        try:
+            assert get_tool_manifest() is not None
+        finally:
+            reset_tool_manifest()
+
+
+@pytest.mark.unit
+class TestLoadToolsFromManifest:
+    """load_tools reads covered categories from the manifest."""
+
+    def test_load_tools_skips_json(self, tu, monkeypatch):
+        """No JSON file is parsed when the manifest covers every category."""
+
+        def fail(path):
+            raise AssertionError(f"read {path}")
+
+        monkeypatch.setattr(execute_function, "read_json_list", fail)
+        tu.load_tools(include_tools=["alpha_two", "composed"])
+        assert [t["name"] for t in tu.all_tools] == ["alpha_two", "composed"]
+        assert tu.all_tool_dict["alpha_two"]["source_file"] == tu.tool_files["alpha"]
+
+    def test_extra_config_files_fall_back(self, tu, tmp_path, tool_config):
+        """tool_config_files outside the manifest are read from JSON."""
+        extra = tmp_path / "extra.json"
+        extra.write_text(json.dumps([tool_config("extra_tool")]))
+        tu.load_tools(tool_config_files={"extra": str(extra)})
+        assert {"alpha_one", "alpha_two", "composed", "extra_tool"} <= set(
+            tu.all_tool_dict
+        )
+        assert tu.all_tool_dict["extra_tool"]["category"] == "extra"
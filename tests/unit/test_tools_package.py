@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Tests for the lazily-loaded ``tooluniverse.tools`` wrapper package.
+"""
+
+import importlib
+import os
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+from tooluniverse.generate_tools import generate_init
+
+
+def _run(code):
+    """Run ``code`` in a fresh interpreter and return the last line it prints."""
+    result = subprocess.run(
+        [sys.executable, "-c", textwrap.dedent(code)],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+    )
+    return result.stdout.strip().splitlines()[-1]
+
+
+@pytest.mark.unit
+class TestLazyToolsPackage:
+    """The generated package imports wrappers on demand."""
+
+    def test_single_import_loads_one_wrapper(self):
+        """Importing one tool does not import the other wrappers."""
+        loaded = _run(
+            """
+            import sys
+            from tooluniverse.tools import ArXiv_search_papers
+            print(sorted(m for m in sys.modules if m.startswith("tooluniverse.tools.")))
+            """
+        )
+        assert loaded == (
+            "['tooluniverse.tools.ArXiv_search_papers', "
+            "'tooluniverse.tools._shared_client']"
+        )
+
+    def test_names_resolve_to_wrapper_functions(self):
+        """Package attributes are the wrappers, even after a submodule import."""
+        tools = importlib.import_module("tooluniverse.tools")
+        importlib.import_module("tooluniverse.tools.BLAST_protein_search")
+        assert callable(tools.BLAST_protein_search)
+        assert tools.BLAST_protein_search.__name__ == "BLAST_protein_search"
+        assert "ArXiv_search_papers" in dir(tools)
+        with pytest.raises(AttributeError):
+            tools.not_a_tool
+
+    def test_star_import_exports_all(self):
+        """``from tooluniverse.tools import *`` still binds every tool."""
+        namespace = {}
+        exec("from tooluniverse.tools import *", namespace)
+        tools = importlib.import_module("tooluniverse.tools")
+        assert set(tools.__all__) <= set(namespace)
+
+    def test_generated_init_maps_miscased_modules(self, tmp_path):
+        """Wrappers saved under another spelling are still found."""
+        (tmp_path / "alpha.py").write_text("def alpha():\n    return 'a'\n")
+        (tmp_path / "BETA.py").write_text("def beta():\n    return 'b'\n")
+        (tmp_path / "_shared_client.py").write_text(
+            "def get_shared_client():\n    pass\n\n\n"
+            "def reset_shared_client():\n    pass\n"
+        )
+        generate_init(["alpha", "beta"], tmp_path)
+        content = (tmp_path / "__init__.py").read_text()
+        assert '"beta": "BETA"' in content
+        assert "from .BETA import beta" in content
+        assert "from .alpha import alpha" in content
@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared upstream document cache and the UniProt entry tools.
+"""
+
+import json
+import threading
+import time
+
+import pytest
+import requests
+
+from tooluniverse.cache.upstream_cache import (
+    UpstreamCache,
+    canonical_url,
+    reset_upstream_cache,
+)
+from tooluniverse.uniprot_tool import UniProtRESTTool
+
+ENTRY = {
+    "primaryAccession": "P05067",
+    "comments": [
+        {"commentType": "FUNCTION", "texts": [{"value": "Binds things."}]},
+        {
+            "commentType": "SUBCELLULAR LOCATION",
+            "subcellularLocations": [{"location": {"value": "Membrane"}}],
+        },
+    ],
+}
+
+
+def _response(payload, status=200, delay=0.0):
+    def _get(url, params=None, **kwargs):
+        time.sleep(delay)
+        response = requests.Response()
+        response.status_code = status
+        response._content = json.dumps(payload).encode()
+        response.url = url
+        return response
+
+    return _get
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    """Each test starts with an empty process-wide cache."""
+    reset_upstream_cache()
+    yield
+    reset_upstream_cache()
+
+
+@pytest.mark.unit
+class TestUpstreamCache:
+    """Keying, sharing and expiry."""
+
+    def test_canonical_url_ignores_spelling(self):
+        """Host case, query order and fragments do not change the key."""
+        assert canonical_url(
+            "https://REST.uniprot.org/x?b=2&a=1#frag"
+        ) == canonical_url("https://rest.uniprot.org/x", {"a": 1, "b": 2})
+
+    def test_concurrent_misses_share_one_fetch(self):
+        """Threads asking for the same URL wait for a single fetch."""
+        cache = UpstreamCache(ttl=60)
+        calls = []
+        get = _response(ENTRY, delay=0.05)
+
+        def counting_get(url, **kwargs):
+            calls.append(url)
+            return get(url, **kwargs)
+
+        results = []
+        threads = [
+            threading.Thread(
+                target=lambda: results.append(
+                    cache.get_json("https://rest.uniprot.org/e", get=counting_get)
+                )
+            )
+            for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len(calls) == 1
+        assert all(result is results[0] for result in results)
+        assert cache.stats()["shared"] == 4
+
+    def test_entries_expire(self):
+        """A document older than its TTL is fetched again."""
+        cache = UpstreamCache(ttl=0.05)
+        calls = []
+
+        def fetch():
+            calls.append(1)
+            return {"n": len(calls)}
+
+        assert cache.get_or_fetch("k", fetch) == {"n": 1}
+        assert cache.get_or_fetch("k", fetch) == {"n": 1}
+        time.sleep(0.06)
+        assert cache.get_or_fetch("k", fetch) == {"n": 2}
+
+    def test_errors_are_not_cached(self):
+        """Non-2xx responses raise and a later call retries."""
+        cache = UpstreamCache(ttl=60)
+        with pytest.raises(requests.HTTPError):
+            cache.get_json("https://rest.uniprot.org/e", get=_response({}, 500))
+        assert cache.get_json("https://rest.uniprot.org/e", get=_response(ENTRY)) == (
+            ENTRY
+        )
+
+    def test_parser_and_accept_header_keep_entries_apart(self):
+        """One URL read as JSON, as text, or with another Accept is not shared."""
+        cache = UpstreamCache(ttl=60)
+        url = "https://rest.uniprot.org/e"
+        get = _response(ENTRY)
+        as_json = cache.get_json(url, get=get)
+        as_text = cache.get_document(url, lambda response: response.text, get=get)
+        as_tsv = cache.get_json(url, get=get, headers={"Accept": "text/tsv"})
+        assert as_json == ENTRY
+        assert as_text == json.dumps(ENTRY)
+        assert cache.fetches == 3
+        assert cache.get_json(url, get=get, headers={"accept": "text/tsv"}) is as_tsv
+        assert cache.fetches == 3
+
+    def test_byte_budget_evicts(self):
+        """Documents beyond the memory budget push out the oldest."""
+        cache = UpstreamCache(ttl=60, max_bytes=1000)
+        for key in ("a", "b", "c"):
+            cache.get_or_fetch(key, lambda: key, size=200)
+        cache.get_or_fetch("d", lambda: "d", size=200)
+        cache.get_or_fetch("e", lambda: "e", size=200)
+        cache.get_or_fetch("f", lambda: "f", size=200)
+        assert cache.stats()["evictions"] >= 1
+        assert cache.stats()["current_bytes"] <= 1000
+
+
+@pytest.mark.unit
+class TestUniProtSharing:
+    """Entry tools projecting the same document share one download."""
+
+    def _tool(self, name, extract_path):
+        return UniProtRESTTool(
+            {
+                "name": name,
+                "type": "UniProtRESTTool",
+                "parameter": {
+                    "type": "object",
+                    "properties": {"accession": {"type": "string"}},
+                },
+                "fields": {
+                    "endpoint": "https://rest.uniprot.org/uniprotkb/{accession}.json",
+                    "extract_path": extract_path,
+                },
+            }
+        )
+
+    def test_projections_share_fetch(self, monkeypatch):
+        """Function and location tools download the entry once."""
+        calls = []
+
+        def fake_get(tool, url, **kwargs):
+            calls.append(url)
+            return _response(ENTRY)(url)
+
+        monkeypatch.setattr(UniProtRESTTool, "http_get", fake_get)
+        function_tool = self._tool(
+            "UniProt_get_function_by_accession",
+            "comments[?(@.commentType=='FUNCTION')].texts[*].value",
+        )
+        location_tool = self._tool(
+            "UniProt_get_subcellular_location_by_accession",
+            "comments[?(@.commentType=="
+            "'SUBCELLULAR LOCATION')].subcellularLocations[*].location.value",
+        )
+        assert function_tool.run({"accession": "P05067"}) == ["Binds things."]
+        assert location_tool.run({"accession": "P05067"}) == ["Membrane"]
+        assert len(calls) == 1
+
+    def test_status_error_reported(self, monkeypatch):
+        """A failed fetch keeps the tool's status-code error format."""
+        monkeypatch.setattr(
+            UniProtRESTTool,
+            "http_get",
+            lambda tool, url, **kwargs: _response({"messages": ["nope"]}, 404)(url),
+        )
+        result = self._tool("UniProt_get_entry_by_accession", None).run(
+            {"accession": "XXXX"}
+        )
+        assert result["error"] == "UniProt API returned status code: 404"
+
+
+@pytest.mark.unit
+class TestRevalidation:
+    """Expired documents with validators are revalidated, not refetched."""
+
+    def _server(self, etag='"v1"'):
+        calls = []
+
+        def get(url, params=None, headers=None, **kwargs):
+            calls.append(dict(headers or {}))
+            response = requests.Response()
+            response.url = url
+            response.headers["ETag"] = etag
+            if (headers or {}).get("If-None-Match") == etag:
+                response.status_code = 304
+                response._content = b""
+            else:
+                response.status_code = 200
+                response._content = json.dumps(ENTRY).encode()
+            return response
+
+        return get, calls
+
+    def test_not_modified_renews_entry(self):
+        """A 304 keeps the parsed document and restarts its TTL."""
+        cache = UpstreamCache(ttl=0.05)
+        get, calls = self._server()
+        first = cache.get_json("https://rest.uniprot.org/e", get=get)
+        time.sleep(0.06)
+        second = cache.get_json("https://rest.uniprot.org/e", get=get)
+        assert second is first
+        assert calls[1] == {"If-None-Match": '"v1"'}
+        assert cache.stats()["revalidated"] == 1
+        # Fresh again: no third request
+        cache.get_json("https://rest.uniprot.org/e", get=get)
+        assert len(calls) == 2
+
+    def test_changed_document_replaced(self):
+        """A 200 to a conditional request replaces the entry."""
+        cache = UpstreamCache(ttl=0.05)
+        get, calls = self._server()
+        first = cache.get_json("https://rest.uniprot.org/e", get=get)
+        time.sleep(0.06)
+        get_v2, _ = self._server(etag='"v2"')
+        second = cache.get_json("https://rest.uniprot.org/e", get=get_v2)
+        assert second == first and second is not first
+        assert cache.stats()["revalidated"] == 0
+
+    def test_revalidation_can_be_disabled(self):
+        """With revalidation off, expired documents are fetched in full."""
+        cache = UpstreamCache(ttl=0.05, revalidate=False)
+        get, calls = self._server()
+        cache.get_json("https://rest.uniprot.org/e", get=get)
+        time.sleep(0.06)
+        cache.get_json("https://rest.uniprot.org/e", get=get)
+        assert calls == [{}, {}]